@@ -58,6 +58,26 @@ SENDER_EMAIL = os.getenv("SENDER_EMAIL", "kpj45123@gmail.com")
 # Brevo 리스트 ID (캠페인 전송용)
 BREVO_LIST_IDS = [int(x.strip()) for x in os.getenv("BREVO_LIST_IDS", "2").split(",") if x.strip()]
 
+# 과목 카탈로그 설정 (collect_subjects.py가 생성한 학기별 JSONL 위치)
+COURSE_CATALOG_DIR = os.getenv(
+    "COURSE_CATALOG_DIR",
+    str(Path(__file__).parent.parent / "google_adk" / "data" / "과목정보")
+)
+
+# 강의계획서 조회 설정
+SYLLABUS_MAX_CONCURRENCY_PER_HOST = int(os.getenv("SYLLABUS_MAX_CONCURRENCY_PER_HOST", "4"))
+SYLLABUS_CACHE_TTL_SECONDS = int(os.getenv("SYLLABUS_CACHE_TTL_SECONDS", "3600"))
+
+# 강의계획서 일괄 수집 Parquet 데이터셋 위치 (year=/semester= 파티션)
+SYLLABUS_DATASET_DIR = os.getenv(
+    "SYLLABUS_DATASET_DIR",
+    str(Path(__file__).parent.parent / "google_adk" / "data" / "과목정보" / "syllabus_dataset")
+)
+
+# 입력 살균 길이 상한 (정규식 검사 전에 자름)
+SANITIZER_MAX_MESSAGE_LENGTH = int(os.getenv("SANITIZER_MAX_MESSAGE_LENGTH", "4000"))
+SANITIZER_MAX_FIELD_LENGTH = int(os.getenv("SANITIZER_MAX_FIELD_LENGTH", "200"))
+
 # 환경 확인
 def check_config():
     """환경 변수 확인"""
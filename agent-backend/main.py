@@ -33,6 +33,7 @@ from routers import database
 from routers.email import router as email_router
 
 import config
+from utils.metrics import SENSITIVE_LABELS, get_metrics
 
 # HTTPBearer security scheme (Swagger UI용)
 security = HTTPBearer()
@@ -117,6 +118,12 @@ async def health_check():
     """헬스체크 엔드포인트"""
     return {"status": "ok", "service": "agent-backend-api"}
 
+# 프로세스 내 카운터 (안전 사전 필터 차단 수 등)
+@app.get("/metrics")
+async def metrics():
+    """카운터 메트릭 조회 (인스턴스별, 재시작 시 초기화, 인증 없는 공개 응답이라 차단 키워드 라벨은 제외)"""
+    return get_metrics().snapshot(exclude_labels=SENSITIVE_LABELS)
+
 # 루트 엔드포인트
 @app.get("/")
 async def root():
@@ -126,6 +133,7 @@ async def root():
         "version": "2.0.0",
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "create_session": "POST /sessions",
             "list_sessions": "GET /sessions",
             "send_message": "POST /chat/message",
@@ -2,6 +2,7 @@
 ChatService - 채팅 메시지 처리 서비스
 
 Vertex AI와 통신하고 Repository를 통해 메시지를 저장합니다.
+차단 키워드가 있는 메시지는 Agent Engine을 호출하지 않고 바로 거부합니다.
 """
 from typing import AsyncGenerator, Optional
 from uuid import UUID
@@ -11,10 +12,14 @@ from domain.repositories.chat_message_repository import ChatMessageRepository
 from domain.repositories.chat_session_repository import ChatSessionRepository
 from domain.repositories.profile_repository import ProfileRepository
 from utils.input_sanitizer import sanitize_message
+from utils.metrics import get_metrics
 import vertexai
 import config
 import asyncio
 
+# 에이전트 safety_check_callback과 같은 차단 목록/매처 (config가 google_adk 경로를 잡은 뒤 import)
+from google_adk.safety import REFUSAL_MESSAGE, get_safety_matcher
+
 
 class ChatService:
     """
@@ -81,6 +86,7 @@ class ChatService:
         """
         메시지 전송 및 스트리밍 응답 (비동기)
         
+        0. 입력 살균 + 안전 사전 필터 (차단 시 거부 메시지만 반환, DB/Agent Engine 미호출)
         1. 세션 조회
         2. 사용자 메시지 저장
         3. 프로필 정보 조회 및 주입
@@ -108,6 +114,16 @@ class ChatService:
                 raise ValueError("Message cannot be empty after sanitization")
             
             print(f"[ChatService] ✅ Input sanitized (length: {len(message_text)})")
+
+            # 🛡️ 안전 사전 필터: 에이전트의 safety_check_callback과 같은 목록으로
+            # 차단 대상이면 세션 조회/저장과 Agent Engine 왕복 없이 바로 거부
+            blocked = get_safety_matcher().first_blocked(message_text)
+            if blocked:
+                get_metrics().increment("chat_preflight_blocked_total", keyword=blocked.keyword)
+                print(f"[ChatService] 🚫 Blocked by pre-flight filter: '{blocked.keyword}'")
+                yield REFUSAL_MESSAGE
+                return
+            get_metrics().increment("chat_preflight_passed_total")
             # ========================================
             
             # 1. 세션 조회
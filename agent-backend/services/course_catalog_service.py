@@ -0,0 +1,278 @@
+"""
+CourseCatalogService - 로컬 과목 카탈로그 검색 서비스
+
+collect_subjects.py가 수집한 학기별 JSONL(kangnam_all_{YEAR}_{SEMESTER}.jsonl)을
+메모리에 색인하여 과목 검색을 app.kangnam.ac.kr 호출 없이 처리합니다.
+
+- 과목명: 문자 bigram 역색인 + 부분 문자열 검증
+- 학수번호: 정확 일치
+- 필터: 담당교수, 학과/전공, 학년, 학점
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# 학수번호 형식 (예: EF01601, CS31002)
+SUBJECT_CODE_PATTERN = re.compile(r"^[A-Za-z]{2,3}\d{4,6}$")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (공백 제거 + 소문자)"""
+    return _WHITESPACE.sub("", text or "").lower()
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+@dataclass
+class CatalogCourse:
+    """
+    카탈로그 과목 (학수번호-분반 단위)
+
+    Attributes:
+        id: 학수번호-분반
+        departments: 이 과목을 개설 목록에 포함한 학과/전공 (중복 행 병합)
+        grades: 개설 학년 (교양은 0)
+    """
+    id: str
+    subject_code: str
+    section: str
+    name: str
+    professor: str
+    credit: str
+    lecture_time: str
+    params: str
+    syllabus_url: str
+    departments: List[str] = field(default_factory=list)
+    grades: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_document(cls, doc: dict) -> 'CatalogCourse':
+        """collect_subjects.py 문서(JSONL 한 줄)에서 생성"""
+        metadata = doc.get("metadata", {})
+        subject_code, _, section = doc["id"].rpartition("-")
+
+        lecture_time = ""
+        for line in doc.get("content", "").splitlines():
+            if line.startswith("강의시간:"):
+                lecture_time = line.split(":", 1)[1].strip()
+                break
+
+        syllabus_url = metadata.get("syllabus_url", "")
+        return cls(
+            id=doc["id"],
+            subject_code=subject_code,
+            section=section,
+            name=metadata.get("subject_name", ""),
+            professor=metadata.get("professor", ""),
+            credit=str(metadata.get("credit", "")),
+            lecture_time=lecture_time,
+            params=params_from_syllabus_url(syllabus_url),
+            syllabus_url=syllabus_url,
+            departments=list(metadata.get("departments") or [metadata.get("department", "")]),
+            grades=[int(g) for g in metadata.get("grades") or [metadata.get("grade", 0)]],
+        )
+
+    def merge(self, other: 'CatalogCourse'):
+        """같은 학수번호-분반의 다른 학과 행 병합"""
+        for dept in other.departments:
+            if dept not in self.departments:
+                self.departments.append(dept)
+        for grade in other.grades:
+            if grade not in self.grades:
+                self.grades.append(grade)
+
+    def to_dict(self) -> Dict[str, object]:
+        """/proxy/subject/search 응답 형식 (parse_course_list와 동일한 키 + 카탈로그 정보)"""
+        return {
+            "학수번호": self.subject_code,
+            "분반": self.section,
+            "과목명": self.name,
+            "담당교수": self.professor,
+            "학점": self.credit,
+            "시수": "",
+            "강의시간": self.lecture_time,
+            "params": self.params,
+            "학과": self.departments,
+            "학년": self.grades,
+        }
+
+
+def params_from_syllabus_url(syllabus_url: str) -> str:
+    """강의계획서 URL에서 goPrint 파라미터 문자열(empl,year,smst,subj,clas) 복원"""
+    if not syllabus_url:
+        return ""
+    query = parse_qs(urlparse(syllabus_url).query)
+    keys = ["empl_numb", "schl_year", "schl_smst", "subj_numb", "lctr_clas"]
+    return ",".join(query.get(key, [""])[0] for key in keys)
+
+
+class CourseCatalog:
+    """한 학기 과목 카탈로그의 인메모리 색인"""
+
+    def __init__(self, courses: List[CatalogCourse]):
+        merged: Dict[str, CatalogCourse] = {}
+        for course in courses:
+            if course.id in merged:
+                merged[course.id].merge(course)
+            else:
+                merged[course.id] = course
+
+        self.courses: List[CatalogCourse] = list(merged.values())
+        self._names = [normalize(c.name) for c in self.courses]
+        self._by_code: Dict[str, List[int]] = {}
+        self._name_bigrams: Dict[str, Set[int]] = {}
+        self._by_professor: Dict[str, Set[int]] = {}
+        self._by_department: Dict[str, Set[int]] = {}
+        self._by_grade: Dict[int, Set[int]] = {}
+        self._by_credit: Dict[str, Set[int]] = {}
+
+        for i, course in enumerate(self.courses):
+            self._by_code.setdefault(course.subject_code.upper(), []).append(i)
+            for gram in _bigrams(self._names[i]):
+                self._name_bigrams.setdefault(gram, set()).add(i)
+            self._by_professor.setdefault(normalize(course.professor), set()).add(i)
+            for dept in course.departments:
+                self._by_department.setdefault(normalize(dept), set()).add(i)
+            for grade in course.grades:
+                self._by_grade.setdefault(grade, set()).add(i)
+            self._by_credit.setdefault(course.credit, set()).add(i)
+
+    @classmethod
+    def from_jsonl(cls, path: Path) -> 'CourseCatalog':
+        courses = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    courses.append(CatalogCourse.from_document(json.loads(line)))
+        return cls(courses)
+
+    def __len__(self) -> int:
+        return len(self.courses)
+
+    def _match_name(self, keyword: str) -> List[int]:
+        key = normalize(keyword)
+        if not key:
+            return list(range(len(self.courses)))
+        if len(key) == 1:
+            return [i for i, name in enumerate(self._names) if key in name]
+
+        candidates: Optional[Set[int]] = None
+        for gram in _bigrams(key):
+            postings = self._name_bigrams.get(gram)
+            if not postings:
+                return []
+            candidates = postings if candidates is None else candidates & postings
+        return sorted(i for i in candidates if key in self._names[i])
+
+    def search(
+        self,
+        keyword: str = "",
+        subject_code: Optional[str] = None,
+        professor: Optional[str] = None,
+        department: Optional[str] = None,
+        grade: Optional[int] = None,
+        credit: Optional[str] = None
+    ) -> List[CatalogCourse]:
+        """
+        과목 검색
+
+        Args:
+            keyword: 과목명 부분 문자열 (학수번호 형식이면 학수번호로 검색)
+            subject_code: 학수번호 (정확 일치)
+            professor: 담당교수 (부분 일치)
+            department: 학과/전공 (부분 일치)
+            grade: 학년 (교양은 0)
+            credit: 학점
+
+        Returns:
+            카탈로그 순서를 유지한 과목 목록
+        """
+        if not subject_code and SUBJECT_CODE_PATTERN.match(keyword.strip()):
+            subject_code, keyword = keyword.strip(), ""
+
+        if subject_code:
+            indices = list(self._by_code.get(subject_code.strip().upper(), []))
+            if keyword:
+                key = normalize(keyword)
+                indices = [i for i in indices if key in self._names[i]]
+        else:
+            indices = self._match_name(keyword)
+
+        filters: List[Set[int]] = []
+        if professor:
+            filters.append(self._lookup_partial(self._by_professor, normalize(professor)))
+        if department:
+            filters.append(self._lookup_partial(self._by_department, normalize(department)))
+        if grade is not None:
+            filters.append(self._by_grade.get(grade, set()))
+        if credit is not None:
+            filters.append(self._by_credit.get(str(credit).strip(), set()))
+
+        for allowed in filters:
+            indices = [i for i in indices if i in allowed]
+        return [self.courses[i] for i in indices]
+
+    @staticmethod
+    def _lookup_partial(index: Dict[str, Set[int]], key: str) -> Set[int]:
+        """정규화된 키를 부분 문자열로 포함하는 모든 항목의 합집합"""
+        matched: Set[int] = set()
+        for value, postings in index.items():
+            if key in value:
+                matched |= postings
+        return matched
+
+
+class CourseCatalogService:
+    """
+    학기별 과목 카탈로그 관리 서비스
+
+    카탈로그 파일은 첫 조회 시 한 번만 읽어 메모리에 유지합니다.
+    해당 학기 파일이 없으면 None을 반환하여 호출 측이 실시간 조회로 대체하게 합니다.
+    """
+
+    FILE_PATTERN = "kangnam_all_{year}_{semester}.jsonl"
+
+    def __init__(self, catalog_dir: Path):
+        """
+        Args:
+            catalog_dir: 학기별 JSONL 파일이 있는 디렉토리
+        """
+        self.catalog_dir = Path(catalog_dir)
+        self._catalogs: Dict[Tuple[str, str], Optional[CourseCatalog]] = {}
+
+    def get_catalog(self, year: str, semester: str) -> Optional[CourseCatalog]:
+        """학기 카탈로그 조회 (없으면 None)"""
+        key = (str(year), str(semester))
+        if key not in self._catalogs:
+            path = self.catalog_dir / self.FILE_PATTERN.format(year=key[0], semester=key[1])
+            if path.exists():
+                catalog = CourseCatalog.from_jsonl(path)
+                print(f"[CourseCatalog] ✅ Loaded {len(catalog)} courses from {path.name}")
+            else:
+                catalog = None
+                print(f"[CourseCatalog] ⚠️ Catalog not found: {path}")
+            self._catalogs[key] = catalog
+        return self._catalogs[key]
+
+
+# Dependency Injection을 위한 싱글톤 팩토리
+_course_catalog_service_instance: Optional[CourseCatalogService] = None
+
+
+def get_course_catalog_service() -> CourseCatalogService:
+    """
+    CourseCatalogService 싱글톤 인스턴스 반환
+    """
+    global _course_catalog_service_instance
+    if _course_catalog_service_instance is None:
+        import config
+        _course_catalog_service_instance = CourseCatalogService(Path(config.COURSE_CATALOG_DIR))
+    return _course_catalog_service_instance
@@ -0,0 +1,236 @@
+"""
+SyllabusHarvester - 학기 전체 강의계획서 일괄 수집 → Parquet 데이터셋
+
+강의계획서는 프록시에서 요청이 올 때 한 건씩만 가져오므로 선수과목, 평가방법,
+주차별강의계획을 모아서 분석할 수 없었습니다. 학기 카탈로그(CourseCatalogService)의
+모든 과목 강의계획서를 SyllabusService로 동시에 가져와 parse_syllabus_html로 파싱한 뒤,
+year=/semester= 파티션 Parquet 데이터셋(config.SYLLABUS_DATASET_DIR)으로 저장합니다.
+
+- 같은 학기를 다시 수집하면 해당 파티션만 교체
+- 실패한 과목은 결과 요약에만 남기고 데이터셋에는 성공한 과목만 기록
+- 스키마 고정 (빈 항목도 같은 열 타입, 중첩 항목은 list/struct/map)
+
+사용법 (agent-backend 디렉토리에서):
+    python -m services.syllabus_harvester --year 2025 --semester 2
+    python -c "from services.syllabus_harvester import read_dataset; print(read_dataset('<dir>', 2025, 2).num_rows)"
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from services.course_catalog_service import CatalogCourse, CourseCatalogService
+from services.syllabus_service import SyllabusService
+
+# parse_syllabus_html의 문자열 항목 (그대로 열 이름으로 사용)
+TEXT_FIELDS = [
+    "년도", "학기", "교과목명_한글", "교과목명_영문", "담당교수", "학수번호_분반",
+    "강의요일교시", "학점_시간수", "강의실", "핵심역량", "성적평가기준", "연구실",
+    "E-Mail", "휴대전화", "면담가능시간", "연구일", "관리부서", "선수과목",
+    "관련_기초과목", "동시수강_관련과목", "관련_고급과목", "교과목_개요", "수업목표",
+    "교수학습_세부운영_방법", "수업운영방식", "주교재", "참고도서", "학부(과)",
+]
+LIST_FIELDS = [
+    "이수구분_교양", "이수구분_전공", "이수구분_일반선택", "강좌특성",
+    "장애학생_시험시간", "장애학생_지원사항",
+]
+TEACHING_METHOD_KEYS = ["표준", "자기주도식", "현장연계"]
+WEEKLY_PLAN_KEYS = ["주차", "학습주제", "수업방식/이용기재", "교수학습자료", "과제", "수업운영방식"]
+
+_STRINGS = pa.list_(pa.string())
+
+SYLLABUS_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("subject_code", pa.string()),
+        ("section", pa.string()),
+        ("subject_name", pa.string()),
+        ("professor", pa.string()),
+        ("params", pa.string()),
+        ("syllabus_url", pa.string()),
+    ]
+    + [(name, pa.string()) for name in TEXT_FIELDS]
+    + [(name, _STRINGS) for name in LIST_FIELDS]
+    + [
+        ("교수학습방법", pa.struct([(key, _STRINGS) for key in TEACHING_METHOD_KEYS])),
+        ("평가방법_세부사항", pa.string()),
+        ("평가방법_항목", pa.map_(pa.string(), pa.string())),
+        ("주차별강의계획", pa.list_(pa.struct([(key, pa.string()) for key in WEEKLY_PLAN_KEYS]))),
+        ("harvested_at", pa.timestamp("s", tz="UTC")),
+        ("year", pa.int16()),
+        ("semester", pa.int8()),
+    ]
+)
+PARTITION_COLUMNS = ["year", "semester"]
+PARTITIONING = ds.partitioning(
+    pa.schema([SYLLABUS_SCHEMA.field(name) for name in PARTITION_COLUMNS]), flavor="hive"
+)
+
+
+def to_row(course: CatalogCourse, syllabus: Dict[str, Any], year: int, semester: int,
+           harvested_at: datetime) -> Dict[str, Any]:
+    """카탈로그 과목 + 파싱 결과 → SYLLABUS_SCHEMA 행"""
+    evaluation = syllabus.get("평가방법") or {}
+    methods = syllabus.get("교수학습방법") or {}
+    row: Dict[str, Any] = {
+        "id": course.id,
+        "subject_code": course.subject_code,
+        "section": course.section,
+        "subject_name": course.name,
+        "professor": course.professor,
+        "params": course.params,
+        "syllabus_url": course.syllabus_url,
+    }
+    row.update({name: syllabus.get(name, "") for name in TEXT_FIELDS})
+    row.update({name: list(syllabus.get(name) or []) for name in LIST_FIELDS})
+    row.update({
+        "교수학습방법": {key: list(methods.get(key) or []) for key in TEACHING_METHOD_KEYS},
+        "평가방법_세부사항": evaluation.get("세부사항", ""),
+        "평가방법_항목": list((evaluation.get("항목") or {}).items()),
+        "주차별강의계획": [
+            {key: week.get(key, "") for key in WEEKLY_PLAN_KEYS}
+            for week in syllabus.get("주차별강의계획") or []
+        ],
+        "harvested_at": harvested_at,
+        "year": year,
+        "semester": semester,
+    })
+    return row
+
+
+class SyllabusHarvester:
+    """
+    학기 강의계획서 일괄 수집기
+
+    Args:
+        catalog_service: 학기 카탈로그 (과목 목록 + goPrint params)
+        syllabus_service: 강의계획서 조회 (호스트별 동시성 제한)
+        dataset_dir: Parquet 데이터셋 루트 (year=/semester= 파티션)
+    """
+
+    def __init__(
+        self,
+        catalog_service: CourseCatalogService,
+        syllabus_service: SyllabusService,
+        dataset_dir: Path,
+    ):
+        self.catalog_service = catalog_service
+        self.syllabus_service = syllabus_service
+        self.dataset_dir = Path(dataset_dir)
+
+    async def _fetch_all(
+        self, courses: List[CatalogCourse]
+    ) -> Tuple[List[Tuple[CatalogCourse, Dict[str, Any]]], Dict[str, str]]:
+        """모든 과목 강의계획서 조회 (완료될 때마다 진행률 출력)"""
+        started = time.monotonic()
+        done = 0
+        step = max(1, len(courses) // 20)
+
+        async def fetch(course: CatalogCourse):
+            nonlocal done
+            try:
+                result = await self.syllabus_service.get_syllabus(course.params)
+                return course, result["syllabus"], None
+            except Exception as e:
+                return course, None, str(e) or type(e).__name__
+            finally:
+                done += 1
+                if done % step == 0 or done == len(courses):
+                    print(f"[SyllabusHarvester] {done}/{len(courses)} ({time.monotonic() - started:.1f}s)")
+
+        outcomes = await asyncio.gather(*(fetch(course) for course in courses))
+        harvested = [(course, syllabus) for course, syllabus, error in outcomes if error is None]
+        failures = {course.id: error for course, _, error in outcomes if error is not None}
+        return harvested, failures
+
+    async def harvest(self, year: str, semester: str) -> Dict[str, Any]:
+        """
+        학기 전체 수집 후 파티션 교체
+
+        Returns:
+            {"courses", "harvested", "failures": {과목 id: 오류}, "path", "seconds"}
+
+        Raises:
+            ValueError: 학기 카탈로그가 없는 경우
+        """
+        catalog = self.catalog_service.get_catalog(year, semester)
+        if catalog is None:
+            raise ValueError(f"{year}년 {semester}학기 카탈로그가 없습니다. collect_subjects.py를 먼저 실행하세요.")
+
+        courses = [course for course in catalog.courses if course.params]
+        print(f"[SyllabusHarvester] ▶ {year}-{semester}: 강의계획서 {len(courses)}개 수집 시작")
+        started = time.monotonic()
+        harvested, failures = await self._fetch_all(courses)
+
+        harvested_at = datetime.now(timezone.utc).replace(microsecond=0)
+        rows = [to_row(course, syllabus, int(year), int(semester), harvested_at) for course, syllabus in harvested]
+        path = self.write_partition(rows, int(year), int(semester))
+        seconds = time.monotonic() - started
+
+        print(f"[SyllabusHarvester] ✅ {len(rows)}/{len(courses)}개 저장 → {path} ({seconds:.1f}s)")
+        for course_id, error in list(failures.items())[:10]:
+            print(f"[SyllabusHarvester] ⚠️ 실패: {course_id} {error}")
+        return {
+            "courses": len(courses),
+            "harvested": len(rows),
+            "failures": failures,
+            "path": str(path),
+            "seconds": seconds,
+        }
+
+    def write_partition(self, rows: List[Dict[str, Any]], year: int, semester: int) -> Path:
+        """year/semester 파티션을 rows로 교체 (다른 학기 파티션은 유지)"""
+        table = pa.Table.from_pylist(rows, schema=SYLLABUS_SCHEMA)
+        self.dataset_dir.mkdir(parents=True, exist_ok=True)
+        ds.write_dataset(
+            table,
+            str(self.dataset_dir),
+            format="parquet",
+            partitioning=PARTITIONING,
+            existing_data_behavior="delete_matching",
+            basename_template="part-{i}.parquet",
+        )
+        return self.dataset_dir / f"year={year}" / f"semester={semester}"
+
+
+def read_dataset(dataset_dir: Path, year: Optional[int] = None, semester: Optional[int] = None) -> pa.Table:
+    """데이터셋 읽기 (year/semester를 주면 해당 파티션만)"""
+    dataset = ds.dataset(str(dataset_dir), schema=SYLLABUS_SCHEMA, partitioning=PARTITIONING)
+    condition = None
+    for name, value in (("year", year), ("semester", semester)):
+        if value is not None:
+            expression = ds.field(name) == value
+            condition = expression if condition is None else condition & expression
+    return dataset.to_table(filter=condition)
+
+
+async def _main():
+    import argparse
+    import config
+
+    parser = argparse.ArgumentParser(description="학기 전체 강의계획서 수집 → Parquet")
+    parser.add_argument("--year", required=True)
+    parser.add_argument("--semester", required=True)
+    parser.add_argument("--concurrency", type=int, default=config.SYLLABUS_MAX_CONCURRENCY_PER_HOST,
+                        help="호스트당 동시 요청 수")
+    parser.add_argument("--output", default=config.SYLLABUS_DATASET_DIR, help="데이터셋 루트 디렉토리")
+    args = parser.parse_args()
+
+    syllabus_service = SyllabusService(max_concurrency_per_host=args.concurrency, cache_ttl_seconds=0)
+    harvester = SyllabusHarvester(
+        CourseCatalogService(Path(config.COURSE_CATALOG_DIR)),
+        syllabus_service,
+        Path(args.output),
+    )
+    try:
+        await harvester.harvest(args.year, args.semester)
+    finally:
+        await syllabus_service.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
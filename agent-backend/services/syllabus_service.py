@@ -0,0 +1,200 @@
+"""
+SyllabusService - 강의계획서 상세 조회 서비스
+
+goPrint 파라미터 문자열(empl,year,smst,subj,clas)로 강의계획서를 가져와 파싱합니다.
+
+- 호스트별 동시 요청 수 제한 (asyncio.Semaphore)
+- 파싱 결과 TTL 캐시 (같은 강의계획서 재조회 시 원격 호출 없음)
+- 일괄 조회 시 입력 순서 유지 + 항목별 오류 보고
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from utils.syllabus_parser import parse_syllabus_html_async
+
+# 강남대학교 강의계획서 시스템 Base URL
+BASE_URL = "https://app.kangnam.ac.kr/knumis/sbr"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+def build_syllabus_url(params_str: str) -> str:
+    """
+    goPrint 파라미터 문자열로 강의계획서 URL 생성
+
+    Raises:
+        ValueError: 파라미터 형식이 올바르지 않은 경우
+    """
+    val = [v.strip() for v in params_str.split(',')]
+    if len(val) < 5 or not all(val[:5]):
+        raise ValueError(f"잘못된 params 형식입니다: {params_str!r}")
+
+    empl_numb, schl_year, schl_smst, subj_numb, lctr_clas = val[:5]
+
+    # URL 결정
+    temp_year = int(schl_year)
+    if temp_year >= 2020:
+        url_path = 'syllabus2020.jsp'
+    elif temp_year >= 2017:
+        url_path = 'syllabus2017.jsp'
+    else:
+        url_path = 'syllabus.jsp'
+
+    repo_path = '../sbr/sbr3070_New.mrd' if temp_year >= 2014 else '../sbr/sbr3070.mrd'
+
+    return (
+        f"{BASE_URL}/{url_path}?schl_year={schl_year}&schl_smst={schl_smst}"
+        f"&subj_numb={subj_numb}&lctr_clas={lctr_clas}&empl_numb={empl_numb}"
+        f"&repo_path={repo_path}&winopt=1010"
+    )
+
+
+class SyllabusService:
+    """강의계획서 조회 서비스 (호스트별 동시성 제한 + 결과 캐시)"""
+
+    def __init__(
+        self,
+        max_concurrency_per_host: int = 4,
+        cache_ttl_seconds: int = 3600,
+        cache_max_entries: int = 512,
+        timeout: float = 15.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            max_concurrency_per_host: 호스트당 동시 요청 수 상한
+            cache_ttl_seconds: 파싱 결과 캐시 유지 시간 (0이면 캐시 사용 안 함)
+            cache_max_entries: 캐시 최대 항목 수 (초과 시 가장 오래된 항목 제거)
+            timeout: 요청 타임아웃 (초)
+            transport: httpx 트랜스포트 (테스트용 주입)
+        """
+        self.max_concurrency_per_host = max(1, max_concurrency_per_host)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+        self.timeout = timeout
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                timeout=self.timeout,
+                transport=self._transport,
+                limits=httpx.Limits(max_connections=self.max_concurrency_per_host * 2)
+            )
+        return self._client
+
+    def _get_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_concurrency_per_host)
+        return self._host_semaphores[host]
+
+    def _cache_get(self, params_str: str) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(params_str)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[params_str]
+            return None
+        self._cache.move_to_end(params_str)
+        return result
+
+    def _cache_set(self, params_str: str, result: Dict[str, Any]):
+        if self.cache_ttl_seconds <= 0:
+            return
+        self._cache[params_str] = (time.monotonic() + self.cache_ttl_seconds, result)
+        self._cache.move_to_end(params_str)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    async def _fetch_html(self, url: str) -> str:
+        async with self._get_semaphore(url):
+            response = await self._get_client().get(url)
+        response.raise_for_status()
+        return response.content.decode("euc-kr", errors="replace")
+
+    async def get_syllabus(self, params_str: str) -> Dict[str, Any]:
+        """
+        강의계획서 단건 조회
+
+        Returns:
+            {"syllabus": dict, "syllabus_url": str, "cached": bool}
+
+        Raises:
+            ValueError: params 형식 오류
+            httpx.HTTPError: 원격 조회 실패
+        """
+        params_str = params_str.strip()
+        cached = self._cache_get(params_str)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        syllabus_url = build_syllabus_url(params_str)
+        html = await self._fetch_html(syllabus_url)
+
+        # 파싱 (워커 풀에서 실행하여 이벤트 루프 블로킹 방지)
+        syllabus_data = await parse_syllabus_html_async(html)
+
+        result = {"syllabus": syllabus_data, "syllabus_url": syllabus_url}
+        self._cache_set(params_str, result)
+        return {**result, "cached": False}
+
+    async def get_syllabi(self, params_list: List[str]) -> List[Dict[str, Any]]:
+        """
+        강의계획서 일괄 조회
+
+        캐시에 없는 항목만 동시에 가져오며 (같은 params는 한 번만 요청),
+        결과는 입력 순서대로 반환합니다. 실패한 항목은 status="error"로 표시합니다.
+        """
+        unique = list(dict.fromkeys(p.strip() for p in params_list))
+        outcomes = await asyncio.gather(
+            *(self.get_syllabus(p) for p in unique),
+            return_exceptions=True
+        )
+        by_params = dict(zip(unique, outcomes))
+
+        results = []
+        for params_str in params_list:
+            outcome = by_params[params_str.strip()]
+            if isinstance(outcome, Exception):
+                results.append({
+                    "params": params_str,
+                    "status": "error",
+                    "error": str(outcome) or type(outcome).__name__
+                })
+            else:
+                results.append({"params": params_str, "status": "success", **outcome})
+        return results
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Dependency Injection을 위한 싱글톤 팩토리
+_syllabus_service_instance: Optional[SyllabusService] = None
+
+
+def get_syllabus_service() -> SyllabusService:
+    """
+    SyllabusService 싱글톤 인스턴스 반환
+    """
+    global _syllabus_service_instance
+    if _syllabus_service_instance is None:
+        import config
+        _syllabus_service_instance = SyllabusService(
+            max_concurrency_per_host=config.SYLLABUS_MAX_CONCURRENCY_PER_HOST,
+            cache_ttl_seconds=config.SYLLABUS_CACHE_TTL_SECONDS
+        )
+    return _syllabus_service_instance
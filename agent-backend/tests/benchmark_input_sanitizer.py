@@ -0,0 +1,76 @@
+"""
+입력 살균기 최악 입력 벤치마크
+
+되돌아가기(backtracking)를 유발하는 입력을 길이별로 만들어
+기존 살균기(패턴별 re.search/re.sub, 길이 제한 없음)와 단일 패스 스캐너의 처리 시간을 비교합니다.
+기존 방식은 길이가 4배가 될 때마다 시간이 약 16배(O(n²)), 스캐너는 약 4배(O(n))로 늘어납니다.
+마지막 열은 길이 상한(SANITIZER_MAX_MESSAGE_LENGTH)을 적용한 실제 sanitize_message 시간입니다.
+
+사용법:
+    python agent-backend/tests/benchmark_input_sanitizer.py [최대길이]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from legacy_input_sanitizer import LegacyInputSanitizer
+from utils.input_sanitizer import InputSanitizer, sanitize_message
+
+# 이름 → 길이 n인 입력 생성
+ADVERSARIAL_INPUTS = {
+    "unclosed <script>": lambda n: "<script>" * (n // 8),
+    "OR without '='": lambda n: " or" * (n // 3),
+    "on-handler word": lambda n: "on" * (n // 2),
+    "open /* comments": lambda n: "/*" * (n // 2),
+    "<embed without '>'": lambda n: "<embed" * (n // 6),
+    "normal question": lambda n: ("2024학년도 소프트웨어학부 졸업요건 알려줘. " * (n // 26 + 1))[:n],
+}
+
+# 기존 방식이 한 번에 수 초 이상 걸리기 시작하면 더 긴 입력은 건너뜀
+LEGACY_TIME_LIMIT = 2.0
+
+
+def elapsed_ms(func, text: str) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func(text)
+        return (time.perf_counter() - start) * 1000
+
+
+def main():
+    max_length = int(sys.argv[1]) if len(sys.argv) > 1 else 64000
+    lengths = []
+    length = 1000
+    while length <= max_length:
+        lengths.append(length)
+        length *= 4
+
+    legacy = lambda text: LegacyInputSanitizer.sanitize_text(text, max_length=None)
+    scanner = lambda text: InputSanitizer.sanitize_text(text, max_length=len(text))
+
+    print(f"cap: SANITIZER_MAX_MESSAGE_LENGTH={InputSanitizer.MAX_MESSAGE_LENGTH}\n")
+    print(f"{'input':<20}{'length':>8}{'legacy ms':>12}{'scanner ms':>12}{'capped ms':>11}")
+    print("-" * 63)
+    for name, make in ADVERSARIAL_INPUTS.items():
+        skip_legacy = False
+        for length in lengths:
+            text = make(length)
+            if skip_legacy:
+                old = "skipped"
+            else:
+                old_ms = elapsed_ms(legacy, text)
+                skip_legacy = old_ms > LEGACY_TIME_LIMIT * 1000
+                old = f"{old_ms:.1f}"
+            new = elapsed_ms(scanner, text)
+            capped = elapsed_ms(sanitize_message, text)
+            print(f"{name:<20}{len(text):>8}{old:>12}{new:>12.1f}{capped:>11.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
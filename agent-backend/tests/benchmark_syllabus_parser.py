@@ -0,0 +1,55 @@
+"""
+강의계획서 파서 벤치마크
+
+기존 파서(레이블마다 트리 전체 탐색)와 단일 순회 인덱스 파서의
+fixture별 평균 파싱 시간을 비교합니다.
+
+사용법:
+    python agent-backend/tests/benchmark_syllabus_parser.py [반복횟수]
+"""
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from legacy_syllabus_parser import parse_syllabus_html as legacy_parse
+from utils.syllabus_parser import parse_syllabus_html
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "syllabus"
+
+
+def bench(func, html: str, number: int) -> float:
+    """1회 평균 실행 시간 (ms)"""
+    return timeit.timeit(lambda: func(html), number=number) / number * 1000
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    candidates = [
+        ("legacy (html.parser)", legacy_parse),
+        ("indexed (html.parser)", lambda html: parse_syllabus_html(html, "html.parser")),
+    ]
+    try:
+        import lxml  # noqa: F401
+        candidates.append(("indexed (lxml)", lambda html: parse_syllabus_html(html, "lxml")))
+    except ImportError:
+        print("ℹ️ lxml이 설치되지 않아 lxml 백엔드는 건너뜁니다.\n")
+
+    print(f"{'fixture':<20}{'parser':<24}{'avg (ms)':>10}{'speedup':>10}")
+    print("-" * 64)
+    for path in sorted(FIXTURE_DIR.glob("syllabus_*.html")):
+        html = path.read_text(encoding="utf-8")
+        baseline = None
+        for name, func in candidates:
+            avg = bench(func, html, number)
+            baseline = baseline or avg
+            print(f"{path.stem:<20}{name:<24}{avg:>10.3f}{baseline / avg:>9.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
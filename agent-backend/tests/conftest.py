@@ -0,0 +1,15 @@
+"""
+agent-backend 테스트 공통 설정
+
+main.py와 동일하게 agent-backend 디렉토리를 sys.path에 추가하여
+routers, services, utils 등을 절대 경로로 import 할 수 있게 합니다.
+google_adk 패키지도 import 할 수 있도록 저장소 루트도 추가합니다.
+(config.py와 같은 방식, agent-backend/ 안에서 pytest를 실행해도 동작)
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, BACKEND_DIR)
+sys.path.append(os.path.dirname(BACKEND_DIR))
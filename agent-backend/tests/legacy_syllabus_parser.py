@@ -0,0 +1,204 @@
+"""
+기존 강의계획서 파서 (참조 구현)
+
+utils.syllabus_parser로 교체되기 전 routers/proxy/subject_proxy.py에 있던
+parse_syllabus_html을 그대로 보관합니다. 출력 동일성 테스트와 벤치마크의 기준입니다.
+"""
+import re
+from typing import Any, Dict
+
+from bs4 import BeautifulSoup
+
+
+def parse_syllabus_html(html: str) -> Dict[str, Any]:
+    """강의계획서 상세 HTML을 파싱하여 JSON(dict) 형태로 반환합니다."""
+    soup = BeautifulSoup(html, "html.parser")   
+    data = {}
+
+    # 메인 정보 테이블 파싱
+    main_tbody = soup.find("tbody")
+    if not main_tbody:
+        main_tbody = soup
+
+    def get_main_text(label):
+        """<th> 레이블로 <td> 텍스트를 찾는 헬퍼"""
+        th = main_tbody.find("th", string=lambda s: s and label in s.strip())
+        if not th:
+            return ""
+        
+        td = th.find_next_sibling("td")
+        if td:
+            for br in td.find_all("br"): 
+                br.replace_with("\n")
+            return td.get_text(strip=True)
+        
+        tr = th.find_parent("tr")
+        if not tr: 
+            return ""
+        
+        all_cells = tr.find_all(["th", "td"])
+        found_th = False
+        for cell in all_cells:
+            if cell == th:
+                found_th = True
+                continue
+            if found_th and cell.name == "td":
+                for br in cell.find_all("br"): 
+                    br.replace_with("\n")
+                return cell.get_text(strip=True)
+        return ""
+
+    # 기본 정보 추출
+    data["년도"] = get_main_text("년 도")
+    data["학기"] = get_main_text("학 기")
+    data["교과목명_한글"] = get_main_text("한글")
+    data["교과목명_영문"] = get_main_text("영문")
+    data["담당교수"] = get_main_text("담당교수")
+    data["학수번호_분반"] = get_main_text("학수번호-분반")
+    data["강의요일교시"] = get_main_text("강의요일교시")
+    data["학점_시간수"] = get_main_text("학점")
+    data["강의실"] = get_main_text("강의실")
+    data["핵심역량"] = get_main_text("핵심역량")
+    data["성적평가기준"] = get_main_text("성적평가기준")
+    data["연구실"] = get_main_text("연구실")
+    data["E-Mail"] = get_main_text("E-Mail")
+    data["휴대전화"] = get_main_text("휴대전화")
+    data["면담가능시간"] = get_main_text("면담가능시간")
+    data["연구일"] = get_main_text("연구일")
+    data["관리부서"] = get_main_text("관리부서")
+    data["선수과목"] = get_main_text("선수과목")
+    data["관련_기초과목"] = get_main_text("기초과목")
+    data["동시수강_관련과목"] = get_main_text("동시수강")
+    data["관련_고급과목"] = get_main_text("고급과목")
+    data["교과목_개요"] = get_main_text("교과목")
+    data["수업목표"] = get_main_text("수업목표")
+    data["교수학습_세부운영_방법"] = get_main_text("세부운영")
+    data["수업운영방식"] = get_main_text("수업운영방식")
+    data["주교재"] = get_main_text("주교재")
+    data["참고도서"] = get_main_text("참고도서")
+
+    # 체크박스 항목 파싱
+    def get_checked_labels(th_label_search):
+        """특정 <th> 하위 <td>에서 체크된 항목 텍스트 추출"""
+        th_label_search = th_label_search.replace("<br>", "\n").strip()
+        th = main_tbody.find("th", string=lambda s: s and th_label_search in s.strip())
+        if not th: 
+            return []
+        
+        td = th.find_next_sibling("td", {"class": "displayOn"})
+        if not td: 
+            td = th.find_next_sibling("td")
+        if not td: 
+            return []
+        
+        checked_labels = []
+        for checkbox in td.find_all("input", {"type": "checkbox", "checked": True}):
+            label_node = checkbox.next_sibling
+            label_text = ""
+            while label_node:
+                if isinstance(label_node, str):
+                    label_text = label_node.string.strip()
+                elif label_node.name:
+                    label_text = label_node.get_text(strip=True)
+                
+                if label_text:
+                    checked_labels.append(label_text)
+                    break
+                label_node = label_node.next_sibling
+        return checked_labels
+
+    data["이수구분_교양"] = get_checked_labels("교양")
+    data["이수구분_전공"] = get_checked_labels("전공")
+    data["이수구분_일반선택"] = get_checked_labels("일반선택")
+
+    # 학부(과)
+    td_dept = main_tbody.find("td", string=re.compile(r"학부\(과\) :"))
+    if td_dept:
+        data["학부(과)"] = td_dept.get_text(strip=True).split(":")[-1].strip()
+
+    # 강좌특성
+    th_feature = main_tbody.find("th", string=lambda s: s and "강좌특성" in s)
+    checked_features = []
+    if th_feature:
+        td_feature = th_feature.find_next_sibling("td", {"class": "displayOn"})
+        if not td_feature: 
+            td_feature = th_feature.find_next_sibling("td")
+        
+        if td_feature:
+            for checkbox in td_feature.find_all("input", {"type": "checkbox", "checked": True}):
+                label_node = checkbox.next_sibling
+                label_text = ""
+                while label_node:
+                    if isinstance(label_node, str):
+                        label_text = label_node.string.strip()
+                    elif label_node.name:
+                        label_text = label_node.get_text(strip=True)
+                    
+                    if label_text:
+                        checked_features.append(label_text)
+                        break
+                    label_node = label_node.next_sibling
+    data["강좌특성"] = checked_features
+
+    # 교수학습방법
+    learning_methods = {}
+    learning_methods["표준"] = get_checked_labels("표준 교과목운영 <br>기준")
+    learning_methods["자기주도식"] = get_checked_labels("학생 자기주도식<br>수업운영")
+    learning_methods["현장연계"] = get_checked_labels("현장 연계 방법")
+    data["교수학습방법"] = learning_methods
+    
+    # 장애학생 지원
+    data["장애학생_시험시간"] = get_checked_labels("시험시간<br>조정여부")
+    data["장애학생_지원사항"] = get_checked_labels("지원사항")
+
+    # 평가 방법
+    eval_data = {}
+    th_eval = main_tbody.find("th", string="평가방법")
+    if th_eval:
+        nested_table = th_eval.find_next("table")
+        if nested_table:
+            labels = []
+            values = []
+            
+            for th in nested_table.find_all("th"):
+                label = th.get_text(strip=True)
+                if "과제/퀴즈" in label: 
+                    desc_td = th.find_next_sibling("td")
+                    if desc_td:
+                        eval_data["세부사항"] = desc_td.get_text(strip=True)
+                    break
+                if label:
+                    labels.append(label)
+            
+            for td in nested_table.find_all("td"):
+                if "과제/퀴즈" in td.find_parent("tr").get_text(strip=True):
+                    continue
+                values.append(td.get_text(strip=True))
+            
+            eval_data["항목"] = dict(zip(labels, values[:len(labels)]))
+    data["평가방법"] = eval_data
+
+    # 주차별 강의 계획
+    weekly_plan = []
+    th_week_header = soup.find("th", string="주차")
+    if th_week_header:
+        table = th_week_header.find_parent("table")
+        if table:
+            tbody = table.find("tbody")
+            if tbody:
+                rows = tbody.find_all("tr")
+                for row in rows:
+                    cols = row.find_all("td")
+                    if len(cols) == 6: 
+                        week_data = {
+                            "주차": cols[0].get_text(strip=True),
+                            "학습주제": cols[1].get_text(strip=True),
+                            "수업방식/이용기재": cols[2].get_text(strip=True),
+                            "교수학습자료": cols[3].get_text(strip=True),
+                            "과제": cols[4].get_text(strip=True),
+                            "수업운영방식": cols[5].get_text(strip=True)
+                        }
+                        weekly_plan.append(week_data)
+    data["주차별강의계획"] = weekly_plan
+
+    return data
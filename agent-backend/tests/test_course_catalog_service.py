@@ -0,0 +1,74 @@
+"""
+로컬 과목 카탈로그 검색 테스트
+
+collect_subjects.py가 수집한 kangnam_all_2025_2.jsonl을 그대로 사용합니다.
+"""
+from pathlib import Path
+
+import pytest
+
+from services.course_catalog_service import (
+    CourseCatalog,
+    CourseCatalogService,
+    params_from_syllabus_url,
+)
+
+CATALOG_DIR = Path(__file__).resolve().parents[2] / "google_adk" / "data" / "과목정보"
+
+
+@pytest.fixture(scope="module")
+def catalog() -> CourseCatalog:
+    catalog = CourseCatalogService(CATALOG_DIR).get_catalog("2025", "2")
+    assert catalog is not None
+    return catalog
+
+
+def test_duplicate_rows_are_merged(catalog):
+    ids = [course.id for course in catalog.courses]
+    assert len(ids) == len(set(ids))
+
+    course = catalog.search(subject_code="ND01602")[0]
+    assert len(course.departments) > 1
+
+
+def test_substring_match_on_subject_name(catalog):
+    results = catalog.search("데이터")
+    assert results
+    assert all("데이터" in course.name.replace(" ", "") for course in results)
+
+
+def test_keyword_in_subject_code_format_is_exact_code_lookup(catalog):
+    results = catalog.search("ef01601")
+    assert results
+    assert {course.subject_code for course in results} == {"EF01601"}
+
+
+def test_filters(catalog):
+    results = catalog.search("", professor="배성근", grade=1)
+    assert results
+    assert all(course.professor == "배성근" and 1 in course.grades for course in results)
+
+    results = catalog.search("", department="소프트웨어전공", credit="3")
+    assert results
+    assert all(course.credit == "3" for course in results)
+
+
+def test_result_shape_matches_upstream_course_list(catalog):
+    course = catalog.search(subject_code="EF01601")[0].to_dict()
+    assert course["학수번호"] == "EF01601"
+    assert course["강의시간"] == "(주)목9ab"
+    assert course["params"].split(",")[1:] == ["2025", "2", "EF01601", course["분반"]]
+
+
+def test_missing_semester_returns_none(tmp_path):
+    assert CourseCatalogService(tmp_path).get_catalog("2030", "1") is None
+
+
+def test_params_from_syllabus_url():
+    url = (
+        "https://app.kangnam.ac.kr/knumis/sbr/syllabus2020.jsp?schl_year=2025&schl_smst=2"
+        "&subj_numb=EF01601&lctr_clas=01&empl_numb=107962"
+        "&repo_path=../sbr/sbr3070_New.mrd&winopt=1010"
+    )
+    assert params_from_syllabus_url(url) == "107962,2025,2,EF01601,01"
+    assert params_from_syllabus_url("") == ""
@@ -0,0 +1,71 @@
+"""
+입력 살균기 테스트
+
+단일 패스 스캐너가 일반 입력에서 기존 살균기(legacy_input_sanitizer)와 같은 결과를 내는지,
+정규식 전에 길이 상한을 적용하는지, 되돌아가기를 유발하는 입력에서도 선형 시간인지 검증합니다.
+"""
+import time
+
+import pytest
+
+from legacy_input_sanitizer import LegacyInputSanitizer
+from utils.input_sanitizer import InputSanitizer, sanitize_message, scan_patterns
+
+SAMPLES = [
+    "2024학년도 소프트웨어학부 졸업요건 알려줘",
+    "<script>alert(1)</script>샬롬관 어디야?",
+    "<SCRIPT src=x>a</Script>b",
+    "<script>\nalert(1)</script>",
+    "<iframe src=x></iframe>교수님",
+    "<embed src=x> <meta charset=utf-8> <link rel=x>",
+    "button onclick = alert(1)",
+    "ononclick=x",
+    "decision = 1",
+    "javascript:alert(1) vbscript:msgbox data:text/html,<b>",
+    "1 OR 1=1",
+    "'; DROP TABLE users ",
+    "a -- b /* c */ UNION  SELECT exec (x)",
+]
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_same_output_as_legacy(text):
+    expected = LegacyInputSanitizer.sanitize_text(text, max_length=None)
+    assert InputSanitizer.sanitize_text(text) == expected
+
+
+def test_detects_sql_patterns_without_removing():
+    text = "1 OR 1=1 -- '; DROP TABLE x /* c */ UNION SELECT exec("
+    cleaned, dangerous, sql = scan_patterns(text)
+    assert cleaned == text and dangerous == []
+    assert sql == ["block_comment", "command", "comment", "exec", "or_and", "union"]
+
+    # '='/'*/'가 다음 줄에 있으면 같은 줄 기준이라 탐지하지 않음
+    assert scan_patterns("a or b\n= c")[2] == []
+    assert scan_patterns("/* d\n */")[2] == []
+
+
+def test_size_cap_applies_before_scanning():
+    text = "가" * (InputSanitizer.MAX_MESSAGE_LENGTH - 2) + "<script>x</script>"
+    # 상한에서 잘려 닫는 태그가 사라지므로 스크립트 블록으로 보지 않고 이스케이프만 됨
+    assert sanitize_message(text).endswith("&lt;s")
+    assert len(sanitize_message("a" * 100_000)) == InputSanitizer.MAX_MESSAGE_LENGTH
+    assert len(InputSanitizer.sanitize_user_info("a" * 1000)) == InputSanitizer.MAX_FIELD_LENGTH
+
+
+@pytest.mark.parametrize("make", [
+    lambda n: "<script>" * (n // 8),
+    lambda n: " or" * (n // 3),
+    lambda n: "on" * (n // 2),
+    lambda n: "<embed" * (n // 6),
+])
+def test_adversarial_input_is_linear(make):
+    def seconds(length):
+        text = make(length)
+        start = time.perf_counter()
+        scan_patterns(text)
+        return time.perf_counter() - start
+
+    small, large = seconds(20_000), seconds(160_000)
+    # 8배 길이에서 O(n²)이면 ~64배, 선형이면 ~8배 (측정 잡음 감안해 넉넉히)
+    assert large < max(small, 1e-3) * 24
@@ -0,0 +1,84 @@
+"""
+강의계획서 일괄 수집 테스트
+
+임시 학기 카탈로그 + httpx.MockTransport 강의계획서 서버로 수집한 뒤,
+year/semester 파티션 Parquet 데이터셋의 중첩 열, 실패 보고, 파티션 교체를 검증합니다.
+"""
+import asyncio
+import json
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+
+from services.course_catalog_service import CourseCatalogService
+from services.syllabus_harvester import SYLLABUS_SCHEMA, SyllabusHarvester, read_dataset
+from services.syllabus_service import SyllabusService, build_syllabus_url
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "syllabus"
+HTML_2020 = (FIXTURE_DIR / "syllabus_2020.html").read_text(encoding="utf-8").encode("euc-kr")
+
+
+def write_catalog(catalog_dir: Path, year: str, semester: str, subjects):
+    lines = []
+    for subject in subjects:
+        params = f"100063,{year},{semester},{subject},01"
+        lines.append(json.dumps({
+            "id": f"{subject}-01",
+            "content": "강의시간: (주)화3ab",
+            "metadata": {
+                "subject_name": f"과목 {subject}",
+                "department": "소프트웨어전공 (ICT융합공학부)",
+                "grade": 3,
+                "professor": "김태권",
+                "credit": "3",
+                "syllabus_url": build_syllabus_url(params),
+            },
+        }, ensure_ascii=False))
+    path = catalog_dir / f"kangnam_all_{year}_{semester}.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def harvester(tmp_path: Path, fail_subjects=()):
+    async def upstream(request: httpx.Request) -> httpx.Response:
+        subject = parse_qs(request.url.query.decode())["subj_numb"][0]
+        if subject in fail_subjects:
+            return httpx.Response(500)
+        return httpx.Response(200, content=HTML_2020)
+
+    service = SyllabusService(cache_ttl_seconds=0, transport=httpx.MockTransport(upstream))
+    return SyllabusHarvester(CourseCatalogService(tmp_path), service, tmp_path / "dataset")
+
+
+def test_harvest_writes_partitioned_dataset(tmp_path):
+    write_catalog(tmp_path, "2025", "2", ["CS31002", "CS31003", "CS31004"])
+    summary = asyncio.run(harvester(tmp_path, fail_subjects={"CS31004"}).harvest("2025", "2"))
+
+    assert summary["harvested"] == 2 and list(summary["failures"]) == ["CS31004-01"]
+    assert (tmp_path / "dataset" / "year=2025" / "semester=2").is_dir()
+
+    table = read_dataset(tmp_path / "dataset", 2025, 2)
+    assert table.schema.equals(SYLLABUS_SCHEMA)
+    rows = {row["id"]: row for row in table.to_pylist()}
+    assert set(rows) == {"CS31002-01", "CS31003-01"}
+
+    row = rows["CS31002-01"]
+    assert row["선수과목"] == "자료구조, 객체지향프로그래밍"
+    assert dict(row["평가방법_항목"])["중간고사"] == "30%"
+    assert row["주차별강의계획"][0]["학습주제"] == "오리엔테이션 및 소프트웨어공학 개요"
+    assert row["교수학습방법"]["표준"] == ["이론중심", "이론+실습"]
+    assert (row["year"], row["semester"]) == (2025, 2)
+
+
+def test_reharvest_replaces_only_that_partition(tmp_path):
+    write_catalog(tmp_path, "2025", "1", ["CS10001"])
+    write_catalog(tmp_path, "2025", "2", ["CS31002", "CS31003"])
+    asyncio.run(harvester(tmp_path).harvest("2025", "1"))
+    asyncio.run(harvester(tmp_path).harvest("2025", "2"))
+
+    write_catalog(tmp_path, "2025", "2", ["CS31002"])
+    asyncio.run(harvester(tmp_path).harvest("2025", "2"))
+
+    assert read_dataset(tmp_path / "dataset", 2025, 2).column("id").to_pylist() == ["CS31002-01"]
+    assert read_dataset(tmp_path / "dataset", 2025, 1).num_rows == 1
+    assert read_dataset(tmp_path / "dataset").num_rows == 2
@@ -0,0 +1,63 @@
+"""
+강의계획서 파서 테스트
+
+utils.syllabus_parser가 기존 파서(legacy_syllabus_parser)와 동일한 결과를 내는지
+2014 / 2017 / 2020 템플릿 fixture로 검증합니다.
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from legacy_syllabus_parser import parse_syllabus_html as legacy_parse
+from utils.syllabus_parser import parse_syllabus_html, parse_syllabus_html_async
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "syllabus"
+FIXTURES = sorted(FIXTURE_DIR.glob("syllabus_*.html"))
+
+
+def load(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def test_fixtures_exist():
+    assert [p.name for p in FIXTURES] == [
+        "syllabus_2014.html",
+        "syllabus_2017.html",
+        "syllabus_2020.html",
+    ]
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.stem)
+def test_matches_legacy_parser(path):
+    html = load(path)
+    assert parse_syllabus_html(html) == legacy_parse(html)
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.stem)
+def test_matches_legacy_parser_with_lxml(path):
+    pytest.importorskip("lxml")
+    html = load(path)
+    assert parse_syllabus_html(html, features="lxml") == legacy_parse(html)
+
+
+def test_parses_2020_template_fields():
+    data = parse_syllabus_html(load(FIXTURE_DIR / "syllabus_2020.html"))
+
+    assert data["교과목명_한글"] == "소프트웨어공학"
+    assert data["학수번호_분반"] == "CS31002-01"
+    assert data["학부(과)"] == "ICT융합공학부 소프트웨어전공"
+    assert data["이수구분_전공"] == ["전공선택"]
+    assert data["강좌특성"] == ["PBL", "플립러닝"]
+    assert data["평가방법"]["항목"]["중간고사"] == "30%"
+    assert data["평가방법"]["세부사항"] == "주차별 설계 산출물 제출 및 퀴즈 2회"
+    assert len(data["주차별강의계획"]) == 15
+
+
+def test_empty_document():
+    assert parse_syllabus_html("") == legacy_parse("")
+
+
+def test_async_parse_runs_in_worker_pool():
+    html = load(FIXTURE_DIR / "syllabus_2017.html")
+    assert asyncio.run(parse_syllabus_html_async(html)) == legacy_parse(html)
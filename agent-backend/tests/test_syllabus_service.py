@@ -0,0 +1,97 @@
+"""
+강의계획서 일괄 조회 테스트
+
+httpx.MockTransport로 원격 시스템을 대신하여 동시성 제한, 입력 순서 유지,
+항목별 오류 보고, 캐시 재사용을 검증합니다.
+"""
+import asyncio
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from services.syllabus_service import SyllabusService, build_syllabus_url
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "syllabus"
+HTML_2020 = (FIXTURE_DIR / "syllabus_2020.html").read_text(encoding="utf-8").encode("euc-kr")
+
+
+class FakeUpstream:
+    """요청 수와 최대 동시 요청 수를 기록하는 가짜 강의계획서 서버"""
+
+    def __init__(self, fail_subjects=()):
+        self.fail_subjects = set(fail_subjects)
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            subject = parse_qs(request.url.query.decode())["subj_numb"][0]
+            if subject in self.fail_subjects:
+                return httpx.Response(500)
+            return httpx.Response(200, content=HTML_2020)
+        finally:
+            self.in_flight -= 1
+
+
+def make_params(i: int, year: int = 2025) -> str:
+    return f"E{i:04d},{year},2,CS{i:05d},01"
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_build_syllabus_url_by_year():
+    assert "syllabus2020.jsp" in build_syllabus_url("E1,2025,2,CS1,01")
+    assert "syllabus2017.jsp" in build_syllabus_url("E1,2018,1,CS1,01")
+    assert "syllabus.jsp" in build_syllabus_url("E1,2015,1,CS1,01")
+    with pytest.raises(ValueError):
+        build_syllabus_url("E1,2025")
+
+
+def test_batch_respects_host_concurrency_and_order():
+    upstream = FakeUpstream()
+    service = SyllabusService(max_concurrency_per_host=3, transport=httpx.MockTransport(upstream))
+    params = [make_params(i) for i in range(10)]
+
+    results = run(service.get_syllabi(params))
+
+    assert [r["params"] for r in results] == params
+    assert all(r["status"] == "success" for r in results)
+    assert results[0]["syllabus"]["교과목명_한글"]
+    assert len(upstream.requests) == 10
+    assert upstream.max_in_flight <= 3
+
+
+def test_batch_reports_per_item_errors():
+    upstream = FakeUpstream(fail_subjects={"CS00001"})
+    service = SyllabusService(transport=httpx.MockTransport(upstream))
+    params = [make_params(0), make_params(1), "broken", make_params(2)]
+
+    results = run(service.get_syllabi(params))
+
+    assert [r["status"] for r in results] == ["success", "error", "error", "success"]
+    assert "500" in results[1]["error"]
+    assert "params" in results[2]["error"]
+
+
+def test_batch_fetches_only_cache_misses():
+    upstream = FakeUpstream()
+    service = SyllabusService(transport=httpx.MockTransport(upstream))
+
+    async def scenario():
+        await service.get_syllabus(make_params(0))
+        return await service.get_syllabi([make_params(0), make_params(1), make_params(1)])
+
+    results = run(scenario())
+
+    assert len(upstream.requests) == 2
+    assert [r["cached"] for r in results] == [True, False, False]
+    assert results[1]["syllabus"] == results[2]["syllabus"]
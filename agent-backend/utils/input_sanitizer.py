@@ -1,12 +1,156 @@
-"""
+r"""
 입력 살균(Input Sanitization) 유틸리티
 
 XSS, SQL Injection, Script Injection 등 다양한 공격으로부터 입력을 보호합니다.
 모든 서비스 레이어에서 사용자 입력을 받을 때 최우선으로 적용되어야 합니다.
+
+패턴 17개를 하나씩 re.search/re.sub 하던 방식은 `(\bOR\b|\bAND\b).*=.*`,
+`<script[^>]*>.*?</script>`, `on\w+\s*=` 같은 패턴이 긴 입력에서 시작 위치마다
+끝까지 다시 훑어 O(n²)이 됐습니다. 지금은
+1. 정규식 전에 길이 상한(config.SANITIZER_MAX_*)으로 자르고
+2. 고정 길이 트리거만 담은 하나의 교대(alternation) 정규식으로 한 번 훑은 뒤
+3. 닫는 태그/'>'/'='/줄바꿈처럼 트리거 뒤에 필요한 부분은 앞으로만 움직이는
+   탐색 캐시(_ForwardFinder)로 찾아 입력 길이에 선형인 시간을 보장합니다.
 """
 import re
 import html
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+import config
+
+# 위험 패턴(제거) + SQL Injection 의심 패턴(경고만) 트리거
+# 각 분기는 고정 문자열이거나 소유 수량자(*+, ++)라 되돌아가지 않습니다.
+#   script/iframe/object/applet: <tag[^>]*>.*?</tag> (본문은 같은 줄 안)
+#   embed/meta/link: <tag[^>]*>
+#   handler: on\w+\s*= ("on"만 소비, 단어 끝과 '='는 단어별로 한 번만 확인)
+#   or_and: (\bOR\b|\bAND\b).*=.* (같은 줄 뒤쪽에 '=')
+#   block_comment: /\*.*\*/ (같은 줄 뒤쪽에 '*/')
+_TRIGGER = re.compile(
+    # 첫 글자 집합을 앞에 두면 정규식 엔진이 트리거가 될 수 없는 위치를 빠르게 건너뜀
+    r"(?=[<'/\-aAdDeEjJoOuUvV])(?:"
+    r"<(?P<paired>script|iframe|object|applet)"
+    r"|<(?P<tag>embed|meta|link)"
+    r"|(?P<protocol>javascript:|vbscript:|data:text/html)"
+    r"|(?P<union>union\s++select)"
+    r"|(?P<exec>exec\s*+\()"
+    r"|(?P<handler>on(?=\w))"
+    r"|(?P<or_and>\b(?:or|and)\b)"
+    r"|(?P<command>';?\s*+(?:drop|delete|insert|update|select)\s)"
+    r"|(?P<comment>--)"
+    r"|(?P<block_comment>/\*)"
+    r")",
+    re.IGNORECASE,
+)
+_ASSIGNMENT = re.compile(r"\s*+=")
+_NON_WORD = re.compile(r"\W")
+_CLOSING_TAGS = {
+    name: re.compile(f"</{name}>", re.IGNORECASE)
+    for name in ("script", "iframe", "object", "applet")
+}
+_SQL_KINDS = ("union", "exec", "or_and", "command", "comment", "block_comment")
+
+_UUID_PATTERN = re.compile(r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$')
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+class _ForwardFinder:
+    """
+    "pos 이후 첫 위치" 탐색 캐시
+
+    직전 결과가 pos 이후면 그대로 재사용하므로, 같은 대상을 여러 트리거에서 찾아도
+    텍스트를 대상별로 최대 한 번만 훑습니다. (없음(-1)도 캐시)
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._cache: Dict[str, Tuple[int, int]] = {}
+
+    def find(self, key: str, pos: int, pattern: Optional[re.Pattern] = None) -> int:
+        cached = self._cache.get(key)
+        if cached and cached[0] <= pos and (cached[1] == -1 or cached[1] >= pos):
+            return cached[1]
+        if pattern is None:
+            found = self.text.find(key, pos)
+        else:
+            match = pattern.search(self.text, pos)
+            found = match.start() if match else -1
+        self._cache[key] = (pos, found)
+        return found
+
+    def same_line(self, key: str, pos: int, pattern: Optional[re.Pattern] = None) -> int:
+        """pos 이후 줄바꿈 전에 있는 첫 위치 (정규식 `.`이 줄바꿈을 넘지 않는 것과 같은 기준)"""
+        found = self.find(key, pos, pattern)
+        newline = self.find("\n", pos)
+        return -1 if found == -1 or (newline != -1 and newline < found) else found
+
+
+def scan_patterns(text: str) -> Tuple[str, List[str], List[str]]:
+    """
+    위험 패턴 제거 + SQL Injection 의심 패턴 탐지 (단일 패스, 선형 시간)
+
+    Returns:
+        (위험 패턴을 지운 텍스트, 탐지된 위험 패턴 종류, 탐지된 SQL 패턴 종류)
+    """
+    finder = _ForwardFinder(text)
+    assignments: Dict[int, int] = {}   # 단어 끝 → '=' 다음 위치 (없으면 -1)
+    removed: List[Tuple[int, int]] = []
+    removed_until = 0
+    dangerous: Set[str] = set()
+    sql: Set[str] = set()
+
+    for match in _TRIGGER.finditer(text):
+        kind = match.lastgroup
+        start, end = match.span()
+        if start < removed_until:
+            continue    # 이미 지울 구간 안
+
+        if kind in _SQL_KINDS:
+            if kind in sql:
+                continue
+            if kind == "or_and" and finder.same_line("=", end) == -1:
+                continue
+            if kind == "block_comment" and finder.same_line("*/", end) == -1:
+                continue
+            sql.add(kind)
+            continue
+
+        if kind == "paired":
+            name = match.group("paired").lower()
+            gt = finder.find(">", end)
+            if gt == -1:
+                continue
+            close = finder.same_line(f"</{name}>", gt + 1, _CLOSING_TAGS[name])
+            if close == -1:
+                continue
+            end = close + len(name) + 3
+        elif kind == "tag":
+            gt = finder.find(">", end)
+            if gt == -1:
+                continue
+            end = gt + 1
+        elif kind == "handler":
+            word_end = finder.find("\\W", end, _NON_WORD)
+            if word_end == -1:
+                continue    # 텍스트 끝까지 단어 ('=' 없음)
+            if word_end not in assignments:
+                assignment = _ASSIGNMENT.match(text, word_end)
+                assignments[word_end] = assignment.end() if assignment else -1
+            if assignments[word_end] == -1:
+                continue
+            end = assignments[word_end]
+
+        dangerous.add(kind)
+        removed.append((start, end))
+        removed_until = end
+
+    if removed:
+        parts, last = [], 0
+        for start, end in removed:
+            parts.append(text[last:start])
+            last = end
+        parts.append(text[last:])
+        text = "".join(parts)
+    return text, sorted(dangerous), sorted(sql)
 
 
 class InputSanitizer:
@@ -14,37 +158,15 @@ class InputSanitizer:
     입력 살균 클래스
     
     다층 방어 전략:
-    1. HTML/Script 태그 제거 및 이스케이핑
-    2. 위험한 문자 패턴 제거
-    3. 최대 길이 제한
-    4. SQL Injection 패턴 탐지
+    1. 최대 길이 제한 (정규식보다 먼저)
+    2. 위험한 HTML/Script 패턴 제거 + SQL Injection 패턴 탐지 (단일 패스)
+    3. HTML 이스케이핑
     """
-    
-    # 위험한 HTML/Script 패턴
-    DANGEROUS_PATTERNS = [
-        r'<script[^>]*>.*?</script>',  # <script> 태그
-        r'<iframe[^>]*>.*?</iframe>',  # <iframe> 태그
-        r'javascript:',                 # javascript: 프로토콜
-        r'on\w+\s*=',                  # onclick, onload 등
-        r'<object[^>]*>.*?</object>',  # <object> 태그
-        r'<embed[^>]*>',               # <embed> 태그
-        r'<applet[^>]*>.*?</applet>',  # <applet> 태그
-        r'<meta[^>]*>',                # <meta> 태그
-        r'<link[^>]*>',                # <link> 태그
-        r'vbscript:',                  # vbscript: 프로토콜
-        r'data:text/html',             # data URI
-    ]
-    
-    # SQL Injection 의심 패턴 (경고용)
-    SQL_INJECTION_PATTERNS = [
-        r"(\bOR\b|\bAND\b).*=.*",      # OR 1=1, AND 1=1
-        r"';?\s*(DROP|DELETE|INSERT|UPDATE|SELECT)\s",  # SQL 명령어
-        r"--",                         # SQL 주석
-        r"/\*.*\*/",                   # 블록 주석
-        r"UNION\s+SELECT",             # UNION SELECT
-        r"exec\s*\(",                  # exec(
-    ]
-    
+
+    # 길이 상한 (환경 변수로 조정)
+    MAX_MESSAGE_LENGTH = config.SANITIZER_MAX_MESSAGE_LENGTH
+    MAX_FIELD_LENGTH = config.SANITIZER_MAX_FIELD_LENGTH
+
     @classmethod
     def sanitize_text(
         cls,
@@ -58,37 +180,31 @@ class InputSanitizer:
         
         Args:
             text: 살균할 텍스트
-            max_length: 최대 길이 (None이면 제한 없음, 기본값: 제한 없음)
+            max_length: 최대 길이 (None이면 MAX_MESSAGE_LENGTH)
             strip_html: HTML 태그 제거 여부
             allow_newlines: 줄바꿈 허용 여부
             
         Returns:
             살균된 텍스트
-            
-        Raises:
-            ValueError: 위험한 패턴이 감지된 경우
         """
         if not text or not isinstance(text, str):
             return ""
         
         original_text = text
         
-        # 1. 최대 길이 제한
-        if max_length and len(text) > max_length:
+        # 1. 최대 길이 제한 (어떤 정규식보다도 먼저)
+        max_length = max_length or cls.MAX_MESSAGE_LENGTH
+        if len(text) > max_length:
             text = text[:max_length]
             print(f"[Sanitizer] Text truncated: {len(original_text)} -> {max_length}")
         
-        # 2. 위험한 패턴 탐지 및 제거
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                print(f"[Sanitizer] ⚠️ Dangerous pattern detected: {pattern}")
-                text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # 3. SQL Injection 패턴 탐지 (경고만, 제거하지 않음 - 오탐 가능성)
-        for pattern in cls.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                print(f"[Sanitizer] ⚠️ Possible SQL injection pattern detected: {pattern}")
-                # SQL Injection은 ORM(SQLAlchemy)이 방어하므로 경고만 출력
+        # 2. 위험한 패턴 제거 + 3. SQL Injection 패턴 탐지 (경고만, 제거하지 않음 - 오탐 가능성)
+        text, dangerous, sql = scan_patterns(text)
+        for kind in dangerous:
+            print(f"[Sanitizer] ⚠️ Dangerous pattern detected: {kind}")
+        for kind in sql:
+            # SQL Injection은 ORM(SQLAlchemy)이 방어하므로 경고만 출력
+            print(f"[Sanitizer] ⚠️ Possible SQL injection pattern detected: {kind}")
         
         # 4. HTML 이스케이핑 (선택적)
         if strip_html:
@@ -123,7 +239,7 @@ class InputSanitizer:
         """
         return cls.sanitize_text(
             message,
-            max_length=None,       # 길이 제한 없음
+            max_length=cls.MAX_MESSAGE_LENGTH,
             strip_html=True,       # HTML 태그 제거
             allow_newlines=True    # 줄바꿈 허용
         )
@@ -141,7 +257,7 @@ class InputSanitizer:
         """
         return cls.sanitize_text(
             title,
-            max_length=None,       # 길이 제한 없음
+            max_length=cls.MAX_FIELD_LENGTH,
             strip_html=True,       # HTML 태그 제거
             allow_newlines=False   # 줄바꿈 불허용
         )
@@ -159,7 +275,7 @@ class InputSanitizer:
         """
         return cls.sanitize_text(
             info,
-            max_length=None,       # 길이 제한 없음
+            max_length=cls.MAX_FIELD_LENGTH,
             strip_html=True,       # HTML 태그 제거
             allow_newlines=False   # 줄바꿈 불허용
         )
@@ -175,8 +291,7 @@ class InputSanitizer:
         Returns:
             유효하면 True
         """
-        uuid_pattern = r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$'
-        return bool(re.match(uuid_pattern, uuid_str.lower()))
+        return bool(_UUID_PATTERN.match(uuid_str.lower()))
     
     @classmethod
     def validate_email(cls, email: str) -> bool:
@@ -189,8 +304,7 @@ class InputSanitizer:
         Returns:
             유효하면 True
         """
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, email))
+        return bool(_EMAIL_PATTERN.match(email))
 
 
 # 편의 함수들
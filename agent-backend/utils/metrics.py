@@ -0,0 +1,88 @@
+"""
+프로세스 내 카운터 메트릭
+
+외부 모니터링 없이 서비스 레이어에서 이벤트 수를 세고 /metrics로 조회합니다.
+(Cloud Run 인스턴스별 값이며 재시작 시 초기화됩니다)
+"""
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# 공개 /metrics 응답에서 빼는 라벨 (차단 키워드 목록이 그대로 노출되지 않도록)
+SENSITIVE_LABELS = frozenset({"keyword"})
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Metrics:
+    """
+    이름 + 라벨별 카운터 (스레드 안전)
+
+    예:
+        metrics.increment("chat_preflight_blocked_total", keyword="jailbreak")
+        metrics.get("chat_preflight_blocked_total", keyword="jailbreak")  # 1
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[LabelKey, int]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1, **labels) -> None:
+        """카운터 증가"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def get(self, name: str, **labels) -> int:
+        """라벨이 정확히 같은 카운터 값 (없으면 0)"""
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0)
+
+    def total(self, name: str) -> int:
+        """라벨과 관계없이 합친 값"""
+        with self._lock:
+            return sum(self._counters.get(name, {}).values())
+
+    def snapshot(self, exclude_labels: Iterable[str] = ()) -> Dict[str, Dict[str, int]]:
+        """
+        JSON 응답용 사본
+
+        Args:
+            exclude_labels: 뺄 라벨 (그 라벨만 다른 카운터는 합산)
+
+        Returns:
+            {메트릭 이름: {"라벨=값,...": 카운트}} (라벨이 없으면 키는 "")
+        """
+        excluded = set(exclude_labels)
+        result: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for name, series in self._counters.items():
+                counts = result.setdefault(name, {})
+                for key, count in series.items():
+                    label = ",".join(f"{label}={value}" for label, value in key if label not in excluded)
+                    counts[label] = counts.get(label, 0) + count
+        return result
+
+    def reset(self) -> None:
+        """모든 카운터 초기화 (테스트용)"""
+        with self._lock:
+            self._counters.clear()
+
+
+# 프로세스 공용 싱글톤
+_metrics_instance: Optional[Metrics] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> Metrics:
+    """Metrics 싱글톤 인스턴스 반환"""
+    global _metrics_instance
+    if _metrics_instance is None:
+        with _metrics_lock:
+            if _metrics_instance is None:
+                _metrics_instance = Metrics()
+    return _metrics_instance
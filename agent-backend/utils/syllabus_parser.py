@@ -0,0 +1,310 @@
+"""
+강의계획서(syllabus) HTML 파서
+
+문서를 한 번만 순회하여 <th> 레이블 → 셀 인덱스를 만든 뒤,
+각 항목은 인덱스에서 바로 조회합니다. (레이블마다 트리 전체를 다시 탐색하지 않음)
+
+- 파서 백엔드: 기본 html.parser, lxml이 설치되어 있으면 선택적으로 사용 가능
+- 비동기 엔드포인트에서는 parse_syllabus_html_async()로 워커 풀에서 파싱
+"""
+import asyncio
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+# 파서 백엔드 ("html.parser" 또는 "lxml")
+DEFAULT_FEATURES = os.getenv("SYLLABUS_HTML_PARSER", "html.parser")
+
+# 파싱 워커 풀 크기
+PARSER_WORKERS = int(os.getenv("SYLLABUS_PARSER_WORKERS", "2"))
+
+_DEPT_PATTERN = re.compile(r"학부\(과\) :")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _resolve_features(features: Optional[str]) -> str:
+    """요청된 파서 백엔드를 확인하고, 사용할 수 없으면 html.parser로 대체"""
+    features = features or DEFAULT_FEATURES
+    if features == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            print("[SyllabusParser] ⚠️ lxml이 설치되지 않아 html.parser로 대체합니다.")
+            return "html.parser"
+    return features
+
+
+def _subtree_end(node: Tag):
+    """node 하위 트리 다음에 오는 첫 노드 (순회 범위 판정용)"""
+    while node is not None and node.next_sibling is None:
+        node = node.parent
+    return node.next_sibling if node is not None else None
+
+
+def _cell_text(cell: Tag) -> str:
+    for br in cell.find_all("br"):
+        br.replace_with("\n")
+    return cell.get_text(strip=True)
+
+
+def _checked_labels(td: Tag) -> List[str]:
+    """<td> 안에서 체크된 체크박스 바로 뒤의 레이블 텍스트 추출"""
+    checked_labels = []
+    for checkbox in td.find_all("input", {"type": "checkbox", "checked": True}):
+        label_node = checkbox.next_sibling
+        label_text = ""
+        while label_node:
+            if isinstance(label_node, str):
+                label_text = label_node.string.strip()
+            elif label_node.name:
+                label_text = label_node.get_text(strip=True)
+
+            if label_text:
+                checked_labels.append(label_text)
+                break
+            label_node = label_node.next_sibling
+    return checked_labels
+
+
+class SyllabusIndex:
+    """
+    강의계획서 문서의 셀 인덱스
+
+    한 번의 순회로 다음을 수집합니다.
+    - 메인 테이블(첫 번째 <tbody>)의 <th>/<td> 중 단일 문자열을 가진 셀 (문서 순서)
+    - 문서 전체에서 첫 번째 "주차" 헤더
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        main_tbody = soup.find("tbody")
+        self.main_tbody = main_tbody or soup
+
+        self.main_th: List[Tuple[str, Tag]] = []
+        self.main_td: List[Tuple[str, Tag]] = []
+        self.week_header: Optional[Tag] = None
+        self._th_cache: Dict[str, Optional[Tag]] = {}
+
+        in_main = main_tbody is None
+        main_end = _subtree_end(main_tbody) if main_tbody is not None else None
+
+        for node in soup.descendants:
+            if node is main_tbody:
+                in_main = True
+            elif main_end is not None and node is main_end:
+                in_main = False
+
+            if not isinstance(node, Tag) or node.name not in ("th", "td"):
+                continue
+
+            text = node.string
+            if text is None:
+                continue
+
+            if node.name == "th":
+                if in_main:
+                    self.main_th.append((text, node))
+                if self.week_header is None and text == "주차":
+                    self.week_header = node
+            elif in_main:
+                self.main_td.append((text, node))
+
+    def find_th(self, label: str) -> Optional[Tag]:
+        """레이블을 포함하는 첫 번째 <th> (앞뒤 공백 무시)"""
+        if label not in self._th_cache:
+            self._th_cache[label] = next(
+                (th for text, th in self.main_th if label in text.strip()), None
+            )
+        return self._th_cache[label]
+
+    def find_th_exact(self, label: str) -> Optional[Tag]:
+        return next((th for text, th in self.main_th if text == label), None)
+
+    def find_td(self, pattern: re.Pattern) -> Optional[Tag]:
+        return next((td for text, td in self.main_td if pattern.search(text)), None)
+
+    def main_text(self, label: str) -> str:
+        """<th> 레이블로 <td> 텍스트 조회"""
+        th = self.find_th(label)
+        if not th:
+            return ""
+
+        td = th.find_next_sibling("td")
+        if td:
+            return _cell_text(td)
+
+        tr = th.find_parent("tr")
+        if not tr:
+            return ""
+
+        found_th = False
+        for cell in tr.find_all(["th", "td"]):
+            if cell is th:
+                found_th = True
+                continue
+            if found_th and cell.name == "td":
+                return _cell_text(cell)
+        return ""
+
+    def checked_labels(self, label: str) -> List[str]:
+        """<th> 레이블 옆 <td>에서 체크된 항목 조회"""
+        th = self.find_th(label.replace("<br>", "\n").strip())
+        if not th:
+            return []
+
+        td = th.find_next_sibling("td", {"class": "displayOn"})
+        if not td:
+            td = th.find_next_sibling("td")
+        if not td:
+            return []
+        return _checked_labels(td)
+
+
+def _parse_evaluation(index: SyllabusIndex) -> Dict[str, Any]:
+    eval_data = {}
+    th_eval = index.find_th_exact("평가방법")
+    if not th_eval:
+        return eval_data
+
+    nested_table = th_eval.find_next("table")
+    if not nested_table:
+        return eval_data
+
+    labels = []
+    values = []
+    for th in nested_table.find_all("th"):
+        label = th.get_text(strip=True)
+        if "과제/퀴즈" in label:
+            desc_td = th.find_next_sibling("td")
+            if desc_td:
+                eval_data["세부사항"] = desc_td.get_text(strip=True)
+            break
+        if label:
+            labels.append(label)
+
+    for td in nested_table.find_all("td"):
+        if "과제/퀴즈" in td.find_parent("tr").get_text(strip=True):
+            continue
+        values.append(td.get_text(strip=True))
+
+    eval_data["항목"] = dict(zip(labels, values[:len(labels)]))
+    return eval_data
+
+
+def _parse_weekly_plan(index: SyllabusIndex) -> List[Dict[str, str]]:
+    weekly_plan = []
+    if not index.week_header:
+        return weekly_plan
+
+    table = index.week_header.find_parent("table")
+    tbody = table.find("tbody") if table else None
+    if not tbody:
+        return weekly_plan
+
+    for row in tbody.find_all("tr"):
+        cols = row.find_all("td")
+        if len(cols) == 6:
+            weekly_plan.append({
+                "주차": cols[0].get_text(strip=True),
+                "학습주제": cols[1].get_text(strip=True),
+                "수업방식/이용기재": cols[2].get_text(strip=True),
+                "교수학습자료": cols[3].get_text(strip=True),
+                "과제": cols[4].get_text(strip=True),
+                "수업운영방식": cols[5].get_text(strip=True)
+            })
+    return weekly_plan
+
+
+def parse_syllabus_html(html: str, features: Optional[str] = None) -> Dict[str, Any]:
+    """
+    강의계획서 상세 HTML을 파싱하여 JSON(dict) 형태로 반환합니다.
+
+    Args:
+        html: 강의계획서 HTML (syllabus.jsp / syllabus2017.jsp / syllabus2020.jsp)
+        features: BeautifulSoup 파서 백엔드 (기본값: SYLLABUS_HTML_PARSER 환경 변수)
+    """
+    soup = BeautifulSoup(html, _resolve_features(features))
+    index = SyllabusIndex(soup)
+    data = {}
+
+    # 기본 정보 추출
+    data["년도"] = index.main_text("년 도")
+    data["학기"] = index.main_text("학 기")
+    data["교과목명_한글"] = index.main_text("한글")
+    data["교과목명_영문"] = index.main_text("영문")
+    data["담당교수"] = index.main_text("담당교수")
+    data["학수번호_분반"] = index.main_text("학수번호-분반")
+    data["강의요일교시"] = index.main_text("강의요일교시")
+    data["학점_시간수"] = index.main_text("학점")
+    data["강의실"] = index.main_text("강의실")
+    data["핵심역량"] = index.main_text("핵심역량")
+    data["성적평가기준"] = index.main_text("성적평가기준")
+    data["연구실"] = index.main_text("연구실")
+    data["E-Mail"] = index.main_text("E-Mail")
+    data["휴대전화"] = index.main_text("휴대전화")
+    data["면담가능시간"] = index.main_text("면담가능시간")
+    data["연구일"] = index.main_text("연구일")
+    data["관리부서"] = index.main_text("관리부서")
+    data["선수과목"] = index.main_text("선수과목")
+    data["관련_기초과목"] = index.main_text("기초과목")
+    data["동시수강_관련과목"] = index.main_text("동시수강")
+    data["관련_고급과목"] = index.main_text("고급과목")
+    data["교과목_개요"] = index.main_text("교과목")
+    data["수업목표"] = index.main_text("수업목표")
+    data["교수학습_세부운영_방법"] = index.main_text("세부운영")
+    data["수업운영방식"] = index.main_text("수업운영방식")
+    data["주교재"] = index.main_text("주교재")
+    data["참고도서"] = index.main_text("참고도서")
+
+    # 체크박스 항목
+    data["이수구분_교양"] = index.checked_labels("교양")
+    data["이수구분_전공"] = index.checked_labels("전공")
+    data["이수구분_일반선택"] = index.checked_labels("일반선택")
+
+    # 학부(과)
+    td_dept = index.find_td(_DEPT_PATTERN)
+    if td_dept:
+        data["학부(과)"] = td_dept.get_text(strip=True).split(":")[-1].strip()
+
+    # 강좌특성
+    data["강좌특성"] = index.checked_labels("강좌특성")
+
+    # 교수학습방법
+    data["교수학습방법"] = {
+        "표준": index.checked_labels("표준 교과목운영 <br>기준"),
+        "자기주도식": index.checked_labels("학생 자기주도식<br>수업운영"),
+        "현장연계": index.checked_labels("현장 연계 방법"),
+    }
+
+    # 장애학생 지원
+    data["장애학생_시험시간"] = index.checked_labels("시험시간<br>조정여부")
+    data["장애학생_지원사항"] = index.checked_labels("지원사항")
+
+    data["평가방법"] = _parse_evaluation(index)
+    data["주차별강의계획"] = _parse_weekly_plan(index)
+
+    return data
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=PARSER_WORKERS,
+            thread_name_prefix="syllabus-parser"
+        )
+    return _executor
+
+
+async def parse_syllabus_html_async(html: str, features: Optional[str] = None) -> Dict[str, Any]:
+    """parse_syllabus_html()을 워커 풀에서 실행 (이벤트 루프 블로킹 방지)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(),
+        partial(parse_syllabus_html, html, features)
+    )
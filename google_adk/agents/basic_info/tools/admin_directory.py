@@ -0,0 +1,358 @@
+"""
+행정부서 로컬 디렉터리
+
+data/강남대 기본정보/행정부서 전화번호.jsonl을 한 번 읽어 조직도(parent → children)를
+구성하고, 부서명/slug, 담당 업무, 전화번호, 직원 이름으로 색인합니다.
+
+- "수강신청 누가 담당해?" → 담당 업무가 일치하는 직원 (대학명이 있으면 관할 교학팀으로 한정)
+- "교학1팀 전화번호" → 부서 정보 + 상위/하위 조직
+- "031-280-3470", "3470" → 해당 번호의 부서/직원
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_DATA_PATH = (
+    Path(__file__).resolve().parents[3] / "data" / "강남대 기본정보" / "행정부서 전화번호.jsonl"
+)
+
+# 담당 업무로 보지 않는 일반 단어 (직함/설명 문구)
+GENERIC_TERMS = {
+    "팀장", "팀원", "처장", "부처장", "행정", "행정지원", "일반행정", "강남대학교", "등", "업무",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+_TERM_SPLIT = re.compile(r"[,()·/]|\s및\s")
+_ROLE_SPLIT = re.compile(r"[,()·/\s]+")
+_PHONE_PATTERN = re.compile(r"\d[\d-]{2,}\d")
+_LEADING_PARTICLE = re.compile(r"^(의|및)\s+")
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (공백 제거 + 소문자)"""
+    return _WHITESPACE.sub("", text or "").lower()
+
+
+def _digits(text: str) -> str:
+    return re.sub(r"\D", "", text or "")
+
+
+def _split_terms(text: str) -> List[str]:
+    """부서 설명에서 쉼표/괄호로 나열된 한 단어짜리 업무 항목 추출"""
+    terms = []
+    for piece in _TERM_SPLIT.split(text or ""):
+        piece = _LEADING_PARTICLE.sub("", piece.strip())
+        if len(piece) >= 2 and " " not in piece and piece not in GENERIC_TERMS:
+            terms.append(piece)
+    return terms
+
+
+def _role_terms(role: str) -> List[str]:
+    """직원 담당 업무 ("시험 및 성적", "음악학과 조교") → 단어 목록"""
+    return [
+        term for term in _ROLE_SPLIT.split(role or "")
+        if len(term) >= 2 and term not in GENERIC_TERMS
+    ]
+
+
+@dataclass(eq=False)
+class Member:
+    name: str
+    role: str
+    phone: str
+    email: str
+    duties: List[str] = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class OrgUnit:
+    id: str
+    name: str
+    slug: str
+    type: str
+    parent_id: Optional[str]
+    description: str
+    building: Optional[str]
+    room: Optional[str]
+    phone_main: Optional[str]
+    fax: Optional[str]
+    related_colleges: List[str] = field(default_factory=list)
+    members: List[Member] = field(default_factory=list)
+    duties: List[str] = field(default_factory=list)
+    children: List['OrgUnit'] = field(default_factory=list)
+    parent: Optional['OrgUnit'] = None
+
+    @classmethod
+    def from_document(cls, doc: Dict[str, Any]) -> 'OrgUnit':
+        metadata = doc.get("metadata", {})
+        location = metadata.get("location") or {}
+        members = [
+            Member(
+                name=m.get("name", ""),
+                role=m.get("role", ""),
+                phone=m.get("phone", ""),
+                email=m.get("email", ""),
+                duties=_role_terms(m.get("role", "")),
+            )
+            for m in metadata.get("members", [])
+        ]
+        description = doc.get("content", "")
+        duties = list(dict.fromkeys(
+            _split_terms(description) + [d for m in members for d in m.duties]
+        ))
+        return cls(
+            id=doc["id"],
+            name=metadata.get("name_kr", ""),
+            slug=metadata.get("slug", ""),
+            type=metadata.get("type", ""),
+            parent_id=metadata.get("parent"),
+            description=description,
+            building=location.get("building"),
+            room=location.get("room"),
+            phone_main=metadata.get("phone_main"),
+            fax=metadata.get("fax"),
+            related_colleges=metadata.get("related_colleges") or [],
+            members=members,
+            duties=duties,
+        )
+
+    @property
+    def location(self) -> Optional[str]:
+        if not self.building:
+            return None
+        return f"{self.building} {self.room}호" if self.room else self.building
+
+    def path(self) -> List[str]:
+        """최상위 조직부터 이 부서까지의 이름"""
+        names = []
+        node: Optional[OrgUnit] = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return list(reversed(names))
+
+    def to_dict(self, include_members: bool = True) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "type": self.type,
+            "path": " > ".join(self.path()),
+            "parent": self.parent.name if self.parent else None,
+            "children": [child.name for child in self.children],
+            "location": self.location,
+            "phone_main": self.phone_main,
+            "fax": self.fax,
+            "description": self.description,
+        }
+        if self.related_colleges:
+            data["related_colleges"] = self.related_colleges
+        if include_members:
+            data["members"] = [
+                {"name": m.name, "role": m.role, "phone": m.phone, "email": m.email}
+                for m in self.members
+            ]
+        return data
+
+
+def _member_dict(unit: OrgUnit, member: Member) -> Dict[str, Any]:
+    return {
+        "name": member.name,
+        "role": member.role,
+        "phone": member.phone,
+        "email": member.email,
+        "department": unit.name,
+        "department_phone": unit.phone_main,
+        "location": unit.location,
+    }
+
+
+class AdminDirectory:
+    """행정부서 조직도 + 색인"""
+
+    def __init__(self, units: List[OrgUnit]):
+        self.units = units
+        self._by_id = {unit.id: unit for unit in units}
+        for unit in units:
+            parent = self._by_id.get(unit.parent_id) if unit.parent_id else None
+            if parent is not None:
+                unit.parent = parent
+                parent.children.append(unit)
+
+        # 부서명/slug (긴 이름 우선)
+        names: Dict[str, OrgUnit] = {}
+        for unit in units:
+            names.setdefault(normalize(unit.name), unit)
+            names.setdefault(normalize(unit.slug), unit)
+        self._unit_names = sorted(names.items(), key=lambda item: len(item[0]), reverse=True)
+
+        self._by_phone: Dict[str, List[Tuple[OrgUnit, Optional[Member]]]] = {}
+        self._by_member_name: Dict[str, List[Tuple[OrgUnit, Member]]] = {}
+        self._by_college: Dict[str, List[OrgUnit]] = {}
+        for unit in units:
+            for number in (unit.phone_main, unit.fax):
+                self._index_phone(number, unit, None)
+            for member in unit.members:
+                self._index_phone(member.phone, unit, member)
+                self._by_member_name.setdefault(member.name, []).append((unit, member))
+            for college in unit.related_colleges:
+                self._by_college.setdefault(normalize(college), []).append(unit)
+
+    def _index_phone(self, number: Optional[str], unit: OrgUnit, member: Optional[Member]):
+        digits = _digits(number)
+        if not digits:
+            return
+        for key in (digits, digits[-4:]):
+            entries = self._by_phone.setdefault(key, [])
+            if (unit, member) not in entries:
+                entries.append((unit, member))
+
+    @classmethod
+    def from_jsonl(cls, path: Path) -> 'AdminDirectory':
+        units = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    units.append(OrgUnit.from_document(json.loads(line)))
+        return cls(units)
+
+    def roots(self) -> List[OrgUnit]:
+        return [unit for unit in self.units if unit.parent is None]
+
+    def find_unit(self, text: str) -> Optional[OrgUnit]:
+        """
+        부서명/slug가 포함된 부서 (긴 이름 우선)
+
+        "대학"처럼 두 글자 이하인 이름은 다른 단어("공과대학")의 일부로 매칭되지 않도록
+        단어 단위로만 비교합니다.
+        """
+        key = normalize(text)
+        words = {normalize(word) for word in text.split()}
+        for name, unit in self._unit_names:
+            if not name:
+                continue
+            if name in words or (len(name) > 2 and name in key):
+                return unit
+        return None
+
+    def find_by_phone(self, number: str) -> List[Tuple[OrgUnit, Optional[Member]]]:
+        return list(self._by_phone.get(_digits(number), []))
+
+    def find_person(self, text: str) -> List[Tuple[OrgUnit, Member]]:
+        return [entry for name, entries in self._by_member_name.items() if name in text for entry in entries]
+
+    def find_college_units(self, text: str) -> List[OrgUnit]:
+        key = normalize(text)
+        units: List[OrgUnit] = []
+        for college, college_units in self._by_college.items():
+            if college in key:
+                units.extend(u for u in college_units if u not in units)
+        return units
+
+    def who_handles(
+        self,
+        text: str,
+        units: Optional[List[OrgUnit]] = None,
+        limit: int = 10
+    ) -> List[Tuple[OrgUnit, Member]]:
+        """
+        질문에 포함된 담당 업무로 직원 찾기
+
+        Args:
+            text: 질문 ("수강신청 담당자", "음악학과 조교")
+            units: 검색할 부서 (없으면 전체)
+
+        Returns:
+            일치한 업무 글자 수가 많은 순으로 정렬된 (부서, 직원) 목록
+        """
+        key = normalize(text)
+        scored = []
+        for unit in units or self.units:
+            for position, member in enumerate(unit.members):
+                score = sum(len(duty) for duty in member.duties if normalize(duty) in key)
+                if score:
+                    scored.append((-score, position, unit, member))
+        scored.sort(key=lambda item: item[:2])
+        return [(unit, member) for _, _, unit, member in scored[:limit]]
+
+    def answer(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        자유 질문에 로컬 데이터로 답변
+
+        Returns:
+            도구 결과 형식의 dict, 부서/직원/업무를 특정할 수 없으면 None
+        """
+        # 1. 전화번호
+        for number in _PHONE_PATTERN.findall(query):
+            matches = self.find_by_phone(number)
+            if matches:
+                return format_directory(query, [], matches)
+
+        # 2. 직원 이름
+        people = self.find_person(query)
+        if people:
+            return format_directory(query, [], people)
+
+        # 3. 부서명 (+ 해당 부서 안의 담당 업무)
+        unit = self.find_unit(query)
+        if unit is not None:
+            handlers = self.who_handles(query, [unit] + unit.children)
+            return format_directory(query, [unit], handlers)
+
+        # 4. 관할 대학 (+ 담당 업무)
+        college_units = self.find_college_units(query)
+        if college_units:
+            handlers = self.who_handles(query, college_units)
+            return format_directory(query, [] if handlers else college_units, handlers)
+
+        # 5. 담당 업무만
+        handlers = self.who_handles(query)
+        if handlers:
+            return format_directory(query, [], handlers)
+
+        return None
+
+
+def format_directory(
+    query: str,
+    units: List[OrgUnit],
+    people: List[Tuple[OrgUnit, Optional[Member]]]
+) -> Dict[str, Any]:
+    """부서/직원 결과를 도구 결과 형식으로 변환"""
+    results = []
+    for unit, member in people:
+        if member is None:
+            results.append({"title": unit.id, "type": "department", "fields": unit.to_dict(include_members=False)})
+        else:
+            results.append({"title": unit.id, "type": "person", "fields": _member_dict(unit, member)})
+    for unit in units:
+        results.append({"title": unit.id, "type": "department", "fields": unit.to_dict()})
+    for rank, result in enumerate(results, start=1):
+        result["rank"] = rank
+
+    return {
+        "status": "success",
+        "source": "local",
+        "count": len(results),
+        "query": query,
+        "results": results,
+        "message": f"'{query}'에 대한 행정부서/담당자 정보 {len(results)}건을 찾았습니다."
+    }
+
+
+# 프로세스 공용 싱글톤
+_admin_directory_instance: Optional[AdminDirectory] = None
+
+
+def get_admin_directory() -> AdminDirectory:
+    """
+    AdminDirectory 싱글톤 인스턴스 반환
+    """
+    global _admin_directory_instance
+    if _admin_directory_instance is None:
+        from google_adk.config import ADMIN_DIRECTORY_DATA_PATH
+        path = Path(ADMIN_DIRECTORY_DATA_PATH or DEFAULT_DATA_PATH)
+        _admin_directory_instance = AdminDirectory.from_jsonl(path)
+        print(f"[AdminDirectory] ✅ Loaded {len(_admin_directory_instance.units)} units from {path.name}")
+    return _admin_directory_instance
@@ -0,0 +1,374 @@
+"""
+건물/시설 로컬 색인
+
+data/강남대 기본정보/강남대위치정리.jsonl을 한 번 읽어 건물별 시설 목록을
+건물 별칭, 층, 호실 코드, 시설명으로 색인합니다.
+
+- 건물 별칭: "이공관", "이공", "샬롬", "인사관", "도서관" 등 → 건물 ID
+- 층 정규화: "3층" / "03층" / "3F" / "B1" / "지하1층" → "03층", "B1층"
+- 호실 조회: "이301호", "이공관 301호", "예B101" → 해당 시설
+- 시설명 검색: 정규화된 부분 문자열 (완전 일치 > 접두 일치 > 포함 순)
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_DATA_PATH = (
+    Path(__file__).resolve().parents[3] / "data" / "강남대 기본정보" / "강남대위치정리.jsonl"
+)
+
+# 건물 ID → (대표 이름, 호실 접두어, 별칭)
+BUILDING_ALIASES: Dict[str, Tuple[str, str, List[str]]] = {
+    "arts-hall": ("예술관", "예", ["예술관", "예관"]),
+    "simjeon-1-hall": ("심전1관", "생", ["심전1관", "심전일관", "구기숙사", "생활관"]),
+    "simjeon-2-hall": ("심전2관", "", ["심전2관", "심전이관", "신기숙사", "기숙사"]),
+    "simjeon-industry-coop-hall": ("심전산학관", "심산", ["심전산학관", "심전산학협력관", "산학협력관", "산학관", "심산"]),
+    "cheoneun-hall": ("천은관", "천", ["천은관", "천은"]),
+    "uwon-hall": ("우원관", "우", ["우원관", "우원기념관", "우원"]),
+    "shalom-hall": ("샬롬관", "샬", ["샬롬관", "샬롬"]),
+    "seungri-hall": ("승리관", "승", ["승리관", "학군단", "ROTC"]),
+    "gyeongcheon-hall": ("경천관", "경", ["경천관", "경천"]),
+    "husaeng-hall": ("후생관", "후", ["후생관", "후생"]),
+    "mokyang-hall": ("목양관", "목", ["목양관", "목양", "체육관"]),
+    "humanities-social-hall": ("인사관", "인", ["인사관", "인문사회관", "인문관"]),
+    "education-hall": ("교육관", "교", ["교육관"]),
+    "science-engineering-hall": ("이공관", "이", ["이공관", "이공"]),
+    "library": ("도서관", "도", ["중앙도서관", "도서관"]),
+    "main-building": ("본관", "본", ["본관", "대학본부"]),
+}
+
+# 자유 질문에서 시설명 추출 시 버리는 단어
+STOPWORDS = {
+    "어디", "어디야", "어디에", "어디있어", "어디에있어", "위치", "위치는", "알려줘", "알려주세요",
+    "있어", "있나요", "있는", "있는지", "있지", "찾아줘", "건물", "시설", "강남대", "강남대학교", "층", "호",
+    "뭐", "뭐가", "뭐있어", "무엇", "무엇이", "뭐뭐", "정보",
+}
+_PARTICLES = ("에서", "으로", "은", "는", "이", "가", "을", "를", "에", "의", "로")
+
+_WHITESPACE = re.compile(r"\s+")
+# "3층", "3F", "지하1층" 또는 층 표기 없이 "B1", "지하1" (호실 코드 "예B101"과 구분)
+_FLOOR_PATTERN = re.compile(
+    r"(지하\s*|B)?(\d{1,2})\s*(?:층|F)|(?<![가-힣A-Za-z])(지하\s*|B)(\d{1,2})(?![\dA-Za-z호])",
+    re.IGNORECASE,
+)
+_BASEMENT_PATTERN = re.compile(r"^(?:지하\s*|B)(\d{1,2})$", re.IGNORECASE)
+_ROOM_PATTERN = re.compile(r"([가-힣]{1,2})?(B?\d{2,4}(?:-\d+)?)\s*(호)?", re.IGNORECASE)
+_PUNCTUATION = re.compile(r"[?!.,~]+")
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (공백 제거 + 소문자)"""
+    return _WHITESPACE.sub("", text or "").lower()
+
+
+def normalize_floor(floor: str) -> Optional[str]:
+    """
+    층 표기 정규화
+
+    "3층", "03층", "3F", "3" → "03층" / "B1", "B1층", "지하1층" → "B1층"
+    """
+    text = normalize(floor).upper().replace("층", "").replace("F", "")
+    if not text:
+        return None
+    basement = _BASEMENT_PATTERN.match(text.replace("지하", "B"))
+    if basement:
+        return f"B{int(basement.group(1))}층"
+    if text.isdigit():
+        return f"{int(text):02d}층"
+    return None
+
+
+def _room_key(room: str) -> str:
+    """호실 코드 키 ("예B101호" → "예B101")"""
+    return normalize(room).upper().removesuffix("호")
+
+
+@dataclass
+class Facility:
+    building_id: str
+    building: str
+    floor: str
+    name: str
+    room: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "building": self.building,
+            "floor": self.floor,
+            "name": self.name,
+            "room": self.room,
+        }
+
+
+@dataclass
+class Building:
+    id: str
+    name: str
+    room_prefix: str
+    aliases: List[str]
+    description: str
+    map_url: str
+    facilities: List[Facility] = field(default_factory=list)
+
+    @classmethod
+    def from_document(cls, doc: Dict[str, Any]) -> 'Building':
+        metadata = doc.get("metadata", {})
+        name, prefix, aliases = BUILDING_ALIASES.get(doc["id"], (doc["id"], "", [doc["id"]]))
+        building = cls(
+            id=doc["id"],
+            name=name,
+            room_prefix=prefix,
+            aliases=aliases,
+            description=doc.get("content", ""),
+            map_url=metadata.get("naverMapUrl") or metadata.get("kakaoMapUrl", ""),
+        )
+        for item in metadata.get("facilities", []):
+            building.facilities.append(Facility(
+                building_id=building.id,
+                building=name,
+                floor=normalize_floor(item.get("floor", "")) or item.get("floor", ""),
+                name=item.get("name", ""),
+                room=item.get("room", ""),
+            ))
+        return building
+
+    def floors(self) -> Dict[str, List[str]]:
+        """층별 시설명"""
+        result: Dict[str, List[str]] = {}
+        for facility in self.facilities:
+            result.setdefault(facility.floor, []).append(facility.name)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "building": self.name,
+            "description": self.description,
+            "map_url": self.map_url,
+            "facility_count": len(self.facilities),
+            "floors": sorted(self.floors()),
+        }
+
+
+@dataclass
+class ParsedQuery:
+    """자유 질문 해석 결과"""
+    building: Optional[Building] = None
+    floor: Optional[str] = None
+    room: Optional[str] = None
+    room_number: Optional[str] = None
+    keyword: str = ""
+
+
+class BuildingIndex:
+    """건물/시설 인메모리 색인"""
+
+    def __init__(self, buildings: List[Building]):
+        self.buildings = buildings
+        self._by_id = {b.id: b for b in buildings}
+        self._aliases: List[Tuple[str, Building]] = sorted(
+            ((normalize(alias), b) for b in buildings for alias in b.aliases),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._by_room: Dict[str, Facility] = {}
+        self._by_floor: Dict[Tuple[str, str], List[Facility]] = {}
+        self._facilities: List[Tuple[str, Facility]] = []
+        for building in buildings:
+            for facility in building.facilities:
+                self._by_room.setdefault(_room_key(facility.room), facility)
+                self._by_floor.setdefault((building.id, facility.floor), []).append(facility)
+                self._facilities.append((normalize(facility.name), facility))
+
+    @classmethod
+    def from_jsonl(cls, path: Path) -> 'BuildingIndex':
+        buildings = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    buildings.append(Building.from_document(json.loads(line)))
+        return cls(buildings)
+
+    def find_building(self, text: str) -> Optional[Building]:
+        """건물 별칭/ID로 건물 찾기 (긴 별칭 우선)"""
+        key = normalize(text)
+        if key in self._by_id:
+            return self._by_id[key]
+        for alias, building in self._aliases:
+            if alias in key:
+                return building
+        return None
+
+    def facilities_on_floor(self, building: Building, floor: str) -> List[Facility]:
+        normalized = normalize_floor(floor)
+        if not normalized:
+            return []
+        return list(self._by_floor.get((building.id, normalized), []))
+
+    def find_room(self, room: str, building: Optional[Building] = None) -> Optional[Facility]:
+        """
+        호실 코드 조회
+
+        Args:
+            room: "이301호", "예B101" 같은 전체 코드 또는 건물과 함께 쓰는 "301"
+            building: 호실 번호만 주어졌을 때 접두어로 쓸 건물
+        """
+        key = _room_key(room)
+        if building is not None and building.room_prefix and not key.startswith(building.room_prefix):
+            key = building.room_prefix + key
+        return self._by_room.get(key)
+
+    def search_facilities(
+        self,
+        keyword: str,
+        building: Optional[Building] = None,
+        limit: int = 20,
+        floor: Optional[str] = None
+    ) -> List[Facility]:
+        """시설명 검색 (완전 일치 > 접두 일치 > 포함, building/floor가 있으면 그 건물/층만)"""
+        key = normalize(keyword)
+        if not key:
+            return []
+        floor = normalize_floor(floor) if floor else None
+        scored = []
+        for position, (name, facility) in enumerate(self._facilities):
+            if building is not None and facility.building_id != building.id:
+                continue
+            if floor is not None and facility.floor != floor:
+                continue
+            if key not in name:
+                continue
+            rank = 0 if name == key else 1 if name.startswith(key) else 2
+            scored.append((rank, position, facility))
+        scored.sort(key=lambda item: item[:2])
+        return [facility for _, _, facility in scored[:limit]]
+
+    def parse_query(self, query: str) -> ParsedQuery:
+        """자유 질문에서 건물, 층, 호실, 시설명 키워드 추출"""
+        parsed = ParsedQuery(building=self.find_building(query))
+        rest = query
+
+        floor_match = _FLOOR_PATTERN.search(rest)
+        if floor_match:
+            basement, number = floor_match.group(1, 2) if floor_match.group(2) else floor_match.group(3, 4)
+            parsed.floor = normalize_floor(("B" if basement else "") + number)
+            rest = rest.replace(floor_match.group(0), " ")
+
+        # 호실: 접두어("이301") 또는 "호"("301호")가 붙은 번호만 인정
+        for room_match in _ROOM_PATTERN.finditer(rest):
+            prefix, number, suffix = room_match.groups()
+            if prefix or suffix:
+                parsed.room = (prefix or "") + number
+                parsed.room_number = number
+                rest = rest.replace(room_match.group(0), " ")
+                break
+
+        tokens = []
+        for token in _PUNCTUATION.sub(" ", rest).split():
+            if parsed.building and self.find_building(token) is parsed.building:
+                continue
+            for particle in _PARTICLES:
+                if token.endswith(particle) and len(token) > len(particle) + 1:
+                    token = token[:-len(particle)]
+                    break
+            # "2층에" → 층을 떼고 남은 조사만 있는 어절도 버림
+            if token and token not in STOPWORDS and token not in _PARTICLES:
+                tokens.append(token)
+        parsed.keyword = " ".join(tokens)
+        return parsed
+
+    def answer(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        자유 질문에 로컬 데이터로 답변
+
+        Returns:
+            도구 결과 형식의 dict, 건물/시설을 특정할 수 없으면 None
+        """
+        parsed = self.parse_query(query)
+
+        # 1. 호실
+        if parsed.room:
+            facility = self.find_room(parsed.room) or self.find_room(parsed.room_number, parsed.building)
+            if facility:
+                return format_facilities(query, [facility])
+
+        # 2. 건물 + 층 (시설명이 있으면 그 층에서 이름이 일치하는 시설만, 없으면 3으로)
+        if parsed.building and parsed.floor:
+            facilities = self.facilities_on_floor(parsed.building, parsed.floor)
+            if parsed.keyword:
+                facilities = [f for f in facilities if normalize(parsed.keyword) in normalize(f.name)]
+            if facilities:
+                return format_facilities(query, facilities)
+
+        # 3. 시설명 (건물이 있으면 그 건물 전체, 없으면 층이 있으면 모든 건물의 그 층)
+        if parsed.keyword:
+            floor = None if parsed.building else parsed.floor
+            facilities = self.search_facilities(parsed.keyword, parsed.building, floor=floor)
+            if not facilities:
+                for token in parsed.keyword.split():
+                    facilities = self.search_facilities(token, parsed.building, floor=floor)
+                    if facilities:
+                        break
+            if facilities:
+                return format_facilities(query, facilities)
+
+        # 4. 건물 정보 (시설을 물었는데 찾지 못했으면 건물 개요 대신 원격 검색)
+        if parsed.building and not parsed.keyword:
+            return format_buildings(query, [parsed.building])
+
+        return None
+
+
+def format_facilities(query: str, facilities: List[Facility]) -> Dict[str, Any]:
+    results = [
+        {"rank": i, "title": f.building_id, "fields": f.to_dict()}
+        for i, f in enumerate(facilities, start=1)
+    ]
+    return {
+        "status": "success",
+        "source": "local",
+        "count": len(results),
+        "query": query,
+        "results": results,
+        "message": f"'{query}'에 대한 시설 {len(results)}개를 찾았습니다."
+    }
+
+
+def format_buildings(
+    query: str,
+    buildings: List[Building],
+    include_facilities: bool = False
+) -> Dict[str, Any]:
+    results = []
+    for i, building in enumerate(buildings, start=1):
+        fields = building.to_dict()
+        if include_facilities:
+            fields["facilities_by_floor"] = building.floors()
+        results.append({"rank": i, "title": building.id, "snippet": building.description, "fields": fields})
+    return {
+        "status": "success",
+        "source": "local",
+        "count": len(results),
+        "query": query,
+        "results": results,
+        "message": f"'{query}'에 대한 건물 정보 {len(results)}개를 찾았습니다."
+    }
+
+
+# 프로세스 공용 싱글톤
+_building_index_instance: Optional[BuildingIndex] = None
+
+
+def get_building_index() -> BuildingIndex:
+    """
+    BuildingIndex 싱글톤 인스턴스 반환
+    """
+    global _building_index_instance
+    if _building_index_instance is None:
+        from google_adk.config import BUILDING_DATA_PATH
+        path = Path(BUILDING_DATA_PATH or DEFAULT_DATA_PATH)
+        _building_index_instance = BuildingIndex.from_jsonl(path)
+        print(f"[BuildingIndex] ✅ Loaded {len(_building_index_instance.buildings)} buildings from {path.name}")
+    return _building_index_instance
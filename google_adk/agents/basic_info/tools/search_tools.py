@@ -1,11 +1,24 @@
 """
-강남대학교 건물/시설 정보 및 행정부서 연락처 검색 도구 (Vertex AI Search 기반)
+강남대학교 건물/시설 정보 및 행정부서 연락처 검색 도구
+
+- 건물/시설: 로컬 건물 색인(building_index.py)에서 바로 조회, 찾지 못하면 Vertex AI Search
+- 행정부서: 로컬 행정부서 디렉터리(admin_directory.py)에서 바로 조회, 찾지 못하면 Vertex AI Search
 """
 
 import json
 from google.adk.tools import FunctionTool
-from google.auth import default
-from google.auth.transport.requests import Request
+from google_adk.search import get_search_client
+from google_adk.agents.basic_info.tools.admin_directory import (
+    AdminDirectory,
+    format_directory,
+    get_admin_directory,
+)
+from google_adk.agents.basic_info.tools.building_index import (
+    BuildingIndex,
+    format_buildings,
+    format_facilities,
+    get_building_index,
+)
 from typing import Dict, Any, Optional
 
 # Vertex AI Search 엔진 endpoint - 건물/시설 정보
@@ -25,35 +38,32 @@ ADMIN_SEARCH_ENDPOINT = (
     "servingConfigs/default_search:search"
 )
 
+def _building_index() -> Optional[BuildingIndex]:
+    """로컬 건물 색인 (데이터 파일을 읽지 못하면 None → 원격 검색 사용)"""
+    try:
+        return get_building_index()
+    except Exception as e:
+        print(f"[BuildingIndex] ⚠️ 로컬 데이터 로드 실패, 원격 검색 사용: {e}")
+        return None
+
+
+def _admin_directory() -> Optional[AdminDirectory]:
+    """로컬 행정부서 디렉터리 (데이터 파일을 읽지 못하면 None → 원격 검색 사용)"""
+    try:
+        return get_admin_directory()
+    except Exception as e:
+        print(f"[AdminDirectory] ⚠️ 로컬 데이터 로드 실패, 원격 검색 사용: {e}")
+        return None
+
+
 # 공통 함수: Vertex AI Search API 호출
 def vertex_ai_search_request(query: str, endpoint: str, page_size: int = 10) -> Dict[str, Any]:
     """
-    Vertex AI Search API를 curl 호출 형태로 실행하고 결과를 반환.
+    Vertex AI Search API를 호출하고 결과를 반환.
     """
     try:
-        # Google Auth 라이브러리로 access token 가져오기 (배포 환경 호환)
-        credentials, project = default()
-        if not credentials.valid:
-            credentials.refresh(Request())
-        token = credentials.token
-        
-        payload = {
-            "query": query,
-            "pageSize": page_size,
-            "queryExpansionSpec": {"condition": "AUTO"},
-            "spellCorrectionSpec": {"mode": "AUTO"},
-            "languageCode": "ko",
-            "userInfo": {"timeZone": "Asia/Seoul"}
-        }
-        
-        # API 호출
-        import requests
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.post(endpoint, headers=headers, json=payload)
-        result = response.json()
+        # 공용 클라이언트로 호출 (인증 정보/연결 풀 재사용, 타임아웃 적용)
+        result = get_search_client().search(endpoint, query, page_size)
         
         # 정리된 형태로 반환
         if "results" in result:
@@ -94,6 +104,10 @@ def search_building_by_name(building_name: str) -> Dict[str, Any]:
     """
     건물명으로 검색합니다.
     """
+    index = _building_index()
+    building = index.find_building(building_name) if index else None
+    if building:
+        return format_buildings(building_name, [building])
     return vertex_ai_search_request(f"{building_name}", BUILDING_SEARCH_ENDPOINT)
 
 def search_facility_by_location(building: str, floor: Optional[str] = None) -> Dict[str, Any]:
@@ -104,6 +118,16 @@ def search_facility_by_location(building: str, floor: Optional[str] = None) -> D
         query = f"{building} {floor}"
     else:
         query = f"{building} 시설"
+
+    index = _building_index()
+    found = index.find_building(building) if index else None
+    if found and floor:
+        facilities = index.facilities_on_floor(found, floor)
+        if facilities:
+            return format_facilities(query, facilities)
+    elif found:
+        return format_buildings(query, [found], include_facilities=True)
+
     return vertex_ai_search_request(query, BUILDING_SEARCH_ENDPOINT)
 
 def search_facility_by_name(facility_name: str) -> Dict[str, Any]:
@@ -111,30 +135,52 @@ def search_facility_by_name(facility_name: str) -> Dict[str, Any]:
     시설명으로 검색
     """
     query = f"{facility_name}"
+    index = _building_index()
+    if index:
+        facilities = index.search_facilities(facility_name)
+        result = format_facilities(query, facilities) if facilities else index.answer(query)
+        if result:
+            return result
     return vertex_ai_search_request(query, BUILDING_SEARCH_ENDPOINT)
 
 def search_building_info(query: str) -> Dict[str, Any]:
     """
     자유 입력형 검색 (건물/시설)
     """
+    index = _building_index()
+    result = index.answer(query) if index else None
+    if result:
+        return result
     return vertex_ai_search_request(query, BUILDING_SEARCH_ENDPOINT)
 
 def search_admin_department(query: str) -> Dict[str, Any]:
     """
     행정부서 및 연락처 검색
     """
+    directory = _admin_directory()
+    result = directory.answer(query) if directory else None
+    if result:
+        return result
     return vertex_ai_search_request(query, ADMIN_SEARCH_ENDPOINT)
 
 def search_department_by_name(department_name: str) -> Dict[str, Any]:
     """
     부서명으로 검색
     """
+    directory = _admin_directory()
+    unit = directory.find_unit(department_name) if directory else None
+    if unit:
+        return format_directory(department_name, [unit], [])
     return vertex_ai_search_request(f"{department_name}", ADMIN_SEARCH_ENDPOINT)
 
 def search_contact_info(query: str) -> Dict[str, Any]:
     """
     연락처 정보 검색 (전화번호, 팩스, 위치)
     """
+    directory = _admin_directory()
+    result = directory.answer(query) if directory else None
+    if result:
+        return result
     return vertex_ai_search_request(f"{query} 연락처", ADMIN_SEARCH_ENDPOINT)
 
 
@@ -0,0 +1,419 @@
+"""
+졸업요건 로컬 엔진
+
+data/졸업요건/2017_2025_통합_졸업이수학점.json을 시작 시 한 번 읽어
+입학년도(학년도 구간), 대학, 계열, 학부/학과/전공 이름으로 색인합니다.
+
+구조화된 질문(연도 + 대학/학과)은 네트워크 호출 없이 바로 답하고,
+대학/학과를 특정할 수 없는 자유 질문만 Vertex AI Search로 넘깁니다.
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_DATA_PATH = (
+    Path(__file__).resolve().parents[3] / "data" / "졸업요건" / "2017_2025_통합_졸업이수학점.json"
+)
+
+# 학년도 구간마다 이름이 바뀐 대학은 같은 그룹으로 취급
+# (예: 2017~2020 ICT건설복지융합대학 → 2021 이후 공과대학)
+COLLEGE_GROUPS = [
+    ["복지융합대학", "복지융합대"],
+    ["경영관리대학", "경영관리대", "경영대"],
+    ["글로벌인재대학", "글로벌문화콘텐츠대학", "글로벌인재대", "글로벌문화콘텐츠대"],
+    ["공과대학", "ICT건설복지융합대학", "공대", "ICT건설복지융합대"],
+    ["예체능대학", "예체능대"],
+    ["사범대학", "사범대"],
+]
+
+# 대학 이름 대신 쓰는 짧은 단어 (질문의 한 어절 전체가 같을 때만, "사회복지학부"의 "복지"는 제외)
+COLLEGE_KEYWORDS = {
+    "복지": "복지융합대학",
+    "경영": "경영관리대학",
+    "공과": "공과대학",
+    "사범": "사범대학",
+}
+
+_UNIT_SUFFIXES = ("학부", "학과", "전공", "과")
+_YEAR_PATTERN = re.compile(r"(20\d{2})")
+_SHORT_YEAR_PATTERN = re.compile(r"(\d{2})\s*학번")
+_RANGE_PATTERN = re.compile(r"(\d{4})\s*~\s*(\d{4})")
+_OPEN_RANGE_PATTERN = re.compile(r"(\d{4})\s*이후")
+_DAY_NIGHT = re.compile(r"\((주|야)\)")
+_WHITESPACE = re.compile(r"\s+")
+_REQUIREMENT_WORDS = ("졸업", "교양", "이수", "학점")
+_PARTICLE = r"(?:의|은|는|이|가|을|를|에서|에|도|년에|년)"
+# 질문에서 학부/학과/전공 이름으로 보이는 어절 (뒤에 붙은 조사는 무시, "국어교육과"처럼 "교육과"로 끝나는 학과 포함)
+_UNIT_MENTION = re.compile(rf"([가-힣A-Za-z]+?(?:학부|학과|전공|교육과)){_PARTICLE}?[?!.,]*$")
+_TOKEN_TAIL = re.compile(rf"{_PARTICLE}?[?!.,]*$")
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (공백/주야 표기 제거 + 소문자)"""
+    return _WHITESPACE.sub("", _DAY_NIGHT.sub("", text or "")).lower()
+
+
+def parse_year(text: str) -> Optional[int]:
+    """질문에서 입학년도 추출 ("2024년", "24학번")"""
+    match = _YEAR_PATTERN.search(text or "")
+    if match:
+        return int(match.group(1))
+    match = _SHORT_YEAR_PATTERN.search(text or "")
+    if match:
+        return 2000 + int(match.group(1))
+    return None
+
+
+def _tokens(text: str) -> List[str]:
+    """질문 어절 (정규화, 어절마다 그대로 / 조사·문장부호를 뗀 값)"""
+    tokens = []
+    for word in (text or "").split():
+        word = normalize(word)
+        tokens.append(word)
+        stripped = _TOKEN_TAIL.sub("", word)
+        if stripped and stripped != word:
+            tokens.append(stripped)
+    return tokens
+
+
+def _unit_keys(name: str) -> List[str]:
+    """학부/학과/전공 이름의 검색 키 (전체 이름 + 접미사를 뗀 어간)"""
+    key = normalize(name)
+    keys = [key]
+    for suffix in _UNIT_SUFFIXES:
+        if key.endswith(suffix) and len(key) - len(suffix) >= 2:
+            keys.append(key[:-len(suffix)])
+            break
+    return keys
+
+
+@dataclass
+class YearRange:
+    label: str
+    start: int
+    end: Optional[int]
+
+    @classmethod
+    def parse(cls, label: str) -> 'YearRange':
+        match = _RANGE_PATTERN.search(label)
+        if match:
+            return cls(label, int(match.group(1)), int(match.group(2)))
+        match = _OPEN_RANGE_PATTERN.search(label)
+        if match:
+            return cls(label, int(match.group(1)), None)
+        raise ValueError(f"알 수 없는 학년도 구간: {label}")
+
+    def contains(self, year: int) -> bool:
+        return year >= self.start and (self.end is None or year <= self.end)
+
+
+@dataclass
+class Unit:
+    """학부/학과/전공"""
+    name: str
+    kind: str
+    division: str
+    parent: Optional[str] = None
+    note: Optional[str] = None
+
+
+@dataclass
+class RequirementEntry:
+    """한 학년도 구간의 한 대학 졸업요건"""
+    college: str
+    year_range: YearRange
+    requirements: Dict[str, Any]
+    liberal_arts: Dict[str, Any]
+    notes: List[str]
+    major_exploration: Optional[Dict[str, Any]]
+    units: List[Unit] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RequirementEntry':
+        units = []
+        for division in data.get("계열", []):
+            division_name = division.get("계열명", "")
+            for item in division.get("학부및학과", []):
+                kind = "학부" if "학부" in item else "학과"
+                name = item.get(kind, "")
+                units.append(Unit(name, kind, division_name, note=item.get("비고")))
+                for major in item.get("전공", []):
+                    units.append(Unit(major, "전공", division_name, parent=name))
+        return cls(
+            college=data["대학"],
+            year_range=YearRange.parse(data["year_range"]),
+            requirements=data.get("졸업요건", {}),
+            liberal_arts=data.get("교양이수표", {}),
+            notes=data.get("비고", []),
+            major_exploration=data.get("전공탐색"),
+            units=units,
+        )
+
+    def render(self) -> str:
+        """LLM 응답용 텍스트"""
+        lines = [f"[{self.year_range.label} 입학자] {self.college}"]
+        lines.append("졸업요건:")
+        for key, value in self.requirements.items():
+            if value is None:
+                continue
+            if isinstance(value, dict):
+                value = ", ".join(f"{k} {v}" for k, v in value.items())
+            lines.append(f"- {key}: {value}")
+        lines.append("교양이수표:")
+        for key, value in self.liberal_arts.items():
+            if isinstance(value, list):
+                value = ", ".join(value)
+            lines.append(f"- {key}: {value}")
+        if self.major_exploration:
+            targets = ", ".join(self.major_exploration.get("대상", []))
+            courses = ", ".join(self.major_exploration.get("필수과목", []))
+            lines.append(f"전공탐색: 대상 {targets} / 필수과목 {courses}")
+        lines.append("소속 학부/학과: " + ", ".join(
+            u.name for u in self.units if u.kind != "전공"
+        ))
+        for note in self.notes:
+            lines.append(f"※ {note}")
+        return "\n".join(lines)
+
+
+@dataclass
+class Resolution:
+    """질문 해석 결과"""
+    year: Optional[int] = None
+    college_group: Optional[int] = None
+    unit_key: Optional[str] = None
+    category: str = "졸업요건"
+    mentions_requirements: bool = False
+    unknown_units: List[str] = field(default_factory=list)
+
+    @property
+    def resolved(self) -> bool:
+        """
+        대학/학과를 특정했거나, 학과 언급 없이 연도 + 졸업요건 관련 질문인 경우
+
+        로컬 데이터에 없는 학과를 언급하면 다른 학과 요건을 답하지 않도록 해석 실패로 봅니다.
+        """
+        if self.unknown_units:
+            return False
+        if self.college_group is not None or self.unit_key is not None:
+            return True
+        return self.year is not None and self.mentions_requirements
+
+
+class GraduationRequirementsEngine:
+    """졸업요건 인메모리 색인"""
+
+    def __init__(self, entries: List[RequirementEntry]):
+        self.entries = entries
+        self._unit_index: Dict[str, List[Tuple[int, Unit]]] = {}
+
+        groups = [list(names) for names in COLLEGE_GROUPS]
+        known = {normalize(name) for names in groups for name in names}
+        for entry in entries:
+            if normalize(entry.college) not in known:
+                groups.append([entry.college])
+                known.add(normalize(entry.college))
+        self._college_group: Dict[str, int] = {
+            normalize(name): group_id for group_id, names in enumerate(groups) for name in names
+        }
+        # 긴 별칭부터 매칭 ("글로벌문화콘텐츠대학"이 짧은 별칭보다 우선)
+        self._college_aliases = sorted(self._college_group, key=len, reverse=True)
+        self._college_keywords = {
+            keyword: self._college_group[normalize(college)] for keyword, college in COLLEGE_KEYWORDS.items()
+        }
+
+        self._full_names = set()
+        for i, entry in enumerate(entries):
+            for unit in entry.units:
+                keys = _unit_keys(unit.name)
+                self._full_names.add(keys[0])
+                for key in keys:
+                    self._unit_index.setdefault(key, []).append((i, unit))
+        self._unit_keys = sorted(self._unit_index, key=len, reverse=True)
+
+    @classmethod
+    def from_json(cls, path: Path) -> 'GraduationRequirementsEngine':
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls([RequirementEntry.from_dict(item) for item in data.get("data", [])])
+
+    def _find_college(self, text: str) -> Optional[int]:
+        """대학 이름/별칭(부분 문자열) → 짧은 대학 단어(어절 전체) 순"""
+        key = normalize(text)
+        for alias in self._college_aliases:
+            if alias in key:
+                return self._college_group[alias]
+        for token in _tokens(text):
+            if token in self._college_keywords:
+                return self._college_keywords[token]
+        return None
+
+    def _find_unit(self, text: str) -> Optional[str]:
+        """
+        학부/학과/전공 검색 키
+
+        1. 어절 전체가 이름 또는 어간과 같음 ("유아교육과", "사회복지")
+        2. 학과/전공 접미사가 붙은 어절은 어간끼리 비교 ("음악과" → 음악학과)
+        3. 띄어쓰기 없는 질문은 전체 이름만 부분 문자열로 ("2024유아교육과졸업요건")
+
+        어간을 부분 문자열로 찾지 않으므로 "실용음악전공"이 음악학과로, "국어교육과"가 교육학과로 바뀌지 않습니다.
+        """
+        tokens = _tokens(text)
+        for unit_key in self._unit_keys:
+            if unit_key in tokens:
+                return unit_key
+        for token in tokens:
+            if token.endswith(_UNIT_SUFFIXES):
+                stem = _unit_keys(token)[-1]
+                if stem != token and stem in self._unit_index:
+                    return stem
+        key = normalize(text)
+        for unit_key in self._unit_keys:
+            if unit_key in self._full_names and unit_key in key:
+                return unit_key
+        return None
+
+    def _unknown_units(self, text: str) -> List[str]:
+        """질문에 언급된 학부/학과/전공 중 로컬 데이터에서 찾을 수 없는 이름"""
+        unknown = []
+        for word in (text or "").split():
+            match = _UNIT_MENTION.search(word)
+            if match and self._find_unit(match.group(1)) is None:
+                unknown.append(match.group(1))
+        return unknown
+
+    def resolve(self, query: str) -> Resolution:
+        """자유 질문에서 입학년도/대학/학과 추출"""
+        return Resolution(
+            year=parse_year(query),
+            college_group=self._find_college(query),
+            unit_key=self._find_unit(query),
+            category="교양이수표" if "교양" in query else "졸업요건",
+            mentions_requirements=any(word in query for word in _REQUIREMENT_WORDS),
+            unknown_units=self._unknown_units(query),
+        )
+
+    def lookup(
+        self,
+        year: Optional[int] = None,
+        college: Optional[str] = None,
+        department: Optional[str] = None
+    ) -> List[Tuple[RequirementEntry, Optional[Unit]]]:
+        """
+        조건에 맞는 졸업요건 항목 조회
+
+        Args:
+            year: 입학년도 (없으면 모든 학년도 구간, 최신 구간부터)
+            college: 대학 이름 또는 별칭 ("공대", "사범대" 등)
+            department: 학부/학과/전공 이름
+
+        Returns:
+            (졸업요건 항목, 일치한 학부/학과) 목록
+        """
+        college_group = self._find_college(college) if college else None
+        unit_key = self._find_unit(department) if department else None
+        if (college and college_group is None) or (department and unit_key is None):
+            return []
+        return self._select(year, college_group, unit_key)
+
+    def _select(
+        self,
+        year: Optional[int],
+        college_group: Optional[int],
+        unit_key: Optional[str]
+    ) -> List[Tuple[RequirementEntry, Optional[Unit]]]:
+        if unit_key is not None:
+            candidates = [(self.entries[i], unit) for i, unit in self._unit_index[unit_key]]
+        else:
+            candidates = [(entry, None) for entry in self.entries]
+
+        matches = []
+        seen = set()
+        for entry, unit in candidates:
+            if year is not None and not entry.year_range.contains(year):
+                continue
+            if college_group is not None and self._college_group.get(normalize(entry.college)) != college_group:
+                continue
+            if id(entry) in seen:
+                continue
+            seen.add(id(entry))
+            matches.append((entry, unit))
+
+        matches.sort(key=lambda item: item[0].year_range.start, reverse=True)
+        return matches
+
+    def answer(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        자유 질문에 로컬 데이터로 답변
+
+        Returns:
+            search_graduation_requirements와 같은 형식의 결과, 대학/학과를 특정할 수 없으면 None
+        """
+        resolution = self.resolve(query)
+        if not resolution.resolved:
+            return None
+        matches = self._select(resolution.year, resolution.college_group, resolution.unit_key)
+        if not matches:
+            return None
+        return format_matches(query, matches, resolution.category)
+
+    def year_ranges(self) -> List[str]:
+        return list(dict.fromkeys(entry.year_range.label for entry in self.entries))
+
+
+def format_matches(
+    query: str,
+    matches: List[Tuple[RequirementEntry, Optional[Unit]]],
+    category: str = "졸업요건"
+) -> Dict[str, Any]:
+    """Vertex AI Search 결과와 같은 형식으로 변환"""
+    results = []
+    for rank, (entry, unit) in enumerate(matches, start=1):
+        division = unit.division if unit else ", ".join(
+            dict.fromkeys(u.division for u in entry.units)
+        )
+        department = unit.name if unit else "N/A"
+        metadata = {
+            "college": entry.college,
+            "division": division,
+            "department": department,
+            "year_range": entry.year_range.label,
+            "category": category,
+        }
+        results.append({
+            "rank": rank,
+            "content": entry.render(),
+            "metadata": metadata,
+            **metadata,
+            "requirements": entry.requirements,
+            "liberal_arts": entry.liberal_arts,
+            "major_exploration": entry.major_exploration,
+            "notes": entry.notes,
+        })
+    return {
+        "status": "success",
+        "source": "local",
+        "count": len(results),
+        "query": query,
+        "results": results,
+        "message": f"'{query}'에 대한 졸업요건 {len(results)}건을 찾았습니다."
+    }
+
+
+# 프로세스 공용 싱글톤
+_engine_instance: Optional[GraduationRequirementsEngine] = None
+
+
+def get_graduation_engine() -> GraduationRequirementsEngine:
+    """
+    GraduationRequirementsEngine 싱글톤 인스턴스 반환
+    """
+    global _engine_instance
+    if _engine_instance is None:
+        from google_adk.config import GRADUATION_DATA_PATH
+        path = Path(GRADUATION_DATA_PATH or DEFAULT_DATA_PATH)
+        _engine_instance = GraduationRequirementsEngine.from_json(path)
+        print(f"[GraduationEngine] ✅ Loaded {len(_engine_instance.entries)} entries from {path.name}")
+    return _engine_instance
@@ -1,8 +1,9 @@
 """
-강남대학교 졸업요건 검색 도구 (Vertex AI Search)
+강남대학교 졸업요건 검색 도구 (로컬 엔진 + Vertex AI Search)
 
-현재 사용: Vertex AI Search (이 파일)
-  - 빠르고 정확한 메타데이터 기반 검색
+현재 사용: 로컬 졸업요건 엔진 (requirements_engine.py)
+  - 연도/대학/학과로 특정되는 질문은 통합 졸업이수학점 JSON에서 바로 답변
+  - 특정할 수 없는 자유 질문만 Vertex AI Search로 검색
   - 메타데이터 필터링 지원 (college, division, department, year_range, category)
 
 백업용: RAG (rag_search_tools.py)
@@ -13,8 +14,12 @@
 
 import json
 from google.adk.tools import FunctionTool
-from google.auth import default
-from google.auth.transport.requests import Request
+from google_adk.search import get_search_client
+from google_adk.agents.graduation.tools.requirements_engine import (
+    GraduationRequirementsEngine,
+    format_matches,
+    get_graduation_engine,
+)
 from typing import Dict, Optional, Any
 
 # ============================================================================
@@ -30,6 +35,15 @@ VERTEX_SEARCH_ENDPOINT = (
 )
 
 
+def _local_engine() -> Optional[GraduationRequirementsEngine]:
+    """로컬 졸업요건 엔진 (데이터 파일을 읽지 못하면 None → 원격 검색 사용)"""
+    try:
+        return get_graduation_engine()
+    except Exception as e:
+        print(f"[GraduationEngine] ⚠️ 로컬 데이터 로드 실패, 원격 검색 사용: {e}")
+        return None
+
+
 # 공통 함수: Vertex AI Search API 호출
 def vertex_ai_search_request(query: str, page_size: int = 10) -> Dict[str, Any]:
     """
@@ -43,29 +57,8 @@ def vertex_ai_search_request(query: str, page_size: int = 10) -> Dict[str, Any]:
         검색 결과 딕셔너리
     """
     try:
-        # Google Auth 라이브러리로 access token 가져오기 (배포 환경 호환)
-        credentials, project = default()
-        if not credentials.valid:
-            credentials.refresh(Request())
-        token = credentials.token
-        
-        payload = {
-            "query": query,
-            "pageSize": page_size,
-            "queryExpansionSpec": {"condition": "AUTO"},
-            "spellCorrectionSpec": {"mode": "AUTO"},
-            "languageCode": "ko",
-            "userInfo": {"timeZone": "Asia/Seoul"}
-        }
-        
-        # API 호출
-        import requests
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.post(VERTEX_SEARCH_ENDPOINT, headers=headers, json=payload)
-        result = response.json()
+        # 공용 클라이언트로 호출 (인증 정보/연결 풀 재사용, 타임아웃 적용)
+        result = get_search_client().search(VERTEX_SEARCH_ENDPOINT, query, page_size)
         
         # 정리된 형태로 반환
         if "results" in result:
@@ -128,6 +121,14 @@ def search_graduation_requirements(query: str, page_size: Optional[int] = 10) ->
         - query: 원본 질문
         - message: 상태 메시지
     """
+    engine = _local_engine()
+    if engine:
+        result = engine.answer(query)
+        if result:
+            result["results"] = result["results"][:page_size or 10]
+            result["count"] = len(result["results"])
+            return result
+
     return vertex_ai_search_request(query, page_size)
 
 
@@ -152,8 +153,22 @@ def search_by_year_and_college(
     Returns:
         검색 결과 딕셔너리
     """
-    # 학년도 매핑
     year_int = int(year)
+
+    # 로컬 엔진으로 바로 조회
+    engine = _local_engine()
+    matches = engine.lookup(year=year_int, college=college) if engine else []
+    if matches:
+        result = format_matches(f"{year} {college} {category}", matches[:page_size or 5], category)
+        result["search_criteria"] = {
+            "year": year,
+            "year_range": matches[0][0].year_range.label,
+            "college": college,
+            "category": category
+        }
+        return result
+
+    # 학년도 매핑
     if 2017 <= year_int <= 2020:
         year_range_query = "2017~2020"
     elif 2021 <= year_int <= 2024:
@@ -201,6 +216,13 @@ def search_by_department(
         query = f"{year} {department} {category}"
     else:
         query = f"{department} {category}"
+
+    engine = _local_engine()
+    if engine:
+        year_int = int(year) if year and str(year).isdigit() else None
+        matches = engine.lookup(year=year_int, department=department)
+        if matches:
+            return format_matches(query, matches[:5], category)
     
     return vertex_ai_search_request(query, page_size=5)
 
@@ -241,8 +263,8 @@ def get_available_information() -> Dict[str, Any]:
                 "사범대학 교양이수표"
             ]
         },
-        "message": "강남대학교 졸업이수학점 및 교양과목 정보를 Vertex AI Search로 검색할 수 있습니다.",
-        "search_engine": "Vertex AI Search (Discovery Engine)"
+        "message": "강남대학교 졸업이수학점 및 교양과목 정보를 검색할 수 있습니다.",
+        "search_engine": "로컬 졸업요건 엔진 (자유 질문은 Vertex AI Search)"
     }
 
 
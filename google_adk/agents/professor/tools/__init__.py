@@ -10,6 +10,7 @@ from google_adk.agents.professor.tools.search_tools import (
     search_professor_by_name_tool,
     search_professor_by_department_tool,
     search_professor_by_research_field_tool,
+    search_professor_info_batch_tool,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     'search_professor_by_name_tool',
     'search_professor_by_department_tool',
     'search_professor_by_research_field_tool',
+    'search_professor_info_batch_tool',
 ]
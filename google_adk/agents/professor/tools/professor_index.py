@@ -0,0 +1,384 @@
+"""
+교수정보 로컬 색인
+
+data/교수정보/*.jsonl을 한 번 읽어 교수 이름, 학과/전공, 대학, 연구분야 키워드로 색인합니다.
+
+- "양재형 교수" → 이름 정확 일치
+- "양제형 교수" → 자모 분해 편집거리로 오타 허용 (ㅐ/ㅔ 한 글자 차이)
+- "소프트웨어전공 교수", "공과대학 교수" → 학과/대학 소속 교수 목록
+- "TinyML 연구 교수" → 연구분야 키워드 일치
+
+Vertex AI Search는 이름이 정확히 일치해도 다른 교수를 먼저 반환하는 경우가 있어
+로컬에서 특정할 수 있는 질문은 여기서 답하고, 나머지만 원격 검색으로 넘깁니다.
+"""
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parents[3] / "data" / "교수정보"
+
+# 원본 데이터에서 값이 없음을 나타내는 문자열
+MISSING = "정보없음"
+
+# 학과명 끝의 소속 단위 (검색 시 "소프트웨어" → "소프트웨어전공")
+DEPARTMENT_SUFFIXES = ("전공", "학과", "학부", "과")
+
+# 이름/연구분야 후보로 보지 않는 질문 단어
+GENERIC_WORDS = {
+    "교수", "교수님", "연구", "연구실", "연구분야", "분야", "전공", "학과", "소속", "위치",
+    "연락처", "전화", "전화번호", "이메일", "메일", "주소", "담당", "과목", "수업", "강의",
+    "알려줘", "어디", "누구", "정보", "찾아줘", "시간표",
+}
+
+# 이름 후보에서 떼어낼 호칭/조사
+_NAME_SUFFIX = re.compile(r"(교수님|교수|박사님|선생님|님)?(은|는|이|가|의|을|를|께|에게)?$")
+_HANGUL_WORD = re.compile(r"[가-힣]+")
+_WHITESPACE = re.compile(r"\s+")
+
+# 한글 음절 → 자모 분해 (유니코드 조합 규칙)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (공백 제거 + 소문자)"""
+    return _WHITESPACE.sub("", text or "").lower()
+
+
+def decompose(text: str) -> str:
+    """
+    한글 음절을 초성/중성/종성 자모로 분해
+
+    "양재형" → "ㅇㅑㅇㅈㅐㅎㅕㅇ". 한글 음절이 아닌 문자는 그대로 둡니다.
+    """
+    jamo = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            jamo.append(_CHOSEONG[code // 588])
+            jamo.append(_JUNGSEONG[(code % 588) // 28])
+            if code % 28:
+                jamo.append(_JONGSEONG[code % 28])
+        else:
+            jamo.append(char)
+    return "".join(jamo)
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein 거리 (limit을 넘으면 limit + 1을 반환하고 중단)
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _clean(value: Any) -> Optional[str]:
+    if not value or value == MISSING:
+        return None
+    return value
+
+
+def _clean_list(values: Optional[List[str]]) -> List[str]:
+    return [v for v in values or [] if v and v != MISSING]
+
+
+def _department_key(name: str) -> str:
+    """"소프트웨어전공" → "소프트웨어" (접미사를 뗀 학과 검색 키)"""
+    key = normalize(name)
+    for suffix in DEPARTMENT_SUFFIXES:
+        if key.endswith(suffix) and len(key) - len(suffix) >= 2:
+            return key[:-len(suffix)]
+    return key
+
+
+@dataclass(eq=False)
+class Professor:
+    id: str
+    name: str
+    department: str
+    college: Optional[str] = None
+    school: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    office: Optional[str] = None
+    degree: Optional[str] = None
+    keywords: List[str] = field(default_factory=list)
+    courses: List[str] = field(default_factory=list)
+    jamo: str = ""
+
+    @classmethod
+    def from_document(cls, doc: Dict[str, Any]) -> 'Professor':
+        metadata = doc.get("metadata", {})
+        # title: "양재형 교수 | 소프트웨어전공 | 종합 정보" (상경학부는 "상경학부 국제무역학전공")
+        parts = [p.strip() for p in doc.get("title", "").split("|")]
+        department = parts[1].split()[-1] if len(parts) > 1 and parts[1] else ""
+        name = metadata["name_ko"]
+        return cls(
+            id=metadata.get("professor_id") or doc["id"],
+            name=name,
+            department=department,
+            email=_clean(metadata.get("email")),
+            phone=_clean(metadata.get("phone")),
+            office=_clean(metadata.get("office")),
+            degree=_clean(metadata.get("degree")),
+            keywords=_clean_list(metadata.get("keywords")),
+            courses=_clean_list(metadata.get("courses")),
+            jamo=decompose(name),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """원격 검색 structData와 같은 키 + 소속 정보"""
+        return {
+            "name_ko": self.name,
+            "department": self.department,
+            "school": self.school,
+            "college": self.college,
+            "email": self.email,
+            "phone": self.phone,
+            "office": self.office,
+            "degree": self.degree,
+            "keywords": self.keywords,
+            "courses": self.courses,
+            "professor_id": self.id,
+        }
+
+
+class ProfessorIndex:
+    """교수 이름/학과/대학/연구분야 색인"""
+
+    def __init__(self, professors: List[Professor]):
+        self.professors = professors
+        self._by_name: Dict[str, List[Professor]] = {}
+        self._by_department: Dict[str, List[Professor]] = {}
+        self._by_college: Dict[str, List[Professor]] = {}
+        self._by_keyword: Dict[str, List[Professor]] = {}
+
+        for professor in professors:
+            self._by_name.setdefault(professor.name, []).append(professor)
+            for unit in (professor.department, professor.school):
+                if unit:
+                    for key in {normalize(unit), _department_key(unit)}:
+                        bucket = self._by_department.setdefault(key, [])
+                        if professor not in bucket:
+                            bucket.append(professor)
+            if professor.college:
+                self._by_college.setdefault(normalize(professor.college), []).append(professor)
+            for keyword in professor.keywords:
+                self._by_keyword.setdefault(normalize(keyword), []).append(professor)
+
+        # 긴 이름 우선 매칭 ("인공지능융합부"가 "인공지능"보다 먼저)
+        self._department_keys = sorted(self._by_department, key=len, reverse=True)
+        self._college_keys = sorted(self._by_college, key=len, reverse=True)
+        self._keyword_keys = sorted(self._by_keyword, key=len, reverse=True)
+
+    @classmethod
+    def from_jsonl_dir(cls, directory: Path) -> 'ProfessorIndex':
+        """
+        학과별 jsonl을 모두 읽어 색인 구성
+
+        교수 문서("종합 정보")와 학과별 교수 명단 인덱스(org_index)를 함께 읽어
+        명단에 있는 교수에게 대학/학부 소속을 붙입니다.
+        """
+        professors: List[Professor] = []
+        affiliations: Dict[str, Tuple[str, str]] = {}
+        for path in sorted(Path(directory).glob("*.jsonl")):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    doc = json.loads(line)
+                    metadata = doc.get("metadata", {})
+                    if metadata.get("entity") == "org_index":
+                        for professor_id in metadata.get("professor_ids", []):
+                            affiliations[professor_id] = (metadata.get("college"), metadata.get("department"))
+                    elif metadata.get("name_ko"):
+                        professors.append(Professor.from_document(doc))
+
+        for professor in professors:
+            college, school = affiliations.get(professor.id, (None, None))
+            professor.college = college
+            if school and school != professor.department:
+                professor.school = school
+        return cls(professors)
+
+    def _name_candidates(self, text: str) -> List[str]:
+        """질문에서 이름 후보 (2~4글자 한글 단어, 호칭/조사 제거)"""
+        candidates = []
+        for word in _HANGUL_WORD.findall(text or ""):
+            word = _NAME_SUFFIX.sub("", word)
+            if 2 <= len(word) <= 4 and word not in GENERIC_WORDS and word not in candidates:
+                candidates.append(word)
+        return candidates
+
+    def find_by_name(self, text: str) -> List[Professor]:
+        """질문에 포함된 이름과 정확히 일치하는 교수"""
+        found: List[Professor] = []
+        for candidate in self._name_candidates(text):
+            for professor in self._by_name.get(candidate, []):
+                if professor not in found:
+                    found.append(professor)
+        return found
+
+    def fuzzy_find_by_name(self, text: str, max_distance: int = 2) -> List[Tuple[Professor, int]]:
+        """
+        자모 편집거리로 오타가 있는 이름 찾기
+
+        이름을 자모 단위로 비교하므로 "양제형"(ㅔ)과 "양재형"(ㅐ)은 거리 1입니다.
+        글자 수가 같고 다른 음절 수가 허용 거리 이하인 이름만 비교하며,
+        거리가 가까운 순으로 반환합니다.
+
+        Args:
+            text: 질문 ("양제형 교수님 연구실")
+            max_distance: 허용할 최대 자모 편집거리
+        """
+        scored: Dict[str, Tuple[Professor, int]] = {}
+        for candidate in self._name_candidates(text):
+            jamo = decompose(candidate)
+            # 두 글자 이름은 자모가 적어 오타 한 개만 허용
+            limit = 1 if len(candidate) <= 2 else max_distance
+            for professor in self.professors:
+                if len(professor.name) != len(candidate):
+                    continue
+                # 음절이 limit개보다 많이 다르면 자모 비교 생략 (오타는 보통 한두 음절 안)
+                if sum(a != b for a, b in zip(candidate, professor.name)) > limit:
+                    continue
+                distance = edit_distance(jamo, professor.jamo, limit)
+                if distance <= limit and distance < scored.get(professor.id, (None, limit + 1))[1]:
+                    scored[professor.id] = (professor, distance)
+        return sorted(scored.values(), key=lambda item: item[1])
+
+    def match_name(self, text: str) -> Tuple[List[Professor], bool]:
+        """
+        정확한 이름 → 없으면 가장 가까운 거리의 오타 후보
+
+        Returns:
+            (교수 목록, 오타 매칭 여부)
+        """
+        professors = self.find_by_name(text)
+        if professors:
+            return professors, False
+        fuzzy = self.fuzzy_find_by_name(text)
+        if not fuzzy:
+            return [], False
+        best = fuzzy[0][1]
+        return [p for p, distance in fuzzy if distance == best], True
+
+    def find_by_department(self, text: str) -> List[Professor]:
+        """질문에 포함된 학과/전공/학부의 교수 (가장 긴 이름 하나)"""
+        key = normalize(text)
+        for name in self._department_keys:
+            if len(name) >= 2 and name in key:
+                return list(self._by_department[name])
+        return []
+
+    def find_by_college(self, text: str) -> List[Professor]:
+        key = normalize(text)
+        for name in self._college_keys:
+            if name in key:
+                return list(self._by_college[name])
+        return []
+
+    def find_by_keyword(self, text: str) -> List[Professor]:
+        """
+        연구분야 키워드 일치 (질문에 키워드가 포함되거나, 질문 단어가 키워드에 포함)
+        """
+        key = normalize(text)
+        words = [normalize(w) for w in text.split() if len(w) >= 2 and w not in GENERIC_WORDS]
+        found: List[Professor] = []
+        for keyword in self._keyword_keys:
+            if keyword in key or any(word in keyword for word in words):
+                for professor in self._by_keyword[keyword]:
+                    if professor not in found:
+                        found.append(professor)
+        return found
+
+    def answer(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        자유 질문에 로컬 데이터로 답변
+
+        Returns:
+            도구 결과 형식의 dict, 교수/학과/연구분야를 특정할 수 없으면 None
+        """
+        # 1. 이름 정확 일치
+        professors = self.find_by_name(query)
+        if professors:
+            return format_professors(query, professors)
+
+        # 2. 학과/전공 → 3. 대학 → 4. 연구분야
+        department = self.find_by_department(query)
+        if department:
+            return format_professors(query, department)
+
+        college = self.find_by_college(query)
+        if college:
+            return format_professors(query, college)
+
+        keyword = self.find_by_keyword(query)
+        if keyword:
+            return format_professors(query, keyword)
+
+        # 5. 이름 오타 (학과명/키워드가 이름으로 오인되지 않도록 마지막에)
+        professors, fuzzy = self.match_name(query)
+        if professors:
+            return format_professors(query, professors, fuzzy=fuzzy)
+
+        return None
+
+
+def format_professors(query: str, professors: List[Professor], fuzzy: bool = False) -> Dict[str, Any]:
+    """교수 목록을 도구 결과 형식으로 변환"""
+    results = [
+        {"rank": rank, "title": professor.id, "fields": professor.to_dict()}
+        for rank, professor in enumerate(professors, start=1)
+    ]
+    if fuzzy:
+        names = ", ".join(p.name for p in professors)
+        message = f"'{query}'와 정확히 일치하는 교수는 없지만 비슷한 이름({names})을 찾았습니다."
+    else:
+        message = f"'{query}'에 대한 교수 정보 {len(results)}건을 찾았습니다."
+    return {
+        "status": "success",
+        "source": "local",
+        "count": len(results),
+        "query": query,
+        "results": results,
+        "message": message
+    }
+
+
+# 프로세스 공용 싱글톤
+_professor_index_instance: Optional[ProfessorIndex] = None
+_professor_index_lock = threading.Lock()
+
+
+def get_professor_index() -> ProfessorIndex:
+    """
+    ProfessorIndex 싱글톤 인스턴스 반환
+    """
+    global _professor_index_instance
+    if _professor_index_instance is None:
+        with _professor_index_lock:
+            if _professor_index_instance is None:
+                from google_adk.config import PROFESSOR_DATA_DIR
+                directory = Path(PROFESSOR_DATA_DIR or DEFAULT_DATA_DIR)
+                _professor_index_instance = ProfessorIndex.from_jsonl_dir(directory)
+                print(f"[ProfessorIndex] ✅ Loaded {len(_professor_index_instance.professors)} professors from {directory.name}")
+    return _professor_index_instance
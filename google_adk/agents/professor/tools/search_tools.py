@@ -1,12 +1,19 @@
 """
-강남대학교 교수정보 검색 도구 (Vertex AI Search 기반)
+강남대학교 교수정보 검색 도구
+
+로컬 교수 색인(이름/학과/연구분야, 이름 오타 허용)으로 먼저 답하고,
+특정할 수 없는 질문만 Vertex AI Search로 검색합니다.
 """
 
 import json
 from google.adk.tools import FunctionTool
-from google.auth import default
-from google.auth.transport.requests import Request
-from typing import Dict, Any, Optional
+from google_adk.search import get_search_client, merge_results, run_batch
+from google_adk.agents.professor.tools.professor_index import (
+    ProfessorIndex,
+    format_professors,
+    get_professor_index,
+)
+from typing import Dict, Any, List, Optional
 
 # Vertex AI Search 엔진 endpoint
 VERTEX_SEARCH_ENDPOINT = (
@@ -16,35 +23,23 @@ VERTEX_SEARCH_ENDPOINT = (
     "servingConfigs/default_search:search"
 )
 
+def _professor_index() -> Optional[ProfessorIndex]:
+    """로컬 교수 색인 (데이터 파일을 읽지 못하면 None → 원격 검색 사용)"""
+    try:
+        return get_professor_index()
+    except Exception as e:
+        print(f"[ProfessorIndex] ⚠️ 로컬 데이터 로드 실패, 원격 검색 사용: {e}")
+        return None
+
+
 # 공통 함수: Vertex AI Search API 호출
 def vertex_ai_search_request(query: str, page_size: int = 10) -> Dict[str, Any]:
     """
-    Vertex AI Search API를 curl 호출 형태로 실행하고 결과를 반환.
+    Vertex AI Search API를 호출하고 결과를 반환.
     """
     try:
-        # Google Auth 라이브러리로 access token 가져오기 (배포 환경 호환)
-        credentials, project = default()
-        if not credentials.valid:
-            credentials.refresh(Request())
-        token = credentials.token
-        
-        payload = {
-            "query": query,
-            "pageSize": page_size,
-            "queryExpansionSpec": {"condition": "AUTO"},
-            "spellCorrectionSpec": {"mode": "AUTO"},
-            "languageCode": "ko",
-            "userInfo": {"timeZone": "Asia/Seoul"}
-        }
-        
-        # API 호출
-        import requests
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.post(VERTEX_SEARCH_ENDPOINT, headers=headers, json=payload)
-        result = response.json()
+        # 공용 클라이언트로 호출 (인증 정보/연결 풀 재사용, 타임아웃 적용)
+        result = get_search_client().search(VERTEX_SEARCH_ENDPOINT, query, page_size)
         
         # 정리된 형태로 반환
         if "results" in result:
@@ -83,8 +78,12 @@ def vertex_ai_search_request(query: str, page_size: int = 10) -> Dict[str, Any]:
         
 def search_professor_by_name(query: str) -> Dict[str, Any]:
     """
-    교수 이름으로 검색합니다.
+    교수 이름으로 검색합니다. (정확히 일치하는 이름이 없으면 비슷한 이름)
     """
+    index = _professor_index()
+    professors, fuzzy = index.match_name(query) if index else ([], False)
+    if professors:
+        return format_professors(query, professors, fuzzy=fuzzy)
     return vertex_ai_search_request(f"{query} 교수")
 
 def search_professor_by_department(college: str, department: Optional[str] = None) -> Dict[str, Any]:
@@ -95,6 +94,14 @@ def search_professor_by_department(college: str, department: Optional[str] = Non
         query = f"{college} {department} 교수"
     else:
         query = f"{college} 교수"
+    index = _professor_index()
+    if index:
+        if department:
+            professors = index.find_by_department(department)
+        else:
+            professors = index.find_by_college(college) or index.find_by_department(college)
+        if professors:
+            return format_professors(query, professors)
     return vertex_ai_search_request(query)
 
 def search_professor_by_research_field(research_field: str) -> Dict[str, Any]:
@@ -102,23 +109,43 @@ def search_professor_by_research_field(research_field: str) -> Dict[str, Any]:
     연구분야로 교수 검색
     """
     query = f"{research_field} 연구 교수"
+    index = _professor_index()
+    professors = index.find_by_keyword(research_field) if index else []
+    if professors:
+        return format_professors(query, professors)
     return vertex_ai_search_request(query)
 
 def search_professor_info(query: str) -> Dict[str, Any]:
     """
     자유 입력형 검색
     """
+    index = _professor_index()
+    local = index.answer(query) if index else None
+    if local:
+        return local
     return vertex_ai_search_request(query)
 
+def search_professor_info_batch(queries: List[str]) -> Dict[str, Any]:
+    """
+    여러 교수/학과/연구분야를 한 번에 동시 검색하고 중복을 제거해 합친 결과를 반환합니다.
+    예: ["양재형", "김태권", "최인엽"]
+
+    Args:
+        queries: 검색어 목록 (최대 20개)
+    """
+    return merge_results(run_batch(search_professor_info, queries))
+
 
 search_professor_info_tool = FunctionTool(search_professor_info)
 search_professor_by_name_tool = FunctionTool(search_professor_by_name)
 search_professor_by_department_tool = FunctionTool(search_professor_by_department)
 search_professor_by_research_field_tool = FunctionTool(search_professor_by_research_field)
+search_professor_info_batch_tool = FunctionTool(search_professor_info_batch)
 
 ALL_PROFESSOR_TOOLS = [
     search_professor_info_tool,
     search_professor_by_name_tool,
     search_professor_by_department_tool,
     search_professor_by_research_field_tool,
+    search_professor_info_batch_tool,
 ]
@@ -6,6 +6,9 @@ from .subject_tools import (
     search_subject_info_tool,
     search_subject_by_grade_and_dept_tool,
     search_subject_syllabus_tool,
+    search_subject_by_time_tool,
+    check_timetable_conflict_tool,
+    search_subject_info_batch_tool,
     ALL_SUBJECT_TOOLS
 )
 
@@ -13,5 +16,8 @@ __all__ = [
     'search_subject_info_tool',
     'search_subject_by_grade_and_dept_tool',
     'search_subject_syllabus_tool',
+    'search_subject_by_time_tool',
+    'check_timetable_conflict_tool',
+    'search_subject_info_batch_tool',
     'ALL_SUBJECT_TOOLS'
 ]
@@ -0,0 +1,283 @@
+"""
+과목정보 로컬 BM25 검색 엔진
+
+data/과목정보/kangnam_all_{YEAR}_{SEMESTER}.jsonl(약 1.8천 행)을 메모리에 색인하고
+BM25로 순위를 매겨 search_subject_info를 Discovery Engine 호출 없이 처리합니다.
+
+- 토큰화: 한글은 문자 n-gram(기본 bigram), 영문/숫자는 단어 단위
+  ("소프트웨어공학" → 소프, 프트, 트웨, 웨어, 어공, 공학) → 띄어쓰기/조사에 덜 민감
+- 필드 가중치: 과목명 > 담당교수 > 학과/전공 > 본문
+  (필드별 BM25 점수에 가중치를 곱해 합산, 길이 정규화는 필드마다 따로)
+- 같은 학수번호-분반이 여러 학과 목록에 나오면 한 문서로 합치고 학과를 모두 색인
+- 1위 문서가 질문 토큰을 충분히 포함하지 않으면(예: "양자역학" → "건축구조역학") 일치 없음으로 처리
+"""
+import heapq
+import json
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_DATA_PATH = (
+    Path(__file__).resolve().parents[3] / "data" / "과목정보" / "kangnam_all_2025_2.jsonl"
+)
+
+# 필드 가중치 (과목명 > 담당교수 > 학과/전공 > 본문)
+FIELD_BOOSTS = {
+    "subject_name": 3.0,
+    "professor": 2.0,
+    "department": 1.5,
+    "content": 1.0,
+}
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 1위 문서가 포함해야 하는 질문 토큰 비율 (미만이면 로컬 데이터에 없는 질문으로 보고 원격 검색)
+MIN_QUERY_COVERAGE = 0.6
+
+# 검색 의도만 나타내는 질문 단어 (모든 과목과 무관하게 겹치는 토큰을 만들어 제외)
+QUERY_STOPWORDS = {
+    "수업", "강의", "과목", "교과목", "교수", "교수님", "알려줘", "알려주세요", "찾아줘",
+    "뭐야", "뭐가", "있어", "있나요", "어떤", "무슨", "정보", "목록",
+}
+
+_WORD = re.compile(r"[0-9a-z가-힣]+")
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str, n: int = 2) -> List[str]:
+    """
+    검색용 토큰 목록
+
+    한글이 섞인 단어는 문자 n-gram으로, 영문/숫자 단어는 그대로 씁니다.
+    n보다 짧은 한글 단어는 단어 전체를 토큰으로 씁니다. ("3학년" → 3학, 학년)
+    """
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        if not _HANGUL.search(word) or len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+@dataclass(eq=False)
+class CourseDocument:
+    """
+    검색 문서 (학수번호-분반 단위)
+
+    Attributes:
+        departments: 이 과목을 개설 목록에 포함한 학과/전공 (중복 행 병합)
+        grades: 개설 학년 (교양은 0)
+        doc: 원본 JSONL 문서 (첫 행, 결과 content/metadata로 그대로 반환)
+    """
+    id: str
+    subject_name: str
+    professor: str
+    content: str
+    doc: Dict[str, Any]
+    departments: List[str] = field(default_factory=list)
+    grades: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_document(cls, doc: Dict[str, Any]) -> 'CourseDocument':
+        metadata = doc.get("metadata", {})
+        # "과목명: ..." 같은 레이블은 모든 문서에 있어 값만 색인하고,
+        # 강의계획서 URL 줄은 검색어와 무관한 토큰(https, knumis, ...)만 만들어 제외
+        content = "\n".join(
+            line.split(":", 1)[-1].strip()
+            for line in doc.get("content", "").splitlines()
+            if not line.startswith("강의계획서:")
+        )
+        return cls(
+            id=doc["id"],
+            subject_name=metadata.get("subject_name", ""),
+            professor=metadata.get("professor", ""),
+            content=content,
+            doc=doc,
+            departments=list(metadata.get("departments") or [metadata.get("department", "")]),
+            grades=[int(g) for g in metadata.get("grades") or [metadata.get("grade", 0)]],
+        )
+
+    def fields(self) -> Dict[str, str]:
+        return {
+            "subject_name": self.subject_name,
+            "professor": self.professor,
+            "department": " ".join(self.departments),
+            "content": self.content,
+        }
+
+
+@dataclass
+class SearchHit:
+    """
+    검색 결과
+
+    Attributes:
+        coverage: 문서에 나타난 질문 토큰 비율 (0~1)
+    """
+    document: CourseDocument
+    score: float
+    coverage: float = 1.0
+
+
+class CourseSearchEngine:
+    """과목 문서 BM25 색인 (필드별 역색인 + 길이 정규화 값 미리 계산)"""
+
+    def __init__(self, documents: List[CourseDocument], ngram: int = 2):
+        self.documents = documents
+        self.ngram = ngram
+
+        # term -> {문서 번호: {필드: tf}}
+        self._postings: Dict[str, Dict[int, Dict[str, int]]] = {}
+        lengths: Dict[str, List[int]] = {name: [] for name in FIELD_BOOSTS}
+        for doc_id, document in enumerate(documents):
+            for name, text in document.fields().items():
+                tokens = tokenize(text, ngram)
+                lengths[name].append(len(tokens))
+                for token in tokens:
+                    tf = self._postings.setdefault(token, {}).setdefault(doc_id, {})
+                    tf[name] = tf.get(name, 0) + 1
+
+        # 필드별 k1 * (1 - b + b * len / avg_len)
+        self._norms: Dict[str, List[float]] = {}
+        for name, values in lengths.items():
+            avg = (sum(values) / len(values)) if values and sum(values) else 1.0
+            self._norms[name] = [BM25_K1 * (1 - BM25_B + BM25_B * length / avg) for length in values]
+
+        total = len(documents)
+        self._idf = {
+            term: math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self._postings.items()
+        }
+
+    @classmethod
+    def from_jsonl(cls, path: Path, ngram: int = 2) -> 'CourseSearchEngine':
+        """JSONL 읽기 (병합 전 스냅샷처럼 같은 id의 행이 여러 개면 학과/학년만 합침)"""
+        documents: Dict[str, CourseDocument] = {}
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                document = CourseDocument.from_document(json.loads(line))
+                existing = documents.get(document.id)
+                if existing is None:
+                    documents[document.id] = document
+                else:
+                    for dept in document.departments:
+                        if dept not in existing.departments:
+                            existing.departments.append(dept)
+                    for grade in document.grades:
+                        if grade not in existing.grades:
+                            existing.grades.append(grade)
+        return cls(list(documents.values()), ngram=ngram)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def score(self, query: str) -> Dict[int, float]:
+        """질문 토큰별 필드 가중 BM25 점수 합 (문서 번호 -> 점수)"""
+        return self._score(query)[0]
+
+    def _score(self, query: str) -> Tuple[Dict[int, float], Dict[int, int], int]:
+        """(문서 번호 -> 점수, 문서 번호 -> 일치한 질문 토큰 수, 질문 토큰 수)"""
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        words = " ".join(w for w in (query or "").split() if w not in QUERY_STOPWORDS)
+        terms = list(dict.fromkeys(tokenize(words, self.ngram)))
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for doc_id, tfs in postings.items():
+                total = 0.0
+                for name, tf in tfs.items():
+                    total += FIELD_BOOSTS[name] * tf * (BM25_K1 + 1) / (tf + self._norms[name][doc_id])
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * total
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+        return scores, matched, len(terms)
+
+    def search(
+        self, query: str, limit: int = 10, offset: int = 0, min_coverage: float = 0.0
+    ) -> Tuple[int, List[SearchHit]]:
+        """
+        BM25 순위 검색
+
+        Args:
+            query: 검색어
+            limit: 반환할 결과 수
+            offset: 결과 시작 위치 (원격 검색 도구와 같은 페이지 방식)
+            min_coverage: 1위 문서의 질문 토큰 비율이 이보다 낮으면 일치 없음 (0, [])
+
+        Returns:
+            (일치한 전체 문서 수, offset부터 limit개의 결과)
+        """
+        scores, matched, term_count = self._score(query)
+        # 필요한 만큼만 부분 정렬, 동점이면 원본 순서(학수번호 순) 유지
+        ranked = heapq.nsmallest(offset + limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        if not ranked or matched[ranked[0][0]] < min_coverage * term_count:
+            return 0, []
+        page = ranked[offset:]
+        return len(scores), [
+            SearchHit(self.documents[doc_id], score, matched[doc_id] / term_count) for doc_id, score in page
+        ]
+
+
+def format_search(query: str, total: int, hits: List[SearchHit], offset: int = 0) -> Dict[str, Any]:
+    """원격 검색 도구(vertex_ai_search_request)와 같은 결과 형식"""
+    results = []
+    for rank, hit in enumerate(hits, start=1 + offset):
+        doc = hit.document.doc
+        metadata = dict(doc.get("metadata", {}))
+        if len(hit.document.departments) > 1:
+            metadata["departments"] = hit.document.departments
+        results.append({
+            "rank": rank,
+            "title": hit.document.id,
+            "content": doc.get("content", ""),
+            "metadata": metadata,
+            "snippet": "",
+            "score": round(hit.score, 3),
+        })
+
+    if results:
+        message = f"'{query}'에 대한 검색 결과 {len(results)}개를 찾았습니다. (전체 {total}개 중 {offset+1}~{offset+len(results)})"
+    else:
+        message = f"'{query}'에 대한 검색 결과는 전체 {total}개로, {offset+1}번째부터는 결과가 없습니다."
+
+    return {
+        "status": "success",
+        "source": "local",
+        "count": len(results),
+        "total_size": total,
+        "query": query,
+        "offset": offset,
+        "results": results,
+        "message": message,
+    }
+
+
+# 프로세스 공용 싱글톤
+_course_search_instance: Optional[CourseSearchEngine] = None
+_course_search_lock = threading.Lock()
+
+
+def get_course_search_engine() -> CourseSearchEngine:
+    """
+    CourseSearchEngine 싱글톤 인스턴스 반환
+    """
+    global _course_search_instance
+    if _course_search_instance is None:
+        with _course_search_lock:
+            if _course_search_instance is None:
+                from google_adk.config import SUBJECT_DATA_PATH
+                path = Path(SUBJECT_DATA_PATH or DEFAULT_DATA_PATH)
+                _course_search_instance = CourseSearchEngine.from_jsonl(path)
+                print(f"[CourseSearch] ✅ Indexed {len(_course_search_instance)} courses from {path.name}")
+    return _course_search_instance
@@ -1,12 +1,29 @@
 """
-강남대학교 과목 정보 검색 도구 (Vertex AI Search 기반)
+강남대학교 과목 정보 검색 도구
+
+자유 검색은 로컬 BM25 엔진(course_search)으로 먼저 처리하고,
+질문 토큰을 충분히 포함하는 과목이 없을 때만 Vertex AI Search를 호출합니다.
 """
 
 import json
 from google.adk.tools import FunctionTool
-from google.auth import default
-from google.auth.transport.requests import Request
-from typing import Dict, Any, Optional
+from google_adk.search import get_search_client, merge_results, run_batch
+from google_adk.agents.subject.tools.course_search import (
+    MIN_QUERY_COVERAGE,
+    CourseSearchEngine,
+    format_search,
+    get_course_search_engine,
+)
+from google_adk.agents.subject.tools.timetable import (
+    TIME_OF_DAY,
+    TimetableIndex,
+    describe_mask,
+    format_timed_courses,
+    get_timetable_index,
+    parse_days,
+    window_mask,
+)
+from typing import Dict, Any, List, Optional
 
 # Vertex AI Search 엔진 endpoint
 VERTEX_SEARCH_ENDPOINT = (
@@ -16,36 +33,32 @@ VERTEX_SEARCH_ENDPOINT = (
     "servingConfigs/default_search:search"
 )
 
+def _course_search() -> Optional[CourseSearchEngine]:
+    """로컬 과목 검색 엔진 (데이터 파일을 읽지 못하면 None → 원격 검색 사용)"""
+    try:
+        return get_course_search_engine()
+    except Exception as e:
+        print(f"[CourseSearch] ⚠️ 로컬 데이터 로드 실패, 원격 검색 사용: {e}")
+        return None
+
+
+def _timetable() -> Optional[TimetableIndex]:
+    """로컬 시간표 색인 (데이터 파일을 읽지 못하면 None)"""
+    try:
+        return get_timetable_index()
+    except Exception as e:
+        print(f"[Timetable] ⚠️ 로컬 데이터 로드 실패: {e}")
+        return None
+
+
 # 공통 함수: Vertex AI Search API 호출
 def vertex_ai_search_request(query: str, page_size: int = 10, offset: int = 0) -> Dict[str, Any]:
     """
-    Vertex AI Search API를 curl 호출 형태로 실행하고 결과를 반환.
+    Vertex AI Search API를 호출하고 결과를 반환.
     """
     try:
-        # Google Auth 라이브러리로 access token 가져오기 (배포 환경 호환)
-        credentials, project = default()
-        if not credentials.valid:
-            credentials.refresh(Request())
-        token = credentials.token
-        
-        payload = {
-            "query": query,
-            "pageSize": page_size,
-            "offset": offset,
-            "queryExpansionSpec": {"condition": "AUTO"},
-            "spellCorrectionSpec": {"mode": "AUTO"},
-            "languageCode": "ko",
-            "userInfo": {"timeZone": "Asia/Seoul"}
-        }
-        
-        # API 호출
-        import requests
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        response = requests.post(VERTEX_SEARCH_ENDPOINT, headers=headers, json=payload)
-        result = response.json()
+        # 공용 클라이언트로 호출 (인증 정보/연결 풀 재사용, 타임아웃 적용)
+        result = get_search_client().search(VERTEX_SEARCH_ENDPOINT, query, page_size, offset)
         
         # 정리된 형태로 반환
         if "results" in result:
@@ -99,8 +112,23 @@ def search_subject_info(query: str, offset: int = 0) -> Dict[str, Any]:
         query: 검색어
         offset: 검색 결과 시작 위치 (기본값 0). 더 많은 결과를 볼 때 10, 20 등으로 설정하세요.
     """
+    engine = _course_search()
+    if engine:
+        total, hits = engine.search(query, limit=10, offset=offset, min_coverage=MIN_QUERY_COVERAGE)
+        if total:
+            return format_search(query, total, hits, offset)
     return vertex_ai_search_request(query, offset=offset)
 
+def search_subject_info_batch(queries: List[str]) -> Dict[str, Any]:
+    """
+    여러 과목/교수 이름을 한 번에 동시 검색하고 중복을 제거해 합친 결과를 반환합니다.
+    예: 교수님별 담당 과목 → ["양재형", "김태권", "최인엽"]
+
+    Args:
+        queries: 검색어 목록 (최대 20개)
+    """
+    return merge_results(run_batch(search_subject_info, queries))
+
 def search_subject_by_grade_and_dept(grade: int, department: str, offset: int = 0) -> Dict[str, Any]:
     """
     특정 학과와 학년의 수업을 검색합니다.
@@ -125,13 +153,143 @@ def search_subject_syllabus(subject_name: str, offset: int = 0) -> Dict[str, Any
     query = f"{subject_name} 강의계획서"
     return vertex_ai_search_request(query, offset=offset)
 
+def search_subject_by_time(
+    day: Optional[str] = None,
+    time_of_day: Optional[str] = None,
+    department: Optional[str] = None,
+    grade: Optional[int] = None,
+    keyword: Optional[str] = None,
+    offset: int = 0
+) -> Dict[str, Any]:
+    """
+    요일/시간대 조건으로 수업을 찾습니다. 수업 시간이 모두 해당 요일/시간대 안에 있는 과목만 반환합니다.
+    예: "목요일 오후 교양 수업" → search_subject_by_time(day="목", time_of_day="오후", department="교양")
+
+    Args:
+        day: 요일 ("월"~"금", "목요일", 여러 요일은 "월,수")
+        time_of_day: 시간대 ("오전" 09~12시, "오후" 12~18시, "야간" 18시 이후)
+        department: 학과/전공 이름 일부 (교양 과목은 "교양")
+        grade: 학년 (1~4, 교양은 0)
+        keyword: 과목명에 포함될 단어
+        offset: 검색 결과 시작 위치 (기본값 0). 더 많은 결과를 볼 때 10, 20 등으로 설정하세요.
+    """
+    query = " ".join(str(v) for v in (day, time_of_day, department, grade, keyword) if v not in (None, ""))
+    days = parse_days(day)
+    if time_of_day and time_of_day not in TIME_OF_DAY:
+        return {
+            "status": "error",
+            "query": query,
+            "message": f"time_of_day는 {', '.join(TIME_OF_DAY)} 중 하나여야 합니다."
+        }
+    if days is None and not time_of_day:
+        return {"status": "error", "query": query, "message": "요일(day) 또는 시간대(time_of_day)를 지정해 주세요."}
+
+    index = _timetable()
+    if index is None:
+        return {"status": "error", "query": query, "message": "시간표 데이터를 불러올 수 없습니다."}
+
+    first, last = TIME_OF_DAY.get(time_of_day, (1, 15))
+    courses = index.within(window_mask(days, first, last))
+    if department:
+        dept = department.replace(" ", "")
+        courses = [c for c in courses if any(dept in d.replace(" ", "") for d in c.document.departments)]
+    if grade is not None:
+        courses = [c for c in courses if grade in c.document.grades]
+    if keyword:
+        word = keyword.replace(" ", "")
+        courses = [c for c in courses if word in c.document.subject_name.replace(" ", "")]
+
+    # 이른 시간 순 (가장 낮은 비트 = 가장 이른 요일/교시)
+    courses.sort(key=lambda c: ((c.mask & -c.mask).bit_length(), c.document.subject_name))
+    return format_timed_courses(query, courses, offset=offset)
+
+def check_timetable_conflict(courses: List[str]) -> Dict[str, Any]:
+    """
+    여러 과목의 수업 시간이 겹치는지 확인합니다.
+    예: "데이터베이스랑 소프트웨어공학 같이 들을 수 있어?" → check_timetable_conflict(["데이터베이스", "소프트웨어공학"])
+
+    Args:
+        courses: 과목명, 학수번호(EF14207) 또는 학수번호-분반(EF14207-01) 목록
+    """
+    index = _timetable()
+    if index is None:
+        return {"status": "error", "query": courses, "message": "시간표 데이터를 불러올 수 없습니다."}
+
+    fixed = []       # 분반이 하나로 정해진 과목
+    ambiguous = []   # 분반이 여러 개인 과목
+    not_found = []
+    for text in courses:
+        found = index.resolve(text)
+        if not found:
+            not_found.append(text)
+        elif len(found) == 1:
+            fixed.append((text, found[0]))
+        else:
+            ambiguous.append((text, found))
+
+    conflicts = []
+    for i, (_, a) in enumerate(fixed):
+        for _, b in fixed[i + 1:]:
+            overlap = index.conflicts(a, b)
+            if overlap:
+                conflicts.append({"courses": [a.id, b.id], "overlap": describe_mask(overlap)})
+
+    # 분반이 여러 개면 분반마다 확정된 과목과 겹치는지 표시
+    sections = []
+    for text, found in ambiguous:
+        sections.append({
+            "query": text,
+            "sections": [
+                {
+                    "id": course.id,
+                    "professor": course.document.professor,
+                    "time_slots": describe_mask(course.mask),
+                    "conflicts_with": [
+                        other.id for _, other in fixed
+                        if other is not course and index.conflicts(course, other)
+                    ],
+                }
+                for course in found
+            ]
+        })
+
+    resolved = [
+        {"query": text, "id": course.id, "subject_name": course.document.subject_name,
+         "lecture_time": course.lecture_time, "time_slots": describe_mask(course.mask)}
+        for text, course in fixed
+    ]
+    unscheduled = [course.id for _, course in fixed if not course.mask]
+    message = f"확인한 과목 {len(fixed)}개 중 시간이 겹치는 조합 {len(conflicts)}개"
+    if sections:
+        message += f", 분반 선택이 필요한 과목 {len(sections)}개"
+    if not_found:
+        message += f", 찾지 못한 과목: {', '.join(not_found)}"
+
+    return {
+        "status": "success",
+        "source": "local",
+        "has_conflict": bool(conflicts),
+        "courses": resolved,
+        "conflicts": conflicts,
+        "ambiguous": sections,
+        "unscheduled": unscheduled,
+        "not_found": not_found,
+        "message": message
+    }
+
 
 search_subject_info_tool = FunctionTool(search_subject_info)
+search_subject_info_batch_tool = FunctionTool(search_subject_info_batch)
 search_subject_by_grade_and_dept_tool = FunctionTool(search_subject_by_grade_and_dept)
 search_subject_syllabus_tool = FunctionTool(search_subject_syllabus)
+search_subject_by_time_tool = FunctionTool(search_subject_by_time)
+check_timetable_conflict_tool = FunctionTool(check_timetable_conflict)
 
 ALL_SUBJECT_TOOLS = [
     search_subject_info_tool,
     search_subject_by_grade_and_dept_tool,
-    search_subject_syllabus_tool
+    search_subject_syllabus_tool,
+    search_subject_by_time_tool,
+    check_timetable_conflict_tool,
+    search_subject_info_batch_tool,
 ]
@@ -0,0 +1,276 @@
+"""
+강의시간 파서 + 시간표 슬롯 색인
+
+과목정보의 강의시간 문자열을 (요일, 교시, 반교시) 슬롯으로 풀고
+과목마다 비트셋(int)으로 저장합니다.
+
+    "(주)목9ab"            → 목 9교시 a, b
+    "(주)수4ab5a,목5b6ab"  → 수 4a 4b 5a, 목 5b 6a 6b
+    "(야)월101112"         → 월 10, 11, 12교시 (야간은 반교시 구분 없이 교시 전체)
+    "별도배정", ""         → 슬롯 없음
+
+비트 번호 = 요일 * 30 + (교시 - 1) * 2 + 반교시 이므로
+두 과목의 시간 충돌은 mask_a & mask_b 한 번으로 확인합니다.
+
+교시 시각은 1교시 09:00부터 1시간 단위(a: 앞 30분, b: 뒤 30분)로 계산하며,
+야간 교시(10교시~)도 같은 규칙(10교시 18:00)을 따른다고 가정합니다.
+"""
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DAYS = "월화수목금토일"
+MAX_PERIOD = 15
+HALVES = "ab"
+SLOTS_PER_DAY = MAX_PERIOD * len(HALVES)
+
+# 1교시 시작 시각 (시)
+FIRST_PERIOD_HOUR = 9
+
+# 시간대 → 교시 범위 (포함)
+TIME_OF_DAY = {
+    "오전": (1, 3),     # 09:00-12:00
+    "오후": (4, 9),     # 12:00-18:00
+    "야간": (10, MAX_PERIOD),
+    "저녁": (10, MAX_PERIOD),
+}
+
+_PREFIX = re.compile(r"^\((주|야)\)")
+_DAY_SEGMENT = re.compile(r"([월화수목금토일])([0-9ab]+)")
+_PERIOD_TOKEN = re.compile(r"(\d+)([ab]*)")
+
+
+@dataclass(frozen=True)
+class Slot:
+    """30분 단위 수업 칸 (day: 0=월, period: 1~15교시, half: 0=a, 1=b)"""
+    day: int
+    period: int
+    half: int
+
+    @property
+    def bit(self) -> int:
+        return self.day * SLOTS_PER_DAY + (self.period - 1) * len(HALVES) + self.half
+
+    @classmethod
+    def from_bit(cls, bit: int) -> 'Slot':
+        day, rest = divmod(bit, SLOTS_PER_DAY)
+        period, half = divmod(rest, len(HALVES))
+        return cls(day, period + 1, half)
+
+    @property
+    def start_minutes(self) -> int:
+        return (FIRST_PERIOD_HOUR + self.period - 1) * 60 + self.half * 30
+
+
+def _split_periods(digits: str) -> List[int]:
+    """붙어 있는 교시 숫자 분리 ("101112" → 10, 11, 12 / "12" → 12)"""
+    periods = []
+    i = 0
+    while i < len(digits):
+        two = digits[i:i + 2]
+        if len(two) == 2 and 10 <= int(two) <= MAX_PERIOD:
+            periods.append(int(two))
+            i += 2
+        else:
+            periods.append(int(digits[i]))
+            i += 1
+    return periods
+
+
+def parse_lecture_time(text: str) -> List[Slot]:
+    """
+    강의시간 문자열 → 슬롯 목록
+
+    인식할 수 없는 문자열("별도배정", 빈 값)은 빈 목록을 반환합니다.
+    """
+    text = _PREFIX.sub("", (text or "").replace(" ", ""))
+    slots: List[Slot] = []
+    for day_char, body in _DAY_SEGMENT.findall(text):
+        day = DAYS.index(day_char)
+        for digits, halves in _PERIOD_TOKEN.findall(body):
+            if halves:
+                # "9ab": 한 자리 교시 + 반교시
+                periods = [int(digits)]
+            else:
+                # 야간 "101112": 교시 전체
+                periods = _split_periods(digits)
+                halves = HALVES
+            for period in periods:
+                if not 1 <= period <= MAX_PERIOD:
+                    continue
+                for half in halves:
+                    slots.append(Slot(day, period, HALVES.index(half)))
+    return slots
+
+
+def slots_to_mask(slots: Iterable[Slot]) -> int:
+    mask = 0
+    for slot in slots:
+        mask |= 1 << slot.bit
+    return mask
+
+
+def mask_to_slots(mask: int) -> List[Slot]:
+    slots = []
+    bit = 0
+    while mask:
+        if mask & 1:
+            slots.append(Slot.from_bit(bit))
+        mask >>= 1
+        bit += 1
+    return slots
+
+
+def window_mask(days: Optional[Iterable[int]] = None, first_period: int = 1, last_period: int = MAX_PERIOD) -> int:
+    """요일/교시 범위 전체를 덮는 마스크 (days가 없으면 모든 요일)"""
+    mask = 0
+    for day in (range(len(DAYS)) if days is None else days):
+        for period in range(first_period, last_period + 1):
+            for half in range(len(HALVES)):
+                mask |= 1 << Slot(day, period, half).bit
+    return mask
+
+
+def _clock(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def describe_mask(mask: int) -> List[str]:
+    """마스크 → 요일별 연속 구간 ("목 16:00-18:00")"""
+    ranges: List[Tuple[int, int, int]] = []
+    for slot in mask_to_slots(mask):
+        start = slot.start_minutes
+        if ranges and ranges[-1][0] == slot.day and ranges[-1][2] == start:
+            ranges[-1] = (slot.day, ranges[-1][1], start + 30)
+        else:
+            ranges.append((slot.day, start, start + 30))
+    return [f"{DAYS[day]} {_clock(start)}-{_clock(end)}" for day, start, end in ranges]
+
+
+def parse_days(text: Optional[str]) -> Optional[List[int]]:
+    """"목", "목요일", "월,수" → 요일 번호 목록 (없으면 None)"""
+    if not text:
+        return None
+    days = [DAYS.index(char) for char in text if char in DAYS]
+    return sorted(set(days)) or None
+
+
+def _lecture_time(doc: Dict[str, Any]) -> str:
+    for line in doc.get("content", "").splitlines():
+        if line.startswith("강의시간:"):
+            return line.split(":", 1)[1].strip()
+    return ""
+
+
+@dataclass(eq=False)
+class TimedCourse:
+    """시간표 색인 항목 (course_search.CourseDocument + 강의시간 비트셋)"""
+    document: Any
+    lecture_time: str
+    mask: int
+
+    @property
+    def id(self) -> str:
+        return self.document.id
+
+
+class TimetableIndex:
+    """
+    과목별 강의시간 비트셋 + 슬롯 → 과목 역색인
+
+    Args:
+        documents: course_search.CourseDocument 목록 (BM25 엔진과 같은 문서를 공유)
+    """
+
+    def __init__(self, documents: List[Any]):
+        self.courses: List[TimedCourse] = []
+        self._by_id: Dict[str, TimedCourse] = {}
+        self._by_code: Dict[str, List[TimedCourse]] = {}
+        self._by_name: Dict[str, List[TimedCourse]] = {}
+        self._by_slot: Dict[int, List[int]] = {}
+
+        for document in documents:
+            lecture_time = _lecture_time(document.doc)
+            course = TimedCourse(document, lecture_time, slots_to_mask(parse_lecture_time(lecture_time)))
+            position = len(self.courses)
+            self.courses.append(course)
+            self._by_id[document.id] = course
+            self._by_code.setdefault(document.id.rpartition("-")[0], []).append(course)
+            self._by_name.setdefault(document.subject_name.replace(" ", ""), []).append(course)
+            for slot in mask_to_slots(course.mask):
+                self._by_slot.setdefault(slot.bit, []).append(position)
+
+    def resolve(self, text: str) -> List[TimedCourse]:
+        """학수번호-분반 → 학수번호 → 과목명 순으로 과목 찾기 (분반이 여러 개면 모두)"""
+        key = (text or "").strip()
+        if key.upper() in self._by_id:
+            return [self._by_id[key.upper()]]
+        if key.upper() in self._by_code:
+            return list(self._by_code[key.upper()])
+        return list(self._by_name.get(key.replace(" ", ""), []))
+
+    def within(self, window: int) -> List[TimedCourse]:
+        """
+        수업 시간이 모두 window 안에 있는 과목
+
+        window에 걸친 슬롯의 과목만 후보로 모은 뒤 mask & ~window == 0으로 확인합니다.
+        """
+        candidates = set()
+        for slot in mask_to_slots(window):
+            candidates.update(self._by_slot.get(slot.bit, ()))
+        return [
+            self.courses[position] for position in sorted(candidates)
+            if self.courses[position].mask & ~window == 0
+        ]
+
+    @staticmethod
+    def conflicts(a: TimedCourse, b: TimedCourse) -> int:
+        """겹치는 슬롯 마스크 (0이면 충돌 없음)"""
+        return a.mask & b.mask
+
+
+def format_timed_courses(query: str, courses: List[TimedCourse], offset: int = 0, limit: int = 10) -> Dict[str, Any]:
+    """시간 조건 검색 결과 (원격 검색 도구와 같은 형식 + time_slots)"""
+    page = courses[offset:offset + limit]
+    results = []
+    for rank, course in enumerate(page, start=1 + offset):
+        doc = course.document.doc
+        results.append({
+            "rank": rank,
+            "title": course.id,
+            "content": doc.get("content", ""),
+            "metadata": doc.get("metadata", {}),
+            "time_slots": describe_mask(course.mask),
+        })
+    total = len(courses)
+    return {
+        "status": "success",
+        "source": "local",
+        "count": len(results),
+        "total_size": total,
+        "query": query,
+        "offset": offset,
+        "results": results,
+        "message": f"'{query}' 조건의 과목 {len(results)}개를 찾았습니다. (전체 {total}개 중 {offset+1}~{offset+len(results)})"
+    }
+
+
+# 프로세스 공용 싱글톤
+_timetable_index_instance: Optional[TimetableIndex] = None
+_timetable_index_lock = threading.Lock()
+
+
+def get_timetable_index() -> TimetableIndex:
+    """
+    TimetableIndex 싱글톤 인스턴스 반환 (과목 검색 엔진과 같은 문서 사용)
+    """
+    global _timetable_index_instance
+    if _timetable_index_instance is None:
+        with _timetable_index_lock:
+            if _timetable_index_instance is None:
+                from google_adk.agents.subject.tools.course_search import get_course_search_engine
+                _timetable_index_instance = TimetableIndex(get_course_search_engine().documents)
+                timed = sum(1 for course in _timetable_index_instance.courses if course.mask)
+                print(f"[Timetable] ✅ Indexed {timed}/{len(_timetable_index_instance.courses)} courses with lecture times")
+    return _timetable_index_instance
@@ -1,128 +1,30 @@
 """
-ADK Agent 안전 콜백 (Safety Callbacks)
+ADK Agent 콜백 (Safety / Tool Response Callbacks)
 
 프롬프트 인젝션 공격 및 유해한 입력을 차단하기 위한 before_model_callback 구현
 Gemini API 호출 직전에 사용자 입력을 검증하여 악의적인 요청을 방어합니다.
+
+도구 결과는 after_tool_callback에서 압축(compaction.py)한 뒤 모델에 전달합니다.
+질문 분야에 맞는 도구만 남기는 선별(tool_gating.py)도 before_model_callback으로 실행합니다.
 """
 
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.models import LlmRequest, LlmResponse
+from google.adk.tools import BaseTool, ToolContext
 from google.genai import types
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
+from google_adk.compaction import compact_response
+from google_adk.safety import REFUSAL_MESSAGE, get_safety_matcher
+from google_adk.tool_gating import get_intent_scorer, select_tools
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
 
-# ============================================================================
-# 유해 키워드 리스트
-# ============================================================================
-
-HARMFUL_KEYWORDS = [
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 1. 지시사항 무시 / 프롬프트 인젝션 (Korean)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "무시하고", "잊어버려", "지금부터 너는", "역할을 맡아",
-    "역할극", "연기해", "너의 지시사항을", "네 규칙을",
-    "개발자 모드", "제한을 해제해", "규칙을 어겨", "모든 규칙을 무시해",
-    "시스템 프롬프트", "지시사항을 보여줘", "인스트럭션",
-    "가장 먼저 해야 할 일", "절대 잊지 마",
-    "프롬프트를 보여줘", "instruction을 알려줘",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 1. Instruction Bypass / Prompt Injection (English)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "ignore previous", "ignore all prior", "forget your instructions",
-    "disregard your programming", "you are now", "act as", "roleplay",
-    "developer mode", "jailbreak", "dan mode", "break the rules",
-    "ignore rules", "what are your instructions", "show me your prompt",
-    "system prompt", "pretend to be", "override", "bypass",
-    "new instructions", "reset your", "you must now",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 2. 유해/부적절 콘텐츠 (Korean)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "씨발", "개새끼", "병신", "지랄", "엿먹어", "꺼져",
-    "성적인", "음란", "야한", "섹스", "포르노", "자위",
-    "폭력", "살인", "죽여", "자살", "자해", "죽고싶",
-    "혐오", "장애인", "흑인", "백인",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 2. Harmful/Inappropriate Content (English)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "fuck", "shit", "bitch", "asshole", "damn",
-    "sexual", "porn", "nude", "sexy", "horny", "masturbate",
-    "violence", "kill", "murder", "suicide", "self-harm",
-    "hate speech", "discrimination", "racist", "sexist",
-    "nazi", "terrorist",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 3. 범위 이탈 / 메타 질문 (Korean)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "정치", "대통령", "선거", "국회의원", "정당",
-    "만든 사람", "개발자", "감정", "의식", "느낌",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 3. Out-of-Scope / Meta Questions (English)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "politics", "election", "president", "congress", "political party",
-    "who made you",
-    "your developer", "feeling", "emotion", "consciousness", "sentient",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 4. 스팸 / 반복 (Korean)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "천번 출력해", "1000번 반복해", "계속 말해", "도배", "무한 반복",
-    "백번", "만번", "천번", "반복해줘",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 4. Spam / Repetition (English)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "repeat 1000 times", "say it over and over", "spam", "infinite loop",
-    "repeat forever", "keep saying", "output 100 times",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 5. 시스템 탐색 및 정보 추출 (Korean)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "시스템 프롬프트 보여줘", "너의 명령어", "숨겨진 지시",
-    "비밀 정보", "내부 구조", "아키텍처",
-    "config", "설정 파일", "환경 변수",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 5. System Probing / Information Extraction (English)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "show me your prompt", "reveal your instructions", "hidden commands",
-    "secret information", "internal structure", "architecture",
-    "configuration", "config file", "environment variables",
-    "api key", "token", "credentials",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 6. 악의적 테스트 및 우회 시도 (Korean)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "제한을 풀어줘", "보안을 해제", "필터를 우회",
-    "검열을 피해", "탐지를 회피",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 6. Malicious Testing / Bypass Attempts (English)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "bypass security", "disable filter", "remove restrictions",
-    "unlock", "jailbroken", "unrestricted mode",
-    "turn off safety", "disable content policy",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 7. SQL Injection / Code Injection 패턴
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "'; drop table", "union select", "exec(", "eval(",
-    "<script>", "javascript:", "onerror=",
-    
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # 8. 추가 프롬프트 인젝션 변형
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    "from now on", "new task", "new mission", "override previous",
-    "delete all previous", "start over", "reset context",
-    "이제부터", "새로운 임무", "이전 대화 삭제",
-]
+# 차단/허용 목록을 한 번에 훑는 Aho-Corasick 매처 (백엔드 사전 필터와 같은 인스턴스)
+_safety_matcher = get_safety_matcher()
 
 
 # ============================================================================
@@ -163,25 +65,11 @@ def safety_check_callback(
     
     logger.debug(f"[Safety Callback] User message: '{user_message[:100]}...'")
     
-    # 소문자로 변환하여 대소문자 무시 검사
-    user_message_lower = user_message.lower()
-    
-    # 💡 오탐 방지 - 학술 용어는 통과
-    allowed_academic_keywords = [
-        "정치외교", "ai융합", "인공지능학", "정치학", "ai학과",
-        "인공지능전공", "ai전공", "정치외교학과"
-    ]
-    
-    if any(keyword in user_message_lower for keyword in allowed_academic_keywords):
-        logger.debug("[Safety Callback] Academic keyword detected, allowing request")
-        return None
-    
-    # 🚫 유해 키워드 탐지
-    detected_keyword = None
-    for keyword in HARMFUL_KEYWORDS:
-        if keyword.lower() in user_message_lower:
-            detected_keyword = keyword
-            break
+    # 🚫 유해 키워드 탐지 (정규화 + 단일 패스, 허용 목록 구간은 제외)
+    blocked, allowed = _safety_matcher.scan(user_message)
+    if allowed and not blocked:
+        logger.debug(f"[Safety Callback] Academic keyword detected ({allowed[0]}), allowing request")
+    detected_keyword = blocked[0].keyword if blocked else None
     
     if detected_keyword:
         logger.warning(
@@ -193,11 +81,7 @@ def safety_check_callback(
         return LlmResponse(
             content=types.Content(
                 role="model",
-                parts=[types.Part(text=(
-                    "죄송합니다. 해당 요청은 처리할 수 없습니다. "
-                    "강남대학교와 관련된 정보(졸업요건, 과목, 교수, 캠퍼스 등)에 대해 "
-                    "질문해 주시면 성심성의껏 도와드리겠습니다!"
-                ))],
+                parts=[types.Part(text=REFUSAL_MESSAGE)],
             )
         )
     
@@ -205,3 +89,108 @@ def safety_check_callback(
     logger.debug("[Safety Callback] No harmful content detected, proceeding with LLM call")
     return None
 
+
+# ============================================================================
+# 도구 선별 콜백
+# ============================================================================
+
+def _current_turn(contents: List[types.Content]) -> Tuple[str, List[str]]:
+    """
+    이번 턴의 사용자 질문과 그 뒤에 모델이 호출한 도구 이름
+
+    도구 결과(function_response)도 role='user'로 들어오므로 텍스트가 있는 마지막 사용자 메시지를 찾습니다.
+    """
+    called: List[str] = []
+    for content in reversed(contents or []):
+        parts = content.parts or []
+        if content.role == 'user':
+            text = " ".join(part.text for part in parts if part.text)
+            if text:
+                return text, called
+        else:
+            called.extend(part.function_call.name for part in parts if part.function_call)
+    return "", called
+
+
+def tool_gating_callback(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """
+    질문 분야에 해당하는 도구 선언만 남기는 콜백 (before_model_callback)
+
+    확신이 낮으면 요청을 그대로 두고(전체 도구), 실행용 tools_dict는 건드리지 않으므로
+    모델이 선언에서 빠진 도구를 호출해도 정상 실행됩니다.
+
+    Returns:
+        항상 None (LLM 호출은 계속 진행)
+    """
+    from google_adk.config import TOOL_GATING_ENABLED
+
+    if not TOOL_GATING_ENABLED or not llm_request.config or not llm_request.config.tools:
+        return None
+
+    try:
+        text, called = _current_turn(llm_request.contents)
+        available = [
+            declaration.name
+            for tool in llm_request.config.tools
+            for declaration in (tool.function_declarations or [])
+        ]
+        keep = select_tools(get_intent_scorer(), text, available, called) if text else None
+    except Exception as e:
+        logger.error(f"[ToolGating] 도구 선별 실패, 전체 도구 사용: {e}")
+        return None
+
+    if keep is None:
+        logger.info(f"[ToolGating] Low confidence, keeping all {len(available)} tools")
+        return None
+
+    for tool in llm_request.config.tools:
+        if tool.function_declarations:
+            tool.function_declarations = [
+                declaration for declaration in tool.function_declarations
+                if declaration.name in keep
+            ]
+    llm_request.config.tools = [
+        tool for tool in llm_request.config.tools
+        if tool.function_declarations or tool.function_declarations is None
+    ]
+    logger.info(f"[ToolGating] {len(available)} → {len(keep)} tools: {sorted(keep)}")
+    return None
+
+
+# ============================================================================
+# 도구 응답 압축 콜백
+# ============================================================================
+
+def compact_tool_response_callback(
+    tool: BaseTool,
+    args: Dict[str, Any],
+    tool_context: ToolContext,
+    tool_response: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    도구 결과를 모델에 전달하기 전에 압축하는 콜백 (after_tool_callback)
+
+    Returns:
+        Optional[dict] - 압축된 결과, 압축하지 않으면 None (원본 그대로 전달)
+    """
+    from google_adk.config import TOOL_RESPONSE_COMPACTION_ENABLED
+
+    if not TOOL_RESPONSE_COMPACTION_ENABLED or not isinstance(tool_response, dict):
+        return None
+
+    try:
+        compacted, stats = compact_response(tool.name, tool_response)
+    except Exception as e:
+        logger.error(f"[Compaction] {tool.name}: 압축 실패, 원본 전달: {e}")
+        return None
+
+    logger.info(
+        f"[Compaction] {tool.name}: "
+        f"{stats['before_chars']} chars/~{stats['before_tokens']} tokens → "
+        f"{stats['after_chars']} chars/~{stats['after_tokens']} tokens"
+        + (f" (omitted {stats['omitted_results']} results)" if stats["omitted_results"] else "")
+    )
+    return compacted
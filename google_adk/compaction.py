@@ -0,0 +1,215 @@
+"""
+도구 응답 압축 (Tool Response Compaction)
+
+검색 도구는 structData 전체(fields, metadata, content)와 오류 시 raw_response까지 반환하고,
+이 결과가 그대로 Gemini 프롬프트에 들어가 토큰과 지연 시간을 늘립니다.
+after_tool_callback에서 도구별 정책으로 결과를 줄인 뒤 모델에 전달합니다.
+
+1. 필드 화이트리스트: 결과 항목과 fields/metadata에서 답변에 쓰는 키만 남김
+2. 긴 문자열 자르기: content/snippet/description 등
+3. 토큰 예산: 예산을 넘으면 뒤쪽 결과부터 제외 (omitted_results에 개수 표시)
+
+압축 전후 크기(문자 수, 추정 토큰)는 호출마다 로그로 남깁니다.
+"""
+import json
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 모델에 전달하지 않는 키 (디버깅용 원본 응답)
+DROP_KEYS = frozenset({"raw_response"})
+
+# 도구가 반환한 문자열이 이보다 길면 자름 (정책에 text_limits가 없을 때)
+DEFAULT_STRING_LIMIT = 600
+
+TRUNCATION_MARK = "…"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (Gemini 토크나이저 근사)
+
+    ASCII는 약 4글자에 1토큰, 한글 등 그 외 문자는 1글자에 1토큰으로 계산합니다.
+    실제보다 약간 크게 잡히므로 예산 판단에는 안전한 쪽입니다.
+    """
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+@dataclass(frozen=True)
+class ToolPolicy:
+    """
+    도구별 압축 정책
+
+    Attributes:
+        result_keys: 결과 항목에 남길 키 (None이면 전부)
+        nested_keys: fields/metadata 같은 하위 dict에 남길 키 {하위 키: 남길 키}
+        text_limits: 키별 최대 글자 수 (나머지 문자열은 DEFAULT_STRING_LIMIT)
+        drop_line_prefixes: content에서 뺄 줄의 시작 문자열 (다른 필드와 중복되는 줄)
+        token_budget: 결과 전체 토큰 예산 (None이면 config 기본값)
+    """
+    result_keys: Optional[FrozenSet[str]] = None
+    nested_keys: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+    text_limits: Dict[str, int] = field(default_factory=dict)
+    drop_line_prefixes: Tuple[str, ...] = ()
+    token_budget: Optional[int] = None
+
+
+_PROFESSOR_FIELDS = frozenset({
+    "name_ko", "department", "school", "college", "email", "phone", "office", "keywords", "courses",
+})
+_SUBJECT_METADATA = frozenset({
+    "subject_name", "department", "departments", "grade", "professor", "credit", "syllabus_url",
+})
+_SUBJECT_RESULT_KEYS = frozenset({
+    "rank", "title", "content", "metadata", "time_slots", "matched_queries",
+})
+_SUBJECT_TEXT_LIMITS = {"content": 200, "snippet": 0}
+
+# 여러 질문의 결과를 합치는 일괄 도구는 예산을 더 크게
+BATCH_TOKEN_BUDGET = 4000
+
+_PROFESSOR_POLICY = ToolPolicy(
+    result_keys=frozenset({"rank", "title", "fields", "matched_queries"}),
+    nested_keys={"fields": _PROFESSOR_FIELDS},
+    text_limits={"snippet": 0},
+)
+_SUBJECT_POLICY = ToolPolicy(
+    result_keys=_SUBJECT_RESULT_KEYS,
+    nested_keys={"metadata": _SUBJECT_METADATA},
+    text_limits=_SUBJECT_TEXT_LIMITS,
+    # 강의계획서 URL 줄은 metadata.syllabus_url과 중복
+    drop_line_prefixes=("강의계획서:",),
+)
+
+TOOL_POLICIES: Dict[str, ToolPolicy] = {
+    "search_professor_info": _PROFESSOR_POLICY,
+    "search_professor_by_name": _PROFESSOR_POLICY,
+    "search_professor_by_department": _PROFESSOR_POLICY,
+    "search_professor_by_research_field": _PROFESSOR_POLICY,
+    "search_professor_info_batch": replace(_PROFESSOR_POLICY, token_budget=BATCH_TOKEN_BUDGET),
+    "search_subject_info": _SUBJECT_POLICY,
+    "search_subject_by_grade_and_dept": _SUBJECT_POLICY,
+    "search_subject_syllabus": _SUBJECT_POLICY,
+    "search_subject_by_time": _SUBJECT_POLICY,
+    "search_subject_info_batch": replace(_SUBJECT_POLICY, token_budget=BATCH_TOKEN_BUDGET),
+    "search_building_info": ToolPolicy(text_limits={"snippet": 200, "description": 300}),
+    "search_facility_by_location": ToolPolicy(text_limits={"snippet": 200, "description": 300}),
+    "search_admin_department": ToolPolicy(text_limits={"snippet": 200, "description": 300}),
+    "search_graduation_requirements": ToolPolicy(text_limits={"snippet": 300, "content": 800}),
+}
+
+DEFAULT_POLICY = ToolPolicy()
+
+
+def _truncate(value: str, limit: int) -> Optional[str]:
+    if limit <= 0:
+        return None
+    if len(value) <= limit:
+        return value
+    return value[:limit] + TRUNCATION_MARK
+
+
+def _project(value: Any, policy: ToolPolicy, key: Optional[str] = None) -> Any:
+    """하위 dict 화이트리스트 + 문자열 자르기 (재귀)"""
+    if isinstance(value, str):
+        if key == "content" and policy.drop_line_prefixes:
+            value = "\n".join(
+                line for line in value.splitlines()
+                if not line.startswith(policy.drop_line_prefixes)
+            )
+        return _truncate(value, policy.text_limits.get(key, DEFAULT_STRING_LIMIT))
+    if isinstance(value, list):
+        return [_project(item, policy, key) for item in value]
+    if isinstance(value, dict):
+        allowed = policy.nested_keys.get(key)
+        projected = {}
+        for k, v in value.items():
+            if k in DROP_KEYS or (allowed is not None and k not in allowed):
+                continue
+            v = _project(v, policy, k)
+            if v is not None:
+                projected[k] = v
+        return projected
+    return value
+
+
+def _project_result(item: Any, policy: ToolPolicy) -> Any:
+    if not isinstance(item, dict):
+        return _project(item, policy)
+    if policy.result_keys is not None:
+        item = {k: v for k, v in item.items() if k in policy.result_keys}
+    return _project(item, policy)
+
+
+def compact_response(
+    tool_name: str,
+    response: Dict[str, Any],
+    token_budget: Optional[int] = None
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    도구 응답 압축
+
+    Args:
+        tool_name: 도구(함수) 이름 → TOOL_POLICIES에서 정책 선택
+        response: 도구가 반환한 dict
+        token_budget: 토큰 예산 (None이면 정책 → config 순으로 결정)
+
+    Returns:
+        (압축된 응답, 크기 통계 {before_chars, before_tokens, after_chars, after_tokens, omitted_results})
+    """
+    policy = TOOL_POLICIES.get(tool_name, DEFAULT_POLICY)
+    if token_budget is None:
+        token_budget = policy.token_budget
+    if token_budget is None:
+        from google_adk.config import TOOL_RESPONSE_TOKEN_BUDGET
+        token_budget = TOOL_RESPONSE_TOKEN_BUDGET
+
+    before = _dumps(response)
+    compacted: Dict[str, Any] = {}
+    for key, value in response.items():
+        if key in DROP_KEYS:
+            continue
+        if key == "results" and isinstance(value, list):
+            compacted[key] = [_project_result(item, policy) for item in value]
+        else:
+            compacted[key] = _project(value, DEFAULT_POLICY, key)
+
+    # 예산 초과 시 뒤쪽(순위가 낮은) 결과부터 제외, 최소 1개는 남김
+    results = compacted.get("results")
+    omitted = 0
+    after = _dumps(compacted)
+    if isinstance(results, list) and len(results) > 1 and estimate_tokens(after) > token_budget:
+        # 결과별 토큰을 한 번씩만 계산해 남길 개수 결정 (메시지 안내 문구 몫 여유 포함)
+        base = estimate_tokens(_dumps({k: v for k, v in compacted.items() if k != "results"})) + 80
+        used, keep = base, 0
+        for item in results:
+            used += estimate_tokens(_dumps(item)) + 1
+            if used > token_budget and keep >= 1:
+                break
+            keep += 1
+        omitted = len(results) - keep
+        if omitted:
+            del results[keep:]
+            compacted["count"] = keep
+            compacted["omitted_results"] = omitted
+            compacted["message"] = (
+                f"{compacted.get('message', '')} (응답 길이 제한으로 상위 {keep}개만 표시, "
+                f"{omitted}개 생략 — 더 보려면 offset이나 더 구체적인 검색어를 사용하세요)"
+            ).strip()
+            after = _dumps(compacted)
+
+    stats = {
+        "before_chars": len(before),
+        "before_tokens": estimate_tokens(before),
+        "after_chars": len(after),
+        "after_tokens": estimate_tokens(after),
+        "omitted_results": omitted,
+    }
+    return compacted, stats
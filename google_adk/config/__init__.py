@@ -43,6 +43,33 @@ DEFAULT_DISTANCE_THRESHOLD = 0.5
 DEFAULT_EMBEDDING_MODEL = "publishers/google/models/text-multilingual-embedding-002"  # ✅ 변경!
 DEFAULT_EMBEDDING_REQUESTS_PER_MIN = 1000
 
+# Vertex AI Search (Discovery Engine) 클라이언트 설정
+VERTEX_SEARCH_CONNECT_TIMEOUT = float(os.environ.get("VERTEX_SEARCH_CONNECT_TIMEOUT", "3"))  # 연결 타임아웃 (초)
+VERTEX_SEARCH_READ_TIMEOUT = float(os.environ.get("VERTEX_SEARCH_READ_TIMEOUT", "10"))  # 응답 타임아웃 (초)
+VERTEX_SEARCH_POOL_SIZE = int(os.environ.get("VERTEX_SEARCH_POOL_SIZE", "10"))  # 연결 풀 크기
+VERTEX_SEARCH_TOKEN_REFRESH_MARGIN = int(os.environ.get("VERTEX_SEARCH_TOKEN_REFRESH_MARGIN", "300"))  # 만료 몇 초 전 갱신
+
+# Vertex AI Search 결과 캐시 설정 (stale-while-revalidate)
+VERTEX_SEARCH_CACHE_ENABLED = os.environ.get("VERTEX_SEARCH_CACHE_ENABLED", "true").lower() == "true"
+VERTEX_SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get("VERTEX_SEARCH_CACHE_MAX_ENTRIES", "1024"))
+VERTEX_SEARCH_CACHE_DEFAULT_TTL = int(os.environ.get("VERTEX_SEARCH_CACHE_DEFAULT_TTL", "3600"))  # 기본 TTL (초)
+VERTEX_SEARCH_CACHE_STALE_TTL = int(os.environ.get("VERTEX_SEARCH_CACHE_STALE_TTL", "86400"))  # TTL 경과 후 stale 허용 시간 (초)
+# 데이터스토어(엔진 ID)별 TTL (초) - 거의 바뀌지 않는 데이터일수록 길게
+VERTEX_SEARCH_CACHE_TTLS = {
+    "kangnam-building-informati_1762755276541": 24 * 3600,  # 건물/시설
+    "kangnam-admin-info_1762756510225": 24 * 3600,  # 행정부서 연락처
+    "kangnam-univ-graduation-re_1762133185323": 24 * 3600,  # 졸업요건
+    "kangnam-professor-search-a_1761497936584": 12 * 3600,  # 교수 정보
+    "kangnam-subject-info_1764222007906": 6 * 3600,  # 과목 정보 (학기 중 변경 가능)
+}
+
+# 로컬 데이터 경로 (비워두면 google_adk/data 기본 파일 사용)
+GRADUATION_DATA_PATH = os.environ.get("GRADUATION_DATA_PATH")
+BUILDING_DATA_PATH = os.environ.get("BUILDING_DATA_PATH")
+ADMIN_DIRECTORY_DATA_PATH = os.environ.get("ADMIN_DIRECTORY_DATA_PATH")
+PROFESSOR_DATA_DIR = os.environ.get("PROFESSOR_DATA_DIR")
+SUBJECT_DATA_PATH = os.environ.get("SUBJECT_DATA_PATH")
+
 # GCS configuration defaults
 GCS_DEFAULT_STORAGE_CLASS = "STANDARD"  # Standard storage class for buckets
 GCS_DEFAULT_LOCATION = GCS_BUCKET_LOCATION  # Seoul region for data storage
@@ -52,4 +79,18 @@ GCS_LIST_BLOBS_MAX_RESULTS = 100  # Max results for blob listing
 
 # Logging configuration
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
-LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
\ No newline at end of file
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# 도구 응답 압축 (google_adk/compaction.py)
+TOOL_RESPONSE_COMPACTION_ENABLED = os.environ.get("TOOL_RESPONSE_COMPACTION_ENABLED", "true").lower() == "true"
+TOOL_RESPONSE_TOKEN_BUDGET = int(os.environ.get("TOOL_RESPONSE_TOKEN_BUDGET", "2000"))  # 도구 결과 1건당 추정 토큰 상한
+
+# 턴별 도구 선별 (google_adk/tool_gating.py)
+TOOL_GATING_ENABLED = os.environ.get("TOOL_GATING_ENABLED", "true").lower() == "true"
+
+# 명시적 컨텍스트 캐시 (google_adk/agent.py의 app, 고정 프롬프트 접두어 재사용)
+# static_instruction은 설정과 관계없이 암시적 캐시 대상이며, 이 값은 캐시를 직접 만드는 방식(유료 저장)을 켭니다.
+CONTEXT_CACHE_ENABLED = os.environ.get("CONTEXT_CACHE_ENABLED", "false").lower() == "true"
+CONTEXT_CACHE_TTL_SECONDS = int(os.environ.get("CONTEXT_CACHE_TTL_SECONDS", "1800"))
+CONTEXT_CACHE_INTERVALS = int(os.environ.get("CONTEXT_CACHE_INTERVALS", "10"))  # 같은 캐시를 재사용할 최대 호출 수
+CONTEXT_CACHE_MIN_TOKENS = int(os.environ.get("CONTEXT_CACHE_MIN_TOKENS", "2048"))  # 이보다 작은 요청은 캐시하지 않음
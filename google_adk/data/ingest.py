@@ -0,0 +1,520 @@
+"""
+Vertex AI Search 데이터 스토어 통합 적재 CLI
+
+create_*_datastore.py / upload_*_AI_Search.py 스크립트마다 ID가 하드코딩되어 있고
+데이터 스토어를 하나씩 순서대로 올리던 것을, 선언형 레지스트리(DATASTORES) 하나로 모았습니다.
+
+- Source: 레코드(JSON 문자열)를 한 줄씩 내보냄 (JsonlSource: 글롭 패턴의 JSONL 파일들)
+- RecordSchema: 스트리밍하면서 필수 필드/타입, 문서 id 형식/중복 검증 (잘못된 줄은 건너뛰고 위치와 함께 보고)
+- Sink: 검증된 줄을 바로 기록 (GcsSink: GCS resumable 업로드, LocalSink: 로컬 디렉토리)
+  도중에 실패하면 GCS 업로드를 취소해 잘린 파일이 확정되지 않음
+- VertexSearchImporter: 데이터 스토어 생성(선택) + GCS import (클라이언트 주입 가능)
+- 여러 데이터 스토어를 스레드 풀에서 동시에 처리하고, 진행 상황과 요약 표를 한 번에 출력
+
+사용법:
+    python google_adk/data/ingest.py --list
+    python google_adk/data/ingest.py                          # 전체 데이터 스토어
+    python google_adk/data/ingest.py subjects professors --create
+    python google_adk/data/ingest.py --validate-only          # 업로드 없이 검증만
+    python google_adk/data/ingest.py --local /tmp/ingest      # GCS 대신 로컬에 기록 (import 생략)
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple
+
+PROJECT_ID = "kangnam-backend"
+LOCATION = "global"
+BUCKET_NAME = "kangnam-univ"
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_WORKERS = 4
+IMPORT_TIMEOUT_SECONDS = 600
+# 진행률 출력 간격 (레코드 수)
+PROGRESS_EVERY = 500
+# 요약에 표시할 잘못된 레코드 수
+MAX_REPORTED_INVALID = 5
+
+# Discovery Engine 문서 id 형식
+DOCUMENT_ID_PATTERN = re.compile(r"[a-zA-Z0-9][a-zA-Z0-9_-]{0,127}")
+
+
+# ----------------------------------------
+# 1. 소스
+# ----------------------------------------
+class Source(Protocol):
+    def describe(self) -> str: ...
+
+    def lines(self) -> Iterator[Tuple[str, str]]:
+        """(위치, JSON 문자열) 한 레코드씩"""
+        ...
+
+
+class JsonlSource:
+    """DATA_DIR 기준 글롭 패턴의 JSONL 파일들 (파일명 순, 빈 줄 제외)"""
+
+    def __init__(self, *patterns: str, base_dir: str = DATA_DIR):
+        self.patterns = patterns
+        self.base_dir = base_dir
+
+    def files(self) -> List[str]:
+        return [
+            path
+            for pattern in self.patterns
+            for path in sorted(glob.glob(os.path.join(self.base_dir, pattern)))
+        ]
+
+    def describe(self) -> str:
+        return ", ".join(self.patterns)
+
+    def lines(self) -> Iterator[Tuple[str, str]]:
+        files = self.files()
+        if not files:
+            raise FileNotFoundError(f"소스 파일이 없습니다: {self.describe()}")
+        for path in files:
+            with open(path, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if line:
+                        yield f"{os.path.basename(path)}:{line_number}", line
+
+
+# ----------------------------------------
+# 2. 레코드 검증
+# ----------------------------------------
+@dataclass(frozen=True)
+class RecordSchema:
+    """
+    필수 필드와 타입 + 문서 id 필드
+
+    id_field가 None이면 Discovery Engine이 id를 자동 생성합니다.
+    (import할 때마다 새 id가 붙으므로 이런 데이터 스토어는 항상 FULL 조정으로 import)
+    """
+    required: Dict[str, type]
+    id_field: Optional[str] = "id"
+
+    def validate(self, record: object) -> Optional[str]:
+        """문제가 있으면 오류 메시지, 없으면 None"""
+        if not isinstance(record, dict):
+            return "JSON 객체가 아님"
+        for name, expected in self.required.items():
+            if name not in record:
+                return f"필드 없음: {name}"
+            if not isinstance(record[name], expected):
+                return f"{name} 타입 오류: {type(record[name]).__name__} (기대 {expected.__name__})"
+            if expected is str and not record[name].strip():
+                return f"빈 값: {name}"
+        if self.id_field:
+            doc_id = record.get(self.id_field)
+            if not isinstance(doc_id, str) or not DOCUMENT_ID_PATTERN.fullmatch(doc_id):
+                return f"문서 id 형식 오류: {doc_id!r}"
+        return None
+
+
+# ----------------------------------------
+# 3. 레지스트리
+# ----------------------------------------
+@dataclass(frozen=True)
+class DatastoreSpec:
+    """
+    데이터 스토어 하나의 선언 (소스 → GCS 폴더 → 데이터 스토어)
+
+    full이 True면 --full 없이도 항상 FULL 조정으로 import합니다. (소스가 항상 전체 데이터인 작은 스토어)
+    """
+    name: str
+    data_store_id: str
+    display_name: str
+    source: Source
+    schema: RecordSchema
+    gcs_folder: str
+    object_name: str
+    full: bool = False
+
+    @property
+    def object_path(self) -> str:
+        return f"{self.gcs_folder}/{self.object_name}"
+
+
+DOCUMENT_SCHEMA = RecordSchema({"id": str, "content": str, "metadata": dict})
+
+DATASTORES: Dict[str, DatastoreSpec] = {
+    spec.name: spec
+    for spec in [
+        DatastoreSpec(
+            name="subjects",
+            data_store_id="kangnam-subjects-datastore",
+            display_name="강남대학교 과목 정보 (2025-2)",
+            source=JsonlSource("과목정보/kangnam_all_2025_2.jsonl"),
+            schema=DOCUMENT_SCHEMA,
+            gcs_folder="rag_data/subjects",
+            object_name="kangnam_all_2025_2.jsonl",
+        ),
+        DatastoreSpec(
+            name="professors",
+            data_store_id="kangnam-univ-professor-info-datastore",
+            display_name="강남대학교 교수정보 검색 스토어",
+            source=JsonlSource("교수정보/*.jsonl"),
+            schema=RecordSchema({"id": str, "title": str, "text": str, "metadata": dict}),
+            gcs_folder="rag_data/professors",
+            object_name="professors.jsonl",
+        ),
+        DatastoreSpec(
+            name="buildings",
+            data_store_id="kangnam-univ-building-info-datastore",
+            display_name="강남대학교 건물/시설 정보 검색 스토어",
+            source=JsonlSource("강남대 기본정보/강남대위치정리.jsonl"),
+            schema=DOCUMENT_SCHEMA,
+            gcs_folder="rag_data/building_info",
+            object_name="강남대위치정리.jsonl",
+        ),
+        DatastoreSpec(
+            name="admin",
+            data_store_id="kangnam-univ-admin-contacts-datastore",
+            display_name="강남대학교 행정부서 연락처 검색 스토어",
+            source=JsonlSource("강남대 기본정보/행정부서 전화번호.jsonl"),
+            schema=DOCUMENT_SCHEMA,
+            gcs_folder="rag_data/admin_contacts",
+            object_name="행정부서 전화번호.jsonl",
+        ),
+        DatastoreSpec(
+            name="graduation",
+            data_store_id="kangnam-univ-graduation-requirements-datastore",
+            display_name="강남대학교 졸업요건 검색 스토어",
+            source=JsonlSource("result/kangnam_univ_graduation_requirements.jsonl"),
+            # id는 upload_to_rag.py가 대학/계열/학년도/구분 해시로 생성
+            schema=DOCUMENT_SCHEMA,
+            gcs_folder="rag_data/graduation",
+            object_name="kangnam_univ_graduation_requirements_2017_2025.jsonl",
+            # 파일이 항상 전체 요건(38건)이라 FULL로 맞춤
+            # (id 자동 생성 시절 문서가 INCREMENTAL로는 지워지지 않고 새 id 문서와 함께 남음)
+            full=True,
+        ),
+    ]
+}
+
+
+# ----------------------------------------
+# 4. 싱크
+# ----------------------------------------
+class Sink(Protocol):
+    def open(self, spec: DatastoreSpec) -> Tuple[BinaryIO, str]:
+        """
+        (쓰기용 바이너리 파일 객체, 기록 위치 URI)
+
+        with 블록이 정상 종료되면 확정되고, 예외로 끝나면 GCS 업로드는 취소됩니다.
+        """
+        ...
+
+
+class GcsSink:
+    """
+    gs://{bucket}/{gcs_folder}/{object_name}에 스트리밍 업로드
+
+    blob.open("wb")는 chunk_size 단위 resumable 업로드라 전체 파일을 메모리에 올리지 않습니다.
+    텍스트 모드("w")의 TextIOWrapper는 예외가 나도 close()로 업로드를 확정하므로 바이너리 BlobWriter를
+    그대로 돌려줍니다. (BlobWriter.__exit__는 예외 시 terminate()로 업로드 취소)
+    """
+
+    def __init__(self, bucket_name: str = BUCKET_NAME, client=None, chunk_size: int = 8 * 1024 * 1024):
+        self.bucket_name = bucket_name
+        self.chunk_size = chunk_size
+        self._client = client
+        self._lock = threading.Lock()
+
+    def _bucket(self):
+        with self._lock:
+            if self._client is None:
+                from google.cloud import storage
+                self._client = storage.Client(project=PROJECT_ID)
+            return self._client.bucket(self.bucket_name)
+
+    def open(self, spec: DatastoreSpec) -> Tuple[BinaryIO, str]:
+        blob = self._bucket().blob(spec.object_path)
+        writer = blob.open("wb", chunk_size=self.chunk_size, content_type="application/jsonl")
+        return writer, f"gs://{self.bucket_name}/{spec.object_path}"
+
+
+class LocalSink:
+    """{directory}/{gcs_folder}/{object_name}에 기록 (GCS 없이 결과 확인용)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def open(self, spec: DatastoreSpec) -> Tuple[BinaryIO, str]:
+        path = os.path.join(self.directory, spec.object_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return open(path, "wb"), path
+
+
+# ----------------------------------------
+# 5. Vertex AI Search import
+# ----------------------------------------
+class VertexSearchImporter:
+    """
+    데이터 스토어 생성 + GCS JSONL import
+
+    Args:
+        document_client: DocumentServiceClient 호환 객체 (import_documents)
+        data_store_client: DataStoreServiceClient 호환 객체 (create_data_store, --create 때만 필요)
+        full: True면 FULL 조정 (GCS 파일에 없는 문서를 데이터 스토어에서 삭제)
+    """
+
+    def __init__(self, document_client=None, data_store_client=None, project: str = PROJECT_ID,
+                 location: str = LOCATION, full: bool = False, timeout: float = IMPORT_TIMEOUT_SECONDS):
+        self.document_client = document_client
+        self.data_store_client = data_store_client
+        self.project = project
+        self.location = location
+        self.full = full
+        self.timeout = timeout
+
+    @classmethod
+    def create(cls, **options) -> 'VertexSearchImporter':
+        """실제 Discovery Engine 클라이언트로 생성"""
+        from google.api_core.client_options import ClientOptions
+        from google.cloud import discoveryengine
+
+        location = options.get("location", LOCATION)
+        client_options = (
+            ClientOptions(api_endpoint=f"{location}-discoveryengine.googleapis.com")
+            if location != "global" else None
+        )
+        return cls(
+            document_client=discoveryengine.DocumentServiceClient(client_options=client_options),
+            data_store_client=discoveryengine.DataStoreServiceClient(client_options=client_options),
+            **options,
+        )
+
+    def ensure_data_store(self, spec: DatastoreSpec) -> bool:
+        """없으면 생성 (생성했으면 True, 이미 있으면 False)"""
+        from google.api_core.exceptions import AlreadyExists
+        from google.cloud import discoveryengine
+
+        request = discoveryengine.CreateDataStoreRequest(
+            parent=f"projects/{self.project}/locations/{self.location}/collections/default_collection",
+            data_store_id=spec.data_store_id,
+            data_store=discoveryengine.DataStore(
+                display_name=spec.display_name,
+                industry_vertical=discoveryengine.IndustryVertical.GENERIC,
+                solution_types=[discoveryengine.SolutionType.SOLUTION_TYPE_SEARCH],
+                content_config=discoveryengine.DataStore.ContentConfig.NO_CONTENT,
+            ),
+        )
+        try:
+            self.data_store_client.create_data_store(request=request).result(timeout=self.timeout)
+            return True
+        except AlreadyExists:
+            return False
+
+    def is_full(self, spec: DatastoreSpec) -> bool:
+        """
+        FULL 조정 여부 (--full, 항상 FULL인 스토어, id 자동 생성 스토어)
+
+        id 자동 생성 스토어는 INCREMENTAL이면 import마다 중복 문서가 쌓여 항상 FULL입니다.
+        """
+        return self.full or spec.full or spec.schema.id_field is None
+
+    def import_uri(self, spec: DatastoreSpec, uri: str) -> List[str]:
+        """GCS JSONL import 후 오류 샘플 메시지 목록 반환 (빈 목록이면 성공)"""
+        from google.cloud import discoveryengine
+
+        mode = discoveryengine.ImportDocumentsRequest.ReconciliationMode
+        request = discoveryengine.ImportDocumentsRequest(
+            parent=(
+                f"projects/{self.project}/locations/{self.location}/collections/default_collection"
+                f"/dataStores/{spec.data_store_id}/branches/default_branch"
+            ),
+            gcs_source=discoveryengine.GcsSource(input_uris=[uri], data_schema="custom"),
+            reconciliation_mode=mode.FULL if self.is_full(spec) else mode.INCREMENTAL,
+            auto_generate_ids=spec.schema.id_field is None,
+            id_field=spec.schema.id_field or "",
+        )
+        response = self.document_client.import_documents(request=request).result(timeout=self.timeout)
+        return [sample.message for sample in response.error_samples]
+
+
+# ----------------------------------------
+# 6. 실행
+# ----------------------------------------
+@dataclass
+class IngestResult:
+    """데이터 스토어 하나의 적재 결과"""
+    name: str
+    records: int = 0
+    invalid: List[str] = field(default_factory=list)
+    uri: Optional[str] = None
+    created: bool = False
+    imported: bool = False
+    import_errors: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.import_errors
+
+
+class Progress:
+    """여러 스레드의 진행 메시지를 한 줄씩 출력"""
+
+    def __init__(self, width: int = 10):
+        self.width = width
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def report(self, name: str, message: str):
+        with self._lock:
+            print(f"[{time.monotonic() - self.started:6.1f}s] {name:<{self.width}} {message}", flush=True)
+
+
+def valid_lines(spec: DatastoreSpec, result: IngestResult, progress: Progress) -> Iterator[str]:
+    """소스를 한 줄씩 검증해 통과한 줄만 내보냄 (잘못된 줄은 result.invalid에 위치와 함께 기록)"""
+    seen_ids = set()
+    for location, line in spec.source.lines():
+        try:
+            record = json.loads(line)
+            error = spec.schema.validate(record)
+        except json.JSONDecodeError as e:
+            error = f"JSON 오류: {e.msg}"
+        if error is None and spec.schema.id_field:
+            doc_id = record[spec.schema.id_field]
+            if doc_id in seen_ids:
+                error = f"중복 id: {doc_id}"
+            seen_ids.add(doc_id)
+        if error is not None:
+            result.invalid.append(f"{location} {error}")
+            continue
+        result.records += 1
+        if result.records % PROGRESS_EVERY == 0:
+            progress.report(spec.name, f"검증 {result.records}건...")
+        yield line
+
+
+def ingest_one(spec: DatastoreSpec, sink: Optional[Sink], importer: Optional[VertexSearchImporter],
+               progress: Progress, create: bool = False) -> IngestResult:
+    """
+    데이터 스토어 하나 적재: 검증하며 싱크에 기록 → (선택) 생성 → import
+
+    sink가 None이면 검증만, importer가 None이면 import를 생략합니다.
+    싱크는 첫 유효 레코드에서 열어, 소스가 없거나 비어 있으면 기존 파일을 덮어쓰지 않습니다.
+    FULL 조정인데 잘못된 줄이 있으면 건너뛴 문서가 데이터 스토어에서 삭제되므로 업로드를 취소하고 중단합니다.
+    """
+    result = IngestResult(spec.name)
+    started = time.monotonic()
+    try:
+        lines = valid_lines(spec, result, progress)
+        first = next(lines, None) if sink is not None else None
+        if first is not None:
+            writer, result.uri = sink.open(spec)
+            with writer:
+                writer.write((first + "\n").encode("utf-8"))
+                for line in lines:
+                    writer.write((line + "\n").encode("utf-8"))
+                if result.invalid and importer is not None and importer.is_full(spec):
+                    raise ValueError(f"FULL 조정 중단: 잘못된 레코드 {len(result.invalid)}건 (건너뛴 문서가 삭제됨)")
+        else:
+            for _ in lines:
+                pass
+        if result.records == 0:
+            raise ValueError(f"유효한 레코드가 없습니다: {spec.source.describe()}")
+        progress.report(spec.name, f"✅ 레코드 {result.records}건 (오류 {len(result.invalid)}) → {result.uri or '검증만'}")
+
+        if importer is not None and result.uri is not None:
+            if create and importer.ensure_data_store(spec):
+                result.created = True
+                progress.report(spec.name, f"🆕 데이터 스토어 생성: {spec.data_store_id}")
+            progress.report(spec.name, f"🚀 import 시작 → {spec.data_store_id}")
+            result.import_errors = importer.import_uri(spec, result.uri)
+            result.imported = True
+            progress.report(spec.name, "✅ import 완료" if not result.import_errors
+                            else f"⚠️ import 오류 {len(result.import_errors)}건")
+    except Exception as e:
+        result.error = str(e) or type(e).__name__
+        progress.report(spec.name, f"❌ {result.error}")
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def run(specs: Sequence[DatastoreSpec], sink: Optional[Sink], importer: Optional[VertexSearchImporter],
+        workers: int = DEFAULT_WORKERS, create: bool = False) -> List[IngestResult]:
+    """데이터 스토어들을 동시에 적재 (결과는 specs 순서)"""
+    progress = Progress(width=max(len(spec.name) for spec in specs))
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(specs)))) as pool:
+        futures = [pool.submit(ingest_one, spec, sink, importer, progress, create) for spec in specs]
+        return [future.result() for future in futures]
+
+
+def format_summary(results: Sequence[IngestResult]) -> str:
+    """결과 요약 표 + 잘못된 레코드/오류 상세"""
+    width = max(len(result.name) for result in results)
+    lines = [f"{'name':<{width}}  {'records':>7}  {'invalid':>7}  {'import':<6}  {'time':>6}  uri"]
+    for result in results:
+        if result.error:
+            status = "실패"
+        elif result.imported:
+            status = "완료" if not result.import_errors else "오류"
+        else:
+            status = "-"
+        lines.append(
+            f"{result.name:<{width}}  {result.records:>7}  {len(result.invalid):>7}  {status:<6}  "
+            f"{result.seconds:>5.1f}s  {result.uri or ''}"
+        )
+    for result in results:
+        for message in result.invalid[:MAX_REPORTED_INVALID]:
+            lines.append(f"⚠️ {result.name}: {message}")
+        if len(result.invalid) > MAX_REPORTED_INVALID:
+            lines.append(f"⚠️ {result.name}: ... 외 {len(result.invalid) - MAX_REPORTED_INVALID}건")
+        for message in result.import_errors[:MAX_REPORTED_INVALID]:
+            lines.append(f"❌ {result.name} import: {message}")
+        if result.error:
+            lines.append(f"❌ {result.name}: {result.error}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vertex AI Search 데이터 스토어 통합 적재")
+    parser.add_argument("names", nargs="*", help=f"적재할 데이터 스토어 (기본: 전체, {', '.join(DATASTORES)})")
+    parser.add_argument("--list", action="store_true", help="레지스트리 출력")
+    parser.add_argument("--validate-only", action="store_true", help="업로드/import 없이 검증만")
+    parser.add_argument("--local", metavar="DIR", help="GCS 대신 로컬 디렉토리에 기록 (import 생략)")
+    parser.add_argument("--create", action="store_true", help="데이터 스토어가 없으면 생성")
+    parser.add_argument("--full", action="store_true", help="FULL 조정 (파일에 없는 문서 삭제, 잘못된 레코드가 있으면 중단)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시에 처리할 데이터 스토어 수")
+    args = parser.parse_args()
+
+    if args.list:
+        for spec in DATASTORES.values():
+            print(f"{spec.name:<12} {spec.data_store_id:<48} {spec.source.describe()} → gs://{BUCKET_NAME}/{spec.object_path}")
+        return
+
+    unknown = [name for name in args.names if name not in DATASTORES]
+    if unknown:
+        parser.error(f"알 수 없는 데이터 스토어: {', '.join(unknown)} (사용 가능: {', '.join(DATASTORES)})")
+    specs = [DATASTORES[name] for name in args.names or DATASTORES]
+
+    if args.validate_only:
+        sink, importer = None, None
+    elif args.local:
+        sink, importer = LocalSink(args.local), None
+    else:
+        sink, importer = GcsSink(), VertexSearchImporter.create(full=args.full)
+
+    print("=" * 60)
+    print(f"📦 적재 대상: {', '.join(spec.name for spec in specs)} (동시 {args.workers})")
+    print("=" * 60)
+    results = run(specs, sink, importer, workers=args.workers, create=args.create)
+    print("\n" + "=" * 60)
+    print(format_summary(results))
+    print("=" * 60)
+    if not all(result.ok for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
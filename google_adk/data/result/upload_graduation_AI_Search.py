@@ -52,8 +52,10 @@ def import_graduation_docs():
     import_request = discoveryengine.ImportDocumentsRequest(
         parent=parent,
         gcs_source=gcs_source,
-        reconciliation_mode=discoveryengine.ImportDocumentsRequest.ReconciliationMode.INCREMENTAL,
-        auto_generate_ids=True,  # 문서 ID 자동 생성 (JSONL에 id 필드가 없으므로)
+        # 파일이 전체 졸업요건이라 FULL (자동 생성 id로 올렸던 이전 문서 삭제)
+        reconciliation_mode=discoveryengine.ImportDocumentsRequest.ReconciliationMode.FULL,
+        auto_generate_ids=False,  # ID 필드 직접 지정 (upload_to_rag.py가 생성)
+        id_field="id",  # JSON의 문서 ID 필드
     )
 
     # 실행
@@ -1,27 +1,31 @@
 """
 강남대학교 졸업이수학점 JSON 데이터를 Vertex AI RAG 코퍼스에 업로드하는 스크립트
 
+JSON 읽기 → 계열 평탄화 → chunk 생성 → JSONL 직렬화 → 기록을 제너레이터로 이어서,
+chunk 목록을 메모리에 모으지 않고 한 줄씩 로컬 확인용 파일과 GCS resumable 업로드에 바로 씁니다.
+(메모리 사용량: JSON 파일 하나 + 업로드 chunk_size 버퍼)
+
+import 시에는 아무 작업도 하지 않으며, vertexai.init과 GCS 클라이언트 생성은 main()에서만 합니다.
+
 사용법:
-    python google_adk/data/upload_to_rag.py
+    python google_adk/data/upload_to_rag.py             # result/ 폴더에 JSONL 생성 (확인용)
+    python google_adk/data/upload_to_rag.py --upload    # 생성과 동시에 GCS 업로드 → 코퍼스 import
 """
-
+import argparse
+import hashlib
 import json
-import os
+from dataclasses import dataclass
 from pathlib import Path
-import vertexai
-from vertexai.preview import rag
-from google.cloud import storage
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 # ==============================
 # 설정
 # ==============================
 # 현재 스크립트 디렉토리
 SCRIPT_DIR = Path(__file__).parent
-DATA_DIR = SCRIPT_DIR
+DATA_DIR = SCRIPT_DIR / "졸업요건"  # 원본 JSON 폴더
 RESULT_DIR = SCRIPT_DIR / "result"  # 로컬 결과 저장 폴더
-
-# result 폴더가 없으면 생성
-RESULT_DIR.mkdir(exist_ok=True)
+LOCAL_JSONL_PATH = RESULT_DIR / "kangnam_univ_graduation_requirements.jsonl"
 
 # 처리할 JSON 파일들
 JSON_FILES = [
@@ -35,6 +39,8 @@ JSON_FILES = [
 GCS_BUCKET_NAME = "kangnam-univ"
 GCS_BUCKET_LOCATION = "asia-northeast3"  # 서울
 GCS_RAG_DATA_PATH = "rag_data/kangnam_univ_graduation_requirements_2017_2025.jsonl"  # GCS 경로
+# resumable 업로드 chunk 크기 (256KB의 배수, 이만큼만 메모리에 버퍼링)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 # 코퍼스 내 파일명 (display_name)
 CORPUS_FILE_DISPLAY_NAME = "강남대학교_졸업이수학점_2017_2025"  # 코퍼스 안에서 보이는 이름
@@ -45,21 +51,6 @@ LOCATION = "us-east4"
 CORPUS_ID = "6917529027641081856"
 CORPUS_NAME = f"projects/{PROJECT_ID}/locations/{LOCATION}/ragCorpora/{CORPUS_ID}"
 
-# ==============================
-# 초기화
-# ==============================
-print(f"🔄 초기화 중...")
-print(f"   프로젝트: {PROJECT_ID}")
-print(f"   Vertex AI 리전: {LOCATION}")
-print(f"   GCS 버킷: gs://{GCS_BUCKET_NAME}")
-print(f"   코퍼스 ID: {CORPUS_ID}\n")
-
-# Vertex AI 초기화
-vertexai.init(project=PROJECT_ID, location=LOCATION)
-
-# GCS 클라이언트 초기화
-storage_client = storage.Client(project=PROJECT_ID)
-bucket = storage_client.bucket(GCS_BUCKET_NAME)
 
 # ==============================
 # 헬퍼 함수
@@ -76,6 +67,7 @@ def merge_departments(department_data):
             names.extend(dept["전공"])
     return ", ".join(names)
 
+
 def extract_year_range_from_filename(filename):
     """파일명에서 학년도 범위 추출"""
     if "2017_2025_통합" in filename:
@@ -88,52 +80,81 @@ def extract_year_range_from_filename(filename):
         return "2017-2020"
     return "unknown"
 
+
 # ==============================
-# JSON 데이터 처리
+# 파이프라인 단계 (모두 제너레이터)
 # ==============================
-all_chunks = []
-
-for json_file in JSON_FILES:
-    json_path = DATA_DIR / json_file
-    
-    if not json_path.exists():
-        print(f"⚠️  파일을 찾을 수 없습니다: {json_file}")
-        continue
-    
-    print(f"📂 처리 중: {json_file}")
-    
-    with open(json_path, "r", encoding="utf-8") as f:
-        file_data = json.load(f)
-    
-    # 파일명에서 기본 year_range 추출 (fallback용)
-    default_year_range = extract_year_range_from_filename(json_file)
-    document_title = file_data.get("document_title", "")
-    
-    # data 배열 가져오기
-    colleges_data = file_data.get("data", [])
-    
-    for college_info in colleges_data:
-        college = college_info.get("대학", "")
-        grad_req = college_info.get("졸업요건", {})
-        liberal_arts = college_info.get("교양이수표", {})
-        divisions = college_info.get("계열", [])
-        
-        # ⭐ JSON 내부의 year_range를 우선 사용, 없으면 파일명에서 추출한 값 사용
-        year_range = college_info.get("year_range", default_year_range)
-        
-        for division in divisions:
-            division_name = division.get("계열명", "")
-            departments_list = division.get("학부및학과", [])
-            departments_str = merge_departments(departments_list)
-            
-            # Chunk 1: 졸업요건
-            if grad_req:
-                content = f"""
+@dataclass
+class Division:
+    """계열 하나 (chunk 생성 단위)"""
+    source_file: str
+    college: str
+    division_name: str
+    departments: str
+    year_range: str
+    grad_req: Dict[str, Any]
+    liberal_arts: Dict[str, Any]
+
+
+def read_sources(paths: Iterable[Path]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """JSON 파일을 하나씩 읽기 (없는 파일은 경고 후 건너뜀)"""
+    for path in paths:
+        if not path.exists():
+            print(f"⚠️  파일을 찾을 수 없습니다: {path.name}")
+            continue
+        print(f"📂 처리 중: {path.name}")
+        with open(path, "r", encoding="utf-8") as f:
+            yield path.name, json.load(f)
+
+
+def flatten(sources: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[Division]:
+    """대학 → 계열 평탄화 (JSON 내부 year_range 우선, 없으면 파일명에서 추출)"""
+    for source_file, file_data in sources:
+        default_year_range = extract_year_range_from_filename(source_file)
+        for college_info in file_data.get("data", []):
+            for division in college_info.get("계열", []):
+                yield Division(
+                    source_file=source_file,
+                    college=college_info.get("대학", ""),
+                    division_name=division.get("계열명", ""),
+                    departments=merge_departments(division.get("학부및학과", [])),
+                    year_range=college_info.get("year_range", default_year_range),
+                    grad_req=college_info.get("졸업요건", {}),
+                    liberal_arts=college_info.get("교양이수표", {}),
+                )
+
+
+def _metadata(division: Division, category: str) -> Dict[str, str]:
+    return {
+        "college": division.college,
+        "division": division.division_name,
+        "department": division.departments,
+        "year_range": division.year_range,
+        "category": category,
+        "language": "ko",
+        "source_file": division.source_file,
+    }
+
+
+def chunk_id(division: Division, category: str) -> str:
+    """
+    문서 id (대학/계열/학년도/구분 해시)
+
+    다시 생성해도 같은 chunk는 같은 id라 데이터 스토어 INCREMENTAL import가 중복 없이 덮어씁니다.
+    """
+    key = "|".join([division.college, division.division_name, division.year_range, category])
+    return "grad-" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def graduation_chunk(division: Division) -> Dict[str, Any]:
+    """Chunk 1: 졸업요건"""
+    grad_req = division.grad_req
+    content = f"""
 [졸업요건 정보]
-대학: {college}
-계열: {division_name}
-학과/전공: {departments_str}
-학년도: {year_range}
+대학: {division.college}
+계열: {division.division_name}
+학과/전공: {division.departments}
+학년도: {division.year_range}
 
 졸업요건:
 - 기초교양: {grad_req.get('기초교양', 'N/A')}학점
@@ -143,157 +164,160 @@ for json_file in JSON_FILES:
 - 다전공자 전공학점: {grad_req.get('다전공자', {}).get('전공기초+전공선택', 'N/A')}학점
 - 최소졸업학점: {grad_req.get('최소졸업학점', 'N/A')}학점
 """.strip()
-                
-                all_chunks.append({
-                    "content": content,
-                    "metadata": {
-                        "college": college,
-                        "division": division_name,
-                        "department": departments_str,
-                        "year_range": year_range,
-                        "category": "졸업요건",
-                        "language": "ko",
-                        "source_file": json_file
-                    }
-                })
-            
-            # Chunk 2: 교양이수표
-            if liberal_arts:
-                # 교양이수표를 텍스트로 포맷팅
-                liberal_text_parts = [
-                    f"[교양이수표]",
-                    f"대학: {college}",
-                    f"계열: {division_name}",
-                    f"학과/전공: {departments_str}",
-                    f"학년도: {year_range}",
-                    "",
-                    "교양 과목:"
-                ]
-                
-                for category, subjects in liberal_arts.items():
-                    if isinstance(subjects, list):
-                        liberal_text_parts.append(f"\n{category}:")
-                        for subject in subjects:
-                            liberal_text_parts.append(f"  - {subject}")
-                    else:
-                        liberal_text_parts.append(f"{category}: {subjects}")
-                
-                content = "\n".join(liberal_text_parts)
-                
-                all_chunks.append({
-                    "content": content,
-                    "metadata": {
-                        "college": college,
-                        "division": division_name,
-                        "department": departments_str,
-                        "year_range": year_range,
-                        "category": "교양이수표",
-                        "language": "ko",
-                        "source_file": json_file
-                    }
-                })
-    
-    print(f"   ✅ {len([c for c in all_chunks if c['metadata']['source_file'] == json_file])}개 chunk 생성")
-
-print(f"\n📊 총 {len(all_chunks)}개의 chunk 생성 완료\n")
+    return {"id": chunk_id(division, "졸업요건"), "content": content, "metadata": _metadata(division, "졸업요건")}
 
-# ==============================
-# 로컬 result 폴더에 JSONL 저장 (확인용)
-# ==============================
-print(f"💾 로컬 result 폴더에 저장 중...")
-
-# JSONL 문자열 생성
-jsonl_content = "\n".join([
-    json.dumps(chunk, ensure_ascii=False) 
-    for chunk in all_chunks
-])
-
-# 로컬 파일로 저장
-local_jsonl_path = RESULT_DIR / "kangnam_univ_graduation_requirements.jsonl"
-with open(local_jsonl_path, "w", encoding="utf-8") as f:
-    f.write(jsonl_content)
-
-print(f"   ✅ 로컬 저장 완료!")
-print(f"   📁 경로: {local_jsonl_path}")
-print(f"   📦 크기: {len(jsonl_content.encode('utf-8')) / 1024:.2f} KB")
-print(f"\n   💡 업로드 전에 파일을 확인하세요: {local_jsonl_path}\n")
-
-# 사용자 확인
-confirm = input("🚀 GCS에 업로드하시겠습니까? (yes/no): ").strip().lower()
-if confirm not in ['yes', 'y']:
-    print("❌ 업로드가 취소되었습니다.")
-    print(f"   로컬 파일: {local_jsonl_path}")
-    exit(0)
 
-# ==============================
-# GCS에 JSONL 업로드
-# ==============================
-print(f"\n☁️  GCS에 업로드 중...")
-print(f"   버킷: gs://{GCS_BUCKET_NAME}")
-print(f"   경로: {GCS_RAG_DATA_PATH}")
-
-# GCS에 업로드
-try:
-    blob = bucket.blob(GCS_RAG_DATA_PATH)
-    blob.upload_from_string(
-        jsonl_content,
-        content_type="application/jsonl"
-    )
-    
-    gcs_uri = f"gs://{GCS_BUCKET_NAME}/{GCS_RAG_DATA_PATH}"
-    print(f"   ✅ GCS 업로드 완료!")
-    print(f"   📍 URI: {gcs_uri}")
-    print(f"   📦 크기: {len(jsonl_content.encode('utf-8')) / 1024:.2f} KB\n")
-    
-except Exception as e:
-    print(f"\n❌ GCS 업로드 실패:")
-    print(f"   {str(e)}")
-    print(f"\n💡 확인사항:")
-    print(f"   1. 버킷 존재 여부: gs://{GCS_BUCKET_NAME}")
-    print(f"   2. 권한: Storage Object Admin 역할")
-    print(f"   3. 인증: gcloud auth application-default login")
-    exit(1)
+def liberal_arts_chunk(division: Division) -> Dict[str, Any]:
+    """Chunk 2: 교양이수표"""
+    parts = [
+        "[교양이수표]",
+        f"대학: {division.college}",
+        f"계열: {division.division_name}",
+        f"학과/전공: {division.departments}",
+        f"학년도: {division.year_range}",
+        "",
+        "교양 과목:",
+    ]
+    for category, subjects in division.liberal_arts.items():
+        if isinstance(subjects, list):
+            parts.append(f"\n{category}:")
+            parts.extend(f"  - {subject}" for subject in subjects)
+        else:
+            parts.append(f"{category}: {subjects}")
+    return {
+        "id": chunk_id(division, "교양이수표"),
+        "content": "\n".join(parts),
+        "metadata": _metadata(division, "교양이수표"),
+    }
+
+
+def build_chunks(divisions: Iterable[Division]) -> Iterator[Dict[str, Any]]:
+    """계열마다 졸업요건/교양이수표 chunk (있는 것만)"""
+    for division in divisions:
+        if division.grad_req:
+            yield graduation_chunk(division)
+        if division.liberal_arts:
+            yield liberal_arts_chunk(division)
+
+
+def serialize(chunks: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """chunk → JSONL 한 줄 (UTF-8)"""
+    for chunk in chunks:
+        yield (json.dumps(chunk, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def chunk_stream(paths: Iterable[Path]) -> Iterator[bytes]:
+    """read → flatten → chunk → serialize"""
+    return serialize(build_chunks(flatten(read_sources(paths))))
+
+
+@dataclass
+class WriteStats:
+    lines: int = 0
+    bytes: int = 0
+
+
+def write_lines(lines: Iterable[bytes], writers: Sequence[BinaryIO]) -> WriteStats:
+    """한 줄씩 모든 writer에 기록 (로컬 확인용 파일 + GCS 업로드를 한 번에)"""
+    stats = WriteStats()
+    for line in lines:
+        for writer in writers:
+            writer.write(line)
+        stats.lines += 1
+        stats.bytes += len(line)
+    return stats
+
 
 # ==============================
-# Vertex AI RAG 코퍼스로 Import
+# GCS / Vertex AI
 # ==============================
-print(f"🚀 Vertex AI RAG 코퍼스에 Import 중...")
-print(f"   코퍼스: {CORPUS_NAME}")
-print(f"   소스: {gcs_uri}")
+def open_gcs_writer(bucket, blob_path: str = GCS_RAG_DATA_PATH, chunk_size: int = UPLOAD_CHUNK_SIZE) -> BinaryIO:
+    """GCS resumable 업로드 writer (close 시 업로드 확정)"""
+    return bucket.blob(blob_path).open("wb", chunk_size=chunk_size, content_type="application/jsonl")
+
 
-try:
-    # RagFile 설정으로 display_name 지정
+def import_to_corpus(gcs_uri: str, rag=None):
+    """GCS JSONL → RAG 코퍼스 import (rag 모듈 주입 가능)"""
+    if rag is None:
+        from vertexai.preview import rag
     operation = rag.import_files(
         corpus_name=CORPUS_NAME,
         paths=[gcs_uri],
         chunk_size=800,
         chunk_overlap=100,
     )
-    
-    print(f"   ⏳ Import 및 임베딩 생성 중...")
+    print("   ⏳ Import 및 임베딩 생성 중...")
     print(f"   📝 코퍼스 내 표시명: {CORPUS_FILE_DISPLAY_NAME}")
-    
     try:
-        result = operation.result()
-        print(f"   ✅ Import 완료 확인됨!")
+        operation.result()
+        print("   ✅ Import 완료 확인됨!")
     except Exception as result_error:
-        print(f"   ⚠️  완료 확인 실패 (백그라운드 처리 중일 수 있음)")
+        print("   ⚠️  완료 확인 실패 (백그라운드 처리 중일 수 있음)")
         print(f"   에러: {str(result_error)}")
-    
-    print(f"\n✅ Import 요청 완료!")
-    print(f"   📄 총 {len(all_chunks)}개 chunk")
-    print(f"   📁 로컬 파일: {local_jsonl_path}")
-    print(f"   ☁️  GCS 파일: {gcs_uri}")
-    print(f"   🔍 1-5분 후 코퍼스에서 검색 가능합니다!")
-    
-except Exception as e:
-    print(f"\n❌ Vertex AI Import 실패:")
-    print(f"   {str(e)}")
-    print(f"\n💡 확인사항:")
-    print(f"   1. 인증: gcloud auth application-default login")
-    print(f"   2. 권한: Vertex AI User 역할")
-    print(f"   3. API 활성화: Vertex AI API")
-    print(f"   4. 코퍼스 ID: {CORPUS_ID}")
-    print(f"   5. GCS 파일 접근 권한")
-    exit(1)
 
+
+def main():
+    parser = argparse.ArgumentParser(description="졸업이수학점 JSON → JSONL → RAG 코퍼스")
+    parser.add_argument("--upload", action="store_true", help="생성과 동시에 GCS 업로드 후 코퍼스 import")
+    parser.add_argument("--output", default=str(LOCAL_JSONL_PATH), help="로컬 확인용 JSONL 경로")
+    args = parser.parse_args()
+
+    paths = [DATA_DIR / name for name in JSON_FILES]
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not args.upload:
+        with open(output_path, "wb") as local_file:
+            stats = write_lines(chunk_stream(paths), [local_file])
+        print(f"\n📊 총 {stats.lines}개의 chunk 생성 완료 ({stats.bytes / 1024:.2f} KB)")
+        print(f"   📁 경로: {output_path}")
+        print("\n   💡 파일을 확인한 뒤 --upload로 다시 실행하면 GCS 업로드와 코퍼스 import를 진행합니다.")
+        return
+
+    import vertexai
+    from google.cloud import storage
+
+    print("🔄 초기화 중...")
+    print(f"   프로젝트: {PROJECT_ID}")
+    print(f"   Vertex AI 리전: {LOCATION}")
+    print(f"   GCS 버킷: gs://{GCS_BUCKET_NAME}")
+    print(f"   코퍼스 ID: {CORPUS_ID}\n")
+    vertexai.init(project=PROJECT_ID, location=LOCATION)
+    bucket = storage.Client(project=PROJECT_ID).bucket(GCS_BUCKET_NAME)
+    gcs_uri = f"gs://{GCS_BUCKET_NAME}/{GCS_RAG_DATA_PATH}"
+
+    print(f"☁️  생성하면서 GCS에 업로드 중... → {gcs_uri}")
+    try:
+        with open(output_path, "wb") as local_file, open_gcs_writer(bucket) as gcs_file:
+            stats = write_lines(chunk_stream(paths), [local_file, gcs_file])
+    except Exception as e:
+        print(f"\n❌ GCS 업로드 실패:")
+        print(f"   {str(e)}")
+        print(f"\n💡 확인사항:")
+        print(f"   1. 버킷 존재 여부: gs://{GCS_BUCKET_NAME}")
+        print(f"   2. 권한: Storage Object Admin 역할")
+        print(f"   3. 인증: gcloud auth application-default login")
+        raise SystemExit(1)
+    print(f"   ✅ GCS 업로드 완료! ({stats.lines}개 chunk, {stats.bytes / 1024:.2f} KB)")
+    print(f"   📁 로컬 파일: {output_path}\n")
+
+    print(f"🚀 Vertex AI RAG 코퍼스에 Import 중...")
+    print(f"   코퍼스: {CORPUS_NAME}")
+    print(f"   소스: {gcs_uri}")
+    try:
+        import_to_corpus(gcs_uri)
+    except Exception as e:
+        print(f"\n❌ Vertex AI Import 실패:")
+        print(f"   {str(e)}")
+        print(f"\n💡 확인사항:")
+        print(f"   1. 인증: gcloud auth application-default login")
+        print(f"   2. 권한: Vertex AI User 역할")
+        print(f"   3. API 활성화: Vertex AI API")
+        print(f"   4. 코퍼스 ID: {CORPUS_ID}")
+        print(f"   5. GCS 파일 접근 권한")
+        raise SystemExit(1)
+    print(f"\n✅ Import 요청 완료! 🔍 1-5분 후 코퍼스에서 검색 가능합니다!")
+
+
+if __name__ == "__main__":
+    main()
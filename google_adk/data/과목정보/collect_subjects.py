@@ -1,20 +1,43 @@
-import requests
-import re
+"""
+강남대학교 학기별 개설 과목 수집 (app.kangnam.ac.kr 과목 조회 → JSONL)
+
+전공(학과 × 학년 H1~H4)과 교양(영역 G 코드) 조회 단위를 비동기로 동시에 가져옵니다.
+- httpx.AsyncClient 하나를 공유 (조회 폼 쿠키는 처음 한 번만, 오류 후 재시도 시 다시 받음)
+- 동시 요청 수 상한(--concurrency) + 호스트 초당 요청 수 상한(--rate)
+- 5xx/429/네트워크 오류는 지수 백오프로 재시도
+- 완료 단위마다 진행률 출력, 결과 파일은 완료 순서와 관계없이 항상 같은 단위 순서로 기록
+
+중단/실패에 대비해 완료된 단위를 체크포인트(*.checkpoint.jsonl)에 바로 기록하고,
+다시 실행하면 남은 단위만 조회합니다. 모든 단위가 끝나면 여러 학과에 중복된 과목을
+id 하나로 병합(dedup.py)한 뒤 스냅샷(JSONL)을 교체하며,
+이전 스냅샷과 id별 내용 해시를 비교한 변경분을 *.delta.json으로 남깁니다.
+
+사용법:
+    python google_adk/data/과목정보/collect_subjects.py [--year 2025 --semester 2]
+    python google_adk/data/과목정보/collect_subjects.py --concurrency 4 --rate 5
+    python google_adk/data/과목정보/collect_subjects.py --fresh   # 체크포인트 무시
+"""
+import argparse
+import asyncio
 import json
-import time
-import socket
 import os
-import requests.packages.urllib3.util.connection as urllib3_cn
-from bs4 import BeautifulSoup
-from urllib.parse import quote
+import random
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urlparse
 
-# ----------------------------------------
-# 0. 네트워크 설정 (IPv4 강제)
-# ----------------------------------------
-def allowed_gai_family():
-    return socket.AF_INET
+import httpx
+from bs4 import BeautifulSoup
 
-urllib3_cn.allowed_gai_family = allowed_gai_family
+try:
+    from .dedup import merge_documents
+    from .snapshot import diff_hashes, load_hashes, snapshot_hashes, write_jsonl_atomic
+except ImportError:
+    # 스크립트로 직접 실행한 경우 (같은 폴더)
+    from dedup import merge_documents
+    from snapshot import diff_hashes, load_hashes, snapshot_hashes, write_jsonl_atomic
 
 # ----------------------------------------
 # 기본 설정
@@ -22,7 +45,33 @@ urllib3_cn.allowed_gai_family = allowed_gai_family
 BASE_URL = "https://app.kangnam.ac.kr/knumis/sbr"
 YEAR = "2025"
 SEMESTER = "2"
-OUTPUT_FILE = os.path.abspath(f"kangnam_all_{YEAR}_{SEMESTER}.jsonl")
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+USER_AGENT = "Mozilla/5.0"
+
+# 조회 코드: 전공 학년(H1~H4), 교양 영역(G)
+H_CODES = ["H1", "H2", "H3", "H4"]
+G_CODES = ["G31", "G32", "G333", "G344", "G355", "G9", "G19"]
+LIBERAL_ARTS_CODE = "5185"
+
+# 서버 부하 제한 기본값 (단위 약 280개 → 1분 이내)
+DEFAULT_CONCURRENCY = 6
+DEFAULT_REQUESTS_PER_SECOND = 8.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 0.5
+
+
+def output_path(year: str, semester: str, data_dir: str = DATA_DIR) -> str:
+    """학기별 결과 파일 경로 (kangnam_all_{YEAR}_{SEMESTER}.jsonl)"""
+    return os.path.join(data_dir, f"kangnam_all_{year}_{semester}.jsonl")
+
+
+def checkpoint_path(output_file: str) -> str:
+    return output_file.replace(".jsonl", "") + ".checkpoint.jsonl"
+
+
+def delta_path(output_file: str) -> str:
+    return output_file.replace(".jsonl", "") + ".delta.json"
 
 
 # ----------------------------------------
@@ -149,43 +198,204 @@ def parse_course_list(html: str):
 
 
 # ----------------------------------------
-# 3. 전공(H) / 교양(G) 과목 조회 API 호출
+# 3. 전공(H) / 교양(G) 과목 조회 (비동기)
 # ----------------------------------------
-def fetch_courses_by_major(mode_code: str, grad_code: str):
-    session = requests.Session()
-    session.headers.update({"User-Agent": "Mozilla/5.0"})
-    try:
-        session.get(f"{BASE_URL}/sbr1010.jsp", timeout=10)
+@dataclass(frozen=True)
+class CrawlUnit:
+    """조회 한 번에 해당하는 단위 (학과 × 학년 코드, 또는 교양 × 영역 코드)"""
+    dept_code: str
+    dept_name: str
+    grad_code: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.dept_code}/{self.grad_code}"
+
+    @property
+    def is_liberal_arts(self) -> bool:
+        return self.dept_code == LIBERAL_ARTS_CODE
+
+
+def build_units(departments: List[Dict[str, str]]) -> List[CrawlUnit]:
+    """전공(교양 제외) × H 코드, 교양 × G 코드 순서의 조회 단위 목록"""
+    units = [
+        CrawlUnit(d["code"], d["name"], h)
+        for d in departments if d["code"] != LIBERAL_ARTS_CODE
+        for h in H_CODES
+    ]
+    units += [CrawlUnit(LIBERAL_ARTS_CODE, "교양", g) for g in G_CODES]
+    return units
+
+
+class RateLimiter:
+    """
+    호스트별 요청 시작 간격 제한 (초당 requests_per_second회)
+
+    다음 요청이 시작할 수 있는 시각을 예약해 두고 그때까지 기다리므로
+    동시에 기다리는 코루틴이 많아도 간격이 일정하게 유지됩니다.
+    """
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_start: Dict[str, float] = {}
+
+    async def wait(self, host: str):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        start = max(now, self._next_start.get(host, now))
+        self._next_start[host] = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class CourseCrawler:
+    """
+    과목 조회 크롤러 (공유 세션 + 동시성/속도 제한 + 재시도)
+
+    Args:
+        year, semester: 조회 학기
+        concurrency: 동시 요청 수 상한
+        requests_per_second: 호스트당 초당 요청 수 상한 (0이면 제한 없음)
+        max_retries: 단위별 재시도 횟수 (첫 시도 제외)
+        backoff_seconds: 재시도 대기 기준 시간 (시도마다 2배 + 무작위 지터)
+        transport: httpx 트랜스포트 (테스트용 주입, 기본은 IPv4 고정)
+    """
 
+    def __init__(
+        self,
+        year: str = YEAR,
+        semester: str = SEMESTER,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.year = year
+        self.semester = semester
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        # 서버가 IPv6에서 응답하지 않아 IPv4로 고정 (기존 urllib3 allowed_gai_family 설정과 동일)
+        self._client = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            timeout=timeout,
+            transport=transport or httpx.AsyncHTTPTransport(local_address="0.0.0.0"),
+            limits=httpx.Limits(max_connections=max(1, concurrency)),
+        )
+        self._primed = False
+        self._prime_lock = asyncio.Lock()
+        self.request_count = 0
+
+    async def __aenter__(self) -> "CourseCrawler":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self._semaphore:
+            await self.rate_limiter.wait(urlparse(url).netloc)
+            self.request_count += 1
+            response = await self._client.request(method, url, **kwargs)
+        if response.status_code == 429 or response.status_code >= 500:
+            response.raise_for_status()
+        return response
+
+    async def _prime_session(self):
+        """조회 폼(sbr1010.jsp)을 한 번 열어 세션 쿠키를 받음"""
+        if self._primed:
+            return
+        async with self._prime_lock:
+            if not self._primed:
+                await self._request("GET", f"{BASE_URL}/sbr1010.jsp")
+                self._primed = True
+
+    async def _fetch_once(self, unit: CrawlUnit) -> List[Dict[str, str]]:
+        await self._prime_session()
         payload = {
-            "schl_year": YEAR,
-            "schl_smst": SEMESTER,
-            "dept_srch": mode_code,
+            "schl_year": self.year,
+            "schl_smst": self.semester,
+            "dept_srch": unit.dept_code,
             "srch_gubn": "21",
             "subj_knam": "",
             "subj_knam2": "",
-            "dept_code1": mode_code,
-            "grad_area1": grad_code
+            "dept_code1": unit.dept_code,
+            "grad_area1": unit.grad_code,
         }
-
-        payload_encoded = {}
-        for k, v in payload.items():
-            payload_encoded[k] = v.encode("euc-kr")
-            
-        post_url = f"{BASE_URL}/sbr1010L.jsp"
-
-        res = session.post(
-            post_url,
-            data=payload_encoded,
+        body = urlencode({k: v.encode("euc-kr") for k, v in payload.items()})
+        response = await self._request(
+            "POST",
+            f"{BASE_URL}/sbr1010L.jsp",
+            content=body,
             headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=30
         )
-
-        res.encoding = "euc-kr"
-        return parse_course_list(res.text)
-    except Exception as e:
-        print(f"Error fetching courses for {mode_code}/{grad_code}: {e}")
-        return []
+        return parse_course_list(response.content.decode("euc-kr", errors="replace"))
+
+    async def fetch_unit(self, unit: CrawlUnit) -> List[Dict[str, str]]:
+        """
+        단위 하나 조회 (재시도 포함)
+
+        Raises:
+            httpx.HTTPError: 재시도 후에도 실패한 경우
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self._fetch_once(unit)
+            except httpx.HTTPError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff_seconds * (2 ** attempt) * (1 + random.random())
+                print(f"  ↻ {unit.dept_name} ({unit.grad_code}) 재시도 {attempt + 1}/{self.max_retries}: {e!r}")
+                # 세션이 만료됐을 수 있으므로 다음 시도 전에 쿠키를 다시 받음
+                self._primed = False
+                await asyncio.sleep(delay)
+
+    async def crawl(
+        self,
+        units: Sequence[CrawlUnit],
+        on_unit_done: Optional[Callable[[CrawlUnit, List[Dict[str, str]]], None]] = None,
+    ) -> Tuple[Dict[CrawlUnit, List[Dict[str, str]]], Dict[CrawlUnit, str]]:
+        """
+        모든 단위를 동시에 조회
+
+        Args:
+            units: 조회 단위 목록
+            on_unit_done: 단위가 성공할 때마다 완료 순서대로 호출
+
+        Returns:
+            (단위별 과목 목록, 실패한 단위별 오류 메시지)
+        """
+        results: Dict[CrawlUnit, List[Dict[str, str]]] = {}
+        failures: Dict[CrawlUnit, str] = {}
+        started = time.monotonic()
+
+        async def run(unit: CrawlUnit):
+            try:
+                return unit, await self.fetch_unit(unit), None
+            except httpx.HTTPError as e:
+                return unit, [], repr(e)
+
+        tasks = [asyncio.create_task(run(unit)) for unit in units]
+        for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+            unit, courses, error = await task
+            if error:
+                failures[unit] = error
+                status = f"❌ {error}"
+            else:
+                results[unit] = courses
+                status = f"{len(courses)}개 과목"
+                if on_unit_done:
+                    on_unit_done(unit, courses)
+            elapsed = time.monotonic() - started
+            print(f"[{done}/{len(units)} {elapsed:5.1f}s] {unit.dept_name} ({unit.grad_code}): {status}")
+        return results, failures
 
 
 # ----------------------------------------
@@ -221,104 +431,214 @@ def construct_syllabus_url(params_str: str):
 
 
 # ----------------------------------------
-# 6. 전체 크롤링 실행
+# 5. 검색 문서 생성
+# ----------------------------------------
+def build_documents(unit: CrawlUnit, courses: List[Dict[str, str]], year: str, semester: str) -> List[dict]:
+    """조회 단위의 과목 목록 → JSONL 문서 (전공은 학년, 교양은 영역 코드 포함)"""
+    documents = []
+    for c in courses:
+        syllabus_url = construct_syllabus_url(c["params"])
+        if unit.is_liberal_arts:
+            scope = f"구분: 교양 {unit.grad_code}\n"
+            metadata = {"department": "교양", "grade": 0}
+        else:
+            grade_num = int(unit.grad_code[1])
+            scope = f"전공: {unit.dept_name}\n학년: {grade_num}학년\n"
+            metadata = {"department": unit.dept_name, "grade": grade_num}
+
+        doc = {
+            "id": f"{c['학수번호']}-{c['분반']}",
+            "content": (
+                f"과목명: {c['과목명']}\n"
+                f"학수번호: {c['학수번호']}\n"
+                f"분반: {c['분반']}\n"
+                f"{scope}"
+                f"담당교수: {c['담당교수']}\n"
+                f"학점: {c['학점']}\n"
+                f"강의시간: {c['강의시간']}\n"
+                f"강의계획서: {syllabus_url}"
+            ),
+            "metadata": {
+                "subject_name": c['과목명'],
+                **metadata,
+                "professor": c['담당교수'],
+                "credit": c['학점'],
+                "year": int(year),
+                "semester": int(semester),
+                "syllabus_url": syllabus_url,
+            }
+        }
+        if unit.is_liberal_arts:
+            doc["metadata"]["category"] = unit.grad_code
+        documents.append(doc)
+    return documents
+
+
+# ----------------------------------------
+# 6. 체크포인트
+# ----------------------------------------
+class Checkpoint:
+    """
+    완료된 조회 단위 기록 (JSONL, 단위마다 한 줄 추가 후 flush)
+
+    한 줄: {"unit": "학과코드/학년코드", "courses": [...]}
+    마지막 줄이 쓰다 만 상태로 끝났으면 그 줄만 버립니다.
+    (이어 쓰기 전에 파일에서도 잘라내서 새 기록이 그 줄에 붙지 않게 합니다.)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def load(self) -> Dict[str, List[Dict[str, str]]]:
+        completed: Dict[str, List[Dict[str, str]]] = {}
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                completed[entry["unit"]] = entry["courses"]
+        return completed
+
+    def record(self, unit: CrawlUnit, courses: List[Dict[str, str]]):
+        if self._file is None:
+            self._drop_partial_line()
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps({"unit": unit.key, "courses": courses}, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def _drop_partial_line(self):
+        """줄바꿈으로 끝나지 않은 마지막 줄을 잘라냄"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if not data or data.endswith(b"\n"):
+                return
+            f.truncate(data.rfind(b"\n") + 1)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# ----------------------------------------
+# 7. 전체 크롤링 실행
 # ----------------------------------------
+async def collect(
+    year: str = YEAR,
+    semester: str = SEMESTER,
+    output_file: Optional[str] = None,
+    fresh: bool = False,
+    **crawler_options,
+) -> Dict[str, object]:
+    """
+    학기 전체 수집 (체크포인트에서 이어서) 후 JSONL 스냅샷과 변경분 저장
+
+    Args:
+        fresh: True면 기존 체크포인트를 지우고 처음부터 수집
+
+    Returns:
+        {"output", "units", "resumed", "documents", "failures", "dedup", "delta", "seconds"}
+        (실패한 단위가 있으면 스냅샷을 바꾸지 않고 documents/dedup/delta는 None)
+    """
+    output_file = output_file or output_path(year, semester)
+    units = build_units(fetch_departments())
+    checkpoint = Checkpoint(checkpoint_path(output_file))
+    if fresh:
+        checkpoint.remove()
+    completed = checkpoint.load()
+    pending = [unit for unit in units if unit.key not in completed]
+
+    print(f"▶ {year}년 {semester}학기 데이터 수집 시작 ({len(units)}개 조회 단위)")
+    print(f"▶ 저장 경로: {output_file}")
+    if completed:
+        print(f"▶ 체크포인트에서 이어서: 완료 {len(units) - len(pending)}개, 남은 단위 {len(pending)}개")
+
+    started = time.monotonic()
+    try:
+        async with CourseCrawler(year, semester, **crawler_options) as crawler:
+            results, failures = await crawler.crawl(pending, on_unit_done=checkpoint.record)
+            request_count = crawler.request_count
+    finally:
+        checkpoint.close()
+    seconds = time.monotonic() - started
+
+    summary: Dict[str, object] = {
+        "output": output_file,
+        "units": len(units),
+        "resumed": len(units) - len(pending),
+        "documents": None,
+        "failures": {unit.key: error for unit, error in failures.items()},
+        "dedup": None,
+        "delta": None,
+        "seconds": seconds,
+    }
+    if failures:
+        print(f"\n⚠️ {len(failures)}개 단위 실패 - 스냅샷은 그대로 두고 체크포인트를 유지합니다. 다시 실행하면 이어서 수집합니다.")
+        for unit, error in failures.items():
+            print(f"   - {unit.dept_name} ({unit.grad_code}) {error}")
+        return summary
+
+    # 완료 순서와 관계없이 단위 순서대로 기록 (재실행 시 같은 파일)
+    courses_by_unit = {**completed, **{unit.key: courses for unit, courses in results.items()}}
+    documents, dedup = merge_documents(
+        doc
+        for unit in units
+        for doc in build_documents(unit, courses_by_unit.get(unit.key, []), year, semester)
+    )
+    previous = load_hashes(output_file)
+    delta = diff_hashes(previous, snapshot_hashes(documents))
+    write_jsonl_atomic(output_file, documents)
+    with open(delta_path(output_file), "w", encoding="utf-8") as f:
+        json.dump({
+            "year": int(year),
+            "semester": int(semester),
+            "snapshot": os.path.basename(output_file),
+            "previous_ids": len(previous) if previous is not None else None,
+            "dedup": dedup.to_dict(),
+            **delta.to_dict(),
+        }, f, ensure_ascii=False, indent=2)
+    checkpoint.remove()
+
+    print(f"\n🎉 전체 크롤링 완료! → {output_file}")
+    print(f"   {len(units)}개 단위, 문서 {len(documents)}개, 요청 {request_count}회, {seconds:.1f}초")
+    print(f"   중복 병합: {dedup.summary()}")
+    print(f"   변경분: {delta.summary()} → {delta_path(output_file)}")
+    summary.update(documents=len(documents), dedup=dedup, delta=delta)
+    return summary
+
+
 def main():
-    print(f"▶ {YEAR}년 {SEMESTER}학기 데이터 수집 시작")
-    print(f"▶ 저장 경로: {OUTPUT_FILE}")
-    
-    departments = fetch_departments()
-    print(f"총 {len(departments)}개 전공 발견\n")
-
-    H_CODES = ["H1", "H2", "H3", "H4"]
-    G_CODES = ["G31", "G32", "G333", "G344", "G355", "G9", "G19"]
-
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as output:
-        
-        # 전공(H 계열)
-        for d in departments:
-            if d["code"] == "5185": continue # 교양 제외
-                
-            print(f"▶ 전공 {d['name']} 처리 중…")
-
-            for h in H_CODES:
-                courses = fetch_courses_by_major(d["code"], h)
-                if courses:
-                    print(f"  - {d['name']} ({h}): {len(courses)}개 과목 수집")
-                
-                grade_num = int(h[1])
-
-                for c in courses:
-                    syllabus_url = construct_syllabus_url(c["params"])
-                    
-                    doc = {
-                        "id": f"{c['학수번호']}-{c['분반']}",
-                        "content": (
-                            f"과목명: {c['과목명']}\n"
-                            f"학수번호: {c['학수번호']}\n"
-                            f"분반: {c['분반']}\n"
-                            f"전공: {d['name']}\n"
-                            f"학년: {grade_num}학년\n"
-                            f"담당교수: {c['담당교수']}\n"
-                            f"학점: {c['학점']}\n"
-                            f"강의시간: {c['강의시간']}\n"
-                            f"강의계획서: {syllabus_url}"
-                        ),
-                        "metadata": {
-                            "subject_name": c['과목명'],
-                            "department": d['name'],
-                            "grade": grade_num,
-                            "professor": c['담당교수'],
-                            "credit": c['학점'],
-                            "year": int(YEAR),
-                            "semester": int(SEMESTER),
-                            "syllabus_url": syllabus_url
-                        }
-                    }
-                    output.write(json.dumps(doc, ensure_ascii=False) + "\n")
-                
-                time.sleep(0.1)
-
-        # 교양(G 계열)
-        print("\n▶ 교양 영역 전체 수집 시작")
-        for g in G_CODES:
-            print(f"- 교양 영역 {g} 처리 중…")
-            courses = fetch_courses_by_major("5185", g)
-            if courses:
-                print(f"  - 교양 {g}: {len(courses)}개 과목 수집")
-
-            for c in courses:
-                syllabus_url = construct_syllabus_url(c["params"])
-                
-                doc = {
-                    "id": f"{c['학수번호']}-{c['분반']}",
-                    "content": (
-                        f"과목명: {c['과목명']}\n"
-                        f"학수번호: {c['학수번호']}\n"
-                        f"분반: {c['분반']}\n"
-                        f"구분: 교양 {g}\n"
-                        f"담당교수: {c['담당교수']}\n"
-                        f"학점: {c['학점']}\n"
-                        f"강의시간: {c['강의시간']}\n"
-                        f"강의계획서: {syllabus_url}"
-                    ),
-                    "metadata": {
-                        "subject_name": c['과목명'],
-                        "department": "교양",
-                        "grade": 0,
-                        "professor": c['담당교수'],
-                        "credit": c['학점'],
-                        "year": int(YEAR),
-                        "semester": int(SEMESTER),
-                        "syllabus_url": syllabus_url,
-                        "category": g
-                    }
-                }
-                output.write(json.dumps(doc, ensure_ascii=False) + "\n")
-            
-            time.sleep(0.1)
-
-    print(f"\n🎉 전체 크롤링 완료! → {OUTPUT_FILE}")
+    parser = argparse.ArgumentParser(description="강남대학교 학기별 개설 과목 수집")
+    parser.add_argument("--year", default=YEAR)
+    parser.add_argument("--semester", default=SEMESTER)
+    parser.add_argument("--output", help="결과 JSONL 경로 (기본: 이 폴더의 kangnam_all_{YEAR}_{SEMESTER}.jsonl)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 요청 수 상한")
+    parser.add_argument("--rate", type=float, default=DEFAULT_REQUESTS_PER_SECOND, help="초당 요청 수 상한")
+    parser.add_argument("--retries", type=int, default=DEFAULT_MAX_RETRIES, help="단위별 재시도 횟수")
+    parser.add_argument("--fresh", action="store_true", help="체크포인트를 무시하고 처음부터 수집")
+    args = parser.parse_args()
+
+    asyncio.run(collect(
+        args.year,
+        args.semester,
+        args.output,
+        fresh=args.fresh,
+        concurrency=args.concurrency,
+        requests_per_second=args.rate,
+        max_retries=args.retries,
+    ))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,198 @@
+"""
+과목 문서 중복 병합 (학수번호-분반 id 기준)
+
+여러 학과가 개설 목록에 함께 올린 과목은 조회 단위마다 같은 id로 한 줄씩 기록되어
+색인이 부풀고, 증분 가져오기(id_field="id")에서 어느 줄이 남을지 정해지지 않습니다.
+같은 id의 줄을 첫 줄 기준으로 하나로 합치고 학과/학년/교양 영역을 목록으로 모읍니다.
+
+- metadata: departments/grades 목록 추가 (교양은 categories), department/grade/category는 첫 값 유지
+- content: 전공/학년/구분 줄을 합친 값으로 다시 써서 강의시간 뒤로 옮김 (중복이 없는 과목은 그대로)
+  학과가 많으면 전공 줄이 수백 자라, 앞에 두면 도구 응답 압축(content 200자)에서 교수/강의시간이 잘림
+- 과목명/교수/학점/강의계획서가 줄마다 다르면 첫 줄을 남기고 conflicts로 보고
+
+사용법:
+    python google_adk/data/과목정보/dedup.py                      # 기본 학기 파일을 제자리에서 병합
+    python google_adk/data/과목정보/dedup.py --input a.jsonl --output b.jsonl
+"""
+import argparse
+import copy
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    from .snapshot import read_jsonl, write_jsonl_atomic
+except ImportError:
+    # 스크립트로 직접 실행한 경우 (같은 폴더)
+    from snapshot import read_jsonl, write_jsonl_atomic
+
+LIBERAL_ARTS_DEPARTMENT = "교양"
+SCOPE_PREFIXES = ("전공:", "학년:", "구분:")
+# 병합된 전공/학년/구분 줄을 넣을 위치 (이 줄 뒤)
+SCOPE_AFTER_PREFIX = "강의시간:"
+# 줄마다 같아야 하는 항목 (다르면 충돌로 보고)
+IDENTITY_FIELDS = ("subject_name", "professor", "credit", "syllabus_url")
+
+
+@dataclass
+class DedupReport:
+    """병합 전후 문서 수와 크기 (JSONL 기준 바이트)"""
+    input_documents: int = 0
+    output_documents: int = 0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    merged_ids: int = 0
+    conflicts: List[str] = field(default_factory=list)
+
+    @property
+    def removed(self) -> int:
+        return self.input_documents - self.output_documents
+
+    @property
+    def document_shrink_ratio(self) -> float:
+        """줄어든 문서 수 비율 (0~1)"""
+        return self.removed / self.input_documents if self.input_documents else 0.0
+
+    @property
+    def shrink_ratio(self) -> float:
+        """줄어든 바이트 비율 (0~1, 병합 문서에 목록 항목이 늘어 문서 수보다 작음)"""
+        return 1 - self.output_bytes / self.input_bytes if self.input_bytes else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"문서 {self.input_documents} → {self.output_documents} (-{self.document_shrink_ratio:.1%}, "
+            f"중복 {self.removed}줄 제거, 병합된 id {self.merged_ids}개), "
+            f"{self.input_bytes / 1024:.0f}KB → {self.output_bytes / 1024:.0f}KB "
+            f"(-{self.shrink_ratio:.1%}), 충돌 {len(self.conflicts)}개"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "input_documents": self.input_documents,
+            "output_documents": self.output_documents,
+            "removed": self.removed,
+            "merged_ids": self.merged_ids,
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "conflicts": self.conflicts,
+        }
+
+
+def _jsonl_bytes(document: dict) -> int:
+    return len(json.dumps(document, ensure_ascii=False).encode("utf-8")) + 1
+
+
+def _unique(values: Iterable) -> list:
+    return list(dict.fromkeys(values))
+
+
+def _departments(metadata: dict) -> List[str]:
+    """행의 학과 목록 (이미 병합된 문서면 departments)"""
+    return metadata.get("departments") or [metadata.get("department", "")]
+
+
+def _grades(metadata: dict) -> List[int]:
+    return [int(g) for g in metadata.get("grades") or [metadata.get("grade", 0)]]
+
+
+def _categories(metadata: dict) -> List[str]:
+    return metadata.get("categories") or ([metadata["category"]] if metadata.get("category") else [])
+
+
+def _scope_lines(rows: List[dict]) -> List[str]:
+    """병합된 학년/교양 영역/전공 줄 (build_documents와 같은 형식, 값만 쉼표로 나열, 긴 전공 줄은 마지막)"""
+    departments = _unique(dept for row in rows for dept in _departments(row["metadata"]))
+    majors = [dept for dept in departments if dept != LIBERAL_ARTS_DEPARTMENT]
+    grades = sorted(set(
+        grade for row in rows for grade in _grades(row["metadata"])
+        if any(dept != LIBERAL_ARTS_DEPARTMENT for dept in _departments(row["metadata"]))
+    ) - {0})
+    categories = _unique(category for row in rows for category in _categories(row["metadata"]))
+    lines = []
+    if majors:
+        lines.append(f"학년: {', '.join(str(g) for g in grades)}학년")
+    if LIBERAL_ARTS_DEPARTMENT in departments:
+        lines.append(f"구분: 교양 {', '.join(categories)}".rstrip())
+    if majors:
+        lines.append(f"전공: {', '.join(majors)}")
+    return lines
+
+
+def _merge_content(content: str, scope: List[str]) -> str:
+    """content의 전공/학년/구분 줄을 빼고 scope를 강의시간 줄 뒤에 넣음 (없으면 끝)"""
+    kept = [line for line in content.split("\n") if not line.startswith(SCOPE_PREFIXES)]
+    position = next(
+        (i + 1 for i, line in enumerate(kept) if line.startswith(SCOPE_AFTER_PREFIX)),
+        len(kept),
+    )
+    return "\n".join(kept[:position] + scope + kept[position:])
+
+
+def merge_group(rows: List[dict]) -> dict:
+    """같은 id의 줄 → 문서 하나 (첫 줄 기준, 학과/학년/영역 목록 추가)"""
+    merged = copy.deepcopy(rows[0])
+    metadata = merged.setdefault("metadata", {})
+    metadata["departments"] = _unique(dept for row in rows for dept in _departments(row["metadata"]))
+    metadata["grades"] = sorted(set(grade for row in rows for grade in _grades(row["metadata"])))
+    categories = _unique(category for row in rows for category in _categories(row["metadata"]))
+    if categories:
+        metadata["categories"] = categories
+    # 이미 병합된 문서(학과/학년/영역이 여럿)도 다시 써서 이전 형식의 줄 순서를 맞춤
+    if len(rows) > 1 or any(len(values) > 1 for values in (metadata["departments"], metadata["grades"], categories)):
+        merged["content"] = _merge_content(merged.get("content", ""), _scope_lines(rows))
+    return merged
+
+
+def merge_documents(documents: Iterable[dict]) -> Tuple[List[dict], DedupReport]:
+    """
+    같은 id의 문서를 하나로 병합 (처음 나온 순서 유지)
+
+    Returns:
+        (병합된 문서 목록, DedupReport)
+    """
+    report = DedupReport()
+    groups: Dict[str, List[dict]] = {}
+    for document in documents:
+        report.input_documents += 1
+        report.input_bytes += _jsonl_bytes(document)
+        groups.setdefault(document["id"], []).append(document)
+
+    merged = []
+    for doc_id, rows in groups.items():
+        if len(rows) > 1:
+            report.merged_ids += 1
+            first = rows[0]["metadata"]
+            if any(row["metadata"].get(key) != first.get(key) for row in rows[1:] for key in IDENTITY_FIELDS):
+                report.conflicts.append(doc_id)
+        document = merge_group(rows)
+        report.output_bytes += _jsonl_bytes(document)
+        merged.append(document)
+
+    report.output_documents = len(merged)
+    return merged, report
+
+
+def dedup_file(input_file: str, output_file: str = None) -> DedupReport:
+    """JSONL 파일 병합 (output_file이 없으면 제자리 교체)"""
+    documents, report = merge_documents(read_jsonl(input_file))
+    write_jsonl_atomic(output_file or input_file, documents)
+    return report
+
+
+def main():
+    data_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="과목 JSONL 중복 id 병합")
+    parser.add_argument("--input", default=os.path.join(data_dir, "kangnam_all_2025_2.jsonl"))
+    parser.add_argument("--output", help="결과 경로 (기본: 입력 파일 교체)")
+    args = parser.parse_args()
+
+    report = dedup_file(args.input, args.output)
+    print(f"✅ 중복 병합 완료 → {args.output or args.input}")
+    print(f"   {report.summary()}")
+    for doc_id in report.conflicts[:10]:
+        print(f"   ⚠️ 충돌 (첫 줄 유지): {doc_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+과목 스냅샷(JSONL) 해시와 변경분(delta)
+
+수집 결과를 통째로 다시 색인하지 않도록 문서 id별 내용 해시를 만들고,
+이전 스냅샷과 비교해 추가/변경/삭제된 id만 골라냅니다.
+
+- document_hash: 키 순서와 무관한 정규 JSON의 SHA-256
+- snapshot_hashes: id가 여러 줄이면(학과별 중복 행) 줄 해시를 정렬해 한 번 더 해시
+- write_jsonl_atomic: 임시 파일에 쓴 뒤 교체 (중간에 죽어도 이전 스냅샷 유지)
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+def canonical_json(document: dict) -> str:
+    return json.dumps(document, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def document_hash(document: dict) -> str:
+    """문서 내용 해시 (sha256 hex)"""
+    return hashlib.sha256(canonical_json(document).encode("utf-8")).hexdigest()
+
+
+def snapshot_hashes(documents: Iterable[dict]) -> Dict[str, str]:
+    """id → 내용 해시 (같은 id의 여러 줄은 순서와 무관하게 하나로 합침)"""
+    grouped: Dict[str, List[str]] = {}
+    for document in documents:
+        grouped.setdefault(document["id"], []).append(document_hash(document))
+    return {
+        doc_id: hashes[0] if len(hashes) == 1
+        else hashlib.sha256("".join(sorted(hashes)).encode("ascii")).hexdigest()
+        for doc_id, hashes in grouped.items()
+    }
+
+
+def read_jsonl(path: str) -> Iterator[dict]:
+    """JSONL 한 줄씩 (빈 줄은 건너뜀)"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_hashes(path: str) -> Optional[Dict[str, str]]:
+    """기존 스냅샷의 id별 해시 (파일이 없으면 None)"""
+    if not os.path.exists(path):
+        return None
+    return snapshot_hashes(read_jsonl(path))
+
+
+def write_jsonl_atomic(path: str, documents: Iterable[dict]) -> int:
+    """임시 파일에 쓴 뒤 교체, 기록한 줄 수 반환"""
+    temp_path = f"{path}.tmp"
+    count = 0
+    with open(temp_path, "w", encoding="utf-8") as f:
+        for document in documents:
+            f.write(json.dumps(document, ensure_ascii=False) + "\n")
+            count += 1
+    os.replace(temp_path, path)
+    return count
+
+
+@dataclass
+class Delta:
+    """이전 스냅샷 대비 변경분 (id 목록은 정렬)"""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def summary(self) -> str:
+        return (
+            f"추가 {len(self.added)}, 변경 {len(self.changed)}, "
+            f"삭제 {len(self.removed)}, 동일 {self.unchanged}"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "added": self.added,
+            "changed": self.changed,
+            "removed": self.removed,
+            "unchanged": self.unchanged,
+        }
+
+
+def diff_hashes(previous: Optional[Dict[str, str]], current: Dict[str, str]) -> Delta:
+    """id별 해시 비교 (previous가 None이면 전부 추가)"""
+    previous = previous or {}
+    delta = Delta(
+        added=sorted(doc_id for doc_id in current if doc_id not in previous),
+        changed=sorted(
+            doc_id for doc_id, digest in current.items()
+            if doc_id in previous and previous[doc_id] != digest
+        ),
+        removed=sorted(doc_id for doc_id in previous if doc_id not in current),
+    )
+    delta.unchanged = len(current) - len(delta.added) - len(delta.changed)
+    return delta
@@ -0,0 +1,224 @@
+"""
+강남대학교 과목 스냅샷 → Vertex AI Search 변경분 동기화
+
+upload_subjects.py는 JSONL 전체를 GCS에 올리고 전체 import를 다시 돌리며, 없어진 과목은
+지우지 않습니다. 데이터 스토어에 마지막으로 동기화한 id별 내용 해시(manifest)와 새 스냅샷을 비교해서
+- 추가/변경된 문서만 inline import(INCREMENTAL)로 batch_size개씩 upsert
+- 스냅샷에서 사라진 id는 delete_document로 삭제
+- 성공한 배치/삭제만 manifest에 반영 (실패분은 다음 실행에서 다시 시도)
+
+Discovery Engine 클라이언트(import_documents, delete_document)는 주입할 수 있어
+테스트에서는 로컬 대역으로 실행합니다. 처음 동기화(manifest 없음)는 전체 upsert가 됩니다.
+manifest는 데이터 스토어마다 하나라, 새 학기 스냅샷도 지금 색인된 이전 학기와 비교해 사라진 과목을 삭제합니다.
+
+사용법:
+    python google_adk/data/과목정보/sync_subjects.py                # 기본 학기 스냅샷
+    python google_adk/data/과목정보/sync_subjects.py --snapshot kangnam_all_2025_2.jsonl --dry-run
+"""
+import argparse
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from google.api_core.client_options import ClientOptions
+from google.api_core.exceptions import NotFound
+from google.cloud import discoveryengine
+
+try:
+    from .dedup import merge_documents
+    from .snapshot import Delta, diff_hashes, read_jsonl, snapshot_hashes
+except ImportError:
+    # 스크립트로 직접 실행한 경우 (같은 폴더)
+    from dedup import merge_documents
+    from snapshot import Delta, diff_hashes, read_jsonl, snapshot_hashes
+
+PROJECT_ID = "kangnam-backend"
+LOCATION = "global"
+DATA_STORE_ID = "kangnam-subjects-datastore"
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SNAPSHOT = os.path.join(DATA_DIR, "kangnam_all_2025_2.jsonl")
+
+# inline import 한 요청당 최대 문서 수 100
+DEFAULT_BATCH_SIZE = 100
+IMPORT_TIMEOUT_SECONDS = 600
+
+
+def manifest_path(snapshot_file: str, data_store: str = DATA_STORE_ID) -> str:
+    """스냅샷 폴더의 {data_store}.synced.json (스냅샷 파일명이 아닌 데이터 스토어 기준)"""
+    return os.path.join(os.path.dirname(os.path.abspath(snapshot_file)), f"{data_store}.synced.json")
+
+
+def load_manifest(path: str, data_store: str) -> Optional[Dict[str, str]]:
+    """마지막 동기화 id별 해시 (없거나 다른 데이터 스토어 기록이면 None)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("data_store") != data_store:
+        return None
+    return manifest["hashes"]
+
+
+def save_manifest(path: str, data_store: str, snapshot_file: str, hashes: Dict[str, str]):
+    """임시 파일에 쓴 뒤 교체 (배치마다 호출)"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "data_store": data_store,
+            "snapshot": os.path.basename(snapshot_file),
+            "synced_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "hashes": dict(sorted(hashes.items())),
+        }, f, ensure_ascii=False, indent=1)
+    os.replace(temp_path, path)
+
+
+def to_document(document: dict) -> discoveryengine.Document:
+    """JSONL 문서 → Discovery Engine 문서 (GCS custom import와 같은 structData)"""
+    return discoveryengine.Document(id=document["id"], struct_data=document)
+
+
+@dataclass
+class SyncResult:
+    """동기화 결과 (failed: id → 오류)"""
+    delta: Delta
+    upserted: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"upsert {len(self.upserted)}, 삭제 {len(self.deleted)}, "
+            f"실패 {len(self.failed)}, 동일 {self.delta.unchanged} ({self.seconds:.1f}s)"
+        )
+
+
+class SubjectSync:
+    """
+    스냅샷 ↔ 데이터 스토어 변경분 동기화
+
+    Args:
+        client: DocumentServiceClient 호환 객체 (import_documents, delete_document)
+        parent: 브랜치 경로 (projects/.../dataStores/{id}/branches/default_branch)
+        batch_size: inline import 한 번에 보낼 문서 수
+    """
+
+    def __init__(self, client, parent: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.client = client
+        self.parent = parent
+        self.batch_size = batch_size
+
+    def document_name(self, doc_id: str) -> str:
+        return f"{self.parent}/documents/{doc_id}"
+
+    def upsert(self, documents: List[dict]) -> Optional[str]:
+        """한 배치 upsert, 실패하면 오류 메시지 반환"""
+        request = discoveryengine.ImportDocumentsRequest(
+            parent=self.parent,
+            inline_source=discoveryengine.ImportDocumentsRequest.InlineSource(
+                documents=[to_document(document) for document in documents],
+            ),
+            reconciliation_mode=discoveryengine.ImportDocumentsRequest.ReconciliationMode.INCREMENTAL,
+        )
+        try:
+            response = self.client.import_documents(request=request).result(timeout=IMPORT_TIMEOUT_SECONDS)
+        except Exception as e:
+            return str(e) or type(e).__name__
+        if response.error_samples:
+            return "; ".join(sample.message for sample in response.error_samples[:3])
+        return None
+
+    def delete(self, doc_id: str) -> Optional[str]:
+        """문서 삭제 (이미 없으면 성공으로 간주), 실패하면 오류 메시지 반환"""
+        try:
+            self.client.delete_document(request=discoveryengine.DeleteDocumentRequest(name=self.document_name(doc_id)))
+        except NotFound:
+            pass
+        except Exception as e:
+            return str(e) or type(e).__name__
+        return None
+
+    def sync(self, snapshot_file: str, data_store: str = DATA_STORE_ID, dry_run: bool = False) -> SyncResult:
+        """
+        스냅샷과 manifest 비교 후 변경분만 반영
+
+        Args:
+            dry_run: True면 변경분만 계산하고 요청/manifest 기록은 하지 않음
+        """
+        started = time.monotonic()
+        documents, _ = merge_documents(read_jsonl(snapshot_file))
+        current = snapshot_hashes(documents)
+        path = manifest_path(snapshot_file, data_store)
+        synced = load_manifest(path, data_store)
+        delta = diff_hashes(synced, current)
+        result = SyncResult(delta=delta)
+
+        print(f"▶ {os.path.basename(snapshot_file)} → {data_store}")
+        print(f"▶ 변경분: {delta.summary()}" + (" (manifest 없음: 전체 upsert)" if synced is None else ""))
+        if dry_run or delta.is_empty:
+            result.seconds = time.monotonic() - started
+            return result
+
+        # 성공한 작업만 반영해 가며 배치마다 저장 (중간에 멈춰도 다음 실행이 남은 것만 처리)
+        manifest = dict(synced or {})
+        by_id = {document["id"]: document for document in documents}
+        pending = delta.added + delta.changed
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            error = self.upsert([by_id[doc_id] for doc_id in batch])
+            if error is None:
+                result.upserted.extend(batch)
+                manifest.update({doc_id: current[doc_id] for doc_id in batch})
+                save_manifest(path, data_store, snapshot_file, manifest)
+            else:
+                result.failed.update({doc_id: error for doc_id in batch})
+            print(f"   upsert {min(start + self.batch_size, len(pending))}/{len(pending)}"
+                  + (f" ⚠️ {error}" if error else ""))
+
+        for doc_id in delta.removed:
+            error = self.delete(doc_id)
+            if error is None:
+                result.deleted.append(doc_id)
+                manifest.pop(doc_id, None)
+            else:
+                result.failed[doc_id] = error
+        if delta.removed:
+            save_manifest(path, data_store, snapshot_file, manifest)
+            print(f"   삭제 {len(result.deleted)}/{len(delta.removed)}")
+
+        result.seconds = time.monotonic() - started
+        return result
+
+
+def create_client(location: str = LOCATION) -> discoveryengine.DocumentServiceClient:
+    client_options = (
+        ClientOptions(api_endpoint=f"{location}-discoveryengine.googleapis.com")
+        if location != "global" else None
+    )
+    return discoveryengine.DocumentServiceClient(client_options=client_options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과목 스냅샷 변경분을 Vertex AI Search에 동기화")
+    parser.add_argument("--snapshot", default=DEFAULT_SNAPSHOT, help="동기화할 JSONL 스냅샷")
+    parser.add_argument("--data-store", default=DATA_STORE_ID)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="inline import 배치 크기 (최대 100)")
+    parser.add_argument("--dry-run", action="store_true", help="변경분만 출력")
+    args = parser.parse_args()
+
+    parent = discoveryengine.DocumentServiceClient.branch_path(
+        project=PROJECT_ID, location=LOCATION, data_store=args.data_store, branch="default_branch",
+    )
+    sync = SubjectSync(None if args.dry_run else create_client(), parent, batch_size=args.batch_size)
+    result = sync.sync(args.snapshot, data_store=args.data_store, dry_run=args.dry_run)
+
+    print(f"\n{'🔎 변경분 확인' if args.dry_run else '🎉 동기화 완료'}: {result.summary()}")
+    for doc_id, error in list(result.failed.items())[:10]:
+        print(f"   ⚠️ 실패: {doc_id} {error}")
+
+
+if __name__ == "__main__":
+    main()
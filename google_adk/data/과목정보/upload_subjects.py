@@ -1,6 +1,9 @@
 """
 강남대학교 과목 정보 Vertex AI Search 업로드 스크립트
 
+처음 데이터 스토어를 만들고 스냅샷 전체를 가져올 때 사용합니다.
+이후 학기 데이터 갱신은 변경분만 반영하는 sync_subjects.py를 사용하세요.
+
 사용법:
     python google_adk/data/과목정보/upload_subjects.py
 """
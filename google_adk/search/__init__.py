@@ -0,0 +1,26 @@
+"""
+Vertex AI Search 공용 모듈
+
+모든 Agent 도구가 같은 인증 정보와 HTTP 연결 풀을 공유합니다.
+"""
+
+from google_adk.search.client import (
+    VertexSearchClient,
+    LatencyStats,
+    endpoint_name,
+    get_search_client,
+)
+from google_adk.search.cache import SearchCache, normalize_query
+from google_adk.search.batch import MAX_BATCH_QUERIES, merge_results, run_batch
+
+__all__ = [
+    'VertexSearchClient',
+    'LatencyStats',
+    'endpoint_name',
+    'get_search_client',
+    'SearchCache',
+    'normalize_query',
+    'MAX_BATCH_QUERIES',
+    'merge_results',
+    'run_batch',
+]
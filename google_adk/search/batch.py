@@ -0,0 +1,130 @@
+"""
+검색 도구 일괄 실행
+
+"교수님마다 담당 과목" 같은 복합 질문에서 모델이 도구를 N번 순차 호출하지 않도록
+질문 목록을 공용 스레드 풀에서 동시에 실행하고, 결과를 하나로 합칩니다.
+
+- 같은 질문(공백/대소문자 차이)은 한 번만 실행
+- 질문별 예외는 해당 질문의 error 결과로 바꾸고 나머지는 계속 진행
+- 여러 질문에서 나온 같은 문서(title)는 한 번만 남기고 matched_queries에 질문을 모음
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from google_adk.search.cache import normalize_query
+
+# 한 번에 받을 최대 질문 수 (모델이 과도하게 큰 목록을 넘기는 것 방지)
+MAX_BATCH_QUERIES = 20
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """프로세스 공용 스레드 풀 (크기는 Vertex AI Search 연결 풀과 같게)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from google_adk.config import VERTEX_SEARCH_POOL_SIZE
+                _executor = ThreadPoolExecutor(
+                    max_workers=VERTEX_SEARCH_POOL_SIZE,
+                    thread_name_prefix="search-batch"
+                )
+    return _executor
+
+
+def _run_one(func: Callable[[str], Dict[str, Any]], query: str) -> Dict[str, Any]:
+    try:
+        return func(query)
+    except Exception as e:
+        return {"status": "error", "query": query, "message": str(e)}
+
+
+def run_batch(
+    func: Callable[[str], Dict[str, Any]],
+    queries: List[str],
+    executor: Optional[ThreadPoolExecutor] = None
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    질문 목록을 동시에 실행
+
+    Args:
+        func: 질문 하나를 받아 도구 결과 dict를 반환하는 함수
+        queries: 질문 목록 (중복은 한 번만 실행, 최대 MAX_BATCH_QUERIES개)
+        executor: 사용할 스레드 풀 (없으면 공용 풀)
+
+    Returns:
+        입력 순서대로 (질문, 결과) 목록
+    """
+    unique: Dict[str, str] = {}
+    for query in queries:
+        if query and query.strip():
+            unique.setdefault(normalize_query(query), query.strip())
+    selected = list(unique.values())[:MAX_BATCH_QUERIES]
+
+    if len(selected) <= 1:
+        return [(query, _run_one(func, query)) for query in selected]
+
+    pool = executor or _get_executor()
+    futures = [(query, pool.submit(_run_one, func, query)) for query in selected]
+    return [(query, future.result()) for query, future in futures]
+
+
+def merge_results(
+    results: List[Tuple[str, Dict[str, Any]]],
+    key: Callable[[Dict[str, Any]], Any] = lambda result: result.get("title")
+) -> Dict[str, Any]:
+    """
+    질문별 도구 결과를 하나로 합치기
+
+    Args:
+        results: run_batch() 결과
+        key: 같은 문서를 판별할 키 (기본: title = 문서 ID)
+
+    Returns:
+        도구 결과 형식의 dict + 질문별 요약(queries)
+    """
+    merged: List[Dict[str, Any]] = []
+    by_key: Dict[Any, Dict[str, Any]] = {}
+    summaries = []
+    for query, result in results:
+        ok = result.get("status") == "success"
+        summaries.append({
+            "query": query,
+            "status": result.get("status"),
+            "count": len(result.get("results", [])) if ok else 0,
+            "message": result.get("message"),
+        })
+        if not ok:
+            continue
+        for item in result.get("results", []):
+            item_key = key(item)
+            existing = by_key.get(item_key) if item_key is not None else None
+            if existing is not None:
+                existing["matched_queries"].append(query)
+                continue
+            item = dict(item, matched_queries=[query])
+            item.pop("rank", None)
+            merged.append(item)
+            if item_key is not None:
+                by_key[item_key] = item
+
+    for rank, item in enumerate(merged, start=1):
+        item["rank"] = rank
+
+    failed = sum(1 for summary in summaries if summary["status"] != "success")
+    if failed == len(summaries):
+        status = "error"
+    elif failed:
+        status = "partial"
+    else:
+        status = "success"
+    return {
+        "status": status,
+        "count": len(merged),
+        "queries": summaries,
+        "results": merged,
+        "message": f"질문 {len(summaries)}개(실패 {failed}개)에서 중복을 제외한 결과 {len(merged)}개를 찾았습니다."
+    }
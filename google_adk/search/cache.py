@@ -0,0 +1,216 @@
+"""
+Vertex AI Search 결과 캐시 (LRU + TTL + stale-while-revalidate)
+
+같은 검색(건물명, 졸업요건 등)이 사용자/턴을 가리지 않고 반복되므로
+(endpoint, 정규화된 검색어, page_size, offset) 단위로 응답을 캐시합니다.
+
+- fresh (TTL 이내): 캐시에서 바로 반환
+- stale (TTL 경과, stale 유지 시간 이내): 캐시 값을 반환하고 백그라운드에서 갱신
+- upstream 오류: 남아 있는 캐시 값이 있으면 그것을 반환
+- 데이터스토어(엔진)별 TTL, 엔드포인트별 적중률 통계
+"""
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from google_adk.search.client import endpoint_name
+
+CacheKey = Tuple[str, str, int, int]
+
+# loader는 (응답 JSON, 성공 여부)를 반환
+Loader = Callable[[], Tuple[Dict[str, Any], bool]]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 검색어 정규화 (NFC + 공백 정리 + 소문자)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", query or "")).strip().lower()
+
+
+@dataclass
+class _Entry:
+    result: Dict[str, Any]
+    stored_at: float
+    ttl: float
+
+
+class _Counters:
+    def __init__(self):
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.stale_on_error = 0
+        self.revalidations = 0
+        self.revalidation_errors = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "stale_on_error": self.stale_on_error,
+            "revalidations": self.revalidations,
+            "revalidation_errors": self.revalidation_errors,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+
+class SearchCache:
+    """검색 응답 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 3600,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_ttl: float = 86400,
+        clock: Callable[[], float] = time.monotonic,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            default_ttl: 기본 TTL (초)
+            ttls: 엔진 ID별 TTL (초)
+            stale_ttl: TTL 경과 후 stale 값을 반환하며 재검증할 수 있는 시간 (초)
+            clock: 시간 함수 (테스트용 주입)
+            executor: 백그라운드 재검증 실행기 (테스트용 주입)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._revalidating: Set[CacheKey] = set()
+        self._counters: Dict[str, _Counters] = {}
+
+    @staticmethod
+    def make_key(endpoint: str, query: str, page_size: int, offset: int) -> CacheKey:
+        return (endpoint, normalize_query(query), int(page_size), int(offset or 0))
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint_name(endpoint), self.default_ttl)
+
+    def _counter(self, endpoint: str) -> _Counters:
+        name = endpoint_name(endpoint)
+        if name not in self._counters:
+            self._counters[name] = _Counters()
+        return self._counters[name]
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-revalidate")
+        return self._executor
+
+    def _store(self, key: CacheKey, result: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = _Entry(result, self._clock(), self.ttl_for(key[0]))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _revalidate(self, key: CacheKey, loader: Loader):
+        try:
+            result, ok = loader()
+            if ok:
+                self._store(key, result)
+            else:
+                with self._lock:
+                    self._counter(key[0]).revalidation_errors += 1
+        except Exception as e:
+            with self._lock:
+                self._counter(key[0]).revalidation_errors += 1
+            print(f"[SearchCache] ⚠️ 재검증 실패 ({endpoint_name(key[0])}): {e}")
+        finally:
+            with self._lock:
+                self._revalidating.discard(key)
+
+    def get_or_load(
+        self,
+        endpoint: str,
+        query: str,
+        page_size: int,
+        offset: int,
+        loader: Loader
+    ) -> Dict[str, Any]:
+        """
+        캐시 조회 후 필요하면 loader로 원격 조회
+
+        성공 응답(ok=True)만 캐시합니다. 캐시 값이 없는 상태에서 원격 조회가
+        예외를 던지면 그대로 전파합니다.
+        """
+        key = self.make_key(endpoint, query, page_size, offset)
+
+        schedule = False
+        with self._lock:
+            counter = self._counter(endpoint)
+            entry = self._entries.get(key)
+            age = self._clock() - entry.stored_at if entry is not None else None
+
+            if entry is not None and age < entry.ttl:
+                counter.hits += 1
+                self._entries.move_to_end(key)
+                return entry.result
+
+            if entry is not None and age < entry.ttl + self.stale_ttl:
+                counter.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._revalidating:
+                    self._revalidating.add(key)
+                    counter.revalidations += 1
+                    schedule = True
+                stale = entry.result
+            else:
+                counter.misses += 1
+                stale = None
+
+        if stale is not None:
+            if schedule:
+                self._get_executor().submit(self._revalidate, key, loader)
+            return stale
+
+        # 캐시 없음 또는 stale 유지 시간도 지난 경우: 원격 조회
+        try:
+            result, ok = loader()
+        except Exception:
+            if entry is None:
+                raise
+            with self._lock:
+                counter.stale_on_error += 1
+            return entry.result
+
+        if ok:
+            self._store(key, result)
+            return result
+        if entry is not None:
+            with self._lock:
+                counter.stale_on_error += 1
+            return entry.result
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전체 및 엔드포인트(엔진 ID)별 캐시 통계"""
+        with self._lock:
+            total = _Counters()
+            for counter in self._counters.values():
+                for name, value in vars(counter).items():
+                    setattr(total, name, getattr(total, name) + value)
+            return {
+                "size": len(self._entries),
+                "total": total.to_dict(),
+                "endpoints": {name: c.to_dict() for name, c in self._counters.items()},
+            }
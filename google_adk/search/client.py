@@ -0,0 +1,263 @@
+"""
+Vertex AI Search (Discovery Engine) 공용 클라이언트
+
+각 Agent 도구 모듈이 개별적으로 인증/HTTP 요청을 처리하던 것을 하나로 모았습니다.
+
+- 인증 정보는 한 번만 로드하고, 만료 전에 미리 갱신 (refresh_margin)
+- requests.Session 연결 풀 재사용 + 연결/응답 타임아웃
+- 401 응답 시 토큰을 강제 갱신하고 한 번 재시도
+- asearch(): 이벤트 루프를 막지 않는 비동기 호출
+- 엔드포인트별 지연 시간 통계 (get_latency_stats)
+- 결과 캐시 (cache.SearchCache, stale-while-revalidate)
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import google.auth
+from google.auth.transport.requests import Request
+
+if TYPE_CHECKING:
+    from google_adk.search.cache import SearchCache
+
+CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
+
+def endpoint_name(endpoint: str) -> str:
+    """엔드포인트 URL에서 엔진 ID 추출 (통계 키)"""
+    marker = "/engines/"
+    if marker in endpoint:
+        return endpoint.split(marker, 1)[1].split("/", 1)[0]
+    return endpoint
+
+
+class LatencyStats:
+    """엔드포인트 하나의 호출 지연 시간 통계"""
+
+    def __init__(self, window: int = 200):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, elapsed_ms: float, ok: bool):
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self._recent.append(elapsed_ms)
+
+    def _percentile(self, ratio: float) -> float:
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": round(self._percentile(0.5), 1),
+            "p95_ms": round(self._percentile(0.95), 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class VertexSearchClient:
+    """Vertex AI Search 검색 클라이언트 (프로세스당 하나를 공유)"""
+
+    def __init__(
+        self,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        pool_size: int = 10,
+        refresh_margin_seconds: int = 300,
+        credentials=None,
+        session: Optional[requests.Session] = None,
+        cache: Optional["SearchCache"] = None
+    ):
+        """
+        Args:
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 응답 타임아웃 (초)
+            pool_size: 호스트당 유지할 연결 수
+            refresh_margin_seconds: 토큰 만료 몇 초 전에 미리 갱신할지
+            credentials: google.auth 인증 정보 (없으면 google.auth.default())
+            session: requests 세션 (테스트용 주입)
+            cache: 검색 결과 캐시 (None이면 캐시 없이 매번 호출)
+        """
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.refresh_margin = timedelta(seconds=refresh_margin_seconds)
+        self._credentials = credentials
+        self._auth_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, LatencyStats] = {}
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+        self.session = session
+        self.cache = cache
+
+    def _needs_refresh(self) -> bool:
+        credentials = self._credentials
+        if not credentials.token or not credentials.valid:
+            return True
+        expiry = getattr(credentials, "expiry", None)
+        if expiry is None:
+            return False
+        # google.auth는 expiry를 naive UTC datetime으로 보관
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        return expiry - datetime.now(timezone.utc) <= self.refresh_margin
+
+    def get_token(self, force_refresh: bool = False) -> str:
+        """access token 반환 (만료 임박 시 갱신)"""
+        with self._auth_lock:
+            if self._credentials is None:
+                self._credentials, _ = google.auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+            if force_refresh or self._needs_refresh():
+                self._credentials.refresh(Request())
+            return self._credentials.token
+
+    def _post(self, endpoint: str, payload: Dict[str, Any], force_refresh: bool = False) -> requests.Response:
+        headers = {
+            "Authorization": f"Bearer {self.get_token(force_refresh)}",
+            "Content-Type": "application/json"
+        }
+        return self.session.post(endpoint, headers=headers, json=payload, timeout=self.timeout)
+
+    def _record(self, endpoint: str, elapsed_ms: float, ok: bool):
+        name = endpoint_name(endpoint)
+        with self._stats_lock:
+            if name not in self._stats:
+                self._stats[name] = LatencyStats()
+            self._stats[name].record(elapsed_ms, ok)
+
+    def _request(self, endpoint: str, query: str, page_size: int, offset: int) -> Tuple[Dict[str, Any], bool]:
+        """원격 호출 (응답 JSON, 성공 여부)"""
+        payload = {
+            "query": query,
+            "pageSize": page_size,
+            "queryExpansionSpec": {"condition": "AUTO"},
+            "spellCorrectionSpec": {"mode": "AUTO"},
+            "languageCode": "ko",
+            "userInfo": {"timeZone": "Asia/Seoul"}
+        }
+        if offset:
+            payload["offset"] = offset
+
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = self._post(endpoint, payload)
+            if response.status_code == 401:
+                # 토큰이 서버 측에서 먼저 만료된 경우 한 번 갱신 후 재시도
+                response = self._post(endpoint, payload, force_refresh=True)
+            result = response.json()
+            ok = response.ok
+            return result, ok
+        finally:
+            self._record(endpoint, (time.perf_counter() - started) * 1000, ok)
+
+    def search(
+        self,
+        endpoint: str,
+        query: str,
+        page_size: int = 10,
+        offset: int = 0,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Vertex AI Search API 호출
+
+        Args:
+            endpoint: servingConfigs/...:search 엔드포인트 URL
+            query: 검색어
+            page_size: 반환할 결과 개수
+            offset: 결과 시작 위치
+            use_cache: 결과 캐시 사용 여부 (캐시가 설정된 경우)
+
+        Returns:
+            Discovery Engine 응답 JSON (결과가 없으면 "results" 키가 없음)
+
+        Raises:
+            requests.RequestException, google.auth.exceptions.GoogleAuthError
+        """
+        if self.cache is None or not use_cache:
+            return self._request(endpoint, query, page_size, offset)[0]
+
+        return self.cache.get_or_load(
+            endpoint, query, page_size, offset,
+            lambda: self._request(endpoint, query, page_size, offset)
+        )
+
+    async def asearch(
+        self,
+        endpoint: str,
+        query: str,
+        page_size: int = 10,
+        offset: int = 0,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """search()의 비동기 버전 (스레드에서 실행하여 이벤트 루프 블로킹 방지)"""
+        return await asyncio.to_thread(self.search, endpoint, query, page_size, offset, use_cache)
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트(엔진 ID)별 지연 시간 통계"""
+        with self._stats_lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+
+# 프로세스 공용 싱글톤
+_search_client_instance: Optional[VertexSearchClient] = None
+_search_client_lock = threading.Lock()
+
+
+def get_search_client() -> VertexSearchClient:
+    """
+    VertexSearchClient 싱글톤 인스턴스 반환
+    """
+    global _search_client_instance
+    if _search_client_instance is None:
+        with _search_client_lock:
+            if _search_client_instance is None:
+                from google_adk.config import (
+                    VERTEX_SEARCH_CONNECT_TIMEOUT,
+                    VERTEX_SEARCH_READ_TIMEOUT,
+                    VERTEX_SEARCH_POOL_SIZE,
+                    VERTEX_SEARCH_TOKEN_REFRESH_MARGIN,
+                    VERTEX_SEARCH_CACHE_ENABLED,
+                    VERTEX_SEARCH_CACHE_MAX_ENTRIES,
+                    VERTEX_SEARCH_CACHE_DEFAULT_TTL,
+                    VERTEX_SEARCH_CACHE_STALE_TTL,
+                    VERTEX_SEARCH_CACHE_TTLS,
+                )
+                from google_adk.search.cache import SearchCache
+
+                cache = None
+                if VERTEX_SEARCH_CACHE_ENABLED:
+                    cache = SearchCache(
+                        max_entries=VERTEX_SEARCH_CACHE_MAX_ENTRIES,
+                        default_ttl=VERTEX_SEARCH_CACHE_DEFAULT_TTL,
+                        ttls=VERTEX_SEARCH_CACHE_TTLS,
+                        stale_ttl=VERTEX_SEARCH_CACHE_STALE_TTL,
+                    )
+                _search_client_instance = VertexSearchClient(
+                    connect_timeout=VERTEX_SEARCH_CONNECT_TIMEOUT,
+                    read_timeout=VERTEX_SEARCH_READ_TIMEOUT,
+                    pool_size=VERTEX_SEARCH_POOL_SIZE,
+                    refresh_margin_seconds=VERTEX_SEARCH_TOKEN_REFRESH_MARGIN,
+                    cache=cache,
+                )
+    return _search_client_instance
@@ -0,0 +1,94 @@
+"""
+과목정보 BM25 검색 벤치마크 / 원격 검색 비교
+
+1) 색인 구성 시간과 질문별 평균 검색 지연 (로컬)
+2) --compare: 같은 질문을 Vertex AI Search(kangnam-subject-info)에도 보내
+   상위 k개 결과의 겹침(overlap@k)과 원격 1위가 로컬 몇 위인지 비교
+   (GCP 인증 정보 필요)
+
+사용법:
+    python google_adk/test/benchmark_course_search.py [반복횟수]
+    python google_adk/test/benchmark_course_search.py --compare [--k 10]
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from google_adk.agents.subject.tools.course_search import DEFAULT_DATA_PATH, CourseSearchEngine
+
+QUERIES = [
+    "소프트웨어공학",
+    "데이터베이스 수업",
+    "김태권 교수님 수업",
+    "캡스톤디자인",
+    "인공지능전공 2학년",
+    "머신러닝",
+    "사회복지 실천론",
+    "유아교육과 3학년 전공",
+    "피아노",
+    "C프로그래밍",
+]
+
+
+def bench(engine: CourseSearchEngine, number: int):
+    print(f"{'query':<24}{'avg (us)':>10}{'hits':>8}")
+    print("-" * 42)
+    for query in QUERIES:
+        avg = timeit.timeit(lambda: engine.search(query), number=number) / number * 1e6
+        total, _ = engine.search(query)
+        print(f"{query:<24}{avg:>10.1f}{total:>8}")
+
+
+def compare(engine: CourseSearchEngine, k: int):
+    from google_adk.agents.subject.tools.subject_tools import vertex_ai_search_request
+
+    print(f"{'query':<24}{f'overlap@{k}':>12}{'remote#1 local rank':>22}{'remote (ms)':>14}")
+    print("-" * 72)
+    overlaps = []
+    for query in QUERIES:
+        _, hits = engine.search(query, limit=k)
+        local_ids = [hit.document.id for hit in hits]
+
+        started = time.perf_counter()
+        remote = vertex_ai_search_request(query, page_size=k)
+        elapsed = (time.perf_counter() - started) * 1000
+        if remote.get("status") != "success":
+            print(f"{query:<24}{'error':>12}  {remote.get('message')}")
+            continue
+        remote_ids = [r["title"] for r in remote["results"]]
+
+        overlap = len(set(local_ids) & set(remote_ids)) / max(len(remote_ids), 1)
+        overlaps.append(overlap)
+        top = remote_ids[0] if remote_ids else None
+        _, all_hits = engine.search(query, limit=len(engine))
+        ranks = [hit.document.id for hit in all_hits]
+        top_rank = ranks.index(top) + 1 if top in ranks else "-"
+        print(f"{query:<24}{overlap:>12.2f}{str(top_rank):>22}{elapsed:>14.1f}")
+
+    if overlaps:
+        print(f"\n평균 overlap@{k}: {sum(overlaps) / len(overlaps):.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("number", nargs="?", type=int, default=200)
+    parser.add_argument("--compare", action="store_true", help="Vertex AI Search 결과와 비교")
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    engine = CourseSearchEngine.from_jsonl(DEFAULT_DATA_PATH)
+    print(f"색인 구성: {len(engine)}개 문서, {(time.perf_counter() - started) * 1000:.1f} ms\n")
+
+    if args.compare:
+        compare(engine, args.k)
+    else:
+        bench(engine, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+에이전트 프롬프트 토큰 벤치마크 (압축 전/후)
+
+모델 호출마다 다시 보내는 고정 부분(시스템 프롬프트 + 도구 선언)의 크기를 비교하고,
+한 턴의 호출 수(도구 호출 수 + 1)를 곱해 턴당 프롬프트 토큰을 보여줍니다.
+
+- 추정 토큰: compaction.estimate_tokens (ASCII 4글자=1, 그 외 1글자=1)
+- --count-tokens: Vertex AI count_tokens로 실제 토큰 수도 계산 (GCP 인증 정보 필요)
+- 질문 예시별로 도구 선별(tool_gating.py) 후 남는 함수 선언 토큰도 비교
+
+사용법:
+    python google_adk/test/benchmark_prompt.py [--tool-calls 1 2 3]
+    python google_adk/test/benchmark_prompt.py --count-tokens
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from google_adk.compaction import estimate_tokens
+from google_adk.prompt import (
+    DESCRIPTION_SOURCE,
+    INSTRUCTION_SOURCE,
+    build_description,
+    build_instruction,
+)
+
+MODEL = "gemini-2.5-flash"
+AGENT_NAME = "kangnam_assistant"
+
+
+def system_prompt(description: str, instruction: str) -> str:
+    """ADK가 만드는 시스템 프롬프트 (instructions + identity 요청 처리기 순서)"""
+    identity = (
+        f'You are an agent. Your internal name is "{AGENT_NAME}".'
+        f' The description about you is "{description}".'
+    )
+    return f"{instruction}\n\n{identity}"
+
+
+QUESTIONS = [
+    "샬롬관 어디야?",
+    "교학팀 전화번호",
+    "김철주 교수님 연구실",
+    "김태권 교수님 수업",
+    "목요일 오후 교양 수업",
+    "2024학년도 소프트웨어학부 졸업요건",
+    "고마워",
+]
+
+
+def tool_declarations(keep=None) -> str:
+    """모델에 함께 보내는 함수 선언 (JSON, keep이 있으면 해당 도구만)"""
+    from google_adk.agent import ALL_KANGNAM_TOOLS
+
+    declarations = [
+        tool._get_declaration().model_dump(mode="json", exclude_none=True)
+        for tool in ALL_KANGNAM_TOOLS
+        if keep is None or tool.name in keep
+    ]
+    return json.dumps(declarations, ensure_ascii=False, separators=(",", ":"))
+
+
+def gated_declarations():
+    """질문 예시별 도구 선별 결과와 남은 함수 선언 토큰"""
+    from google_adk.agent import ALL_KANGNAM_TOOLS
+    from google_adk.tool_gating import get_intent_scorer, select_tools
+
+    names = [tool.name for tool in ALL_KANGNAM_TOOLS]
+    full = estimate_tokens(tool_declarations())
+    print(f"\n{'question':<30}{'tools':>7}{'decl tok':>10}")
+    print("-" * 47)
+    for question in QUESTIONS:
+        keep = select_tools(get_intent_scorer(), question, names)
+        tokens = full if keep is None else estimate_tokens(tool_declarations(keep))
+        count = len(names) if keep is None else len(keep)
+        print(f"{question:<30}{count:>7}{tokens:>10}")
+
+
+def count_tokens(texts):
+    """Vertex AI count_tokens (인증 정보가 없으면 None)"""
+    try:
+        from google import genai
+        from google_adk.config import PROJECT_ID, VERTEX_AI_LOCATION
+
+        client = genai.Client(vertexai=True, project=PROJECT_ID, location=VERTEX_AI_LOCATION)
+        return [client.models.count_tokens(model=MODEL, contents=text).total_tokens for text in texts]
+    except Exception as e:
+        print(f"⚠️ count_tokens 실패: {e}")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tool-calls", type=int, nargs="+", default=[0, 1, 2],
+                        help="턴당 도구 호출 수 (모델 호출 수 = 도구 호출 수 + 1)")
+    parser.add_argument("--count-tokens", action="store_true", help="Vertex AI count_tokens로 실제 토큰 계산")
+    args = parser.parse_args()
+
+    before = system_prompt(DESCRIPTION_SOURCE, INSTRUCTION_SOURCE)
+    after = system_prompt(build_description(), build_instruction())
+    tools = tool_declarations()
+
+    rows = [
+        ("system prompt", before, after),
+        ("tool declarations", tools, tools),
+    ]
+    print(f"{'part':<20}{'before chars':>14}{'after chars':>13}{'before tok':>12}{'after tok':>11}")
+    print("-" * 70)
+    for name, old, new in rows:
+        print(f"{name:<20}{len(old):>14}{len(new):>13}{estimate_tokens(old):>12}{estimate_tokens(new):>11}")
+
+    per_call_before = estimate_tokens(before) + estimate_tokens(tools)
+    per_call_after = estimate_tokens(after) + estimate_tokens(tools)
+    saved = 1 - per_call_after / per_call_before
+    print(f"\n호출당 고정 프롬프트: ~{per_call_before} → ~{per_call_after} tokens ({saved:.1%} 감소)")
+
+    print(f"\n{'tool calls/turn':<18}{'model calls':>12}{'before tok':>12}{'after tok':>11}")
+    print("-" * 53)
+    for tool_calls in args.tool_calls:
+        calls = tool_calls + 1
+        print(f"{tool_calls:<18}{calls:>12}{per_call_before * calls:>12}{per_call_after * calls:>11}")
+    print("(대화 기록과 도구 결과는 제외, 고정 접두어는 암시적 컨텍스트 캐시 대상)")
+
+    gated_declarations()
+
+    if args.count_tokens:
+        counted = count_tokens([before, after, tools])
+        if counted:
+            system_before, system_after, tool_tokens = counted
+            print(
+                f"\ncount_tokens: system {system_before} → {system_after}, "
+                f"tools {tool_tokens}, 호출당 {system_before + tool_tokens} → {system_after + tool_tokens}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+졸업이수학점 RAG 업로드 파이프라인 메모리/시간 벤치마크
+
+졸업요건 JSON을 N개 파일로 복제한 뒤 같은 chunk를
+1) 기존 방식: chunk 전체 리스트 → JSONL 문자열 하나로 합쳐 기록
+2) 스트리밍: chunk_stream → write_lines로 한 줄씩 기록
+으로 만들어 tracemalloc 최대 메모리와 소요 시간을 비교합니다. (GCS 대신 버리는 writer)
+
+사용법:
+    python google_adk/test/benchmark_upload_to_rag.py [파일 수]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from google_adk.data.upload_to_rag import (
+    DATA_DIR,
+    JSON_FILES,
+    build_chunks,
+    chunk_stream,
+    flatten,
+    read_sources,
+    write_lines,
+)
+
+
+class NullWriter:
+    def write(self, data):
+        return len(data)
+
+
+def legacy(paths):
+    """기존 스크립트와 같은 방식 (all_chunks 리스트 + 문자열 join)"""
+    all_chunks = list(build_chunks(flatten(read_sources(paths))))
+    content = "\n".join(json.dumps(chunk, ensure_ascii=False) for chunk in all_chunks)
+    NullWriter().write(content.encode("utf-8"))
+    return len(all_chunks)
+
+
+def streaming(paths):
+    return write_lines(chunk_stream(paths), [NullWriter()]).lines
+
+
+def measure(fn, paths):
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = fn(paths)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, seconds, peak
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    source = (DATA_DIR / JSON_FILES[0]).read_text(encoding="utf-8")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(copies):
+            path = Path(tmp) / f"{i:04d}_{JSON_FILES[0]}"
+            path.write_text(source, encoding="utf-8")
+            paths.append(path)
+
+        # 진행 메시지("처리 중")는 벤치마크 출력에서 제외
+        stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+        try:
+            results = {name: measure(fn, paths) for name, fn in (("legacy", legacy), ("streaming", streaming))}
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    print(f"파일 {copies}개")
+    print(f"{'mode':<12}{'chunks':>8}{'seconds':>10}{'peak (KB)':>12}")
+    print("-" * 42)
+    for name, (count, seconds, peak) in results.items():
+        print(f"{name:<12}{count:>8}{seconds:>10.3f}{peak / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+행정부서 로컬 디렉터리 테스트
+
+실제 행정부서 전화번호.jsonl로 조직도 구성, 부서명/전화번호/직원 조회,
+담당 업무("누가 담당해?") 검색을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_admin_directory.py
+"""
+import pytest
+
+from google_adk.agents.basic_info.tools.admin_directory import (
+    DEFAULT_DATA_PATH,
+    AdminDirectory,
+)
+
+
+@pytest.fixture(scope="module")
+def directory():
+    return AdminDirectory.from_jsonl(DEFAULT_DATA_PATH)
+
+
+def names(result):
+    return [r["fields"]["name"] for r in result["results"]]
+
+
+def test_org_tree(directory):
+    team = directory.find_unit("교무팀")
+
+    assert team.path() == ["대학본부", "교무처", "교무팀"]
+    assert [c.name for c in directory.find_unit("교무처").children] == ["교무팀"]
+    assert {u.name for u in directory.roots()} == {"부총장", "대학원", "대학", "대학본부"}
+
+
+def test_short_unit_name_is_not_matched_inside_words(directory):
+    # "대학" 조직이 "공과대학"의 일부로 매칭되지 않아야 함
+    assert directory.find_unit("공과대학 담당자") is None
+    assert directory.find_unit("대학 조직").name == "대학"
+
+
+def test_department_phone_lookup(directory):
+    result = directory.answer("교학1팀 전화번호")
+
+    assert result["source"] == "local"
+    fields = result["results"][0]["fields"]
+    assert fields["phone_main"] == "031-280-3410"
+    assert fields["location"] == "샬롬관 109호"
+    assert fields["parent"] == "대학"
+
+
+@pytest.mark.parametrize("number", ["031-280-3470", "0312803470", "3470"])
+def test_reverse_phone_lookup(directory, number):
+    result = directory.answer(number)
+    assert "대학원교학팀" in names(result)
+    assert "이종열" in names(result)
+
+
+def test_who_handles_with_college_scope(directory):
+    result = directory.answer("공과대학 수강신청 누가 담당해?")
+    assert names(result) == ["이덕만"]
+    assert result["results"][0]["fields"]["department"] == "교학2팀"
+
+
+def test_who_handles_ranks_more_specific_roles_first(directory):
+    result = directory.answer("음악학과 조교")
+    assert names(result)[0] == "장하연"
+
+
+def test_person_lookup(directory):
+    result = directory.answer("이상언 선생님 연락처")
+    assert result["results"][0]["fields"]["phone"] == "031-280-3410"
+
+
+def test_unresolvable_query_falls_back(directory):
+    assert directory.answer("학생처 전화번호") is None
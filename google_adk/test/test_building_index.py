@@ -0,0 +1,112 @@
+"""
+건물/시설 로컬 색인 테스트
+
+실제 강남대위치정리.jsonl로 건물 별칭, 층 정규화, 호실 코드 조회,
+시설명 검색과 원격 검색으로 넘겨야 하는 질문 판별을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_building_index.py
+"""
+import pytest
+
+from google_adk.agents.basic_info.tools.building_index import (
+    DEFAULT_DATA_PATH,
+    BuildingIndex,
+    normalize_floor,
+)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return BuildingIndex.from_jsonl(DEFAULT_DATA_PATH)
+
+
+def rooms(result):
+    return [r["fields"]["room"] for r in result["results"]]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("3층", "03층"), ("03층", "03층"), ("3F", "03층"), ("3", "03층"),
+    ("B1", "B1층"), ("b1층", "B1층"), ("지하1층", "B1층"), ("지하 2층", "B2층"),
+    ("옥상", None),
+])
+def test_normalize_floor(text, expected):
+    assert normalize_floor(text) == expected
+
+
+def test_building_aliases(index):
+    assert index.find_building("이공관").id == "science-engineering-hall"
+    assert index.find_building("샬롬 식당").id == "shalom-hall"
+    assert index.find_building("중앙도서관").id == "library"
+    assert index.find_building("운동장") is None
+
+
+def test_facilities_on_floor(index):
+    building = index.find_building("이공관")
+    facilities = index.facilities_on_floor(building, "3층")
+
+    assert facilities
+    assert facilities == index.facilities_on_floor(building, "03층")
+    assert {f.floor for f in facilities} == {"03층"}
+
+
+@pytest.mark.parametrize("query", ["이301호", "이공관 301호", "이공관301호"])
+def test_room_lookup(index, query):
+    assert rooms(index.answer(query)) == ["이301호"]
+
+
+def test_basement_room_code(index):
+    assert rooms(index.answer("예B101"))[0] == "예B101호"
+
+
+def test_facility_name_search(index):
+    result = index.answer("샬롬관 학생식당 어디야?")
+    assert result["source"] == "local"
+    assert result["results"][0]["fields"]["name"] == "학생식당"
+
+    exact_first = index.search_facilities("총장실")
+    assert exact_first[0].name == "총장실"
+
+
+def test_floor_keyword_without_match(index):
+    # 그 층에 없는 시설은 층 전체 목록 대신 다른 층 검색 → 없으면 원격 검색
+    assert index.answer("교육관 2층 화장실") is None
+    assert index.answer("천은관 3층 자판기") is None
+
+    result = index.answer("샬롬관 2층 학생식당")
+    assert [r["fields"]["name"] for r in result["results"]][0] == "학생식당"
+    assert index.answer("교육관 2층")["count"] > 1
+
+
+def test_bare_basement_floor(index):
+    assert index.parse_query("샬롬관 B1").floor == "B1층"
+    result = index.answer("샬롬관 B1")
+    assert {r["fields"]["floor"] for r in result["results"]} == {"B1층"}
+    # 호실 코드의 B는 층으로 보지 않음
+    assert index.parse_query("예B101").floor is None
+
+
+def test_floor_without_building_filters_all_buildings(index):
+    result = index.answer("3층 화장실")
+    assert result["results"]
+    assert all(r["fields"]["floor"] == "03층" and "화장실" in r["fields"]["name"] for r in result["results"])
+
+
+def test_unknown_facility_in_building_is_no_match(index):
+    # 건물 개요로 대신 답하지 않음 → 원격 검색
+    assert index.answer("이공관에 있는 편의점") is None
+
+
+def test_question_words_are_not_keywords(index):
+    parsed = index.parse_query("본관 2층에 뭐 있어?")
+    assert (parsed.floor, parsed.keyword) == ("02층", "")
+    result = index.answer("본관 2층에 뭐 있어?")
+    assert {(r["fields"]["building"], r["fields"]["floor"]) for r in result["results"]} == {("본관", "02층")}
+
+
+def test_building_only_query(index):
+    result = index.answer("도서관")
+    assert result["results"][0]["fields"]["building"] == "도서관"
+
+
+def test_unresolvable_query_falls_back(index):
+    assert index.answer("오늘 날씨 어때") is None
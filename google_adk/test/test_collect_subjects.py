@@ -0,0 +1,240 @@
+"""
+과목 수집 크롤러 테스트
+
+httpx.MockTransport로 과목 조회 서버를 대신하여 세션 쿠키 공유, 동시 요청 수/초당 요청 수 제한,
+5xx 재시도, 실패 단위 보고, 단위 순서대로의 JSONL 기록, 학과별 중복 과목 병합,
+체크포인트에서 이어서 수집하기와 이전 스냅샷 대비 변경분(delta)을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_collect_subjects.py
+"""
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs
+
+import httpx
+
+from google_adk.data.과목정보.collect_subjects import (
+    Checkpoint,
+    CourseCrawler,
+    CrawlUnit,
+    build_documents,
+    build_units,
+    collect,
+    fetch_departments,
+)
+from google_adk.data.과목정보.dedup import merge_documents
+
+UNITS = [CrawlUnit("5446", "소프트웨어전공 (ICT융합공학부)", h) for h in ("H1", "H2", "H3", "H4")]
+
+
+def course_list_html(dept: str, grade: str) -> bytes:
+    subject = f"CS{grade[-1]}{dept[-2:]}01"
+    row = (
+        f"<tr id='row1'><td>{subject}</td><td>01</td><td>자료구조</td><td>김철주</td><td>3</td><td>3</td>"
+        f"<td>(주)월1ab</td><td><div onclick=\"goPrint(this,'100063,2025,2,{subject},01')\">보기</div></td></tr>"
+    )
+    return f"<div id='list'><table class='grid_list'>{row}</table></div>".encode("euc-kr")
+
+
+class FakeServer:
+    """쿠키 발급 + 과목 목록 응답, 요청 수/최대 동시 요청 수/요청 시각 기록"""
+
+    def __init__(self, fail_first=(), always_fail=()):
+        self.fail_first = set(fail_first)
+        self.always_fail = set(always_fail)
+        self.cookie_requests = 0
+        self.posts = []
+        self.starts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.starts.append(time.monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if request.url.path.endswith("sbr1010.jsp"):
+                self.cookie_requests += 1
+                return httpx.Response(200, headers={"Set-Cookie": "JSESSIONID=abc; Path=/"})
+
+            assert request.headers.get("cookie") == "JSESSIONID=abc"
+            form = parse_qs(request.content.decode("ascii"), encoding="euc-kr")
+            key = (form["dept_code1"][0], form["grad_area1"][0])
+            self.posts.append(key)
+            if key in self.always_fail or (key in self.fail_first and self.posts.count(key) == 1):
+                return httpx.Response(503)
+            return httpx.Response(200, content=course_list_html(*key))
+        finally:
+            self.in_flight -= 1
+
+
+def crawler(server, **options):
+    options.setdefault("requests_per_second", 0)
+    return CourseCrawler("2025", "2", backoff_seconds=0.01, transport=httpx.MockTransport(server), **options)
+
+
+def test_units_cover_majors_and_liberal_arts():
+    units = build_units(fetch_departments())
+    assert len(units) == (len(fetch_departments()) - 1) * 4 + 7
+    assert units[-1] == CrawlUnit("5185", "교양", "G19")
+
+
+def test_shared_session_and_concurrency_cap():
+    server = FakeServer()
+
+    async def run():
+        async with crawler(server, concurrency=2) as c:
+            return await c.crawl(UNITS * 3)
+
+    results, failures = asyncio.run(run())
+    assert not failures and len(results) == 4
+    assert server.cookie_requests == 1
+    assert server.max_in_flight == 2
+
+
+def test_rate_limit_spaces_request_starts():
+    server = FakeServer()
+
+    async def run():
+        async with crawler(server, concurrency=8, requests_per_second=50) as c:
+            await c.crawl(UNITS)
+
+    asyncio.run(run())
+    gaps = [b - a for a, b in zip(server.starts, server.starts[1:])]
+    assert len(server.starts) == 5 and min(gaps) >= 0.015
+
+
+def test_retry_with_backoff_and_failure_report():
+    server = FakeServer(fail_first={("5446", "H2")}, always_fail={("5446", "H4")})
+
+    async def run():
+        async with crawler(server, max_retries=2) as c:
+            return await c.crawl(UNITS)
+
+    results, failures = asyncio.run(run())
+    assert results[UNITS[1]][0]["학수번호"] == "CS24601"
+    assert list(failures) == [UNITS[3]] and "503" in failures[UNITS[3]]
+    assert server.posts.count(("5446", "H4")) == 3
+    # 실패 후에는 쿠키를 다시 받음
+    assert server.cookie_requests > 1
+
+
+def test_documents_match_existing_format():
+    courses = [{"학수번호": "KC01101", "분반": "02", "과목명": "글쓰기", "담당교수": "최웅",
+                "학점": "2", "시수": "2", "강의시간": "(주)화3ab", "params": "108985,2025,2,KC01101,02"}]
+    major, = build_documents(UNITS[0], courses, "2025", "2")
+    assert major["id"] == "KC01101-02"
+    assert "전공: 소프트웨어전공 (ICT융합공학부)\n학년: 1학년\n" in major["content"]
+    assert major["metadata"]["grade"] == 1 and "category" not in major["metadata"]
+
+    liberal, = build_documents(CrawlUnit("5185", "교양", "G31"), courses, "2025", "2")
+    assert "구분: 교양 G31\n" in liberal["content"]
+    assert liberal["metadata"]["department"] == "교양" and liberal["metadata"]["category"] == "G31"
+    assert liberal["metadata"]["syllabus_url"].endswith("&winopt=1010")
+
+
+def test_collect_writes_units_in_order(tmp_path):
+    server = FakeServer()
+    output = tmp_path / "kangnam_all_2025_2.jsonl"
+    summary = asyncio.run(collect(
+        "2025", "2", str(output),
+        requests_per_second=0, transport=httpx.MockTransport(server),
+    ))
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert summary["failures"] == {}
+    assert [doc["metadata"]["grade"] for doc in lines[:4]] == [1, 2, 3, 4]
+    # 단위마다 한 과목이지만 교양 G9/G19는 같은 학수번호 → 한 문서로 병합
+    ids = [doc["id"] for doc in lines]
+    assert summary["documents"] == len(lines) == len(set(ids))
+    assert summary["dedup"].input_documents == summary["units"] > len(lines)
+
+
+def test_merge_aggregates_departments_and_grades():
+    courses = [{"학수번호": "ND01602", "분반": "06", "과목명": "공학수학", "담당교수": "신수연",
+                "학점": "3", "시수": "3", "강의시간": "(주)수1ab", "params": "109530,2025,2,ND01602,06"}]
+    rows = (
+        build_documents(CrawlUnit("5446", "소프트웨어전공 (ICT융합공학부)", "H2"), courses, "2025", "2")
+        + build_documents(CrawlUnit("5447", "인공지능전공 (인공지능융합공학부)", "H3"), courses, "2025", "2")
+        + build_documents(CrawlUnit("5446", "소프트웨어전공 (ICT융합공학부)", "H3"), courses, "2025", "2")
+        + build_documents(CrawlUnit("5185", "교양", "G31"), courses, "2025", "2")
+        + build_documents(UNITS[0], [{**courses[0], "학수번호": "CS10001"}], "2025", "2")
+    )
+    merged, report = merge_documents(rows)
+
+    assert [doc["id"] for doc in merged] == ["ND01602-06", "CS10001-06"]
+    metadata = merged[0]["metadata"]
+    assert metadata["departments"] == ["소프트웨어전공 (ICT융합공학부)", "인공지능전공 (인공지능융합공학부)", "교양"]
+    assert metadata["grades"] == [0, 2, 3] and metadata["categories"] == ["G31"]
+    # 첫 행 값은 그대로 (기존 department/grade 필터 호환)
+    assert metadata["department"] == "소프트웨어전공 (ICT융합공학부)" and metadata["grade"] == 2
+    # 병합된 줄은 강의시간 뒤, 긴 전공 줄은 마지막 (압축 시 잘려도 교수/강의시간은 남음)
+    assert (
+        "분반: 06\n담당교수: 신수연\n학점: 3\n강의시간: (주)수1ab\n"
+        "학년: 2, 3학년\n구분: 교양 G31\n전공: 소프트웨어전공 (ICT융합공학부), 인공지능전공 (인공지능융합공학부)\n"
+    ) in merged[0]["content"]
+    # 중복 없는 과목은 content 그대로
+    assert merged[1]["content"] == rows[-1]["content"]
+
+    assert (report.input_documents, report.output_documents, report.removed, report.merged_ids) == (5, 2, 3, 1)
+    assert report.output_bytes < report.input_bytes and report.conflicts == []
+    # 이미 병합된 결과를 다시 병합해도 같은 결과
+    assert merge_documents(merged)[0] == merged
+
+
+def test_merge_reports_conflicting_rows():
+    first = {"id": "A-01", "content": "", "metadata": {"department": "가", "grade": 1, "professor": "김"}}
+    second = {"id": "A-01", "content": "", "metadata": {"department": "나", "grade": 1, "professor": "이"}}
+    merged, report = merge_documents([first, second])
+    assert report.conflicts == ["A-01"] and merged[0]["metadata"]["professor"] == "김"
+
+
+def test_resume_from_checkpoint_after_failure(tmp_path):
+    output = tmp_path / "kangnam_all_2025_2.jsonl"
+    options = dict(requests_per_second=0, backoff_seconds=0.01, max_retries=0)
+
+    broken = FakeServer(always_fail={("5185", "G9")})
+    first = asyncio.run(collect("2025", "2", str(output), transport=httpx.MockTransport(broken), **options))
+    assert list(first["failures"]) == ["5185/G9"]
+    assert not output.exists()
+    assert (tmp_path / "kangnam_all_2025_2.checkpoint.jsonl").exists()
+
+    healthy = FakeServer()
+    second = asyncio.run(collect("2025", "2", str(output), transport=httpx.MockTransport(healthy), **options))
+    assert healthy.posts == [("5185", "G9")]
+    assert second["resumed"] == second["units"] - 1
+    assert second["dedup"].input_documents == second["units"]
+    assert not (tmp_path / "kangnam_all_2025_2.checkpoint.jsonl").exists()
+
+
+def test_checkpoint_drops_truncated_line_before_append(tmp_path):
+    path = tmp_path / "run.checkpoint.jsonl"
+    path.write_text('{"unit": "5446/H1", "courses": []}\n{"unit": "5446/H2", "cour', encoding="utf-8")
+
+    checkpoint = Checkpoint(str(path))
+    assert list(checkpoint.load()) == ["5446/H1"]
+    checkpoint.record(UNITS[2], [])
+    checkpoint.close()
+
+    assert list(Checkpoint(str(path)).load()) == ["5446/H1", "5446/H3"]
+    assert path.read_text(encoding="utf-8").count("\n") == 2
+
+
+def test_delta_against_previous_snapshot(tmp_path):
+    output = tmp_path / "kangnam_all_2025_2.jsonl"
+    options = dict(requests_per_second=0, transport=httpx.MockTransport(FakeServer()))
+    first = asyncio.run(collect("2025", "2", str(output), **options))
+    assert first["delta"].added and first["delta"].unchanged == 0 and first["delta"].removed == []
+
+    # 이전 스냅샷에서 한 과목의 교수 변경 + 없어진 과목 하나 추가
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    lines[0]["metadata"]["professor"] = "최웅"
+    lines.append({**lines[1], "id": "OLD00001-01"})
+    output.write_text("".join(json.dumps(doc, ensure_ascii=False) + "\n" for doc in lines), encoding="utf-8")
+
+    second = asyncio.run(collect("2025", "2", str(output), **options))
+    delta = second["delta"]
+    assert delta.added == [] and delta.changed == [lines[0]["id"]] and delta.removed == ["OLD00001-01"]
+    saved = json.loads((tmp_path / "kangnam_all_2025_2.delta.json").read_text(encoding="utf-8"))
+    assert saved["changed"] == delta.changed and saved["unchanged"] == delta.unchanged
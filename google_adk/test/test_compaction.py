@@ -0,0 +1,122 @@
+"""
+도구 응답 압축 테스트
+
+도구별 필드 화이트리스트, 문자열 자르기, raw_response 제거,
+토큰 예산에 따른 결과 생략과 after_tool_callback 동작을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_compaction.py
+"""
+import logging
+from types import SimpleNamespace
+
+from google_adk.callbacks import compact_tool_response_callback
+from google_adk.compaction import compact_response, estimate_tokens
+
+
+def subject_result(i, content_extra=""):
+    return {
+        "rank": i,
+        "title": f"EB14202-{i:02d}",
+        "content": f"과목명: 머신러닝\n강의시간: (주)화4ab5ab6ab{content_extra}\n강의계획서: https://app.kangnam.ac.kr/x?y={i}",
+        "metadata": {
+            "subject_name": "머신러닝",
+            "professor": "허지욱",
+            "syllabus_url": f"https://app.kangnam.ac.kr/x?y={i}",
+            "year": 2025,
+            "semester": 2,
+        },
+        "snippet": "…머신러닝…",
+        "score": 12.3,
+    }
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("머신러닝") == 4
+    assert estimate_tokens("") == 0
+
+
+def test_subject_policy_projects_fields():
+    response = {"status": "success", "count": 1, "results": [subject_result(1)]}
+    compacted, stats = compact_response("search_subject_info", response)
+
+    item = compacted["results"][0]
+    assert set(item) == {"rank", "title", "content", "metadata"}
+    assert set(item["metadata"]) == {"subject_name", "professor", "syllabus_url"}
+    assert "강의계획서" not in item["content"]
+    assert "강의시간" in item["content"]
+    assert stats["after_chars"] < stats["before_chars"]
+
+
+def test_professor_policy_drops_snippet_and_unused_fields():
+    response = {"status": "success", "results": [{
+        "rank": 1, "title": "prof-sw-0000", "snippet": "긴 스니펫",
+        "fields": {"name_ko": "양재형", "office": "이공관519", "professor_id": "prof-sw-0000", "degree": None},
+    }]}
+    compacted, _ = compact_response("search_professor_info", response)
+    assert compacted["results"][0] == {"rank": 1, "title": "prof-sw-0000", "fields": {"name_ko": "양재형", "office": "이공관519"}}
+
+
+def test_error_raw_response_is_dropped():
+    compacted, _ = compact_response("search_building_info", {
+        "status": "error", "message": "검색 결과가 없습니다.", "raw_response": {"totalSize": 0, "x": "y" * 1000},
+    })
+    assert compacted == {"status": "error", "message": "검색 결과가 없습니다."}
+
+
+def test_long_strings_are_truncated():
+    compacted, _ = compact_response("search_graduation_requirements", {
+        "status": "success", "results": [{"content": "가" * 2000}],
+    })
+    assert len(compacted["results"][0]["content"]) == 801
+
+
+def test_token_budget_omits_lowest_ranked_results():
+    response = {
+        "status": "success", "count": 30, "message": "30개",
+        "results": [subject_result(i, " 설명" * 20) for i in range(1, 31)],
+    }
+    compacted, stats = compact_response("search_subject_info", response, token_budget=1000)
+
+    kept = compacted["results"]
+    assert 1 <= len(kept) < 30
+    assert [r["rank"] for r in kept] == list(range(1, len(kept) + 1))
+    assert compacted["count"] == len(kept)
+    assert compacted["omitted_results"] == 30 - len(kept) == stats["omitted_results"]
+    assert stats["after_tokens"] <= 1000
+
+
+def test_budget_keeps_at_least_one_result():
+    response = {"status": "success", "results": [subject_result(1, "가" * 190), subject_result(2)]}
+    compacted, _ = compact_response("search_subject_info", response, token_budget=10)
+    assert len(compacted["results"]) == 1
+
+
+def test_callback_returns_compacted_response_and_logs(caplog):
+    tool = SimpleNamespace(name="search_subject_info")
+    response = {"status": "success", "results": [subject_result(1)]}
+
+    with caplog.at_level(logging.INFO, logger="google_adk.callbacks"):
+        compacted = compact_tool_response_callback(tool, {}, None, response)
+
+    assert "snippet" not in compacted["results"][0]
+    assert "[Compaction] search_subject_info" in caplog.text
+    assert compact_tool_response_callback(tool, {}, None, "not a dict") is None
+
+
+def test_merged_course_keeps_lecture_time():
+    from google_adk.agents.subject.tools.course_search import (
+        DEFAULT_DATA_PATH,
+        CourseSearchEngine,
+        SearchHit,
+        format_search,
+    )
+
+    # 학과 10개가 병합된 문서: 긴 전공 줄이 잘려도 교수/강의시간은 content 앞부분에 남음
+    document = next(d for d in CourseSearchEngine.from_jsonl(DEFAULT_DATA_PATH).documents if d.id == "ND01602-06")
+    assert len(document.departments) == 10
+    response = format_search("공학수학", 1, [SearchHit(document, 1.0)])
+    compacted, _ = compact_response("search_subject_info", response)
+
+    content = compacted["results"][0]["content"]
+    assert "담당교수: 신수연" in content and "강의시간: (주)수1ab2ab3ab" in content and "학년: 2, 3, 4학년" in content
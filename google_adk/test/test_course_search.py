@@ -0,0 +1,103 @@
+"""
+과목정보 BM25 검색 엔진 테스트
+
+실제 kangnam_all_2025_2.jsonl로 n-gram 토큰화, 필드 가중치에 따른 순위,
+중복 행 병합, offset 페이지와 질문 토큰 비율에 따른 원격 검색 전환을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_course_search.py
+"""
+import pytest
+
+from google_adk.agents.subject.tools.course_search import (
+    DEFAULT_DATA_PATH,
+    CourseDocument,
+    MIN_QUERY_COVERAGE,
+    CourseSearchEngine,
+    format_search,
+    tokenize,
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return CourseSearchEngine.from_jsonl(DEFAULT_DATA_PATH)
+
+
+def subjects(hits):
+    return [hit.document.subject_name for hit in hits]
+
+
+def test_tokenize():
+    assert tokenize("소프트웨어공학") == ["소프", "프트", "트웨", "웨어", "어공", "공학"]
+    assert tokenize("C프로그래밍 AI") == ["c프", "프로", "로그", "그래", "래밍", "ai"]
+    assert tokenize("3학년 웹") == ["3학", "학년", "웹"]
+    assert tokenize("머신러닝", n=3) == ["머신러", "신러닝"]
+
+
+def test_duplicate_rows_are_merged(engine):
+    ids = [document.id for document in engine.documents]
+    assert len(ids) == len(set(ids))
+
+    document = next(d for d in engine.documents if d.id == "ND01609-02")
+    assert len(document.departments) > 1
+
+
+def test_subject_name_ranks_first(engine):
+    total, hits = engine.search("소프트웨어공학 수업 알려줘", limit=5)
+
+    assert total > 5
+    assert subjects(hits)[0] == "소프트웨어공학"
+
+
+def test_professor_field(engine):
+    _, hits = engine.search("김태권 교수님 수업")
+    professors = [hit.document.professor for hit in hits]
+
+    # 이름 전체가 일치하는 과목이 bigram 하나만 겹치는 "김태영"보다 먼저
+    assert professors[:7] == ["김태권"] * 7
+    assert "김태영" in professors[7:]
+
+
+def test_field_boost_orders_name_over_content():
+    documents = [
+        CourseDocument("A-01", "경영학원론", "홍길동", "머신러닝 활용 사례", {"id": "A-01"}, ["경영학전공"]),
+        CourseDocument("B-01", "머신러닝", "홍길동", "기초 이론", {"id": "B-01"}, ["인공지능전공"]),
+    ]
+    _, hits = CourseSearchEngine(documents).search("머신러닝")
+    assert [hit.document.id for hit in hits] == ["B-01", "A-01"]
+
+
+def test_offset_pagination(engine):
+    total, first = engine.search("캡스톤디자인", limit=10)
+    _, second = engine.search("캡스톤디자인", limit=10, offset=10)
+    _, both = engine.search("캡스톤디자인", limit=20)
+
+    assert total > 20
+    assert subjects(first + second) == subjects(both)
+
+    result = format_search("캡스톤디자인", total, second, offset=10)
+    assert result["results"][0]["rank"] == 11
+    assert result["total_size"] == total
+
+
+def test_no_match(engine):
+    assert engine.search("오늘 날씨 어때") == (0, [])
+
+
+def test_out_of_vocabulary_query_is_no_match(engine):
+    # bigram 하나만 겹치는 과목("건축구조역학", "뮤직&테크놀로지")은 일치로 보지 않음
+    assert engine.search("양자역학")[0] > 0
+    assert engine.search("양자역학", min_coverage=MIN_QUERY_COVERAGE) == (0, [])
+    assert engine.search("블록체인 기반 핀테크", min_coverage=MIN_QUERY_COVERAGE) == (0, [])
+
+    total, hits = engine.search("자료구조", min_coverage=MIN_QUERY_COVERAGE)
+    assert total > 0 and hits[0].coverage == 1.0
+
+
+def test_offset_past_the_end(engine):
+    total, hits = engine.search("자료구조", offset=500, min_coverage=MIN_QUERY_COVERAGE)
+    assert total > 0 and hits == []
+
+    result = format_search("자료구조", total, hits, offset=500)
+    assert result["count"] == 0 and result["results"] == []
+    assert result["message"] == f"'자료구조'에 대한 검색 결과는 전체 {total}개로, 501번째부터는 결과가 없습니다."
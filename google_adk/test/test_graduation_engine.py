@@ -0,0 +1,99 @@
+"""
+졸업요건 로컬 엔진 테스트
+
+실제 통합 졸업이수학점 JSON으로 연도 구간, 대학 별칭, 학과 조회와
+원격 검색으로 넘겨야 하는 자유 질문 판별을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_graduation_engine.py
+"""
+import pytest
+
+from google_adk.agents.graduation.tools.requirements_engine import (
+    DEFAULT_DATA_PATH,
+    GraduationRequirementsEngine,
+    parse_year,
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return GraduationRequirementsEngine.from_json(DEFAULT_DATA_PATH)
+
+
+def colleges(result):
+    return [(r["year_range"], r["college"]) for r in result["results"]]
+
+
+def test_parse_year():
+    assert parse_year("2024년 입학생") == 2024
+    assert parse_year("21학번 졸업요건") == 2021
+    assert parse_year("졸업요건") is None
+
+
+def test_year_and_college(engine):
+    result = engine.answer("2024년 입학생 복지융합대학 졸업 요건은?")
+
+    assert result["source"] == "local"
+    assert colleges(result) == [("2021~2024", "복지융합대학")]
+    assert result["results"][0]["requirements"]["최소졸업학점"] == 130
+
+
+def test_renamed_college_alias(engine):
+    # 2017~2020 구간의 공과대학은 ICT건설복지융합대학
+    result = engine.answer("2019 공대 졸업요건")
+    assert colleges(result) == [("2017~2020", "ICT건설복지융합대학")]
+
+
+def test_department_lookup_prefers_longest_name(engine):
+    matches = engine.lookup(department="유아교육과")
+
+    assert [entry.year_range.label for entry, _ in matches] == ["2025 이후", "2021~2024", "2017~2020"]
+    assert {unit.name for _, unit in matches} == {"유아교육과"}
+
+
+def test_major_with_day_night_suffix(engine):
+    matches = engine.lookup(year=2018, department="사회사업학전공")
+
+    assert len(matches) == 1
+    entry, unit = matches[0]
+    assert entry.college == "복지융합대학"
+    assert unit.parent == "사회복지학부"
+
+
+def test_year_only_returns_all_colleges(engine):
+    result = engine.answer("2024 졸업요건")
+    assert len(result["results"]) == 5
+    assert {r["year_range"] for r in result["results"]} == {"2021~2024"}
+
+
+def test_unresolvable_question_falls_back(engine):
+    assert engine.answer("채플 몇 번 들어야 해?") is None
+    assert engine.lookup(year=2015, college="사범대학") == []
+    assert engine.lookup(college="없는대학") == []
+
+
+def test_unknown_department_falls_back(engine):
+    # 로컬 데이터에 없는 학과는 연도만으로 전체 대학을 답하지 않고 원격 검색으로 넘김
+    assert engine.answer("2024 간호학과 졸업요건") is None
+    assert engine.answer("2023 신학과 졸업요건은?") is None
+
+
+def test_known_department_with_year_still_resolves(engine):
+    result = engine.answer("2024 유아교육과 졸업요건")
+    assert colleges(result) == [("2021~2024", "사범대학")]
+    assert result["results"][0]["department"] == "유아교육과"
+
+
+def test_stem_is_not_matched_inside_other_names(engine):
+    # "음악"(음악학과 어간)이 "실용음악전공" 안에서, "교육"이 "국어교육과" 안에서 매칭되지 않음
+    assert engine.answer("2024 실용음악전공 졸업요건") is None
+    assert engine.answer("2024 국어교육과 졸업요건") is None
+    result = engine.answer("2021 음악과 졸업요건")
+    assert [r["department"] for r in result["results"]] == ["음악학과"]
+
+
+def test_college_keyword_filters_year_only_query(engine):
+    result = engine.answer("2022년에 복지 졸업요건")
+    assert colleges(result) == [("2021~2024", "복지융합대학")]
+    # "사회복지"는 대학 단어가 아니라 학부 이름으로 해석
+    assert engine.answer("21학번 사회복지 졸업요건")["results"][0]["department"] == "사회복지학부"
@@ -0,0 +1,213 @@
+"""
+데이터 스토어 통합 적재 CLI 테스트
+
+저장소의 실제 데이터가 레지스트리 스키마를 통과하는지, 스트리밍 검증이 잘못된 줄을 위치와 함께 건너뛰는지,
+로컬 싱크 + 가짜 Discovery Engine 클라이언트로 여러 데이터 스토어를 동시에 import하는지,
+실패하거나 FULL 조정에 잘못된 줄이 있으면 업로드를 취소하고 import하지 않는지 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_ingest.py
+"""
+import json
+import threading
+import time
+from dataclasses import replace
+from types import SimpleNamespace
+
+from google_adk.data.ingest import (
+    DATASTORES,
+    DOCUMENT_SCHEMA,
+    DatastoreSpec,
+    JsonlSource,
+    LocalSink,
+    RecordSchema,
+    VertexSearchImporter,
+    format_summary,
+    run,
+)
+
+
+class FakeDocumentClient:
+    """import 요청 기록 + 동시에 진행 중인 import 수 측정"""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def import_documents(self, request):
+        with self._lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        response = SimpleNamespace(error_samples=[])
+        return SimpleNamespace(result=lambda timeout=None: response)
+
+
+def spec_for(tmp_path, name, lines, schema=DOCUMENT_SCHEMA):
+    (tmp_path / f"{name}.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return DatastoreSpec(
+        name=name,
+        data_store_id=f"{name}-datastore",
+        display_name=name,
+        source=JsonlSource(f"{name}.jsonl", base_dir=str(tmp_path)),
+        schema=schema,
+        gcs_folder=f"rag_data/{name}",
+        object_name=f"{name}.jsonl",
+    )
+
+
+def doc(doc_id, **extra):
+    return json.dumps({"id": doc_id, "content": "내용", "metadata": {}, **extra}, ensure_ascii=False)
+
+
+def test_repository_data_passes_registry_schemas():
+    results = run(list(DATASTORES.values()), sink=None, importer=None)
+    for result in results:
+        assert result.ok and result.records > 0 and result.invalid == [], format_summary([result])
+    assert {result.name for result in results} == {"subjects", "professors", "buildings", "admin", "graduation"}
+
+
+def test_invalid_lines_are_skipped_with_location(tmp_path):
+    spec = spec_for(tmp_path, "buildings", [
+        doc("arts-hall"),
+        "{not json",
+        json.dumps({"id": "no-content", "metadata": {}}),
+        doc("arts-hall"),
+        doc("한글 id"),
+        doc("library", content="   "),
+        doc("library"),
+    ])
+    result, = run([spec], LocalSink(str(tmp_path / "out")), importer=None)
+
+    assert result.records == 2 and result.ok
+    assert [message.split(" ", 1)[0] for message in result.invalid] == [
+        "buildings.jsonl:2", "buildings.jsonl:3", "buildings.jsonl:4", "buildings.jsonl:5", "buildings.jsonl:6",
+    ]
+    assert "중복 id" in result.invalid[2] and "필드 없음: content" in result.invalid[1]
+    written = (tmp_path / "out" / "rag_data" / "buildings" / "buildings.jsonl").read_text(encoding="utf-8")
+    assert [json.loads(line)["id"] for line in written.splitlines()] == ["arts-hall", "library"]
+
+
+class UriSink(LocalSink):
+    """로컬에 기록하면서 gs:// URI를 돌려주는 싱크 (import 경로 테스트용)"""
+
+    def open(self, spec):
+        writer, _ = super().open(spec)
+        return writer, f"gs://test-bucket/{spec.object_path}"
+
+
+def test_datastores_import_concurrently(tmp_path):
+    specs = [
+        spec_for(tmp_path, "subjects", [doc("CS10001-01")]),
+        spec_for(tmp_path, "admin", [doc("org-a"), doc("org-b")]),
+        spec_for(tmp_path, "graduation", [json.dumps({"content": "졸업요건", "metadata": {}})],
+                 schema=RecordSchema({"content": str, "metadata": dict}, id_field=None)),
+    ]
+    client = FakeDocumentClient(delay=0.2)
+    importer = VertexSearchImporter(document_client=client, project="p", full=True)
+
+    started = time.monotonic()
+    results = run(specs, UriSink(str(tmp_path / "out")), importer, workers=3)
+    elapsed = time.monotonic() - started
+
+    assert all(result.ok and result.imported for result in results)
+    assert client.max_in_flight == 3 and elapsed < 0.5
+    requests = {request.gcs_source.input_uris[0]: request for request in client.requests}
+    subjects = requests["gs://test-bucket/rag_data/subjects/subjects.jsonl"]
+    assert subjects.parent.endswith("/dataStores/subjects-datastore/branches/default_branch")
+    assert subjects.id_field == "id" and not subjects.auto_generate_ids
+    assert subjects.reconciliation_mode.name == "FULL"
+    graduation = requests["gs://test-bucket/rag_data/graduation/graduation.jsonl"]
+    assert graduation.auto_generate_ids and graduation.reconciliation_mode.name == "FULL"
+
+    summary = format_summary(results)
+    assert "subjects" in summary and "완료" in summary
+
+
+def test_missing_source_does_not_touch_sink(tmp_path):
+    spec = spec_for(tmp_path, "admin", [doc("org-a")])
+    (tmp_path / "admin.jsonl").unlink()
+    client = FakeDocumentClient(delay=0)
+
+    result, = run([spec], UriSink(str(tmp_path / "out")), VertexSearchImporter(document_client=client))
+
+    assert not result.ok and "소스 파일이 없습니다" in result.error
+    assert not (tmp_path / "out").exists() and client.requests == []
+
+
+def test_graduation_records_have_stable_ids():
+    spec = DATASTORES["graduation"]
+    assert spec.schema.id_field == "id"
+    importer = VertexSearchImporter(full=False)
+    # 자동 id 시절 문서가 남지 않도록 졸업요건은 --full 없이도 FULL
+    assert importer.is_full(spec) and not importer.is_full(DATASTORES["subjects"])
+
+    # id 자동 생성 스토어는 INCREMENTAL이면 import마다 중복이 쌓이므로 항상 FULL
+    no_id = RecordSchema({"content": str, "metadata": dict}, id_field=None)
+    assert importer.is_full(DatastoreSpec("x", "x", "x", spec.source, no_id, "x", "x.jsonl"))
+
+
+class FakeBlobWriter:
+    """BlobWriter처럼 예외로 끝난 with 블록은 terminate(), 정상 종료는 close()로 확정"""
+
+    def __init__(self):
+        self.data = b""
+        self.state = "open"
+
+    def write(self, data):
+        self.data += data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.state = "terminated" if exc_type else "committed"
+
+
+class BlobSink:
+    def __init__(self):
+        self.writers = []
+
+    def open(self, spec):
+        self.writers.append(FakeBlobWriter())
+        return self.writers[-1], f"gs://test-bucket/{spec.object_path}"
+
+
+class FailingSource:
+    """첫 줄 뒤에 읽기 오류"""
+
+    def describe(self):
+        return "failing.jsonl"
+
+    def lines(self):
+        yield "failing.jsonl:1", doc("org-a")
+        raise OSError("읽기 오류")
+
+
+def test_mid_stream_failure_terminates_upload(tmp_path):
+    spec = spec_for(tmp_path, "admin", [doc("org-a")])
+    spec = replace(spec, source=FailingSource())
+    sink, client = BlobSink(), FakeDocumentClient(delay=0)
+
+    result, = run([spec], sink, VertexSearchImporter(document_client=client))
+
+    assert not result.ok and "읽기 오류" in result.error
+    assert [writer.state for writer in sink.writers] == ["terminated"] and client.requests == []
+
+
+def test_full_import_aborts_on_invalid_lines(tmp_path):
+    spec = spec_for(tmp_path, "admin", [doc("org-a"), "{not json", doc("org-b")])
+    sink, client = BlobSink(), FakeDocumentClient(delay=0)
+
+    result, = run([spec], sink, VertexSearchImporter(document_client=client, full=True))
+    assert not result.ok and "FULL 조정 중단" in result.error and len(result.invalid) == 1
+    assert [writer.state for writer in sink.writers] == ["terminated"] and client.requests == []
+
+    # INCREMENTAL은 잘못된 줄을 건너뛰고 그대로 import
+    result, = run([spec], sink, VertexSearchImporter(document_client=client))
+    assert result.ok and result.imported and sink.writers[-1].state == "committed"
@@ -0,0 +1,78 @@
+"""
+교수정보 로컬 색인 테스트
+
+실제 data/교수정보/*.jsonl로 이름 정확/오타 매칭, 학과/대학 조회,
+연구분야 키워드 조회와 원격 검색으로 넘겨야 하는 질문 판별을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_professor_index.py
+"""
+import pytest
+
+from google_adk.agents.professor.tools.professor_index import (
+    DEFAULT_DATA_DIR,
+    ProfessorIndex,
+    decompose,
+    edit_distance,
+)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return ProfessorIndex.from_jsonl_dir(DEFAULT_DATA_DIR)
+
+
+def names(result):
+    return [r["fields"]["name_ko"] for r in result["results"]]
+
+
+def test_decompose_and_distance():
+    assert decompose("양재형") == "ㅇㅑㅇㅈㅐㅎㅕㅇ"
+    assert decompose("AI 교수") == "AI ㄱㅛㅅㅜ"
+    assert edit_distance(decompose("양제형"), decompose("양재형"), 2) == 1
+    assert edit_distance("abcdef", "uvwxyz", 2) == 3
+
+
+def test_loads_professors_with_affiliation(index):
+    professor = index.find_by_name("최인엽 교수님")[0]
+
+    assert professor.department == "소프트웨어전공"
+    assert professor.school == "컴퓨터공학부"
+    assert professor.college == "공과대학"
+    assert professor.courses == []  # "정보없음" 제거
+
+
+def test_exact_name(index):
+    result = index.answer("양재형 교수 연구실 어디야?")
+
+    assert result["source"] == "local"
+    assert names(result) == ["양재형"]
+    assert result["results"][0]["fields"]["office"] == "이공관519"
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("양제형 교수님", "양재형"),
+    ("김테권", "김태권"),
+    ("최인엾 교수", "최인엽"),
+])
+def test_fuzzy_name(index, query, expected):
+    professors, fuzzy = index.match_name(query)
+    assert fuzzy
+    assert [p.name for p in professors] == [expected]
+
+
+def test_department_and_school(index):
+    software = index.find_by_department("소프트웨어 교수")
+    school = index.find_by_department("컴퓨터공학부")
+
+    assert {p.department for p in software} == {"소프트웨어전공"}
+    assert set(software) < set(school)
+    assert {p.department for p in school} == {"소프트웨어전공", "가상현실전공"}
+
+
+def test_keyword(index):
+    assert names(index.answer("TinyML 연구 교수")) == ["최인엽"]
+
+
+def test_generic_words_are_not_names(index):
+    assert index.fuzzy_find_by_name("연구실 위치 전화번호 이메일 시간표") == []
+    assert index.answer("교수님 이메일 주소 알려줘") is None
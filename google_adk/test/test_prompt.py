@@ -0,0 +1,62 @@
+"""
+에이전트 프롬프트 압축 테스트
+
+장식(구분선, 이모지, 강조, 표) 제거 규칙과, 압축 후에도 도구 이름과
+예시 호출이 그대로 남는지, 에이전트가 압축본을 고정 접두어로 쓰는지 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_prompt.py
+"""
+import re
+
+from google_adk.prompt import (
+    INSTRUCTION_SOURCE,
+    build_instruction,
+    compact_instruction,
+    measure_prompt,
+)
+
+
+def test_compact_instruction_strips_decoration():
+    text = """
+    ━━━━━━━━━━━━━━━━━━━━
+    🛑 **[절대 원칙]** 🛑
+    ━━━━━━━━━━━━━━━━━━━━
+
+    1️⃣ **search_building_info(query: str)**
+       - 예시: `search_building_info("샬롬관")`
+
+    | 질문 예시 | 사용 도구 |
+    |----------|----------|
+    | "샬롬관 어디야?" | `search_building_info("샬롬관")` |
+    """
+    assert compact_instruction(text) == "\n".join([
+        "[절대 원칙]",
+        "search_building_info(query: str)",
+        '- 예시: search_building_info("샬롬관")',
+        "질문 예시 → 사용 도구",
+        '"샬롬관 어디야?" → search_building_info("샬롬관")',
+    ])
+
+
+def test_compact_instruction_keeps_section_breaks_and_arrows():
+    text = "[A]\n\n\n내용 → 도구\n\n[B]\n내용"
+    assert compact_instruction(text) == "[A]\n내용 → 도구\n\n[B]\n내용"
+
+
+def test_build_instruction_keeps_tool_names():
+    built = build_instruction()
+    for name in set(re.findall(r"\b(search_\w+|check_\w+|get_\w+)\(", INSTRUCTION_SOURCE)):
+        assert f"{name}(" in built
+    assert "━" not in built and "**" not in built and "|---" not in built
+
+
+def test_build_instruction_is_smaller_and_stable():
+    assert measure_prompt(build_instruction())["tokens"] < measure_prompt(INSTRUCTION_SOURCE)["tokens"]
+    assert compact_instruction(build_instruction()) == build_instruction()
+
+
+def test_agent_uses_compact_static_instruction():
+    from google_adk.agent import root_agent
+
+    assert root_agent.static_instruction == build_instruction()
+    assert not root_agent.instruction
@@ -0,0 +1,76 @@
+"""
+검색 도구 일괄 실행 테스트
+
+run_batch의 중복 제거/동시 실행/예외 격리와 merge_results의
+문서 중복 제거, 상태(success/partial/error) 계산을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_search_batch.py
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from google_adk.search.batch import MAX_BATCH_QUERIES, merge_results, run_batch
+
+
+def fake_tool(query):
+    if query == "boom":
+        raise RuntimeError("검색 실패")
+    return {
+        "status": "success",
+        "query": query,
+        "results": [
+            {"rank": 1, "title": f"{query}-doc"},
+            {"rank": 2, "title": "shared-doc"},
+        ],
+    }
+
+
+def test_run_batch_dedupes_and_keeps_order():
+    calls = []
+
+    def tool(query):
+        calls.append(query)
+        return {"status": "success", "query": query, "results": []}
+
+    results = run_batch(tool, ["A 과목", "b", "a  과목", " ", "B"], executor=ThreadPoolExecutor(4))
+
+    assert [query for query, _ in results] == ["A 과목", "b"]
+    assert sorted(calls) == ["A 과목", "b"]
+
+
+def test_run_batch_runs_concurrently():
+    barrier = threading.Barrier(3, timeout=2)
+
+    def tool(query):
+        # 세 질문이 동시에 실행되지 않으면 Barrier 시간 초과
+        barrier.wait()
+        return {"status": "success", "query": query, "results": []}
+
+    started = time.perf_counter()
+    results = run_batch(tool, ["a", "b", "c"], executor=ThreadPoolExecutor(3))
+
+    assert all(result["status"] == "success" for _, result in results)
+    assert time.perf_counter() - started < 2
+
+
+def test_run_batch_limits_query_count():
+    queries = [f"q{i}" for i in range(MAX_BATCH_QUERIES + 5)]
+    results = run_batch(lambda q: {"status": "success", "results": []}, queries, executor=ThreadPoolExecutor(4))
+    assert len(results) == MAX_BATCH_QUERIES
+
+
+def test_merge_results_dedupes_documents():
+    merged = merge_results(run_batch(fake_tool, ["x", "y", "boom"], executor=ThreadPoolExecutor(3)))
+
+    assert merged["status"] == "partial"
+    assert [r["title"] for r in merged["results"]] == ["x-doc", "shared-doc", "y-doc"]
+    assert [r["rank"] for r in merged["results"]] == [1, 2, 3]
+    assert merged["results"][1]["matched_queries"] == ["x", "y"]
+    assert merged["queries"][2] == {"query": "boom", "status": "error", "count": 0, "message": "검색 실패"}
+
+
+def test_merge_results_all_failed():
+    merged = merge_results(run_batch(fake_tool, ["boom"]))
+    assert merged["status"] == "error"
+    assert merged["count"] == 0
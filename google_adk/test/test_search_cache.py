@@ -0,0 +1,168 @@
+"""
+Vertex AI Search 결과 캐시 테스트
+
+가짜 시계와 동기 실행기로 TTL, stale-while-revalidate, 오류 시 stale 반환,
+데이터스토어별 TTL, LRU 제거, 적중률 통계를 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_search_cache.py
+"""
+from concurrent.futures import Executor, Future
+
+import pytest
+
+from google_adk.search.cache import SearchCache, normalize_query
+
+BUILDING = "https://x/engines/kangnam-building/servingConfigs/default_search:search"
+SUBJECT = "https://x/engines/kangnam-subject/servingConfigs/default_search:search"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DeferredExecutor(Executor):
+    """submit된 작업을 run_all() 호출 시점에 실행"""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.pending.append((fn, args, kwargs))
+        return Future()
+
+    def run_all(self):
+        pending, self.pending = self.pending, []
+        for fn, args, kwargs in pending:
+            fn(*args, **kwargs)
+
+
+class FakeUpstream:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("upstream down")
+        return {"results": [], "version": self.calls}, True
+
+
+def make_cache(**kwargs):
+    clock = FakeClock()
+    executor = DeferredExecutor()
+    cache = SearchCache(
+        default_ttl=100, stale_ttl=1000, ttls={"kangnam-subject": 10},
+        clock=clock, executor=executor, **kwargs
+    )
+    return cache, clock, executor
+
+
+def test_normalize_query():
+    assert normalize_query("  샬롬관   위치 ") == normalize_query("샬롬관 위치")
+    assert normalize_query("ABC") == "abc"
+
+
+def test_fresh_hit_and_normalized_key():
+    cache, _, _ = make_cache()
+    upstream = FakeUpstream()
+
+    cache.get_or_load(BUILDING, "샬롬관", 10, 0, upstream)
+    result = cache.get_or_load(BUILDING, " 샬롬관 ", 10, 0, upstream)
+
+    assert upstream.calls == 1
+    assert result["version"] == 1
+    assert cache.get_stats()["total"]["hit_rate"] == 0.5
+
+
+def test_page_size_and_offset_are_part_of_key():
+    cache, _, _ = make_cache()
+    upstream = FakeUpstream()
+
+    cache.get_or_load(SUBJECT, "q", 10, 0, upstream)
+    cache.get_or_load(SUBJECT, "q", 10, 10, upstream)
+    cache.get_or_load(SUBJECT, "q", 5, 0, upstream)
+
+    assert upstream.calls == 3
+
+
+def test_stale_while_revalidate():
+    cache, clock, executor = make_cache()
+    upstream = FakeUpstream()
+    cache.get_or_load(BUILDING, "q", 10, 0, upstream)
+
+    clock.now = 150  # TTL(100) 경과, stale 허용 범위 이내
+    stale = cache.get_or_load(BUILDING, "q", 10, 0, upstream)
+    again = cache.get_or_load(BUILDING, "q", 10, 0, upstream)
+
+    assert stale["version"] == 1 and again["version"] == 1
+    assert len(executor.pending) == 1  # 재검증은 한 번만 예약
+
+    executor.run_all()
+    assert cache.get_or_load(BUILDING, "q", 10, 0, upstream)["version"] == 2
+    stats = cache.get_stats()["endpoints"]["kangnam-building"]
+    assert stats["stale_hits"] == 2 and stats["revalidations"] == 1
+
+
+def test_per_datastore_ttl():
+    cache, clock, executor = make_cache()
+    upstream = FakeUpstream()
+    cache.get_or_load(SUBJECT, "q", 10, 0, upstream)
+    cache.get_or_load(BUILDING, "q", 10, 0, upstream)
+
+    clock.now = 50  # subject TTL(10)만 경과
+    cache.get_or_load(SUBJECT, "q", 10, 0, upstream)
+    cache.get_or_load(BUILDING, "q", 10, 0, upstream)
+
+    stats = cache.get_stats()["endpoints"]
+    assert stats["kangnam-subject"]["stale_hits"] == 1
+    assert stats["kangnam-building"]["hits"] == 1
+
+
+def test_serves_stale_when_upstream_fails():
+    cache, clock, _ = make_cache()
+    upstream = FakeUpstream()
+    cache.get_or_load(BUILDING, "q", 10, 0, upstream)
+
+    clock.now = 5000  # stale 허용 범위도 경과
+    upstream.fail = True
+    result = cache.get_or_load(BUILDING, "q", 10, 0, upstream)
+
+    assert result["version"] == 1
+    assert cache.get_stats()["total"]["stale_on_error"] == 1
+
+    with pytest.raises(ConnectionError):
+        cache.get_or_load(BUILDING, "other", 10, 0, upstream)
+
+
+def test_error_responses_are_not_cached():
+    cache, _, _ = make_cache()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        return {"error": {"code": 500}}, False
+
+    cache.get_or_load(BUILDING, "q", 10, 0, failing)
+    cache.get_or_load(BUILDING, "q", 10, 0, failing)
+
+    assert len(calls) == 2
+    assert cache.get_stats()["size"] == 0
+
+
+def test_lru_eviction():
+    cache, _, _ = make_cache(max_entries=2)
+    upstream = FakeUpstream()
+    cache.get_or_load(BUILDING, "a", 10, 0, upstream)
+    cache.get_or_load(BUILDING, "b", 10, 0, upstream)
+    cache.get_or_load(BUILDING, "a", 10, 0, upstream)  # a 최근 사용
+    cache.get_or_load(BUILDING, "c", 10, 0, upstream)  # b 제거
+
+    cache.get_or_load(BUILDING, "a", 10, 0, upstream)
+    cache.get_or_load(BUILDING, "b", 10, 0, upstream)
+
+    assert upstream.calls == 4
@@ -0,0 +1,134 @@
+"""
+Vertex AI Search 공용 클라이언트 테스트
+
+실제 인증/네트워크 없이 가짜 인증 정보와 세션으로 토큰 캐싱, 만료 전 갱신,
+401 재시도, 타임아웃 전달, 엔드포인트별 지연 통계를 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_search_client.py
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from google_adk.search.client import VertexSearchClient, endpoint_name
+
+ENDPOINT = (
+    "https://discoveryengine.googleapis.com/v1alpha/"
+    "projects/1/locations/global/collections/default_collection/"
+    "engines/kangnam-test-engine/servingConfigs/default_search:search"
+)
+
+
+def _utcnow():
+    # google.auth와 같이 naive UTC datetime 사용
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class FakeCredentials:
+    def __init__(self, lifetime: timedelta):
+        self.lifetime = lifetime
+        self.token = None
+        self.expiry = None
+        self.refresh_count = 0
+
+    @property
+    def valid(self):
+        return self.token is not None and _utcnow() < self.expiry
+
+    def refresh(self, request):
+        self.refresh_count += 1
+        self.token = f"token-{self.refresh_count}"
+        self.expiry = _utcnow() + self.lifetime
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class FakeSession:
+    def __init__(self, statuses=()):
+        self.statuses = list(statuses)
+        self.calls = []
+
+    def post(self, url, headers, json, timeout):
+        self.calls.append({"url": url, "headers": headers, "json": json, "timeout": timeout})
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = {"results": [{"document": {"id": "doc-1"}}]} if status == 200 else {"error": {}}
+        return FakeResponse(status, body)
+
+
+def make_client(lifetime=timedelta(hours=1), statuses=()):
+    credentials = FakeCredentials(lifetime)
+    session = FakeSession(statuses)
+    client = VertexSearchClient(
+        connect_timeout=2, read_timeout=5, refresh_margin_seconds=300,
+        credentials=credentials, session=session
+    )
+    return client, credentials, session
+
+
+def test_token_is_cached_between_calls():
+    client, credentials, session = make_client()
+    client.search(ENDPOINT, "샬롬관")
+    client.search(ENDPOINT, "천은관")
+
+    assert credentials.refresh_count == 1
+    assert session.calls[0]["timeout"] == (2, 5)
+    assert session.calls[1]["headers"]["Authorization"] == "Bearer token-1"
+
+
+def test_token_refreshed_ahead_of_expiry():
+    # 남은 수명(2분)이 갱신 여유(5분)보다 짧으면 매번 미리 갱신
+    client, credentials, _ = make_client(lifetime=timedelta(minutes=2))
+    client.search(ENDPOINT, "a")
+    client.search(ENDPOINT, "b")
+
+    assert credentials.refresh_count == 2
+
+
+def test_unauthorized_retries_once_with_fresh_token():
+    client, credentials, session = make_client(statuses=[401, 200])
+    result = client.search(ENDPOINT, "졸업요건")
+
+    assert "results" in result
+    assert credentials.refresh_count == 2
+    assert session.calls[1]["headers"]["Authorization"] == "Bearer token-2"
+
+
+def test_offset_only_sent_when_paging():
+    client, _, session = make_client()
+    client.search(ENDPOINT, "q")
+    client.search(ENDPOINT, "q", page_size=5, offset=10)
+
+    assert "offset" not in session.calls[0]["json"]
+    assert session.calls[1]["json"]["offset"] == 10
+    assert session.calls[1]["json"]["pageSize"] == 5
+
+
+def test_latency_stats_per_endpoint_and_async():
+    client, _, _ = make_client(statuses=[200, 500])
+    asyncio.run(client.asearch(ENDPOINT, "q"))
+    client.search(ENDPOINT, "q")
+
+    stats = client.get_latency_stats()
+    assert endpoint_name(ENDPOINT) == "kangnam-test-engine"
+    assert stats["kangnam-test-engine"]["count"] == 2
+    assert stats["kangnam-test-engine"]["errors"] == 1
+
+
+def test_cache_skips_repeated_upstream_calls():
+    from google_adk.search.cache import SearchCache
+
+    client, _, session = make_client()
+    client.cache = SearchCache()
+    client.search(ENDPOINT, "샬롬관")
+    client.search(ENDPOINT, "샬롬관 ")
+    client.search(ENDPOINT, "샬롬관", use_cache=False)
+
+    assert len(session.calls) == 2
+    assert client.cache.get_stats()["total"]["hits"] == 1
@@ -0,0 +1,131 @@
+"""
+과목 스냅샷 변경분 동기화 테스트
+
+Discovery Engine 대신 요청을 기록하는 로컬 클라이언트를 주입해, 처음 동기화의 배치 upsert,
+변경/추가분만 다시 보내기, 삭제된 id 제거(새 학기 스냅샷 포함), 실패한 배치를 manifest에 남기지 않고
+재시도하는지 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_sync_subjects.py
+"""
+import json
+from types import SimpleNamespace
+
+from google.api_core.exceptions import NotFound
+
+from google_adk.data.과목정보.sync_subjects import SubjectSync, manifest_path
+
+PARENT = "projects/p/locations/global/dataStores/ds/branches/default_branch"
+
+
+class FakeDocumentClient:
+    """import/delete 요청 기록 + 문서 저장 (fail_ids가 든 배치는 오류 응답)"""
+
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.documents = {}
+        self.import_batches = []
+        self.deleted = []
+
+    def import_documents(self, request):
+        ids = [document.id for document in request.inline_source.documents]
+        self.import_batches.append(ids)
+        errors = [SimpleNamespace(message=f"invalid {doc_id}") for doc_id in ids if doc_id in self.fail_ids]
+        if not errors:
+            for document in request.inline_source.documents:
+                self.documents[document.id] = dict(document.struct_data)
+        response = SimpleNamespace(error_samples=errors)
+        return SimpleNamespace(result=lambda timeout=None: response)
+
+    def delete_document(self, request):
+        doc_id = request.name.rsplit("/", 1)[-1]
+        self.deleted.append(doc_id)
+        if self.documents.pop(doc_id, None) is None:
+            raise NotFound("missing")
+
+
+def write_snapshot(path, professors):
+    lines = [
+        json.dumps({"id": doc_id, "content": f"과목명: {doc_id}", "metadata": {"professor": professor}},
+                   ensure_ascii=False)
+        for doc_id, professor in professors.items()
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_first_sync_upserts_everything_in_batches(tmp_path):
+    snapshot = tmp_path / "kangnam_all_2025_2.jsonl"
+    write_snapshot(snapshot, {f"CS{i:05d}-01": "김" for i in range(5)})
+    client = FakeDocumentClient()
+
+    result = SubjectSync(client, PARENT, batch_size=2).sync(str(snapshot), data_store="ds")
+
+    assert [len(batch) for batch in client.import_batches] == [2, 2, 1]
+    assert len(result.upserted) == 5 and not result.failed
+    assert client.documents["CS00000-01"]["metadata"]["professor"] == "김"
+    manifest = json.loads((tmp_path / "ds.synced.json").read_text(encoding="utf-8"))
+    assert manifest["data_store"] == "ds" and len(manifest["hashes"]) == 5
+
+
+def test_second_sync_sends_only_changes_and_deletes_removed(tmp_path):
+    snapshot = tmp_path / "kangnam_all_2025_2.jsonl"
+    write_snapshot(snapshot, {"A-01": "김", "B-01": "이", "C-01": "박"})
+    client = FakeDocumentClient()
+    SubjectSync(client, PARENT).sync(str(snapshot), data_store="ds")
+
+    write_snapshot(snapshot, {"A-01": "김", "B-01": "최", "D-01": "정"})
+    client.import_batches.clear()
+    result = SubjectSync(client, PARENT).sync(str(snapshot), data_store="ds")
+
+    assert client.import_batches == [["D-01", "B-01"]]
+    assert client.deleted == ["C-01"] and result.deleted == ["C-01"]
+    assert set(client.documents) == {"A-01", "B-01", "D-01"}
+    assert result.delta.unchanged == 1
+
+    # 변경 없으면 요청 없음, 다른 데이터 스토어 manifest는 쓰지 않음
+    client.import_batches.clear()
+    assert SubjectSync(client, PARENT).sync(str(snapshot), data_store="ds").delta.is_empty
+    assert client.import_batches == []
+    assert SubjectSync(None, PARENT).sync(str(snapshot), data_store="other", dry_run=True).delta.added
+
+
+def test_failed_batch_is_retried_next_run(tmp_path):
+    snapshot = tmp_path / "kangnam_all_2025_2.jsonl"
+    write_snapshot(snapshot, {"A-01": "김", "B-01": "이", "C-01": "박"})
+
+    failing = FakeDocumentClient(fail_ids={"C-01"})
+    first = SubjectSync(failing, PARENT, batch_size=2).sync(str(snapshot), data_store="ds")
+    assert first.upserted == ["A-01", "B-01"] and list(first.failed) == ["C-01"]
+
+    healthy = FakeDocumentClient()
+    SubjectSync(healthy, PARENT, batch_size=2).sync(str(snapshot), data_store="ds")
+    assert healthy.import_batches == [["C-01"]]
+    manifest = json.loads(open(manifest_path(str(snapshot), "ds"), encoding="utf-8").read())
+    assert set(manifest["hashes"]) == {"A-01", "B-01", "C-01"}
+
+
+def test_already_missing_document_counts_as_deleted(tmp_path):
+    snapshot = tmp_path / "kangnam_all_2025_2.jsonl"
+    write_snapshot(snapshot, {"A-01": "김", "B-01": "이"})
+    SubjectSync(FakeDocumentClient(), PARENT).sync(str(snapshot), data_store="ds")
+
+    write_snapshot(snapshot, {"A-01": "김"})
+    result = SubjectSync(FakeDocumentClient(), PARENT).sync(str(snapshot), data_store="ds")
+    assert result.deleted == ["B-01"] and not result.failed
+
+
+def test_new_semester_snapshot_diffs_against_indexed_store(tmp_path):
+    previous = tmp_path / "kangnam_all_2025_2.jsonl"
+    write_snapshot(previous, {"A-01": "김", "B-01": "이"})
+    client = FakeDocumentClient()
+    SubjectSync(client, PARENT).sync(str(previous), data_store="ds")
+
+    # 파일명이 달라도 같은 데이터 스토어의 manifest와 비교 → 없어진 학기 과목 삭제
+    current = tmp_path / "kangnam_all_2026_1.jsonl"
+    write_snapshot(current, {"A-01": "김", "C-01": "박"})
+    client.import_batches.clear()
+    result = SubjectSync(client, PARENT).sync(str(current), data_store="ds")
+
+    assert client.import_batches == [["C-01"]] and result.deleted == ["B-01"]
+    assert set(client.documents) == {"A-01", "C-01"}
+    manifest = json.loads((tmp_path / "ds.synced.json").read_text(encoding="utf-8"))
+    assert manifest["snapshot"] == "kangnam_all_2026_1.jsonl" and set(manifest["hashes"]) == {"A-01", "C-01"}
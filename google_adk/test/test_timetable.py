@@ -0,0 +1,89 @@
+"""
+강의시간 파서 / 시간표 색인 테스트
+
+강의시간 문자열의 슬롯 변환, 비트셋 충돌 판정, 요일/시간대 창 검색과 학년 필터를
+실제 kangnam_all_2025_2.jsonl로 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_timetable.py
+"""
+import pytest
+
+from google_adk.agents.subject.tools.course_search import DEFAULT_DATA_PATH, CourseSearchEngine
+from google_adk.agents.subject.tools.timetable import (
+    Slot,
+    TimetableIndex,
+    describe_mask,
+    parse_lecture_time,
+    slots_to_mask,
+    window_mask,
+)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return TimetableIndex(CourseSearchEngine.from_jsonl(DEFAULT_DATA_PATH).documents)
+
+
+def mask(text):
+    return slots_to_mask(parse_lecture_time(text))
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("(주)목9ab", [Slot(3, 9, 0), Slot(3, 9, 1)]),
+    ("(주)수4ab5a,목5b6ab", [
+        Slot(2, 4, 0), Slot(2, 4, 1), Slot(2, 5, 0),
+        Slot(3, 5, 1), Slot(3, 6, 0), Slot(3, 6, 1),
+    ]),
+    ("(야)화11", [Slot(1, 11, 0), Slot(1, 11, 1)]),
+    ("별도배정", []),
+    ("", []),
+])
+def test_parse_lecture_time(text, expected):
+    assert parse_lecture_time(text) == expected
+
+
+def test_night_periods_are_split():
+    assert {s.period for s in parse_lecture_time("(야)월101112")} == {10, 11, 12}
+    assert describe_mask(mask("(야)월101112")) == ["월 18:00-21:00"]
+
+
+def test_describe_mask_merges_consecutive_slots():
+    assert describe_mask(mask("(주)수4ab5a,목5b6ab")) == ["수 12:00-13:30", "목 13:30-15:00"]
+
+
+def test_conflict_on_half_period():
+    # 수 5a까지 수업 vs 수 5b부터 수업 → 겹치지 않음, 5a를 같이 쓰면 겹침
+    assert mask("(주)수4ab5a") & mask("(주)수5b6ab") == 0
+    assert mask("(주)수4ab5a") & mask("(주)수5a") != 0
+
+
+def test_window_contains_only_courses_fully_inside(index):
+    window = window_mask([3], 4, 9)  # 목요일 오후
+    courses = index.within(window)
+
+    assert courses
+    assert all(course.mask and course.mask & ~window == 0 for course in courses)
+    assert all(describe_mask(course.mask)[0].startswith("목") for course in courses)
+
+
+def test_resolve_and_conflict(index):
+    sections = index.resolve("데이터베이스")
+    assert [c.id for c in sections] == ["EF14207-01", "EF14207-02"]
+    assert index.resolve("ef14207-02") == sections[1:]
+    assert index.resolve("EF14207") == sections
+
+    first, second = sections
+    assert index.conflicts(first, second) == 0
+    assert index.conflicts(first, first) == first.mask
+
+
+def test_grade_filter_matches_any_merged_grade():
+    from google_adk.agents.subject.tools.subject_tools import search_subject_by_time
+
+    # ND01602-06 공학수학은 2, 3, 4학년 목록에 모두 있는 병합 문서 (metadata.grade는 첫 값 2)
+    for grade in (2, 3, 4):
+        result = search_subject_by_time(day="수", time_of_day="오전", grade=grade, keyword="공학수학")
+        assert "ND01602-06" in [r["title"] for r in result["results"]]
+
+    result = search_subject_by_time(day="수", time_of_day="오전", grade=1, keyword="공학수학")
+    assert "ND01602-06" not in [r["title"] for r in result["results"]]
@@ -0,0 +1,90 @@
+"""
+턴별 도구 선별 테스트
+
+키워드/개체 사전 점수, 복합 질문의 여러 분야 선택, 확신이 낮을 때 전체 도구 유지,
+before_model_callback에서 함수 선언만 줄이는 동작을 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_tool_gating.py
+"""
+from google.adk.models import LlmRequest
+from google.genai import types
+
+from google_adk.callbacks import tool_gating_callback
+from google_adk.tool_gating import DOMAIN_TOOLS, IntentScorer, get_intent_scorer, select_tools
+
+ALL_TOOLS = [name for names in DOMAIN_TOOLS.values() for name in names]
+
+scorer = IntentScorer(entities={
+    "building": ["샬롬관", "이공관"],
+    "professor": ["김철주", "김태권"],
+    "subject": ["데이터베이스", "소프트웨어공학"],
+})
+
+
+def test_entity_and_keyword_scores():
+    assert scorer.select_domains("샬롬관 어디야?") == ["building"]
+    assert scorer.select_domains("김철주 교수님 연구실") == ["professor"]
+    assert scorer.select_domains("데이터베이스 강의계획서") == ["subject"]
+    assert scorer.select_domains("2024학년도 졸업요건") == ["graduation"]
+
+
+def test_compound_question_keeps_related_domains():
+    assert scorer.select_domains("김태권 교수님 수업") == ["professor", "subject"]
+
+
+def test_low_confidence_returns_none():
+    assert scorer.select_domains("안녕") is None
+    assert select_tools(scorer, "안녕", ALL_TOOLS) is None
+    # 분야가 너무 많이 걸리면 선별하지 않음
+    assert scorer.select_domains("샬롬관 교학팀 김철주 교수 데이터베이스 졸업") is None
+
+
+def test_select_tools_keeps_called_and_unknown_tools():
+    keep = select_tools(scorer, "샬롬관 어디야?", ALL_TOOLS + ["new_tool"], called=["search_professor_info"])
+    assert keep == {"search_building_info", "search_facility_by_location", "search_professor_info", "new_tool"}
+
+
+def test_local_entity_dictionaries():
+    local = get_intent_scorer()
+    assert {"building", "professor", "subject"} <= set(local.entities)
+    assert local.select_domains("천은관 3층") == ["building"]
+
+
+def request(*contents):
+    declarations = [types.FunctionDeclaration(name=name, description=name) for name in ALL_TOOLS]
+    return LlmRequest(
+        contents=list(contents),
+        config=types.GenerateContentConfig(tools=[types.Tool(function_declarations=declarations)]),
+    )
+
+
+def user(text):
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def declared(llm_request):
+    return [d.name for tool in llm_request.config.tools for d in tool.function_declarations]
+
+
+def test_callback_prunes_declarations_only():
+    llm_request = request(user("이공관 3층에 뭐 있어?"))
+    assert tool_gating_callback(None, llm_request) is None
+    assert declared(llm_request) == ["search_building_info", "search_facility_by_location"]
+
+
+def test_callback_uses_question_after_tool_response():
+    llm_request = request(
+        user("졸업요건 알려줘"),
+        types.Content(role="model", parts=[types.Part(function_call=types.FunctionCall(name="search_admin_department", args={}))]),
+        types.Content(role="user", parts=[types.Part(function_response=types.FunctionResponse(name="search_admin_department", response={}))]),
+    )
+    tool_gating_callback(None, llm_request)
+    assert set(declared(llm_request)) == {
+        "search_graduation_requirements", "get_available_information", "search_admin_department",
+    }
+
+
+def test_callback_keeps_all_tools_when_unsure():
+    llm_request = request(user("고마워"))
+    tool_gating_callback(None, llm_request)
+    assert declared(llm_request) == ALL_TOOLS
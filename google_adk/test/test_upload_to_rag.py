@@ -0,0 +1,87 @@
+"""
+졸업이수학점 RAG 업로드 파이프라인 테스트
+
+제너레이터 파이프라인이 기존 스크립트가 만든 result/ JSONL과 같은 줄을 만드는지,
+다음 파일을 필요할 때만 읽는지(스트리밍), 로컬 파일과 GCS resumable writer에 함께 쓰는지 검증합니다.
+
+실행: python -m pytest -q google_adk/test/test_upload_to_rag.py
+"""
+import io
+import json
+from types import SimpleNamespace
+
+import google_adk.data.upload_to_rag as upload_to_rag
+from google_adk.data.upload_to_rag import (
+    DATA_DIR,
+    JSON_FILES,
+    LOCAL_JSONL_PATH,
+    chunk_stream,
+    import_to_corpus,
+    open_gcs_writer,
+    write_lines,
+)
+
+
+def test_same_chunks_as_existing_result_file():
+    expected = LOCAL_JSONL_PATH.read_text(encoding="utf-8").splitlines()
+    produced = [line.decode("utf-8").rstrip("\n") for line in chunk_stream(DATA_DIR / name for name in JSON_FILES)]
+    assert produced == expected
+
+
+def test_module_import_has_no_clients():
+    assert not hasattr(upload_to_rag, "bucket") and not hasattr(upload_to_rag, "storage_client")
+    assert not hasattr(upload_to_rag, "all_chunks")
+
+
+def test_files_are_read_lazily(tmp_path):
+    college = {"대학": "공과대학", "졸업요건": {"기초교양": 13}, "교양이수표": {"기초": ["글쓰기"]},
+               "계열": [{"계열명": "공학", "학부및학과": [{"학부": "ICT융합공학부", "전공": ["소프트웨어전공"]}]}]}
+    paths = []
+    for name in ("a_2025이상.json", "b_2017~2020.json"):
+        path = tmp_path / name
+        path.write_text(json.dumps({"data": [college]}, ensure_ascii=False), encoding="utf-8")
+        paths.append(path)
+
+    opened = []
+
+    def tracked():
+        for path in paths:
+            opened.append(path.name)
+            yield path
+
+    stream = chunk_stream(tracked())
+    first, second = next(stream), next(stream)
+    assert opened == ["a_2025이상.json"]
+    assert json.loads(first)["metadata"]["year_range"] == "2025+"
+    assert json.loads(second)["metadata"]["category"] == "교양이수표"
+    assert json.loads(next(stream))["metadata"]["year_range"] == "2017-2020"
+    assert opened == ["a_2025이상.json", "b_2017~2020.json"]
+
+
+class FakeBlob:
+    def __init__(self, bucket, path):
+        self.bucket, self.path = bucket, path
+
+    def open(self, mode, **options):
+        self.bucket.opened.append((self.path, mode, options))
+        return self.bucket.buffer
+
+
+def test_write_lines_tees_to_local_and_gcs_writer():
+    bucket = SimpleNamespace(opened=[], buffer=io.BytesIO())
+    bucket.blob = lambda path: FakeBlob(bucket, path)
+    local = io.BytesIO()
+
+    gcs = open_gcs_writer(bucket, "rag_data/x.jsonl", chunk_size=256 * 1024)
+    stats = write_lines(iter([b"a\n", "나\n".encode("utf-8")]), [local, gcs])
+
+    assert bucket.opened == [("rag_data/x.jsonl", "wb", {"chunk_size": 256 * 1024, "content_type": "application/jsonl"})]
+    assert local.getvalue() == bucket.buffer.getvalue() == "a\n나\n".encode("utf-8")
+    assert (stats.lines, stats.bytes) == (2, 6)
+
+
+def test_import_to_corpus_uses_injected_rag():
+    calls = []
+    rag = SimpleNamespace(import_files=lambda **kwargs: calls.append(kwargs) or SimpleNamespace(result=lambda: None))
+    import_to_corpus("gs://bucket/x.jsonl", rag=rag)
+    assert calls[0]["paths"] == ["gs://bucket/x.jsonl"] and calls[0]["corpus_name"] == upload_to_rag.CORPUS_NAME
@@ -0,0 +1,233 @@
+"""
+턴별 도구 선별 (Tool Gating)
+
+모델 호출마다 13개 도구 선언이 모두 전송되지만, 질문 대부분은 한 분야에 속합니다.
+before_model_callback에서 사용자 질문의 분야를 로컬에서 점수화하고,
+해당 분야의 도구만 llm_request에 남겨 함수 선언 토큰과 잘못된 도구 선택을 줄입니다.
+
+- 키워드 사전: 분야별 질문 단어 ("연구실" → 교수, "졸업" → 졸업요건)
+- 개체 사전: 로컬 데이터 파일에서 만든 이름 목록 (건물 별칭, 부서명, 교수명, 과목명)
+- 최고 점수에 가까운 분야를 모두 남김 (복합 질문, 빠뜨리는 쪽보다 더 남기는 쪽으로)
+- 신호가 없거나 거의 모든 분야가 걸리면 None → 전체 도구 그대로 (안전한 기본값)
+"""
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+# 분야 → 도구 이름 (여기 없는 도구는 항상 남김)
+DOMAIN_TOOLS: Dict[str, List[str]] = {
+    "building": ["search_building_info", "search_facility_by_location"],
+    "admin": ["search_admin_department"],
+    "professor": ["search_professor_info", "search_professor_info_batch"],
+    "subject": [
+        "search_subject_info",
+        "search_subject_info_batch",
+        "search_subject_by_grade_and_dept",
+        "search_subject_syllabus",
+        "search_subject_by_time",
+        "check_timetable_conflict",
+    ],
+    "graduation": ["search_graduation_requirements", "get_available_information"],
+}
+
+# 분야별 질문 키워드 (공백 없이 비교)
+DOMAIN_KEYWORDS: Dict[str, List[str]] = {
+    "building": [
+        "건물", "어디", "위치", "층", "시설", "식당", "카페", "편의점", "화장실",
+        "주차", "지도", "가는길", "호실", "열람실", "기숙사",
+    ],
+    "admin": [
+        "부서", "행정", "팀", "전화번호", "연락처", "담당자", "업무", "사무실",
+        "장학", "등록금", "휴학", "복학", "증명서",
+    ],
+    "professor": ["교수", "연구실", "연구분야", "메일", "박사"],
+    "subject": [
+        "수업", "과목", "강의", "강좌", "시간표", "계획서", "학수번호", "분반",
+        "요일", "오전", "오후", "야간", "교시", "겹", "충돌", "수강", "개설",
+    ],
+    "graduation": [
+        "졸업", "이수", "학점", "교양", "필수", "요건", "입학", "학년도",
+        "복수전공", "부전공", "어떤정보",
+    ],
+}
+
+KEYWORD_WEIGHT = 1.0
+# 이름이 직접 나오면 키워드보다 강한 신호
+ENTITY_WEIGHT = 2.0
+
+# 최고 점수가 이보다 낮으면 전체 도구 사용
+MIN_CONFIDENCE = 1.0
+# 최고 점수 대비 이 비율 이상인 분야를 함께 남김 ("김태권 교수님 수업" → 교수 + 과목)
+RELATIVE_THRESHOLD = 0.3
+# 이만큼 많은 분야가 걸리면 선별 효과가 없어 전체 도구 사용
+MAX_DOMAINS = 3
+
+# 너무 짧아 일반 단어와 겹치는 이름은 개체 사전에서 제외
+MIN_ENTITY_LENGTH = 2
+MIN_NAME_LENGTH = 3
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """비교용 정규화 (공백 제거 + 소문자)"""
+    return _WHITESPACE.sub("", text or "").lower()
+
+
+class IntentScorer:
+    """
+    키워드 + 개체 사전 기반 분야 점수
+
+    Args:
+        entities: 분야 → 이름 목록 (로컬 데이터에서 추출)
+        keywords: 분야 → 키워드 목록 (기본: DOMAIN_KEYWORDS)
+    """
+
+    def __init__(
+        self,
+        entities: Optional[Dict[str, Iterable[str]]] = None,
+        keywords: Optional[Dict[str, List[str]]] = None
+    ):
+        self.keywords = {
+            domain: sorted({normalize(word) for word in words})
+            for domain, words in (keywords or DOMAIN_KEYWORDS).items()
+        }
+        self.entities: Dict[str, List[str]] = {}
+        for domain, names in (entities or {}).items():
+            self.entities[domain] = sorted({
+                key for key in (normalize(name) for name in names)
+                if len(key) >= MIN_ENTITY_LENGTH
+            })
+
+    @classmethod
+    def from_local_data(cls) -> 'IntentScorer':
+        """로컬 색인(건물, 행정부서, 교수, 과목)에서 개체 사전 구성 (실패한 분야는 키워드만 사용)"""
+        loaders = {
+            "building": _building_names,
+            "admin": _admin_names,
+            "professor": _professor_names,
+            "subject": _subject_names,
+        }
+        entities = {}
+        for domain, loader in loaders.items():
+            try:
+                entities[domain] = loader()
+            except Exception as e:
+                print(f"[ToolGating] ⚠️ {domain} 개체 사전 로드 실패, 키워드만 사용: {e}")
+        return cls(entities)
+
+    def score(self, text: str) -> Dict[str, float]:
+        """분야별 점수 (일치한 키워드 수 * KEYWORD_WEIGHT + 일치한 이름 수 * ENTITY_WEIGHT)"""
+        key = normalize(text)
+        scores: Dict[str, float] = {}
+        for domain, words in self.keywords.items():
+            hits = sum(1 for word in words if word in key)
+            if hits:
+                scores[domain] = scores.get(domain, 0.0) + hits * KEYWORD_WEIGHT
+        for domain, names in self.entities.items():
+            hits = sum(1 for name in names if name in key)
+            if hits:
+                scores[domain] = scores.get(domain, 0.0) + hits * ENTITY_WEIGHT
+        return scores
+
+    def select_domains(self, text: str) -> Optional[List[str]]:
+        """
+        질문에 해당하는 분야 목록
+
+        Returns:
+            점수 높은 순 분야 목록, 확신이 낮으면 None (전체 도구 사용)
+        """
+        scores = self.score(text)
+        if not scores:
+            return None
+        top = max(scores.values())
+        if top < MIN_CONFIDENCE:
+            return None
+        selected = [
+            domain for domain, value in sorted(scores.items(), key=lambda item: -item[1])
+            if value >= top * RELATIVE_THRESHOLD
+        ]
+        if len(selected) > MAX_DOMAINS:
+            return None
+        return selected
+
+
+def select_tools(
+    scorer: IntentScorer,
+    text: str,
+    available: Iterable[str],
+    called: Iterable[str] = ()
+) -> Optional[Set[str]]:
+    """
+    이번 모델 호출에 남길 도구 이름
+
+    Args:
+        scorer: 분야 점수기
+        text: 이번 턴의 사용자 질문
+        available: 요청에 들어 있는 도구 이름
+        called: 이번 턴에 이미 호출한 도구 (다음 호출에서도 유지)
+
+    Returns:
+        남길 도구 이름 집합, 선별하지 않으면 None
+    """
+    domains = scorer.select_domains(text)
+    if domains is None:
+        return None
+    gated = {name for names in DOMAIN_TOOLS.values() for name in names}
+    keep = {name for domain in domains for name in DOMAIN_TOOLS.get(domain, [])}
+    keep.update(called)
+    available = set(available)
+    # 분야에 속하지 않은 도구(새로 추가된 도구 등)는 항상 남김
+    keep.update(name for name in available if name not in gated)
+    keep &= available
+    if not keep or keep == available:
+        return None
+    return keep
+
+
+# ============================================================================
+# 로컬 데이터 → 개체 사전
+# ============================================================================
+
+def _building_names() -> List[str]:
+    from google_adk.agents.basic_info.tools.building_index import get_building_index
+    return [alias for building in get_building_index().buildings for alias in building.aliases]
+
+
+def _admin_names() -> List[str]:
+    from google_adk.agents.basic_info.tools.admin_directory import get_admin_directory
+    return [unit.name for unit in get_admin_directory().units if len(normalize(unit.name)) >= MIN_NAME_LENGTH]
+
+
+def _professor_names() -> List[str]:
+    from google_adk.agents.professor.tools.professor_index import get_professor_index
+    return [p.name for p in get_professor_index().professors if len(p.name) >= MIN_NAME_LENGTH]
+
+
+def _subject_names() -> List[str]:
+    from google_adk.agents.subject.tools.course_search import get_course_search_engine
+    return [
+        document.subject_name for document in get_course_search_engine().documents
+        if len(normalize(document.subject_name)) >= MIN_NAME_LENGTH
+    ]
+
+
+# 프로세스 공용 싱글톤
+_intent_scorer_instance: Optional[IntentScorer] = None
+_intent_scorer_lock = threading.Lock()
+
+
+def get_intent_scorer() -> IntentScorer:
+    """
+    IntentScorer 싱글톤 인스턴스 반환 (첫 호출 시 로컬 색인에서 개체 사전 구성)
+    """
+    global _intent_scorer_instance
+    if _intent_scorer_instance is None:
+        with _intent_scorer_lock:
+            if _intent_scorer_instance is None:
+                _intent_scorer_instance = IntentScorer.from_local_data()
+                counts = ", ".join(
+                    f"{domain} {len(names)}" for domain, names in _intent_scorer_instance.entities.items()
+                )
+                print(f"[ToolGating] ✅ Built entity dictionaries ({counts})")
+    return _intent_scorer_instance